@@ -0,0 +1,670 @@
+#include "activator.hpp"
+
+#include <structmember.h>
+
+#include <atomic>
+#include <chrono>
+#include <random>
+#include <utility>
+#include <vector>
+
+#include "extensions/error_template.hpp"
+#include "extensions/python.hpp"
+
+
+namespace pyitt
+{
+
+/*
+ The activators are called on each begin() of a collection region, so they are implemented natively to avoid the
+ overhead of Python calls. The state of the activators is updated atomically, since regions may be entered from
+ multiple threads.
+ */
+struct count_window_activator_state
+{
+    std::atomic<unsigned long long> invocations = 0;
+};
+
+struct latency_triggered_activator_state
+{
+    std::chrono::nanoseconds threshold;
+    std::atomic<unsigned long long> remaining = 0;
+};
+
+static PyObject* count_window_activator_new(PyTypeObject* type, PyObject* args, PyObject* kwargs);
+static void count_window_activator_dealloc(PyObject* self);
+static PyObject* count_window_activator_repr(PyObject* self);
+static PyObject* count_window_activator_call(PyObject* self, PyObject* args, PyObject* kwargs);
+static PyObject* count_window_activator_reset(PyObject* self, PyObject* Py_UNUSED(args));
+
+static PyObject* probabilistic_activator_new(PyTypeObject* type, PyObject* args, PyObject* kwargs);
+static void probabilistic_activator_dealloc(PyObject* self);
+static PyObject* probabilistic_activator_repr(PyObject* self);
+static PyObject* probabilistic_activator_call(PyObject* self, PyObject* args, PyObject* kwargs);
+
+static PyObject* latency_triggered_activator_new(PyTypeObject* type, PyObject* args, PyObject* kwargs);
+static void latency_triggered_activator_dealloc(PyObject* self);
+static PyObject* latency_triggered_activator_repr(PyObject* self);
+static PyObject* latency_triggered_activator_call(PyObject* self, PyObject* args, PyObject* kwargs);
+static PyObject* latency_triggered_activator_complete(PyObject* self, PyObject* Py_UNUSED(args));
+
+static PyMemberDef count_window_activator_attrs[] =
+{
+    {"first",  T_ULONGLONG, offsetof(CountWindowActivator, first), READONLY, "a number of the first active invocation"},
+    {"last",   T_ULONGLONG, offsetof(CountWindowActivator, last),  READONLY, "a number of the last active invocation"},
+    {nullptr},
+};
+
+static PyMethodDef count_window_activator_methods[] =
+{
+    {"reset", count_window_activator_reset, METH_NOARGS, "Restarts the numbering of invocations."},
+    {nullptr},
+};
+
+static PyMemberDef probabilistic_activator_attrs[] =
+{
+    {"probability",  T_DOUBLE, offsetof(ProbabilisticActivator, probability), READONLY, "a percent of active invocations"},
+    {nullptr},
+};
+
+static PyMemberDef latency_triggered_activator_attrs[] =
+{
+    {"threshold_ms",  T_DOUBLE,    offsetof(LatencyTriggeredActivator, threshold_ms), READONLY, "a latency threshold in milliseconds"},
+    {"count",         T_ULONGLONG, offsetof(LatencyTriggeredActivator, count),        READONLY, "a number of active invocations after a slow one"},
+    {nullptr},
+};
+
+static PyMethodDef latency_triggered_activator_methods[] =
+{
+    {"complete", latency_triggered_activator_complete, METH_NOARGS, "Marks the end of the invocation that is started by the last call of the activator."},
+    {nullptr},
+};
+
+PyTypeObject CountWindowActivator::object_type =
+{
+    .ob_base              = PyVarObject_HEAD_INIT(nullptr, 0)
+    .tp_name              = "pyitt.native.CountWindowActivator",
+    .tp_basicsize         = sizeof(CountWindowActivator),
+    .tp_itemsize          = 0,
+
+    /* Methods to implement standard operations */
+    .tp_dealloc           = count_window_activator_dealloc,
+    .tp_vectorcall_offset = 0,
+    .tp_getattr           = nullptr,
+    .tp_setattr           = nullptr,
+    .tp_as_async          = nullptr,
+    .tp_repr              = count_window_activator_repr,
+
+    /* Method suites for standard classes */
+    .tp_as_number         = nullptr,
+    .tp_as_sequence       = nullptr,
+    .tp_as_mapping        = nullptr,
+
+    /* More standard operations (here for binary compatibility) */
+    .tp_hash              = nullptr,
+    .tp_call              = count_window_activator_call,
+    .tp_str               = nullptr,
+    .tp_getattro          = nullptr,
+    .tp_setattro          = nullptr,
+
+    /* Functions to access object as input/output buffer */
+    .tp_as_buffer         = nullptr,
+
+    /* Flags to define presence of optional/expanded features */
+    .tp_flags             = Py_TPFLAGS_DEFAULT,
+
+    /* Documentation string */
+    .tp_doc               = "An activator of collection regions that is active for a window of invocations.",
+
+    /* Assigned meaning in release 2.0 call function for all accessible objects */
+    .tp_traverse          = nullptr,
+
+    /* Delete references to contained objects */
+    .tp_clear             = nullptr,
+
+    /* Assigned meaning in release 2.1 rich comparisons */
+    .tp_richcompare       = nullptr,
+
+    /* weak reference enabler */
+    .tp_weaklistoffset    = 0,
+
+    /* Iterators */
+    .tp_iter              = nullptr,
+    .tp_iternext          = nullptr,
+
+    /* Attribute descriptor and subclassing stuff */
+    .tp_methods           = count_window_activator_methods,
+    .tp_members           = count_window_activator_attrs,
+    .tp_getset            = nullptr,
+
+    /* Strong reference on a heap type, borrowed reference on a static type */
+    .tp_base              = nullptr,
+    .tp_dict              = nullptr,
+    .tp_descr_get         = nullptr,
+    .tp_descr_set         = nullptr,
+    .tp_dictoffset        = 0,
+    .tp_init              = nullptr,
+    .tp_alloc             = nullptr,
+    .tp_new               = count_window_activator_new,
+
+    /* Low-level free-memory routine */
+    .tp_free              = nullptr,
+
+    /* For PyObject_IS_GC */
+    .tp_is_gc             = nullptr,
+    .tp_bases             = nullptr,
+
+    /* method resolution order */
+    .tp_mro               = nullptr,
+    .tp_cache             = nullptr,
+    .tp_subclasses        = nullptr,
+    .tp_weaklist          = nullptr,
+    .tp_del               = nullptr,
+
+    /* Type attribute cache version tag. Added in version 2.6 */
+    .tp_version_tag       = 0,
+
+    .tp_finalize          = nullptr,
+    .tp_vectorcall        = nullptr,
+};
+
+PyTypeObject ProbabilisticActivator::object_type =
+{
+    .ob_base              = PyVarObject_HEAD_INIT(nullptr, 0)
+    .tp_name              = "pyitt.native.ProbabilisticActivator",
+    .tp_basicsize         = sizeof(ProbabilisticActivator),
+    .tp_itemsize          = 0,
+
+    /* Methods to implement standard operations */
+    .tp_dealloc           = probabilistic_activator_dealloc,
+    .tp_vectorcall_offset = 0,
+    .tp_getattr           = nullptr,
+    .tp_setattr           = nullptr,
+    .tp_as_async          = nullptr,
+    .tp_repr              = probabilistic_activator_repr,
+
+    /* Method suites for standard classes */
+    .tp_as_number         = nullptr,
+    .tp_as_sequence       = nullptr,
+    .tp_as_mapping        = nullptr,
+
+    /* More standard operations (here for binary compatibility) */
+    .tp_hash              = nullptr,
+    .tp_call              = probabilistic_activator_call,
+    .tp_str               = nullptr,
+    .tp_getattro          = nullptr,
+    .tp_setattro          = nullptr,
+
+    /* Functions to access object as input/output buffer */
+    .tp_as_buffer         = nullptr,
+
+    /* Flags to define presence of optional/expanded features */
+    .tp_flags             = Py_TPFLAGS_DEFAULT,
+
+    /* Documentation string */
+    .tp_doc               = "An activator of collection regions that is active for a given percent of invocations.",
+
+    /* Assigned meaning in release 2.0 call function for all accessible objects */
+    .tp_traverse          = nullptr,
+
+    /* Delete references to contained objects */
+    .tp_clear             = nullptr,
+
+    /* Assigned meaning in release 2.1 rich comparisons */
+    .tp_richcompare       = nullptr,
+
+    /* weak reference enabler */
+    .tp_weaklistoffset    = 0,
+
+    /* Iterators */
+    .tp_iter              = nullptr,
+    .tp_iternext          = nullptr,
+
+    /* Attribute descriptor and subclassing stuff */
+    .tp_methods           = nullptr,
+    .tp_members           = probabilistic_activator_attrs,
+    .tp_getset            = nullptr,
+
+    /* Strong reference on a heap type, borrowed reference on a static type */
+    .tp_base              = nullptr,
+    .tp_dict              = nullptr,
+    .tp_descr_get         = nullptr,
+    .tp_descr_set         = nullptr,
+    .tp_dictoffset        = 0,
+    .tp_init              = nullptr,
+    .tp_alloc             = nullptr,
+    .tp_new               = probabilistic_activator_new,
+
+    /* Low-level free-memory routine */
+    .tp_free              = nullptr,
+
+    /* For PyObject_IS_GC */
+    .tp_is_gc             = nullptr,
+    .tp_bases             = nullptr,
+
+    /* method resolution order */
+    .tp_mro               = nullptr,
+    .tp_cache             = nullptr,
+    .tp_subclasses        = nullptr,
+    .tp_weaklist          = nullptr,
+    .tp_del               = nullptr,
+
+    /* Type attribute cache version tag. Added in version 2.6 */
+    .tp_version_tag       = 0,
+
+    .tp_finalize          = nullptr,
+    .tp_vectorcall        = nullptr,
+};
+
+PyTypeObject LatencyTriggeredActivator::object_type =
+{
+    .ob_base              = PyVarObject_HEAD_INIT(nullptr, 0)
+    .tp_name              = "pyitt.native.LatencyTriggeredActivator",
+    .tp_basicsize         = sizeof(LatencyTriggeredActivator),
+    .tp_itemsize          = 0,
+
+    /* Methods to implement standard operations */
+    .tp_dealloc           = latency_triggered_activator_dealloc,
+    .tp_vectorcall_offset = 0,
+    .tp_getattr           = nullptr,
+    .tp_setattr           = nullptr,
+    .tp_as_async          = nullptr,
+    .tp_repr              = latency_triggered_activator_repr,
+
+    /* Method suites for standard classes */
+    .tp_as_number         = nullptr,
+    .tp_as_sequence       = nullptr,
+    .tp_as_mapping        = nullptr,
+
+    /* More standard operations (here for binary compatibility) */
+    .tp_hash              = nullptr,
+    .tp_call              = latency_triggered_activator_call,
+    .tp_str               = nullptr,
+    .tp_getattro          = nullptr,
+    .tp_setattro          = nullptr,
+
+    /* Functions to access object as input/output buffer */
+    .tp_as_buffer         = nullptr,
+
+    /* Flags to define presence of optional/expanded features */
+    .tp_flags             = Py_TPFLAGS_DEFAULT,
+
+    /* Documentation string */
+    .tp_doc               = "An activator of collection regions that is active for the invocations following a slow one.",
+
+    /* Assigned meaning in release 2.0 call function for all accessible objects */
+    .tp_traverse          = nullptr,
+
+    /* Delete references to contained objects */
+    .tp_clear             = nullptr,
+
+    /* Assigned meaning in release 2.1 rich comparisons */
+    .tp_richcompare       = nullptr,
+
+    /* weak reference enabler */
+    .tp_weaklistoffset    = 0,
+
+    /* Iterators */
+    .tp_iter              = nullptr,
+    .tp_iternext          = nullptr,
+
+    /* Attribute descriptor and subclassing stuff */
+    .tp_methods           = latency_triggered_activator_methods,
+    .tp_members           = latency_triggered_activator_attrs,
+    .tp_getset            = nullptr,
+
+    /* Strong reference on a heap type, borrowed reference on a static type */
+    .tp_base              = nullptr,
+    .tp_dict              = nullptr,
+    .tp_descr_get         = nullptr,
+    .tp_descr_set         = nullptr,
+    .tp_dictoffset        = 0,
+    .tp_init              = nullptr,
+    .tp_alloc             = nullptr,
+    .tp_new               = latency_triggered_activator_new,
+
+    /* Low-level free-memory routine */
+    .tp_free              = nullptr,
+
+    /* For PyObject_IS_GC */
+    .tp_is_gc             = nullptr,
+    .tp_bases             = nullptr,
+
+    /* method resolution order */
+    .tp_mro               = nullptr,
+    .tp_cache             = nullptr,
+    .tp_subclasses        = nullptr,
+    .tp_weaklist          = nullptr,
+    .tp_del               = nullptr,
+
+    /* Type attribute cache version tag. Added in version 2.6 */
+    .tp_version_tag       = 0,
+
+    .tp_finalize          = nullptr,
+    .tp_vectorcall        = nullptr,
+};
+
+static bool parse_no_arguments(PyObject* args, PyObject* kwargs)
+{
+    char* kwlist[] = { nullptr };
+    return PyArg_ParseTupleAndKeywords(args, kwargs, "", kwlist);
+}
+
+static PyObject* count_window_activator_new(PyTypeObject* type, PyObject* args, PyObject* kwargs)
+{
+    pyext::pyobject_holder<CountWindowActivator> self = type->tp_alloc(type, 0);
+    if (self == nullptr)
+    {
+        return nullptr;
+    }
+
+    self->state = nullptr;
+
+    char first_key[] = { "first" };
+    char last_key[] = { "last" };
+    char* kwlist[] = { first_key, last_key, nullptr };
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "KK", kwlist, &self->first, &self->last))
+    {
+        return nullptr;
+    }
+
+    if (self->first == 0 || self->first > self->last)
+    {
+        return PyErr_Format(PyExc_ValueError,
+            "The passed window of invocations is not valid, invocations are numbered from 1 and first <= last.");
+    }
+
+    self->state = new (std::nothrow) count_window_activator_state();
+    if (self->state == nullptr)
+    {
+        return PyErr_NoMemory();
+    }
+
+    return self.release();
+}
+
+static void count_window_activator_dealloc(PyObject* self)
+{
+    CountWindowActivator* obj = pyext::pyobject_cast<CountWindowActivator>(self);
+    if (obj)
+    {
+        delete obj->state;
+    }
+
+    Py_TYPE(self)->tp_free(self);
+}
+
+static PyObject* count_window_activator_repr(PyObject* self)
+{
+    CountWindowActivator* obj = pyext::pyobject_cast<CountWindowActivator>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", CountWindowActivator::object_type.tp_name);
+    }
+
+    return PyUnicode_FromFormat("%s(%llu, %llu)", obj->object_type.tp_name, obj->first, obj->last);
+}
+
+static PyObject* count_window_activator_call(PyObject* self, PyObject* args, PyObject* kwargs)
+{
+    CountWindowActivator* obj = pyext::pyobject_cast<CountWindowActivator>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", CountWindowActivator::object_type.tp_name);
+    }
+
+    if (!parse_no_arguments(args, kwargs))
+    {
+        return nullptr;
+    }
+
+    const unsigned long long invocation = obj->state->invocations.fetch_add(1, std::memory_order_relaxed) + 1;
+    return PyBool_FromLong(obj->first <= invocation && invocation <= obj->last);
+}
+
+static PyObject* count_window_activator_reset(PyObject* self, PyObject* Py_UNUSED(args))
+{
+    CountWindowActivator* obj = pyext::pyobject_cast<CountWindowActivator>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", CountWindowActivator::object_type.tp_name);
+    }
+
+    obj->state->invocations.store(0, std::memory_order_relaxed);
+
+    Py_RETURN_NONE;
+}
+
+static PyObject* probabilistic_activator_new(PyTypeObject* type, PyObject* args, PyObject* kwargs)
+{
+    pyext::pyobject_holder<ProbabilisticActivator> self = type->tp_alloc(type, 0);
+    if (self == nullptr)
+    {
+        return nullptr;
+    }
+
+    char probability_key[] = { "probability" };
+    char* kwlist[] = { probability_key, nullptr };
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "d", kwlist, &self->probability))
+    {
+        return nullptr;
+    }
+
+    if (!(0.0 <= self->probability && self->probability <= 100.0))
+    {
+        return PyErr_Format(PyExc_ValueError, "The passed probability must be a percent in the range [0, 100].");
+    }
+
+    return self.release();
+}
+
+static void probabilistic_activator_dealloc(PyObject* self)
+{
+    Py_TYPE(self)->tp_free(self);
+}
+
+static PyObject* probabilistic_activator_repr(PyObject* self)
+{
+    ProbabilisticActivator* obj = pyext::pyobject_cast<ProbabilisticActivator>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", ProbabilisticActivator::object_type.tp_name);
+    }
+
+    pyext::pyobject_holder<PyObject> probability = PyFloat_FromDouble(obj->probability);
+    if (probability == nullptr)
+    {
+        return nullptr;
+    }
+
+    return PyUnicode_FromFormat("%s(%R)", obj->object_type.tp_name, probability.get());
+}
+
+static PyObject* probabilistic_activator_call(PyObject* self, PyObject* args, PyObject* kwargs)
+{
+    ProbabilisticActivator* obj = pyext::pyobject_cast<ProbabilisticActivator>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", ProbabilisticActivator::object_type.tp_name);
+    }
+
+    if (!parse_no_arguments(args, kwargs))
+    {
+        return nullptr;
+    }
+
+    /* Each thread has its own generator, so the activator does not need a lock. */
+    static thread_local std::mt19937_64 generator(std::random_device{}());
+    std::uniform_real_distribution<double> distribution(0.0, 100.0);
+
+    return PyBool_FromLong(distribution(generator) < obj->probability);
+}
+
+/*
+ The start times of the invocations are kept per thread, so the invocations that are nested or executed by different
+ threads concurrently are measured independently. The stack is bounded in case complete() is never called.
+ */
+static constexpr std::size_t latency_triggered_activator_max_depth = 256;
+static thread_local std::vector<std::pair<const LatencyTriggeredActivator*, std::chrono::steady_clock::time_point>>
+    latency_triggered_activator_starts;
+
+static PyObject* latency_triggered_activator_new(PyTypeObject* type, PyObject* args, PyObject* kwargs)
+{
+    pyext::pyobject_holder<LatencyTriggeredActivator> self = type->tp_alloc(type, 0);
+    if (self == nullptr)
+    {
+        return nullptr;
+    }
+
+    self->state = nullptr;
+
+    char threshold_ms_key[] = { "threshold_ms" };
+    char count_key[] = { "count" };
+    char* kwlist[] = { threshold_ms_key, count_key, nullptr };
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "dK", kwlist, &self->threshold_ms, &self->count))
+    {
+        return nullptr;
+    }
+
+    if (!(self->threshold_ms >= 0.0))
+    {
+        return PyErr_Format(PyExc_ValueError, "The passed threshold_ms must not be negative.");
+    }
+
+    if (self->count == 0)
+    {
+        return PyErr_Format(PyExc_ValueError, "The passed count must be greater than zero.");
+    }
+
+    self->state = new (std::nothrow) latency_triggered_activator_state();
+    if (self->state == nullptr)
+    {
+        return PyErr_NoMemory();
+    }
+
+    self->state->threshold = std::chrono::duration_cast<std::chrono::nanoseconds>(
+        std::chrono::duration<double, std::milli>(self->threshold_ms));
+
+    return self.release();
+}
+
+static void latency_triggered_activator_dealloc(PyObject* self)
+{
+    LatencyTriggeredActivator* obj = pyext::pyobject_cast<LatencyTriggeredActivator>(self);
+    if (obj)
+    {
+        delete obj->state;
+    }
+
+    Py_TYPE(self)->tp_free(self);
+}
+
+static PyObject* latency_triggered_activator_repr(PyObject* self)
+{
+    LatencyTriggeredActivator* obj = pyext::pyobject_cast<LatencyTriggeredActivator>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", LatencyTriggeredActivator::object_type.tp_name);
+    }
+
+    pyext::pyobject_holder<PyObject> threshold_ms = PyFloat_FromDouble(obj->threshold_ms);
+    if (threshold_ms == nullptr)
+    {
+        return nullptr;
+    }
+
+    return PyUnicode_FromFormat("%s(%R, %llu)", obj->object_type.tp_name, threshold_ms.get(), obj->count);
+}
+
+static PyObject* latency_triggered_activator_call(PyObject* self, PyObject* args, PyObject* kwargs)
+{
+    LatencyTriggeredActivator* obj = pyext::pyobject_cast<LatencyTriggeredActivator>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", LatencyTriggeredActivator::object_type.tp_name);
+    }
+
+    if (!parse_no_arguments(args, kwargs))
+    {
+        return nullptr;
+    }
+
+    unsigned long long remaining = obj->state->remaining.load(std::memory_order_relaxed);
+    while (remaining != 0 &&
+           !obj->state->remaining.compare_exchange_weak(remaining, remaining - 1, std::memory_order_relaxed))
+    {
+    }
+
+    auto& starts = latency_triggered_activator_starts;
+    if (starts.size() == latency_triggered_activator_max_depth)
+    {
+        starts.erase(starts.begin());
+    }
+
+    try
+    {
+        starts.emplace_back(obj, std::chrono::steady_clock::now());
+    }
+    catch (const std::bad_alloc&)
+    {
+        return PyErr_NoMemory();
+    }
+
+    return PyBool_FromLong(remaining != 0);
+}
+
+static PyObject* latency_triggered_activator_complete(PyObject* self, PyObject* Py_UNUSED(args))
+{
+    LatencyTriggeredActivator* obj = pyext::pyobject_cast<LatencyTriggeredActivator>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", LatencyTriggeredActivator::object_type.tp_name);
+    }
+
+    const auto now = std::chrono::steady_clock::now();
+
+    auto& starts = latency_triggered_activator_starts;
+    for (auto it = starts.rbegin(); it != starts.rend(); ++it)
+    {
+        if (it->first == obj)
+        {
+            if (now - it->second > obj->state->threshold)
+            {
+                obj->state->remaining.store(obj->count, std::memory_order_relaxed);
+            }
+
+            starts.erase(std::next(it).base());
+            break;
+        }
+    }
+
+    Py_RETURN_NONE;
+}
+
+int exec_activators(PyObject* module)
+{
+    if (pyext::add_type(module, &CountWindowActivator::object_type) < 0)
+    {
+        return -1;
+    }
+
+    if (pyext::add_type(module, &ProbabilisticActivator::object_type) < 0)
+    {
+        return -1;
+    }
+
+    return pyext::add_type(module, &LatencyTriggeredActivator::object_type);
+}
+
+} // namespace pyitt
@@ -0,0 +1,45 @@
+#pragma once
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+
+namespace pyitt
+{
+
+struct count_window_activator_state;
+struct latency_triggered_activator_state;
+
+struct CountWindowActivator
+{
+	PyObject_HEAD
+	unsigned long long first;
+	unsigned long long last;
+
+	count_window_activator_state* state;
+
+	static PyTypeObject object_type;
+};
+
+struct ProbabilisticActivator
+{
+	PyObject_HEAD
+	double probability;
+
+	static PyTypeObject object_type;
+};
+
+struct LatencyTriggeredActivator
+{
+	PyObject_HEAD
+	double threshold_ms;
+	unsigned long long count;
+
+	latency_triggered_activator_state* state;
+
+	static PyTypeObject object_type;
+};
+
+int exec_activators(PyObject* module);
+
+} // namespace pyitt
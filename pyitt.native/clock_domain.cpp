@@ -0,0 +1,291 @@
+#include "clock_domain.hpp"
+
+#include <structmember.h>
+
+#include "extensions/error_template.hpp"
+#include "extensions/python.hpp"
+
+
+namespace pyitt
+{
+
+/*
+ The source of the clock information is referenced by the collector for the whole lifetime of the process, since
+ the clock information is requested again on __itt_clock_domain_reset(). Therefore, the source is never released
+ once the clock domain is created by the collector.
+ */
+struct clock_domain_source
+{
+    PyObject* fn;
+    unsigned long long frequency;
+    unsigned long long base;
+};
+
+static PyObject* clock_domain_new(PyTypeObject* type, PyObject* args, PyObject* kwargs);
+static void clock_domain_dealloc(PyObject* self);
+
+static PyObject* clock_domain_repr(PyObject* self);
+
+static PyMemberDef clock_domain_attrs[] =
+{
+    {"source",  T_OBJECT_EX, offsetof(ClockDomain, source), READONLY, "a frequency of the clock or a function that returns the clock information"},
+    {nullptr},
+};
+
+PyTypeObject ClockDomain::object_type =
+{
+    .ob_base              = PyVarObject_HEAD_INIT(nullptr, 0)
+    .tp_name              = "pyitt.native.ClockDomain",
+    .tp_basicsize         = sizeof(ClockDomain),
+    .tp_itemsize          = 0,
+
+    /* Methods to implement standard operations */
+    .tp_dealloc           = clock_domain_dealloc,
+    .tp_vectorcall_offset = 0,
+    .tp_getattr           = nullptr,
+    .tp_setattr           = nullptr,
+    .tp_as_async          = nullptr,
+    .tp_repr              = clock_domain_repr,
+
+    /* Method suites for standard classes */
+    .tp_as_number         = nullptr,
+    .tp_as_sequence       = nullptr,
+    .tp_as_mapping        = nullptr,
+
+    /* More standard operations (here for binary compatibility) */
+    .tp_hash              = nullptr,
+    .tp_call              = nullptr,
+    .tp_str               = nullptr,
+    .tp_getattro          = nullptr,
+    .tp_setattro          = nullptr,
+
+    /* Functions to access object as input/output buffer */
+    .tp_as_buffer         = nullptr,
+
+    /* Flags to define presence of optional/expanded features */
+    .tp_flags             = Py_TPFLAGS_DEFAULT,
+
+    /* Documentation string */
+    .tp_doc               = "A class that represents an ITT clock domain.",
+
+    /* Assigned meaning in release 2.0 call function for all accessible objects */
+    .tp_traverse          = nullptr,
+
+    /* Delete references to contained objects */
+    .tp_clear             = nullptr,
+
+    /* Assigned meaning in release 2.1 rich comparisons */
+    .tp_richcompare       = nullptr,
+
+    /* weak reference enabler */
+    .tp_weaklistoffset    = 0,
+
+    /* Iterators */
+    .tp_iter              = nullptr,
+    .tp_iternext          = nullptr,
+
+    /* Attribute descriptor and subclassing stuff */
+    .tp_methods           = nullptr,
+    .tp_members           = clock_domain_attrs,
+    .tp_getset            = nullptr,
+
+    /* Strong reference on a heap type, borrowed reference on a static type */
+    .tp_base              = nullptr,
+    .tp_dict              = nullptr,
+    .tp_descr_get         = nullptr,
+    .tp_descr_set         = nullptr,
+    .tp_dictoffset        = 0,
+    .tp_init              = nullptr,
+    .tp_alloc             = nullptr,
+    .tp_new               = clock_domain_new,
+
+    /* Low-level free-memory routine */
+    .tp_free              = nullptr,
+
+    /* For PyObject_IS_GC */
+    .tp_is_gc             = nullptr,
+    .tp_bases             = nullptr,
+
+    /* method resolution order */
+    .tp_mro               = nullptr,
+    .tp_cache             = nullptr,
+    .tp_subclasses        = nullptr,
+    .tp_weaklist          = nullptr,
+    .tp_del               = nullptr,
+
+    /* Type attribute cache version tag. Added in version 2.6 */
+    .tp_version_tag       = 0,
+
+    .tp_finalize          = nullptr,
+    .tp_vectorcall        = nullptr,
+};
+
+static bool clock_domain_query_source(clock_domain_source* source)
+{
+    pyext::pyobject_holder<PyObject> info = PyObject_CallObject(source->fn, nullptr);
+    if (info == nullptr)
+    {
+        return false;
+    }
+
+    if (!PyTuple_Check(info.get()))
+    {
+        PyErr_Format(PyExc_TypeError, "The clock information function must return a tuple of frequency and base.");
+        return false;
+    }
+
+    unsigned long long frequency = 0;
+    unsigned long long base = 0;
+    if (!PyArg_ParseTuple(info.get(), "KK", &frequency, &base))
+    {
+        return false;
+    }
+
+    if (frequency == 0)
+    {
+        PyErr_Format(PyExc_ValueError, "The clock frequency must be greater than zero.");
+        return false;
+    }
+
+    source->frequency = frequency;
+    source->base = base;
+
+    return true;
+}
+
+static void ITTAPI clock_domain_get_info(__itt_clock_info* clock_info, void* data)
+{
+    clock_domain_source* source = static_cast<clock_domain_source*>(data);
+
+    /* The collector may query the clock from its own thread while the interpreter is being finalized. */
+    if (source->fn && Py_IsInitialized() && !pyext::is_finalizing())
+    {
+        PyGILState_STATE gil_state = PyGILState_Ensure();
+
+        /* The collector cannot handle errors, so the last valid clock information is reported instead. */
+        PyObject* type = nullptr;
+        PyObject* value = nullptr;
+        PyObject* traceback = nullptr;
+        PyErr_Fetch(&type, &value, &traceback);
+
+        if (!clock_domain_query_source(source))
+        {
+            PyErr_WriteUnraisable(source->fn);
+        }
+
+        PyErr_Restore(type, value, traceback);
+
+        PyGILState_Release(gil_state);
+    }
+
+    clock_info->clock_freq = source->frequency;
+    clock_info->clock_base = source->base;
+}
+
+static PyObject* clock_domain_new(PyTypeObject* type, PyObject* args, PyObject* kwargs)
+{
+    pyext::pyobject_holder<ClockDomain> self = type->tp_alloc(type, 0);
+    if (self == nullptr)
+    {
+        return nullptr;
+    }
+
+    self->source = nullptr;
+    self->handle = nullptr;
+    self->info_source = nullptr;
+
+    char source_key[] = { "source" };
+    char base_key[] = { "base" };
+    char* kwlist[] = { source_key, base_key, nullptr };
+
+    PyObject* source = nullptr;
+    unsigned long long base = 0;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|K", kwlist, &source, &base))
+    {
+        return nullptr;
+    }
+
+    clock_domain_source info_source = { nullptr, 0, base };
+
+    if (PyLong_Check(source))
+    {
+        info_source.frequency = PyLong_AsUnsignedLongLong(source);
+        if (info_source.frequency == static_cast<unsigned long long>(-1) && PyErr_Occurred())
+        {
+            return nullptr;
+        }
+
+        if (info_source.frequency == 0)
+        {
+            return PyErr_Format(PyExc_ValueError, "The clock frequency must be greater than zero.");
+        }
+    }
+    else if (PyCallable_Check(source))
+    {
+        info_source.fn = source;
+
+        /* The function is called in advance, so the errors are reported to the caller rather than to the collector. */
+        if (!clock_domain_query_source(&info_source))
+        {
+            return nullptr;
+        }
+    }
+    else
+    {
+        return PyErr_Format(PyExc_TypeError,
+            "The passed %s is not a valid instance of int or callable.", source_key);
+    }
+
+    self->source = pyext::new_ref(source);
+    self->info_source = new clock_domain_source(info_source);
+    Py_XINCREF(self->info_source->fn);
+
+    self->handle = __itt_clock_domain_create(clock_domain_get_info, self->info_source);
+
+    return self.release();
+}
+
+static void clock_domain_dealloc(PyObject* self)
+{
+    ClockDomain* obj = pyext::pyobject_cast<ClockDomain>(self);
+    if (obj)
+    {
+        /* The source of the clock domain that is created by the collector may be requested after the deallocation. */
+        if (obj->info_source && obj->handle == nullptr)
+        {
+            Py_XDECREF(obj->info_source->fn);
+            delete obj->info_source;
+        }
+
+        Py_XDECREF(obj->source);
+    }
+
+    Py_TYPE(self)->tp_free(self);
+}
+
+static PyObject* clock_domain_repr(PyObject* self)
+{
+    ClockDomain* obj = pyext::pyobject_cast<ClockDomain>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", ClockDomain::object_type.tp_name);
+    }
+
+    return PyUnicode_FromFormat("%s(%R)", obj->object_type.tp_name, obj->source);
+}
+
+PyObject* clock_domain_reset(PyObject* self, PyObject* Py_UNUSED(args))
+{
+    __itt_clock_domain_reset();
+
+    Py_RETURN_NONE;
+}
+
+int exec_clock_domain(PyObject* module)
+{
+    return pyext::add_type(module, &ClockDomain::object_type);
+}
+
+} // namespace pyitt
@@ -0,0 +1,33 @@
+#pragma once
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#include <ittnotify.h>
+
+
+namespace pyitt
+{
+
+struct clock_domain_source;
+
+struct ClockDomain
+{
+	PyObject_HEAD
+	PyObject* source;
+	__itt_clock_domain* handle;
+	clock_domain_source* info_source;
+
+	static PyTypeObject object_type;
+};
+
+inline __itt_clock_domain* clock_domain_get_handle(const ClockDomain* obj)
+{
+	return obj ? obj->handle : nullptr;
+}
+
+PyObject* clock_domain_reset(PyObject* self, PyObject* args);
+
+int exec_clock_domain(PyObject* module);
+
+} // namespace pyitt
@@ -1,7 +1,18 @@
 #include "collection_control.hpp"
 
+#include <atomic>
+#include <chrono>
+#include <condition_variable>
+#include <mutex>
+#include <new>
+#include <system_error>
+#include <thread>
+#include <vector>
+
 #include <ittnotify.h>
 
+#include "fork.hpp"
+
 
 namespace pyitt
 {
@@ -30,4 +41,292 @@ PyObject* detach(PyObject* self, PyObject* Py_UNUSED(args))
     Py_RETURN_NONE;
 }
 
+/*
+ The collection regions are reference-counted across all threads: the collection is resumed (paused) on the first
+ entry to any active (paused) region and paused (resumed) on the last exit. Whether an entry is active is a per-call
+ decision of the activator, so it is kept in a per-thread stack until the matching exit.
+ */
+enum class collection_region_kind : int
+{
+    active = 0,
+    paused = 1,
+};
+
+struct collection_region_entry
+{
+    const PyObject* region;
+    collection_region_kind kind;
+    bool is_active;
+};
+
+struct collection_regions_state
+{
+    std::mutex lock;
+    unsigned long long entered[2] = { 0, 0 };
+};
+
+static collection_regions_state* regions_state = new collection_regions_state();
+static thread_local std::vector<collection_region_entry> region_entries;
+
+static void collection_region_set_collection_state(bool resumed)
+{
+    if (resumed)
+    {
+        __itt_resume();
+    }
+    else
+    {
+        __itt_pause();
+    }
+}
+
+static void collection_region_enter(collection_region_kind kind)
+{
+    std::lock_guard<std::mutex> guard(regions_state->lock);
+    if (++regions_state->entered[static_cast<int>(kind)] == 1)
+    {
+        collection_region_set_collection_state(kind == collection_region_kind::active);
+    }
+}
+
+static void collection_region_exit(collection_region_kind kind)
+{
+    std::lock_guard<std::mutex> guard(regions_state->lock);
+    if (--regions_state->entered[static_cast<int>(kind)] == 0)
+    {
+        collection_region_set_collection_state(kind == collection_region_kind::paused);
+    }
+}
+
+PyObject* collection_region_begin(PyObject* self, PyObject* args)
+{
+    PyObject* region = nullptr;
+    int paused = 0;
+    int is_active = 0;
+
+    if (!PyArg_ParseTuple(args, "Opp", &region, &paused, &is_active))
+    {
+        return nullptr;
+    }
+
+    if (!register_after_fork_in_child())
+    {
+        return nullptr;
+    }
+
+    const collection_region_kind kind = paused ? collection_region_kind::paused : collection_region_kind::active;
+
+    try
+    {
+        region_entries.push_back({ region, kind, static_cast<bool>(is_active) });
+    }
+    catch (const std::bad_alloc&)
+    {
+        return PyErr_NoMemory();
+    }
+
+    if (is_active)
+    {
+        collection_region_enter(kind);
+    }
+
+    Py_RETURN_NONE;
+}
+
+PyObject* collection_region_end(PyObject* Py_UNUSED(self), PyObject* region)
+{
+    /* The exit matches the most recent entry to the same region by the calling thread, if any. */
+    for (auto it = region_entries.rbegin(); it != region_entries.rend(); ++it)
+    {
+        if (it->region == region)
+        {
+            const collection_region_entry entry = *it;
+            region_entries.erase(std::next(it).base());
+
+            if (entry.is_active)
+            {
+                collection_region_exit(entry.kind);
+            }
+            break;
+        }
+    }
+
+    Py_RETURN_NONE;
+}
+
+void collection_regions_after_fork_in_child()
+{
+    /* The mutex could be locked by another thread at the moment of fork, so the state is replaced and leaked. */
+    collection_regions_state* state = new (std::nothrow) collection_regions_state();
+    if (state == nullptr)
+    {
+        return;
+    }
+
+    for (const collection_region_entry& entry : region_entries)
+    {
+        if (entry.is_active)
+        {
+            ++state->entered[static_cast<int>(entry.kind)];
+        }
+    }
+
+    regions_state = state;
+}
+
+/*
+ The collection schedule is driven by a native timer thread, so the collection is resumed and paused in time even if
+ the GIL is held by other threads for a long time. The timer thread never takes the GIL.
+
+ The timer calls __itt_resume() and __itt_pause() directly and does not take the reference counts of the collection
+ regions into account, so a window can resume the collection inside an entered paused region, and the end of a window
+ can pause it inside an entered active region. The schedule and the regions are not meant to be combined.
+ */
+struct collection_schedule_state
+{
+    std::mutex lock;
+    std::condition_variable stop_condition;
+    bool stop_requested = false;
+    std::atomic<bool> active = true;
+    std::thread thread;
+};
+
+/* The pointer is accessed only with the GIL held, the timer thread uses only the state passed to it. */
+static collection_schedule_state* schedule_state = nullptr;
+
+static bool collection_schedule_wait(collection_schedule_state* state, unsigned long duration_ms)
+{
+    std::unique_lock<std::mutex> guard(state->lock);
+    return !state->stop_condition.wait_for(guard, std::chrono::milliseconds(duration_ms),
+                                           [state] { return state->stop_requested; });
+}
+
+static void collection_schedule_run(collection_schedule_state* state,
+                                    unsigned long on_ms,
+                                    unsigned long off_ms,
+                                    unsigned long windows,
+                                    unsigned long delay_ms)
+{
+    if (collection_schedule_wait(state, delay_ms))
+    {
+        for (unsigned long window = 1; windows == 0 || window <= windows; ++window)
+        {
+            __itt_resume();
+            const bool is_completed = collection_schedule_wait(state, on_ms);
+            __itt_pause();
+
+            if (!is_completed || window == windows || !collection_schedule_wait(state, off_ms))
+            {
+                break;
+            }
+        }
+    }
+
+    state->active.store(false, std::memory_order_release);
+}
+
+static void collection_schedule_release(collection_schedule_state* state)
+{
+    if (state == nullptr)
+    {
+        return;
+    }
+
+    {
+        std::lock_guard<std::mutex> guard(state->lock);
+        state->stop_requested = true;
+    }
+    state->stop_condition.notify_all();
+
+    state->thread.join();
+    delete state;
+}
+
+static collection_schedule_state* collection_schedule_take()
+{
+    collection_schedule_state* state = schedule_state;
+    schedule_state = nullptr;
+    return state;
+}
+
+PyObject* collection_schedule_start(PyObject* self, PyObject* args)
+{
+    unsigned long on_ms = 0;
+    unsigned long off_ms = 0;
+    unsigned long windows = 0;
+    unsigned long delay_ms = 0;
+
+    if (!PyArg_ParseTuple(args, "kk|kk", &on_ms, &off_ms, &windows, &delay_ms))
+    {
+        return nullptr;
+    }
+
+    if (on_ms == 0)
+    {
+        return PyErr_Format(PyExc_ValueError, "The duration of the collection window must be greater than zero.");
+    }
+
+    if (!register_after_fork_in_child())
+    {
+        return nullptr;
+    }
+
+    collection_schedule_state* previous_state = collection_schedule_take();
+
+    Py_BEGIN_ALLOW_THREADS;
+    collection_schedule_release(previous_state);
+    Py_END_ALLOW_THREADS;
+
+    collection_schedule_state* state = new (std::nothrow) collection_schedule_state();
+    if (state == nullptr)
+    {
+        return PyErr_NoMemory();
+    }
+
+    try
+    {
+        state->thread = std::thread(collection_schedule_run, state, on_ms, off_ms, windows, delay_ms);
+    }
+    catch (const std::system_error& error)
+    {
+        delete state;
+        return PyErr_Format(PyExc_RuntimeError, "The timer thread of the collection schedule cannot be started: %s",
+                            error.what());
+    }
+
+    schedule_state = state;
+
+    Py_RETURN_NONE;
+}
+
+PyObject* collection_schedule_stop(PyObject* self, PyObject* Py_UNUSED(args))
+{
+    collection_schedule_state* state = collection_schedule_take();
+
+    Py_BEGIN_ALLOW_THREADS;
+    collection_schedule_release(state);
+    Py_END_ALLOW_THREADS;
+    Py_RETURN_NONE;
+}
+
+PyObject* collection_schedule_is_active(PyObject* self, PyObject* Py_UNUSED(args))
+{
+    collection_schedule_state* state = schedule_state;
+    return PyBool_FromLong(state && state->active.load(std::memory_order_acquire));
+}
+
+void collection_schedule_shutdown()
+{
+    collection_schedule_release(collection_schedule_take());
+}
+
+void collection_schedule_after_fork_in_child()
+{
+    /*
+     The timer thread does not exist in the child process and the mutex of the state could be locked by this thread at
+     the moment of fork, so the state of the parent process is leaked intentionally.
+     */
+    schedule_state = nullptr;
+}
+
 } // namespace pyitt
\ No newline at end of file
@@ -11,4 +11,18 @@ PyObject* pause(PyObject* self, PyObject* args);
 PyObject* resume(PyObject* self, PyObject* args);
 PyObject* detach(PyObject* self, PyObject* args);
 
+PyObject* collection_region_begin(PyObject* self, PyObject* args);
+PyObject* collection_region_end(PyObject* self, PyObject* region);
+/* Recounts the entered collection regions in a child process, only the thread that has called fork remains there. */
+void collection_regions_after_fork_in_child();
+
+PyObject* collection_schedule_start(PyObject* self, PyObject* args);
+PyObject* collection_schedule_stop(PyObject* self, PyObject* args);
+PyObject* collection_schedule_is_active(PyObject* self, PyObject* args);
+
+/* Stops the timer thread of the collection schedule, e.g. before the module is released. */
+void collection_schedule_shutdown();
+/* Discards the collection schedule of the parent process in a child process. */
+void collection_schedule_after_fork_in_child();
+
 } // namespace pyitt
\ No newline at end of file
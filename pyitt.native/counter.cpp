@@ -3,6 +3,8 @@
 #include <structmember.h>
 
 #include "domain.hpp"
+#include "name_registry.hpp"
+#include "recorder.hpp"
 #include "string_handle.hpp"
 
 #include "extensions/error_template.hpp"
@@ -14,6 +16,8 @@ namespace pyitt
 {
 
 static PyObject* counter_new(PyTypeObject* type, PyObject* args, PyObject* kwargs);
+static PyObject* counter_create(PyTypeObject* type, PyObject* name, PyObject* domain, PyObject* init_value,
+                                bool set_init_value);
 static void counter_dealloc(PyObject* self);
 
 static PyObject* counter_repr(PyObject* self);
@@ -23,6 +27,9 @@ static PyObject* counter_inc(PyObject* self, PyObject* args);
 static PyObject* counter_dec(PyObject* self, PyObject* args);
 static PyObject* counter_set(PyObject* self, PyObject* arg);
 
+static PyObject* counter_reduce(PyObject* self, PyObject* args);
+static PyObject* counter_from_state(PyObject* cls, PyObject* args);
+
 static PyObject* counter_inplace_inc(PyObject* self, PyObject* arg);
 static PyObject* counter_inplace_dec(PyObject* self, PyObject* arg);
 
@@ -31,6 +38,7 @@ static PyObject* counter_dec_internal(Counter* self, PyObject* arg);
 static PyObject* counter_set_internal(Counter* self, PyObject* arg);
 
 static PyObject* cast_to_pylong(PyObject* obj);
+static void counter_record_value(Counter* self, unsigned long long value);
 
 static PyMemberDef counter_attrs[] =
 {
@@ -45,6 +53,8 @@ static PyMethodDef counter_methods[] =
     {"inc", counter_inc, METH_VARARGS, "Increment the counter value."},
     {"dec", counter_dec, METH_VARARGS, "Decrement the counter value."},
     {"set", counter_set, METH_O,       "Set the counter value."},
+    {"__reduce__", counter_reduce, METH_NOARGS,  "Returns the state of the counter for pickling."},
+    {"_from_state", counter_from_state, METH_VARARGS | METH_CLASS, "Returns the interned counter with the given name and domain."},
     {nullptr},
 };
 
@@ -182,17 +192,6 @@ PyTypeObject Counter::object_type =
 
 static PyObject* counter_new(PyTypeObject* type, PyObject* args, PyObject* kwargs)
 {
-    pyext::pyobject_holder<Counter> self = type->tp_alloc(type, 0);
-    if (self == nullptr)
-    {
-        return nullptr;
-    }
-
-    self->name = nullptr;
-    self->domain = nullptr;
-    self->value = nullptr;
-    self->handle = nullptr;
-
     char name_key[] = { "name" };
     char domain_key[] = { "domain" };
     char init_value_key[] = { "value" };
@@ -208,6 +207,24 @@ static PyObject* counter_new(PyTypeObject* type, PyObject* args, PyObject* kwarg
         return nullptr;
     }
 
+    return counter_create(type, name, domain, init_value, true);
+}
+
+static PyObject* counter_create(PyTypeObject* type, PyObject* name, PyObject* domain, PyObject* init_value,
+                                bool set_init_value)
+{
+    pyext::pyobject_holder<Counter> self = type->tp_alloc(type, 0);
+    if (self == nullptr)
+    {
+        return nullptr;
+    }
+
+    self->name = nullptr;
+    self->domain = nullptr;
+    self->value = nullptr;
+    self->handle = nullptr;
+    self->name_id = 0;
+
     if (name && PyUnicode_Check(name))
     {
         self->name = pyext::new_ref(name);
@@ -219,7 +236,7 @@ static PyObject* counter_new(PyTypeObject* type, PyObject* args, PyObject* kwarg
     else
     {
         return PyErr_Format(PyExc_TypeError,
-            "The passed %s is not a valid instance of str or %s.", name_key, StringHandle::object_type.tp_name);
+            "The passed %s is not a valid instance of str or %s.", "name", StringHandle::object_type.tp_name);
     }
 
     if (pyext::pyobject_cast<Domain>(domain))
@@ -271,7 +288,7 @@ static PyObject* counter_new(PyTypeObject* type, PyObject* args, PyObject* kwarg
     if (self->value == nullptr)
     {
         return PyErr_Format(PyExc_TypeError,
-            "The passed %s is not a valid instance of int and cannot be converted to int.", init_value_key);
+            "The passed %s is not a valid instance of int and cannot be converted to int.", "value");
     }
 
     pyext::string name_str = pyext::string::from_unicode(self->name);
@@ -298,7 +315,11 @@ static PyObject* counter_new(PyTypeObject* type, PyObject* args, PyObject* kwarg
     self->handle = __itt_counter_create(name_str.c_str(), domain_str.c_str());
 #endif
 
-    __itt_counter_set_value(self->handle, &native_init_value);
+    if (set_init_value)
+    {
+        __itt_counter_set_value(self->handle, &native_init_value);
+        counter_record_value(reinterpret_cast<Counter*>(self.get()), native_init_value);
+    }
 
     return self.release();
 }
@@ -490,10 +511,68 @@ static PyObject* counter_set_internal(Counter* self, PyObject* arg)
     self->value = new_value.release();
 
     __itt_counter_set_value(self->handle, &native_new_value);
+    counter_record_value(self, native_new_value);
 
     Py_RETURN_NONE;
 }
 
+static PyObject* counter_reduce(PyObject* self, PyObject* Py_UNUSED(args))
+{
+    Counter* obj = pyext::pyobject_cast<Counter>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", Counter::object_type.tp_name);
+    }
+
+    pyext::pyobject_holder<PyObject> from_state = PyObject_GetAttrString(
+        reinterpret_cast<PyObject*>(&Counter::object_type), "_from_state");
+    if (from_state == nullptr)
+    {
+        return nullptr;
+    }
+
+    return Py_BuildValue("(O(OOO))",
+        from_state.get(), obj->name, domain_get_name(pyext::pyobject_cast<Domain>(obj->domain)), obj->value);
+}
+
+static PyObject* counter_from_state(PyObject* cls, PyObject* args)
+{
+    PyObject* name = nullptr;
+    PyObject* domain = nullptr;
+    PyObject* value = nullptr;
+
+    if (!PyArg_ParseTuple(args, "OOO", &name, &domain, &value))
+    {
+        return nullptr;
+    }
+
+    /* The counter is interned by its name and domain. */
+    PyTypeObject* type = reinterpret_cast<PyTypeObject*>(cls);
+    pyext::pyobject_holder<PyObject> key = PyTuple_Pack(2, name, domain);
+    if (key == nullptr)
+    {
+        return nullptr;
+    }
+
+    if (PyObject* instance = find_interned_instance(type, key.get()))
+    {
+        return pyext::new_ref(instance);
+    }
+
+    /*
+     The counter with the same name and domain can be alive and be updated in this process, so the pickled value is kept
+     in the new instance, but is not set to the ITT counter.
+     */
+    pyext::pyobject_holder<PyObject> instance = counter_create(type, name, domain, value, false);
+    if (instance == nullptr)
+    {
+        return nullptr;
+    }
+
+    return intern_instance(type, key.get(), instance.get());
+}
+
 static PyObject* cast_to_pylong(PyObject* obj)
 {
     if (obj == nullptr || PyLong_Check(obj))
@@ -513,6 +592,22 @@ static PyObject* cast_to_pylong(PyObject* obj)
     return nullptr;
 }
 
+static void counter_record_value(Counter* self, unsigned long long value)
+{
+    if (recorder_is_enabled())
+    {
+        if (self->name_id == 0)
+        {
+            self->name_id = intern_name(self->name);
+        }
+
+        recorder_write(recorder_record_type::counter,
+                       self->name_id,
+                       domain_get_name_id(pyext::pyobject_cast<Domain>(self->domain)),
+                       value);
+    }
+}
+
 int exec_counter(PyObject* module)
 {
     return pyext::add_type(module, &Counter::object_type);
@@ -5,6 +5,8 @@
 
 #include <ittnotify.h>
 
+#include <cstdint>
+
 
 namespace pyitt
 {
@@ -17,9 +19,16 @@ struct Counter
 	PyObject* domain;
 	__itt_counter handle;
 
+	std::uint32_t name_id;
+
 	static PyTypeObject object_type;
 };
 
+inline __itt_counter counter_get_handle(const Counter* obj)
+{
+	return obj ? obj->handle : nullptr;
+}
+
 int exec_counter(PyObject* module);
 
 } // namespace pyitt
@@ -1,7 +1,13 @@
 #include "domain.hpp"
 
+#include <optional>
+#include <string>
+#include <unordered_map>
+#include <unordered_set>
+
 #include <structmember.h>
 
+#include "manifest.hpp"
 #include "string_handle.hpp"
 
 #include "extensions/error_template.hpp"
@@ -18,12 +24,32 @@ static void domain_dealloc(PyObject* self);
 static PyObject* domain_repr(PyObject* self);
 static PyObject* domain_str(PyObject* self);
 
+static PyObject* domain_reduce(PyObject* self, PyObject* args);
+static PyObject* domain_from_name(PyObject* cls, PyObject* name);
+static PyObject* domain_create_many(PyObject* cls, PyObject* names);
+
+static PyObject* domain_get_enabled(PyObject* self, void* closure);
+
 static PyMemberDef domain_attrs[] =
 {
     {"name",  T_OBJECT, offsetof(Domain, name), READONLY, "a domain name"},
     {nullptr},
 };
 
+static PyGetSetDef domain_getset[] =
+{
+    {"enabled", domain_get_enabled, nullptr, "True if the domain is enabled", nullptr},
+    {nullptr},
+};
+
+static PyMethodDef domain_methods[] =
+{
+    {"__reduce__",  domain_reduce,      METH_NOARGS,         "Returns the state of the domain for pickling."},
+    {"_from_name",  domain_from_name,   METH_O | METH_CLASS, "Returns the interned domain with the given name."},
+    {"create_many", domain_create_many, METH_O | METH_CLASS, "Creates the interned domains with the given names."},
+    {nullptr},
+};
+
 PyTypeObject Domain::object_type =
 {
     .ob_base              = PyVarObject_HEAD_INIT(nullptr, 0)
@@ -77,9 +103,9 @@ PyTypeObject Domain::object_type =
     .tp_iternext          = nullptr,
 
     /* Attribute descriptor and subclassing stuff */
-    .tp_methods           = nullptr,
+    .tp_methods           = domain_methods,
     .tp_members           = domain_attrs,
-    .tp_getset            = nullptr,
+    .tp_getset            = domain_getset,
 
     /* Strong reference on a heap type, borrowed reference on a static type */
     .tp_base              = nullptr,
@@ -112,6 +138,50 @@ PyTypeObject Domain::object_type =
     .tp_vectorcall        = nullptr,
 };
 
+/*
+ * The states are shared by all domains with the same name and are never released, so the domains keep the pointers to
+ * them. The registry is accessed only while the GIL is held.
+ */
+struct domain_registry
+{
+    std::unordered_map<std::string, domain_state*> states;
+    std::optional<std::unordered_set<std::string>> allowlist;
+};
+
+static domain_registry& get_domain_registry()
+{
+    static domain_registry* registry = new domain_registry();
+    return *registry;
+}
+
+static bool domain_is_allowed(const domain_registry& registry, const std::string& name)
+{
+    return !registry.allowlist || registry.allowlist->count(name) != 0;
+}
+
+static domain_state* get_domain_state(PyObject* name)
+{
+    Py_ssize_t size = 0;
+    const char* name_utf8 = PyUnicode_AsUTF8AndSize(name, &size);
+    if (name_utf8 == nullptr)
+    {
+        return nullptr;
+    }
+
+    domain_registry& registry = get_domain_registry();
+    std::string key(name_utf8, static_cast<std::size_t>(size));
+
+    auto it = registry.states.find(key);
+    if (it == registry.states.end())
+    {
+        domain_state* state = new domain_state();
+        state->enabled.store(domain_is_allowed(registry, key), std::memory_order_relaxed);
+        it = registry.states.emplace(std::move(key), state).first;
+    }
+
+    return it->second;
+}
+
 static PyObject* domain_new(PyTypeObject* type, PyObject* args, PyObject* kwargs)
 {
     pyext::pyobject_holder<Domain> self = type->tp_alloc(type, 0);
@@ -121,7 +191,9 @@ static PyObject* domain_new(PyTypeObject* type, PyObject* args, PyObject* kwargs
     }
 
     self->handle = nullptr;
+    self->state = nullptr;
     self->name = nullptr;
+    self->name_id = 0;
 
     char name_key[] = { "name" };
     char* kwlist[] = { name_key, nullptr };
@@ -150,6 +222,27 @@ static PyObject* domain_new(PyTypeObject* type, PyObject* args, PyObject* kwargs
             "The passed %s is not a valid instance of str or %s.", name_key, StringHandle::object_type.tp_name);
     }
 
+    if (self->name == nullptr)
+    {
+        return nullptr;
+    }
+
+    manifest_record(manifest_name_type::domain, self->name);
+
+    /* The handle and the state of the interned instance are reused to avoid the encoding and the lookups. */
+    if (Domain* interned_obj = pyext::pyobject_cast<Domain>(find_interned_instance(type, self->name)))
+    {
+        self->handle = interned_obj->handle;
+        self->state = interned_obj->state;
+        return self.release();
+    }
+
+    self->state = get_domain_state(self->name);
+    if (self->state == nullptr)
+    {
+        return nullptr;
+    }
+
     pyext::string name_str = pyext::string::from_unicode(self->name);
     if (name_str.c_str() == nullptr)
     {
@@ -200,6 +293,149 @@ static PyObject* domain_str(PyObject* self)
     return pyext::new_ref(obj->name);
 }
 
+static PyObject* domain_reduce(PyObject* self, PyObject* Py_UNUSED(args))
+{
+    Domain* obj = pyext::pyobject_cast<Domain>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", Domain::object_type.tp_name);
+    }
+
+    pyext::pyobject_holder<PyObject> from_name = PyObject_GetAttrString(
+        reinterpret_cast<PyObject*>(&Domain::object_type), "_from_name");
+    if (from_name == nullptr)
+    {
+        return nullptr;
+    }
+
+    return Py_BuildValue("(O(O))", from_name.get(), obj->name);
+}
+
+static PyObject* domain_from_name(PyObject* cls, PyObject* name)
+{
+    pyext::pyobject_holder<PyObject> args = PyTuple_Pack(1, name);
+    if (args == nullptr)
+    {
+        return nullptr;
+    }
+
+    return get_interned_instance(reinterpret_cast<PyTypeObject*>(cls), name, args.get());
+}
+
+static PyObject* domain_create_many(PyObject* cls, PyObject* names)
+{
+    pyext::pyobject_holder<PyObject> name_sequence = PySequence_Fast(names, "The passed names are not a sequence.");
+    if (name_sequence == nullptr)
+    {
+        return nullptr;
+    }
+
+    Py_ssize_t count = PySequence_Fast_GET_SIZE(name_sequence.get());
+    pyext::pyobject_holder<PyObject> domains = PyList_New(count);
+    if (domains == nullptr)
+    {
+        return nullptr;
+    }
+
+    for (Py_ssize_t i = 0; i < count; ++i)
+    {
+        PyObject* name = PySequence_Fast_GET_ITEM(name_sequence.get(), i);
+        if (!PyUnicode_Check(name))
+        {
+            return PyErr_Format(PyExc_TypeError, pyext::error::invalid_argument_type_tmpl, "name", "str");
+        }
+
+        PyObject* domain = domain_from_name(cls, name);
+        if (domain == nullptr)
+        {
+            return nullptr;
+        }
+
+        PyList_SET_ITEM(domains.get(), i, domain);
+    }
+
+    return domains.release();
+}
+
+static PyObject* domain_get_enabled(PyObject* self, void* Py_UNUSED(closure))
+{
+    Domain* obj = pyext::pyobject_cast<Domain>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", Domain::object_type.tp_name);
+    }
+
+    return PyBool_FromLong(domain_is_enabled(obj));
+}
+
+PyObject* domain_set_enabled(PyObject* Py_UNUSED(self), PyObject* args)
+{
+    PyObject* name = nullptr;
+    int enabled = 0;
+    if (!PyArg_ParseTuple(args, "Up", &name, &enabled))
+    {
+        return nullptr;
+    }
+
+    domain_state* state = get_domain_state(name);
+    if (state == nullptr)
+    {
+        return nullptr;
+    }
+
+    state->enabled.store(enabled != 0, std::memory_order_relaxed);
+
+    Py_RETURN_NONE;
+}
+
+PyObject* domain_set_allowlist(PyObject* Py_UNUSED(self), PyObject* names)
+{
+    std::optional<std::unordered_set<std::string>> allowlist;
+    if (names != Py_None)
+    {
+        pyext::pyobject_holder<PyObject> sequence = PySequence_Fast(names,
+            "The passed names is not a valid instance of sequence type.");
+        if (sequence == nullptr)
+        {
+            return nullptr;
+        }
+
+        allowlist.emplace();
+
+        Py_ssize_t count = PySequence_Fast_GET_SIZE(sequence.get());
+        for (Py_ssize_t i = 0; i < count; ++i)
+        {
+            PyObject* name = PySequence_Fast_GET_ITEM(sequence.get(), i);
+            if (!PyUnicode_Check(name))
+            {
+                return PyErr_Format(PyExc_TypeError,
+                    pyext::error::invalid_argument_type_tmpl, "name", PyUnicode_Type.tp_name);
+            }
+
+            Py_ssize_t size = 0;
+            const char* name_utf8 = PyUnicode_AsUTF8AndSize(name, &size);
+            if (name_utf8 == nullptr)
+            {
+                return nullptr;
+            }
+
+            allowlist->emplace(name_utf8, static_cast<std::size_t>(size));
+        }
+    }
+
+    domain_registry& registry = get_domain_registry();
+    registry.allowlist = std::move(allowlist);
+
+    for (auto& [name, state] : registry.states)
+    {
+        state->enabled.store(domain_is_allowed(registry, name), std::memory_order_relaxed);
+    }
+
+    Py_RETURN_NONE;
+}
+
 int exec_domain(PyObject* module)
 {
     return pyext::add_type(module, &Domain::object_type);
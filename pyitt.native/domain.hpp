@@ -3,17 +3,31 @@
 #define PY_SSIZE_T_CLEAN
 #include <Python.h>
 
+#include <atomic>
+
 #include <ittnotify.h>
 
+#include "name_registry.hpp"
+
+#include "extensions/python.hpp"
+
 
 namespace pyitt
 {
 
+struct domain_state
+{
+	std::atomic<bool> enabled;
+};
+
 struct Domain
 {
 	PyObject_HEAD
 	PyObject* name;
 	__itt_domain* handle;
+	domain_state* state;
+
+	std::uint32_t name_id;
 
 	static PyTypeObject object_type;
 };
@@ -28,6 +42,48 @@ inline PyObject* domain_get_name(const Domain* obj)
 	return obj ? obj->name : nullptr;
 }
 
+inline std::uint32_t domain_get_name_id(Domain* obj)
+{
+	if (obj && obj->name_id == 0)
+	{
+		obj->name_id = intern_name(obj->name);
+	}
+
+	return obj ? obj->name_id : 0;
+}
+
+/*
+ * Returns false if the domain is disabled by pyitt or by the collector, which clears the flags of the ITT domain. The
+ * decision is taken at the beginning of a region, and its end follows it.
+ */
+inline bool domain_is_enabled(const Domain* obj)
+{
+	return obj->state->enabled.load(std::memory_order_relaxed) && (obj->handle == nullptr || obj->handle->flags != 0);
+}
+
+/*
+ * Returns true if the domain argument, the first positional or the 'domain' keyword one, is a disabled domain, so the
+ * call can return before its arguments are parsed.
+ */
+inline bool domain_is_disabled_in_args(PyObject* args, PyObject* kwargs)
+{
+	PyObject* domain = nullptr;
+	if (PyTuple_GET_SIZE(args) > 0)
+	{
+		domain = PyTuple_GET_ITEM(args, 0);
+	}
+	else if (kwargs)
+	{
+		domain = PyDict_GetItemString(kwargs, "domain");
+	}
+
+	Domain* obj = pyext::pyobject_cast<Domain>(domain);
+	return obj && !domain_is_enabled(obj);
+}
+
+PyObject* domain_set_enabled(PyObject* self, PyObject* args);
+PyObject* domain_set_allowlist(PyObject* self, PyObject* names);
+
 int exec_domain(PyObject* module);
 
 } // namespace pyitt
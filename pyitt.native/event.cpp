@@ -2,6 +2,9 @@
 
 #include <structmember.h>
 
+#include "name_registry.hpp"
+#include "recorder.hpp"
+#include "stats.hpp"
 #include "string_handle.hpp"
 
 #include "extensions/error_template.hpp"
@@ -21,6 +24,8 @@ static PyObject* event_str(PyObject* self);
 static PyObject* event_begin(PyObject* self, PyObject* Py_UNUSED(args));
 static PyObject* event_end(PyObject* self, PyObject* Py_UNUSED(args));
 
+static std::uint32_t event_get_name_id(Event* obj);
+
 static PyMemberDef event_attrs[] =
 {
     {"name",  T_OBJECT_EX, offsetof(Event, name), READONLY, "a name of the event"},
@@ -132,6 +137,7 @@ static PyObject* event_new(PyTypeObject* type, PyObject* args, PyObject* kwargs)
 
     self->name = nullptr;
     self->handle = 0;
+    self->name_id = 0;
 
     char name_key[] = { "name" };
     char* kwlist[] = { name_key, nullptr };
@@ -216,6 +222,17 @@ static PyObject* event_begin(PyObject* self, PyObject* Py_UNUSED(args))
     }
 
     __itt_event_start(obj->handle);
+
+    if (recorder_is_enabled())
+    {
+        recorder_write(recorder_record_type::event_begin, event_get_name_id(obj), 0, 0);
+    }
+
+    if (stats_is_enabled())
+    {
+        stats_event_begin(event_get_name_id(obj));
+    }
+
     Py_RETURN_NONE;
 }
 
@@ -229,9 +246,30 @@ static PyObject* event_end(PyObject* self, PyObject* Py_UNUSED(args))
     }
 
     __itt_event_end(obj->handle);
+
+    if (recorder_is_enabled())
+    {
+        recorder_write(recorder_record_type::event_end, event_get_name_id(obj), 0, 0);
+    }
+
+    if (stats_is_enabled())
+    {
+        stats_event_end(event_get_name_id(obj));
+    }
+
     Py_RETURN_NONE;
 }
 
+static std::uint32_t event_get_name_id(Event* obj)
+{
+    if (obj->name_id == 0)
+    {
+        obj->name_id = intern_name(obj->name);
+    }
+
+    return obj->name_id;
+}
+
 int exec_event(PyObject* module)
 {
     return pyext::add_type(module, &Event::object_type);
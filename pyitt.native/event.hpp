@@ -5,6 +5,8 @@
 
 #include <ittnotify.h>
 
+#include <cstdint>
+
 
 namespace pyitt
 {
@@ -15,6 +17,8 @@ struct Event
 	PyObject* name;
 	__itt_event handle;
 
+	std::uint32_t name_id;
+
 	static PyTypeObject object_type;
 };
 
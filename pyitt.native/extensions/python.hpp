@@ -26,9 +26,29 @@ inline PyObject* pyobject_cast(PyObject* self)
 
 inline PyObject* new_ref(PyObject* obj);
 inline PyObject* xnew_ref(PyObject* obj);
+/* Returns true if the interpreter is being finalized, so a thread that does not hold the GIL must not acquire it. */
+inline bool is_finalizing();
 
 int add_type(PyObject* module, PyTypeObject* type);
 
+/*
+ * Parses the arguments of a function that takes keyword arguments. The calls with positional arguments only are parsed
+ * by the faster PyArg_ParseTuple().
+ */
+template<typename... Outputs>
+inline bool parse_arguments(PyObject* args, PyObject* kwargs, const char* format, char** kwlist, Outputs... outputs)
+{
+	return kwargs ? PyArg_ParseTupleAndKeywords(args, kwargs, format, kwlist, outputs...)
+		: PyArg_ParseTuple(args, format, outputs...);
+}
+
+/* Casts a function that takes keyword arguments to PyCFunction for the tables of methods with METH_KEYWORDS. */
+template<typename F>
+inline PyCFunction function_cast(F func)
+{
+	return reinterpret_cast<PyCFunction>(reinterpret_cast<void (*)()>(func));
+}
+
 /* Implementation of inline functions */
 PyObject* new_ref(PyObject* obj)
 {
@@ -50,6 +70,17 @@ PyObject* xnew_ref(PyObject* obj)
 #endif
 }
 
+bool is_finalizing()
+{
+#if defined(PYPY_VERSION)
+	return false;
+#elif PY_MAJOR_VERSION == 3 && PY_MINOR_VERSION < 13
+	return _Py_IsFinalizing();
+#else
+	return Py_IsFinalizing();
+#endif
+}
+
 template<typename T>
 class pyobject_holder
 {
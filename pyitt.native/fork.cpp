@@ -0,0 +1,71 @@
+#include "fork.hpp"
+
+#include "collection_control.hpp"
+#include "gauge.hpp"
+#include "recorder.hpp"
+#include "stats.hpp"
+
+#include "extensions/python.hpp"
+
+
+namespace pyitt
+{
+
+static PyMethodDef after_fork_in_child_method = {
+    "after_fork_in_child", after_fork_in_child, METH_NOARGS, "Reinitializes the native state in a child process."
+};
+
+/* Guarded by the GIL. */
+static bool is_after_fork_in_child_registered = false;
+
+PyObject* after_fork_in_child(PyObject* Py_UNUSED(self), PyObject* Py_UNUSED(args))
+{
+    collection_regions_after_fork_in_child();
+    collection_schedule_after_fork_in_child();
+    gauge_after_fork_in_child();
+    recorder_after_fork_in_child();
+    stats_after_fork_in_child();
+
+    Py_RETURN_NONE;
+}
+
+bool register_after_fork_in_child()
+{
+    if (is_after_fork_in_child_registered)
+    {
+        return true;
+    }
+
+    pyext::pyobject_holder<PyObject> os = PyImport_ImportModule("os");
+    if (os == nullptr)
+    {
+        return false;
+    }
+
+    /* os.register_at_fork() is not available on Windows, where the processes are never forked. */
+    if (!PyObject_HasAttrString(os.get(), "register_at_fork"))
+    {
+        is_after_fork_in_child_registered = true;
+        return true;
+    }
+
+    pyext::pyobject_holder<PyObject> register_at_fork = PyObject_GetAttrString(os.get(), "register_at_fork");
+    pyext::pyobject_holder<PyObject> callback = PyCFunction_New(&after_fork_in_child_method, nullptr);
+    pyext::pyobject_holder<PyObject> args = PyTuple_New(0);
+    pyext::pyobject_holder<PyObject> kwargs = Py_BuildValue("{sO}", "after_in_child", callback.get());
+    if (register_at_fork == nullptr || callback == nullptr || args == nullptr || kwargs == nullptr)
+    {
+        return false;
+    }
+
+    pyext::pyobject_holder<PyObject> result = PyObject_Call(register_at_fork.get(), args.get(), kwargs.get());
+    if (result == nullptr)
+    {
+        return false;
+    }
+
+    is_after_fork_in_child_registered = true;
+    return true;
+}
+
+} // namespace pyitt
@@ -0,0 +1,15 @@
+#pragma once
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+
+namespace pyitt
+{
+
+PyObject* after_fork_in_child(PyObject* self, PyObject* args);
+
+/* Registers after_fork_in_child() through os.register_at_fork() once, on the first use of the native state. */
+bool register_after_fork_in_child();
+
+} // namespace pyitt
@@ -1,9 +1,19 @@
 #include "frame.hpp"
 
+#include <bit>
+#include <cstddef>
+#include <cstdint>
+#include <map>
+#include <new>
+#include <tuple>
+#include <vector>
+
 #include <ittnotify.h>
 
 #include "domain.hpp"
 #include "id.hpp"
+#include "recorder.hpp"
+#include "stats.hpp"
 
 #include "extensions/error_template.hpp"
 #include "extensions/python.hpp"
@@ -11,12 +21,117 @@
 namespace pyitt
 {
 
-PyObject* frame_begin(PyObject* self, PyObject* args)
+/* The names of the keyword arguments. */
+static char domain_key[] = "domain";
+static char id_key[] = "id";
+static char begin_key[] = "begin";
+static char end_key[] = "end";
+static char begins_key[] = "begins";
+static char ends_key[] = "ends";
+
+static bool is_timestamp_buffer(const Py_buffer& buffer)
+{
+    const char* format = buffer.format ? buffer.format : "B";
+
+    constexpr bool is_little_endian = std::endian::native == std::endian::little;
+    if (*format == '@' || *format == '=' || (*format == '<' && is_little_endian) || (*format == '>' && !is_little_endian))
+    {
+        ++format;
+    }
+
+    if (format[0] == '\0' || format[1] != '\0' || buffer.itemsize != sizeof(__itt_timestamp))
+    {
+        return false;
+    }
+
+    switch (format[0])
+    {
+    case 'l':
+    case 'L':
+    case 'q':
+    case 'Q':
+    case 'n':
+    case 'N':
+        return true;
+    default:
+        return false;
+    }
+}
+
+static bool get_timestamp_buffer(PyObject* obj, const char* name, Py_buffer& buffer)
+{
+    if (PyObject_GetBuffer(obj, &buffer, PyBUF_FORMAT | PyBUF_C_CONTIGUOUS) < 0)
+    {
+        return false;
+    }
+
+    if (!is_timestamp_buffer(buffer))
+    {
+        PyErr_Format(PyExc_TypeError, "The passed %s have an unsupported format '%s', 64-bit integers are expected.",
+            name, buffer.format ? buffer.format : "B");
+        PyBuffer_Release(&buffer);
+        return false;
+    }
+
+    return true;
+}
+
+/*
+ * The frames that have begun on the thread and have not ended yet, i.e. whether their beginnings are reported. The
+ * frames are tracked by their domain and their id, since the frames with different ids can overlap.
+ */
+using frame_key = std::tuple<const domain_state*, unsigned long long, unsigned long long>;
+static thread_local std::map<frame_key, std::vector<bool>> thread_frames;
+
+static frame_key get_frame_key(const Domain* domain_obj, const __itt_id* id)
+{
+    return { domain_obj->state, id ? id->d1 : 0, id ? id->d2 : 0 };
+}
+
+static bool push_frame(const Domain* domain_obj, const __itt_id* id, bool is_reported)
+{
+    try
+    {
+        thread_frames[get_frame_key(domain_obj, id)].push_back(is_reported);
+    }
+    catch (const std::bad_alloc&)
+    {
+        PyErr_NoMemory();
+        return false;
+    }
+
+    return true;
+}
+
+/*
+ * Returns true if the beginning of the frame is reported, so its end is reported too. The frames that have begun on
+ * other threads are reported if the domain is enabled.
+ */
+static bool pop_frame(const Domain* domain_obj, const __itt_id* id)
+{
+    auto it = thread_frames.find(get_frame_key(domain_obj, id));
+    if (it == thread_frames.end())
+    {
+        return domain_is_enabled(domain_obj);
+    }
+
+    const bool is_reported = it->second.back();
+    it->second.pop_back();
+    if (it->second.empty())
+    {
+        thread_frames.erase(it);
+    }
+
+    return is_reported;
+}
+
+PyObject* frame_begin(PyObject* self, PyObject* args, PyObject* kwargs)
 {
     PyObject* domain = nullptr;
     PyObject* frame_id = nullptr;
 
-    if (!PyArg_ParseTuple(args, "O|O", &domain, &frame_id))
+    static char* kwlist[] = { domain_key, id_key, nullptr };
+    if (!pyext::parse_arguments(args, kwargs, "O|O", kwlist, &domain, &frame_id))
     {
         return nullptr;
     }
@@ -41,18 +156,40 @@ PyObject* frame_begin(PyObject* self, PyObject* args)
         id = &(id_get_handle(frame_id_obj));
     }
 
+    /* The frame of a disabled domain is tracked too, so its end does not end another frame. */
+    const bool is_reported = domain_is_enabled(domain_obj);
+    if (!push_frame(domain_obj, id, is_reported))
+    {
+        return nullptr;
+    }
+
+    if (!is_reported)
+    {
+        Py_RETURN_NONE;
+    }
+
     __itt_frame_begin_v3(domain_obj->handle, const_cast<__itt_id*>(id));
 
+    if (recorder_is_enabled())
+    {
+        recorder_write(recorder_record_type::frame_begin, 0, domain_get_name_id(domain_obj), id ? id->d1 : 0);
+    }
+
+    if (stats_is_enabled())
+    {
+        stats_frame_begin(domain_get_name_id(domain_obj), id ? id->d1 : 0);
+    }
+
     Py_RETURN_NONE;
 }
 
-PyObject* frame_end(PyObject* self, PyObject* args)
+PyObject* frame_end(PyObject* self, PyObject* args, PyObject* kwargs)
 {
-
     PyObject* domain = nullptr;
     PyObject* frame_id = nullptr;
 
-    if (!PyArg_ParseTuple(args, "O|O", &domain, &frame_id))
+    static char* kwlist[] = { domain_key, id_key, nullptr };
+    if (!pyext::parse_arguments(args, kwargs, "O|O", kwlist, &domain, &frame_id))
     {
         return nullptr;
     }
@@ -77,9 +214,152 @@ PyObject* frame_end(PyObject* self, PyObject* args)
         id = &(id_get_handle(frame_id_obj));
     }
 
+    if (!pop_frame(domain_obj, id))
+    {
+        Py_RETURN_NONE;
+    }
+
     __itt_frame_end_v3(domain_obj->handle, const_cast<__itt_id*>(id));
 
+    if (recorder_is_enabled())
+    {
+        recorder_write(recorder_record_type::frame_end, 0, domain_get_name_id(domain_obj), id ? id->d1 : 0);
+    }
+
+    if (stats_is_enabled())
+    {
+        stats_frame_end(domain_get_name_id(domain_obj), id ? id->d1 : 0);
+    }
+
     Py_RETURN_NONE;
 }
 
+PyObject* frame_submit(PyObject* self, PyObject* args, PyObject* kwargs)
+{
+    if (domain_is_disabled_in_args(args, kwargs))
+    {
+        Py_RETURN_NONE;
+    }
+
+    PyObject* domain = nullptr;
+    unsigned long long begin = 0;
+    unsigned long long end = 0;
+    PyObject* frame_id = nullptr;
+
+    static char* kwlist[] = { domain_key, begin_key, end_key, id_key, nullptr };
+    if (!pyext::parse_arguments(args, kwargs, "OKK|O", kwlist, &domain, &begin, &end, &frame_id))
+    {
+        return nullptr;
+    }
+
+    Domain* domain_obj = pyext::pyobject_cast<Domain>(domain);
+    if (domain_obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "domain", Domain::object_type.tp_name);
+    }
+
+    const __itt_id* id = nullptr;
+    if (frame_id && frame_id != Py_None)
+    {
+        Id* frame_id_obj = pyext::pyobject_cast<Id>(frame_id);
+        if (frame_id_obj == nullptr)
+        {
+            return PyErr_Format(PyExc_TypeError,
+                pyext::error::invalid_argument_type_tmpl, "id", Id::object_type.tp_name);
+        }
+
+        id = &(id_get_handle(frame_id_obj));
+    }
+
+    if (end < begin)
+    {
+        return PyErr_Format(PyExc_ValueError, "The passed end timestamp is less than the begin timestamp.");
+    }
+
+    __itt_frame_submit_v3(domain_obj->handle, const_cast<__itt_id*>(id), begin, end);
+
+    Py_RETURN_NONE;
+}
+
+PyObject* frame_submit_many(PyObject* self, PyObject* args, PyObject* kwargs)
+{
+    if (domain_is_disabled_in_args(args, kwargs))
+    {
+        return PyLong_FromSsize_t(0);
+    }
+
+    PyObject* domain = nullptr;
+    PyObject* begins = nullptr;
+    PyObject* ends = nullptr;
+
+    static char* kwlist[] = { domain_key, begins_key, ends_key, nullptr };
+    if (!pyext::parse_arguments(args, kwargs, "OOO", kwlist, &domain, &begins, &ends))
+    {
+        return nullptr;
+    }
+
+    Domain* domain_obj = pyext::pyobject_cast<Domain>(domain);
+    if (domain_obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "domain", Domain::object_type.tp_name);
+    }
+
+    Py_buffer begins_buffer;
+    if (!get_timestamp_buffer(begins, "begins", begins_buffer))
+    {
+        return nullptr;
+    }
+
+    Py_buffer ends_buffer;
+    if (!get_timestamp_buffer(ends, "ends", ends_buffer))
+    {
+        PyBuffer_Release(&begins_buffer);
+        return nullptr;
+    }
+
+    const Py_ssize_t count = begins_buffer.len / begins_buffer.itemsize;
+    if (count != ends_buffer.len / ends_buffer.itemsize)
+    {
+        PyBuffer_Release(&ends_buffer);
+        PyBuffer_Release(&begins_buffer);
+        return PyErr_Format(PyExc_ValueError, "The passed begins and ends have different lengths.");
+    }
+
+    const __itt_timestamp* begin_values = static_cast<const __itt_timestamp*>(begins_buffer.buf);
+    const __itt_timestamp* end_values = static_cast<const __itt_timestamp*>(ends_buffer.buf);
+
+    for (Py_ssize_t i = 0; i < count; ++i)
+    {
+        if (end_values[i] < begin_values[i])
+        {
+            PyBuffer_Release(&ends_buffer);
+            PyBuffer_Release(&begins_buffer);
+            return PyErr_Format(PyExc_ValueError,
+                "The end timestamp is less than the begin timestamp for the frame %zd.", i);
+        }
+    }
+
+    /* The buffers are held until the end of the call, so the frames are submitted without holding the GIL. */
+    const __itt_domain* domain_handle = domain_obj->handle;
+
+    Py_BEGIN_ALLOW_THREADS
+    for (Py_ssize_t i = 0; i < count; ++i)
+    {
+        __itt_frame_submit_v3(domain_handle, nullptr, begin_values[i], end_values[i]);
+    }
+    Py_END_ALLOW_THREADS
+
+    PyBuffer_Release(&ends_buffer);
+    PyBuffer_Release(&begins_buffer);
+
+    return PyLong_FromSsize_t(count);
+}
+
+PyObject* get_timestamp(PyObject* self, PyObject* Py_UNUSED(args))
+{
+    return PyLong_FromUnsignedLongLong(__itt_get_timestamp());
+}
+
 } // namespace pyitt
@@ -7,7 +7,11 @@
 namespace pyitt
 {
 
-PyObject* frame_begin(PyObject* self, PyObject* args);
-PyObject* frame_end(PyObject* self, PyObject* args);
+PyObject* frame_begin(PyObject* self, PyObject* args, PyObject* kwargs);
+PyObject* frame_end(PyObject* self, PyObject* args, PyObject* kwargs);
+PyObject* frame_submit(PyObject* self, PyObject* args, PyObject* kwargs);
+PyObject* frame_submit_many(PyObject* self, PyObject* args, PyObject* kwargs);
+
+PyObject* get_timestamp(PyObject* self, PyObject* args);
 
 } // namespace pyitt
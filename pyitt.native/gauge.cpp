@@ -0,0 +1,415 @@
+#include "gauge.hpp"
+
+#include <algorithm>
+#include <chrono>
+#include <condition_variable>
+#include <cstdint>
+#include <cstdio>
+#include <cstring>
+#include <iterator>
+#include <mutex>
+#include <new>
+#include <system_error>
+#include <thread>
+#include <vector>
+
+#if defined(__linux__)
+#include <dirent.h>
+#include <unistd.h>
+#endif
+
+#include <ittnotify.h>
+
+#include "counter.hpp"
+#include "fork.hpp"
+
+#include "extensions/error_template.hpp"
+#include "extensions/python.hpp"
+
+
+namespace pyitt
+{
+
+enum class gauge_source
+{
+    rss = 0,
+    threads = 1,
+    fds = 2,
+    context_switches = 3,
+};
+
+static const char* const gauge_source_names[] = { "rss", "threads", "fds", "context_switches" };
+
+#if defined(__linux__)
+
+static bool gauge_read_rss(unsigned long long& value)
+{
+    std::FILE* file = std::fopen("/proc/self/statm", "r");
+    if (file == nullptr)
+    {
+        return false;
+    }
+
+    unsigned long long size = 0;
+    unsigned long long resident = 0;
+    const bool is_read = std::fscanf(file, "%llu %llu", &size, &resident) == 2;
+    std::fclose(file);
+
+    value = resident * static_cast<unsigned long long>(sysconf(_SC_PAGESIZE));
+    return is_read;
+}
+
+static bool gauge_read_status(gauge_source source, unsigned long long& value)
+{
+    std::FILE* file = std::fopen("/proc/self/status", "r");
+    if (file == nullptr)
+    {
+        return false;
+    }
+
+    bool is_read = false;
+    value = 0;
+
+    char line[256];
+    while (std::fgets(line, sizeof(line), file))
+    {
+        unsigned long long field_value = 0;
+        if (source == gauge_source::threads
+            ? std::sscanf(line, "Threads: %llu", &field_value) == 1
+            : std::sscanf(line, "voluntary_ctxt_switches: %llu", &field_value) == 1
+              || std::sscanf(line, "nonvoluntary_ctxt_switches: %llu", &field_value) == 1)
+        {
+            value += field_value;
+            is_read = true;
+        }
+    }
+
+    std::fclose(file);
+    return is_read;
+}
+
+static bool gauge_read_fds(unsigned long long& value)
+{
+    DIR* directory = opendir("/proc/self/fd");
+    if (directory == nullptr)
+    {
+        return false;
+    }
+
+    value = 0;
+    while (dirent* entry = readdir(directory))
+    {
+        if (std::strcmp(entry->d_name, ".") != 0 && std::strcmp(entry->d_name, "..") != 0)
+        {
+            ++value;
+        }
+    }
+
+    closedir(directory);
+
+    /* The descriptor of the open directory is not counted. */
+    value = value > 0 ? value - 1 : 0;
+    return true;
+}
+
+static bool gauge_read_source(gauge_source source, unsigned long long& value)
+{
+    switch (source)
+    {
+    case gauge_source::rss:
+        return gauge_read_rss(value);
+    case gauge_source::threads:
+    case gauge_source::context_switches:
+        return gauge_read_status(source, value);
+    case gauge_source::fds:
+        return gauge_read_fds(value);
+    }
+
+    return false;
+}
+
+#endif
+
+static bool gauge_get_source(PyObject* name, gauge_source& source)
+{
+    std::size_t index = 0;
+    while (index < std::size(gauge_source_names)
+           && PyUnicode_CompareWithASCIIString(name, gauge_source_names[index]) != 0)
+    {
+        ++index;
+    }
+
+    if (index == std::size(gauge_source_names))
+    {
+        PyErr_Format(PyExc_ValueError, "Unknown gauge source: %R.", name);
+        return false;
+    }
+
+    source = static_cast<gauge_source>(index);
+
+#if defined(__linux__)
+    return true;
+#else
+    PyErr_SetString(PyExc_NotImplementedError, "The built-in gauge sources are supported only on Linux.");
+    return false;
+#endif
+}
+
+/*
+ The built-in sources are sampled by a native thread that never takes the GIL, so the samples are taken in time even if
+ the GIL is held by other threads for a long time. The counters are referenced by the entries, so their handles stay
+ valid until the entries are removed, and the entries are changed only with the lock held.
+ */
+struct gauge_entry
+{
+    std::uint64_t id;
+    gauge_source source;
+    __itt_counter handle;
+    PyObject* counter;
+    std::chrono::milliseconds interval;
+    std::chrono::steady_clock::time_point next_sample;
+};
+
+struct gauge_state
+{
+    std::mutex lock;
+    std::condition_variable condition;
+    bool stop_requested = false;
+    std::uint64_t last_id = 0;
+    std::vector<gauge_entry> entries;
+    std::thread thread;
+};
+
+/* The pointer is accessed only with the GIL held, the sampling thread uses only the state passed to it. */
+static gauge_state* gauges_state = nullptr;
+
+static void gauge_run(gauge_state* state)
+{
+    std::unique_lock<std::mutex> guard(state->lock);
+    while (!state->stop_requested)
+    {
+        const auto now = std::chrono::steady_clock::now();
+        auto next_sample = std::chrono::steady_clock::time_point::max();
+
+        for (gauge_entry& entry : state->entries)
+        {
+            if (entry.next_sample <= now)
+            {
+#if defined(__linux__)
+                unsigned long long value = 0;
+                if (gauge_read_source(entry.source, value))
+                {
+                    __itt_counter_set_value(entry.handle, &value);
+                }
+#endif
+                entry.next_sample = now + entry.interval;
+            }
+
+            next_sample = std::min(next_sample, entry.next_sample);
+        }
+
+        if (next_sample == std::chrono::steady_clock::time_point::max())
+        {
+            state->condition.wait(guard);
+        }
+        else
+        {
+            state->condition.wait_until(guard, next_sample);
+        }
+    }
+}
+
+static void gauge_release(gauge_state* state)
+{
+    if (state == nullptr)
+    {
+        return;
+    }
+
+    {
+        std::lock_guard<std::mutex> guard(state->lock);
+        state->stop_requested = true;
+    }
+    state->condition.notify_all();
+
+    state->thread.join();
+
+    for (gauge_entry& entry : state->entries)
+    {
+        Py_XDECREF(entry.counter);
+    }
+
+    delete state;
+}
+
+static gauge_state* gauge_get_state()
+{
+    if (gauges_state)
+    {
+        return gauges_state;
+    }
+
+    gauge_state* state = new (std::nothrow) gauge_state();
+    if (state == nullptr)
+    {
+        PyErr_NoMemory();
+        return nullptr;
+    }
+
+    try
+    {
+        state->thread = std::thread(gauge_run, state);
+    }
+    catch (const std::system_error& error)
+    {
+        delete state;
+        PyErr_Format(PyExc_RuntimeError, "The sampling thread of the gauges cannot be started: %s", error.what());
+        return nullptr;
+    }
+
+    gauges_state = state;
+    return state;
+}
+
+PyObject* gauge_source_start(PyObject* Py_UNUSED(self), PyObject* args)
+{
+    PyObject* source_name = nullptr;
+    PyObject* counter = nullptr;
+    unsigned long interval_ms = 0;
+
+    if (!PyArg_ParseTuple(args, "UOk", &source_name, &counter, &interval_ms))
+    {
+        return nullptr;
+    }
+
+    gauge_source source = gauge_source::rss;
+    if (!gauge_get_source(source_name, source))
+    {
+        return nullptr;
+    }
+
+    Counter* counter_obj = pyext::pyobject_cast<Counter>(counter);
+    if (counter_obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "counter", Counter::object_type.tp_name);
+    }
+
+    if (interval_ms == 0)
+    {
+        return PyErr_Format(PyExc_ValueError, "The sampling interval must be greater than zero.");
+    }
+
+    if (!register_after_fork_in_child())
+    {
+        return nullptr;
+    }
+
+    gauge_state* state = gauge_get_state();
+    if (state == nullptr)
+    {
+        return nullptr;
+    }
+
+    std::uint64_t id = 0;
+    {
+        std::lock_guard<std::mutex> guard(state->lock);
+        try
+        {
+            state->entries.push_back({ state->last_id + 1,
+                                       source,
+                                       counter_get_handle(counter_obj),
+                                       counter,
+                                       std::chrono::milliseconds(interval_ms),
+                                       std::chrono::steady_clock::now() });
+        }
+        catch (const std::bad_alloc&)
+        {
+            return PyErr_NoMemory();
+        }
+
+        id = ++state->last_id;
+        Py_INCREF(counter);
+    }
+    state->condition.notify_all();
+
+    return PyLong_FromUnsignedLongLong(id);
+}
+
+PyObject* gauge_source_stop(PyObject* Py_UNUSED(self), PyObject* args)
+{
+    unsigned long long id = 0;
+    if (!PyArg_ParseTuple(args, "K", &id))
+    {
+        return nullptr;
+    }
+
+    gauge_state* state = gauges_state;
+    if (state == nullptr)
+    {
+        Py_RETURN_NONE;
+    }
+
+    PyObject* counter = nullptr;
+    {
+        std::lock_guard<std::mutex> guard(state->lock);
+        auto entry = std::find_if(state->entries.begin(), state->entries.end(),
+                                  [id](const gauge_entry& e) { return e.id == id; });
+        if (entry != state->entries.end())
+        {
+            counter = entry->counter;
+            state->entries.erase(entry);
+        }
+    }
+
+    Py_XDECREF(counter);
+    Py_RETURN_NONE;
+}
+
+PyObject* gauge_source_sample(PyObject* Py_UNUSED(self), PyObject* source_name)
+{
+    if (!PyUnicode_Check(source_name))
+    {
+        return PyErr_Format(PyExc_TypeError, pyext::error::invalid_argument_type_tmpl, "source", "str");
+    }
+
+    gauge_source source = gauge_source::rss;
+    if (!gauge_get_source(source_name, source))
+    {
+        return nullptr;
+    }
+
+#if defined(__linux__)
+    unsigned long long value = 0;
+    bool is_read = false;
+
+    Py_BEGIN_ALLOW_THREADS;
+    is_read = gauge_read_source(source, value);
+    Py_END_ALLOW_THREADS;
+
+    if (is_read)
+    {
+        return PyLong_FromUnsignedLongLong(value);
+    }
+#endif
+
+    Py_RETURN_NONE;
+}
+
+void gauge_shutdown()
+{
+    gauge_state* state = gauges_state;
+    gauges_state = nullptr;
+    gauge_release(state);
+}
+
+void gauge_after_fork_in_child()
+{
+    /*
+     The sampling thread does not exist in the child process and the mutex of the state could be locked by this thread
+     at the moment of fork, so the state of the parent process is leaked intentionally.
+     */
+    gauges_state = nullptr;
+}
+
+} // namespace pyitt
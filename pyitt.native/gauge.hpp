@@ -0,0 +1,19 @@
+#pragma once
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+
+namespace pyitt
+{
+
+PyObject* gauge_source_start(PyObject* self, PyObject* args);
+PyObject* gauge_source_stop(PyObject* self, PyObject* args);
+PyObject* gauge_source_sample(PyObject* self, PyObject* source);
+
+/* Stops the sampling thread of the built-in gauge sources, e.g. before the module is released. */
+void gauge_shutdown();
+/* Discards the gauges of the parent process in a child process. */
+void gauge_after_fork_in_child();
+
+} // namespace pyitt
@@ -0,0 +1,378 @@
+#include "heap.hpp"
+
+#include <array>
+#include <atomic>
+#include <cstddef>
+#include <cstdint>
+#include <mutex>
+#include <new>
+#include <unordered_set>
+
+#include <ittnotify.h>
+
+
+namespace pyitt
+{
+
+/*
+ The set of the reported blocks, so the release is reported only for them. The set is sharded by the address of the
+ block, since the allocators of the raw domain are called without the GIL.
+ */
+class heap_block_set
+{
+public:
+    bool insert(void* ptr);
+    bool erase(void* ptr);
+    void clear();
+
+private:
+    struct shard
+    {
+        std::mutex lock;
+        std::unordered_set<void*> blocks;
+    };
+
+    static constexpr std::size_t shard_count = 64;
+
+    shard& get_shard(void* ptr);
+
+    std::atomic<std::size_t> m_size = 0;
+    std::array<shard, shard_count> m_shards;
+};
+
+/*
+ The hook wraps the allocator of a Python memory domain and reports the sampled allocations through ITT Heap API.
+ The hook states are never destroyed, so the calls that are in flight on other threads remain valid after the original
+ allocator is restored. If the hook cannot be removed, because another hook has been installed on top of it, the hook
+ stays installed and only forwards the calls.
+ */
+struct heap_hook
+{
+    PyMemAllocatorDomain domain;
+    const char* function_name;
+#if defined(_WIN32)
+    const wchar_t* function_name_w;
+#endif
+
+    PyMemAllocatorEx original_allocator;
+    __itt_heap_function function;
+    bool is_installed;
+    heap_block_set* blocks;
+
+    std::atomic<bool> is_sampling;
+    std::atomic<std::size_t> min_size;
+    std::atomic<std::size_t> sample_every;
+};
+
+#if defined(_WIN32)
+#define PYITT_HEAP_HOOK(domain, name) { domain, name, L##name, {}, nullptr, false, nullptr, false, 0, 1 }
+#else
+#define PYITT_HEAP_HOOK(domain, name) { domain, name, {}, nullptr, false, nullptr, false, 0, 1 }
+#endif
+
+static heap_hook heap_hooks[] =
+{
+    PYITT_HEAP_HOOK(PYMEM_DOMAIN_RAW, "PyMem_RawMalloc"),
+    PYITT_HEAP_HOOK(PYMEM_DOMAIN_MEM, "PyMem_Malloc"),
+    PYITT_HEAP_HOOK(PYMEM_DOMAIN_OBJ, "PyObject_Malloc"),
+};
+
+#undef PYITT_HEAP_HOOK
+
+static thread_local std::size_t heap_allocation_number = 0;
+
+heap_block_set::shard& heap_block_set::get_shard(void* ptr)
+{
+    /* The low bits of the addresses are the same because of the alignment. */
+    return m_shards[(reinterpret_cast<std::uintptr_t>(ptr) >> 4) % shard_count];
+}
+
+bool heap_block_set::insert(void* ptr)
+{
+    shard& block_shard = get_shard(ptr);
+    std::lock_guard<std::mutex> guard(block_shard.lock);
+
+    try
+    {
+        if (block_shard.blocks.insert(ptr).second)
+        {
+            m_size.fetch_add(1, std::memory_order_relaxed);
+        }
+    }
+    catch (const std::bad_alloc&)
+    {
+        return false;
+    }
+
+    return true;
+}
+
+bool heap_block_set::erase(void* ptr)
+{
+    /* Most of the released blocks have not been reported, so the lookup is skipped if there are no reported blocks. */
+    if (ptr == nullptr || m_size.load(std::memory_order_relaxed) == 0)
+    {
+        return false;
+    }
+
+    shard& block_shard = get_shard(ptr);
+    std::lock_guard<std::mutex> guard(block_shard.lock);
+
+    if (block_shard.blocks.erase(ptr) == 0)
+    {
+        return false;
+    }
+
+    m_size.fetch_sub(1, std::memory_order_relaxed);
+    return true;
+}
+
+void heap_block_set::clear()
+{
+    for (shard& block_shard : m_shards)
+    {
+        std::lock_guard<std::mutex> guard(block_shard.lock);
+
+        m_size.fetch_sub(block_shard.blocks.size(), std::memory_order_relaxed);
+        block_shard.blocks.clear();
+    }
+}
+
+static bool heap_is_sampled(const heap_hook* hook, std::size_t size)
+{
+    if (!hook->is_sampling.load(std::memory_order_relaxed) || size < hook->min_size.load(std::memory_order_relaxed))
+    {
+        return false;
+    }
+
+    const std::size_t sample_every = hook->sample_every.load(std::memory_order_relaxed);
+    return sample_every <= 1 || ++heap_allocation_number % sample_every == 0;
+}
+
+static void* heap_malloc(void* ctx, std::size_t size)
+{
+    heap_hook* hook = static_cast<heap_hook*>(ctx);
+    PyMemAllocatorEx& allocator = hook->original_allocator;
+
+    if (!heap_is_sampled(hook, size))
+    {
+        return allocator.malloc(allocator.ctx, size);
+    }
+
+    __itt_heap_allocate_begin(hook->function, size, 0);
+    void* ptr = allocator.malloc(allocator.ctx, size);
+    __itt_heap_allocate_end(hook->function, &ptr, size, 0);
+
+    if (ptr)
+    {
+        hook->blocks->insert(ptr);
+    }
+
+    return ptr;
+}
+
+static void* heap_calloc(void* ctx, std::size_t nelem, std::size_t elsize)
+{
+    heap_hook* hook = static_cast<heap_hook*>(ctx);
+    PyMemAllocatorEx& allocator = hook->original_allocator;
+
+    const std::size_t size = nelem * elsize;
+    if (!heap_is_sampled(hook, size))
+    {
+        return allocator.calloc(allocator.ctx, nelem, elsize);
+    }
+
+    __itt_heap_allocate_begin(hook->function, size, 1);
+    void* ptr = allocator.calloc(allocator.ctx, nelem, elsize);
+    __itt_heap_allocate_end(hook->function, &ptr, size, 1);
+
+    if (ptr)
+    {
+        hook->blocks->insert(ptr);
+    }
+
+    return ptr;
+}
+
+static void* heap_realloc(void* ctx, void* ptr, std::size_t new_size)
+{
+    heap_hook* hook = static_cast<heap_hook*>(ctx);
+    PyMemAllocatorEx& allocator = hook->original_allocator;
+
+    /* The reallocation of a reported block is always reported, so the release of the new block is reported too. */
+    const bool is_reported = hook->blocks->erase(ptr);
+    if (!is_reported && !heap_is_sampled(hook, new_size))
+    {
+        return allocator.realloc(allocator.ctx, ptr, new_size);
+    }
+
+    void* new_ptr = nullptr;
+    if (is_reported)
+    {
+        __itt_heap_reallocate_begin(hook->function, ptr, new_size, 0);
+        new_ptr = allocator.realloc(allocator.ctx, ptr, new_size);
+        __itt_heap_reallocate_end(hook->function, ptr, &new_ptr, new_size, 0);
+    }
+    else
+    {
+        /* The old block has not been reported, so the new block is reported as a new allocation. */
+        __itt_heap_allocate_begin(hook->function, new_size, 0);
+        new_ptr = allocator.realloc(allocator.ctx, ptr, new_size);
+        __itt_heap_allocate_end(hook->function, &new_ptr, new_size, 0);
+    }
+
+    if (new_ptr)
+    {
+        hook->blocks->insert(new_ptr);
+    }
+    else if (is_reported)
+    {
+        /* The old block is kept if the reallocation fails. */
+        hook->blocks->insert(ptr);
+    }
+
+    return new_ptr;
+}
+
+static void heap_free(void* ctx, void* ptr)
+{
+    heap_hook* hook = static_cast<heap_hook*>(ctx);
+    PyMemAllocatorEx& allocator = hook->original_allocator;
+
+    if (!hook->blocks->erase(ptr))
+    {
+        allocator.free(allocator.ctx, ptr);
+        return;
+    }
+
+    __itt_heap_free_begin(hook->function, ptr);
+    allocator.free(allocator.ctx, ptr);
+    __itt_heap_free_end(hook->function, ptr);
+}
+
+static heap_hook* get_heap_hook(PyObject* args, Py_ssize_t* min_size = nullptr, Py_ssize_t* sample_every = nullptr)
+{
+    int domain = 0;
+
+    if (min_size == nullptr)
+    {
+        if (!PyArg_ParseTuple(args, "i", &domain))
+        {
+            return nullptr;
+        }
+    }
+    else if (!PyArg_ParseTuple(args, "i|nn", &domain, min_size, sample_every))
+    {
+        return nullptr;
+    }
+
+    for (heap_hook& hook : heap_hooks)
+    {
+        if (hook.domain == domain)
+        {
+            return &hook;
+        }
+    }
+
+    PyErr_Format(PyExc_ValueError, "The passed allocator domain %d is not a valid allocator domain.", domain);
+    return nullptr;
+}
+
+PyObject* heap_tracking_enable(PyObject* Py_UNUSED(self), PyObject* args)
+{
+    Py_ssize_t min_size = 0;
+    Py_ssize_t sample_every = 1;
+
+    heap_hook* hook = get_heap_hook(args, &min_size, &sample_every);
+    if (hook == nullptr)
+    {
+        return nullptr;
+    }
+
+    if (min_size < 0)
+    {
+        return PyErr_Format(PyExc_ValueError, "The passed min_size must be a non-negative number.");
+    }
+
+    if (sample_every <= 0)
+    {
+        return PyErr_Format(PyExc_ValueError, "The passed sample_every must be a positive number.");
+    }
+
+    hook->min_size.store(static_cast<std::size_t>(min_size), std::memory_order_relaxed);
+    hook->sample_every.store(static_cast<std::size_t>(sample_every), std::memory_order_relaxed);
+
+    if (hook->is_installed)
+    {
+        hook->is_sampling.store(true, std::memory_order_relaxed);
+        Py_RETURN_NONE;
+    }
+
+    if (hook->blocks == nullptr)
+    {
+        hook->blocks = new (std::nothrow) heap_block_set();
+        if (hook->blocks == nullptr)
+        {
+            return PyErr_NoMemory();
+        }
+    }
+
+    if (hook->function == nullptr)
+    {
+#if defined(_WIN32)
+        hook->function = __itt_heap_function_createW(hook->function_name_w, L"pyitt");
+#else
+        hook->function = __itt_heap_function_create(hook->function_name, "pyitt");
+#endif
+    }
+
+    /* The hook wraps the current allocator, so the blocks that have been allocated before are freed correctly. */
+    PyMem_GetAllocator(hook->domain, &hook->original_allocator);
+
+    PyMemAllocatorEx allocator = { hook, heap_malloc, heap_calloc, heap_realloc, heap_free };
+    PyMem_SetAllocator(hook->domain, &allocator);
+
+    hook->is_installed = true;
+    hook->is_sampling.store(true, std::memory_order_relaxed);
+
+    Py_RETURN_NONE;
+}
+
+PyObject* heap_tracking_disable(PyObject* Py_UNUSED(self), PyObject* args)
+{
+    heap_hook* hook = get_heap_hook(args);
+    if (hook == nullptr)
+    {
+        return nullptr;
+    }
+
+    hook->is_sampling.store(false, std::memory_order_relaxed);
+
+    /* Another hook (e.g. tracemalloc) can be installed on top of ours, restoring the original would remove it. */
+    PyMemAllocatorEx current_allocator;
+    PyMem_GetAllocator(hook->domain, &current_allocator);
+
+    if (hook->is_installed && current_allocator.ctx == hook && current_allocator.free == heap_free)
+    {
+        PyMem_SetAllocator(hook->domain, &hook->original_allocator);
+        hook->is_installed = false;
+
+        /* The release of the blocks is not seen anymore, and their addresses can be reused by the new blocks. */
+        hook->blocks->clear();
+    }
+
+    Py_RETURN_NONE;
+}
+
+PyObject* heap_tracking_is_active(PyObject* Py_UNUSED(self), PyObject* args)
+{
+    heap_hook* hook = get_heap_hook(args);
+    if (hook == nullptr)
+    {
+        return nullptr;
+    }
+
+    return PyBool_FromLong(hook->is_sampling.load(std::memory_order_relaxed));
+}
+
+} // namespace pyitt
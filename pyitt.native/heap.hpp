@@ -0,0 +1,14 @@
+#pragma once
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+
+namespace pyitt
+{
+
+PyObject* heap_tracking_enable(PyObject* self, PyObject* args);
+PyObject* heap_tracking_disable(PyObject* self, PyObject* args);
+PyObject* heap_tracking_is_active(PyObject* self, PyObject* args);
+
+} // namespace pyitt
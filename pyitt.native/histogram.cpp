@@ -0,0 +1,602 @@
+#include "histogram.hpp"
+
+#include <structmember.h>
+
+#include <cstdint>
+#include <limits>
+#include <map>
+#include <mutex>
+#include <new>
+#include <utility>
+#include <vector>
+
+#include "domain.hpp"
+#include "metadata.hpp"
+#include "string_handle.hpp"
+
+#include "extensions/error_template.hpp"
+#include "extensions/python.hpp"
+#include "extensions/string.hpp"
+
+
+namespace pyitt
+{
+
+/*
+ The accumulator counts the recorded values and submits the distribution of the values, i.e. the values as x data and
+ their counts as y data, when the number of recorded values reaches the batch size.
+ */
+struct histogram_accumulator
+{
+    std::mutex lock;
+    std::map<long long, unsigned long long> signed_counts;
+    std::map<unsigned long long, unsigned long long> unsigned_counts;
+    std::map<double, unsigned long long> float_counts;
+    Py_ssize_t pending = 0;
+};
+
+static PyObject* histogram_new(PyTypeObject* type, PyObject* args, PyObject* kwargs);
+static void histogram_dealloc(PyObject* self);
+
+static PyObject* histogram_repr(PyObject* self);
+static PyObject* histogram_str(PyObject* self);
+
+static PyObject* histogram_submit(PyObject* self, PyObject* args);
+static PyObject* histogram_record(PyObject* self, PyObject* value);
+static PyObject* histogram_flush(PyObject* self, PyObject* Py_UNUSED(args));
+
+static Py_ssize_t histogram_flush_internal(Histogram* self);
+/* Submits the accumulated counts, the accumulator must be locked. */
+static Py_ssize_t submit_accumulated_counts(Histogram* self);
+
+static PyMemberDef histogram_attrs[] =
+{
+    {"name",       T_OBJECT_EX, offsetof(Histogram, name),       READONLY, "a name of the histogram"},
+    {"domain",     T_OBJECT_EX, offsetof(Histogram, domain),     READONLY, "a domain of the histogram"},
+    {"x_type",     T_INT,       offsetof(Histogram, x_type),     READONLY, "a type of x values"},
+    {"y_type",     T_INT,       offsetof(Histogram, y_type),     READONLY, "a type of y values"},
+    {"batch_size", T_PYSSIZET,  offsetof(Histogram, batch_size), READONLY, "a number of recorded values that are submitted at once"},
+    {nullptr},
+};
+
+static PyMethodDef histogram_methods[] =
+{
+    {"submit", histogram_submit, METH_VARARGS, "Submits x and y values from buffers."},
+    {"record", histogram_record, METH_O,       "Counts the value and submits the distribution of values when the batch is full."},
+    {"flush",  histogram_flush,  METH_NOARGS,  "Submits the distribution of the recorded values."},
+    {nullptr},
+};
+
+PyTypeObject Histogram::object_type =
+{
+    .ob_base              = PyVarObject_HEAD_INIT(nullptr, 0)
+    .tp_name              = "pyitt.native.Histogram",
+    .tp_basicsize         = sizeof(Histogram),
+    .tp_itemsize          = 0,
+
+    /* Methods to implement standard operations */
+    .tp_dealloc           = histogram_dealloc,
+    .tp_vectorcall_offset = 0,
+    .tp_getattr           = nullptr,
+    .tp_setattr           = nullptr,
+    .tp_as_async          = nullptr,
+    .tp_repr              = histogram_repr,
+
+    /* Method suites for standard classes */
+    .tp_as_number         = nullptr,
+    .tp_as_sequence       = nullptr,
+    .tp_as_mapping        = nullptr,
+
+    /* More standard operations (here for binary compatibility) */
+    .tp_hash              = nullptr,
+    .tp_call              = nullptr,
+    .tp_str               = histogram_str,
+    .tp_getattro          = nullptr,
+    .tp_setattro          = nullptr,
+
+    /* Functions to access object as input/output buffer */
+    .tp_as_buffer         = nullptr,
+
+    /* Flags to define presence of optional/expanded features */
+    .tp_flags             = Py_TPFLAGS_DEFAULT,
+
+    /* Documentation string */
+    .tp_doc               = "A class that represents an ITT histogram.",
+
+    /* Assigned meaning in release 2.0 call function for all accessible objects */
+    .tp_traverse          = nullptr,
+
+    /* Delete references to contained objects */
+    .tp_clear             = nullptr,
+
+    /* Assigned meaning in release 2.1 rich comparisons */
+    .tp_richcompare       = nullptr,
+
+    /* weak reference enabler */
+    .tp_weaklistoffset    = 0,
+
+    /* Iterators */
+    .tp_iter              = nullptr,
+    .tp_iternext          = nullptr,
+
+    /* Attribute descriptor and subclassing stuff */
+    .tp_methods           = histogram_methods,
+    .tp_members           = histogram_attrs,
+    .tp_getset            = nullptr,
+
+    /* Strong reference on a heap type, borrowed reference on a static type */
+    .tp_base              = nullptr,
+    .tp_dict              = nullptr,
+    .tp_descr_get         = nullptr,
+    .tp_descr_set         = nullptr,
+    .tp_dictoffset        = 0,
+    .tp_init              = nullptr,
+    .tp_alloc             = nullptr,
+    .tp_new               = histogram_new,
+
+    /* Low-level free-memory routine */
+    .tp_free              = nullptr,
+
+    /* For PyObject_IS_GC */
+    .tp_is_gc             = nullptr,
+    .tp_bases             = nullptr,
+
+    /* method resolution order */
+    .tp_mro               = nullptr,
+    .tp_cache             = nullptr,
+    .tp_subclasses        = nullptr,
+    .tp_weaklist          = nullptr,
+    .tp_del               = nullptr,
+
+    /* Type attribute cache version tag. Added in version 2.6 */
+    .tp_version_tag       = 0,
+
+    .tp_finalize          = nullptr,
+    .tp_vectorcall        = nullptr,
+};
+
+static bool is_signed_integer_type(__itt_metadata_type type)
+{
+    return type == __itt_metadata_s64 || type == __itt_metadata_s32 || type == __itt_metadata_s16;
+}
+
+static bool is_floating_point_type(__itt_metadata_type type)
+{
+    return type == __itt_metadata_float || type == __itt_metadata_double;
+}
+
+template<typename T>
+static bool is_in_integer_type_range(__itt_metadata_type type, T value)
+{
+    switch (type)
+    {
+    case __itt_metadata_u32:
+        return std::in_range<std::uint32_t>(value);
+    case __itt_metadata_s32:
+        return std::in_range<std::int32_t>(value);
+    case __itt_metadata_u16:
+        return std::in_range<std::uint16_t>(value);
+    case __itt_metadata_s16:
+        return std::in_range<std::int16_t>(value);
+    default:
+        return true;
+    }
+}
+
+static bool get_histogram_type(int value, const char* name, __itt_metadata_type& type)
+{
+    if (value <= __itt_metadata_unknown || value > __itt_metadata_double)
+    {
+        PyErr_Format(PyExc_ValueError, "The passed %s %d is not a valid histogram data type.", name, value);
+        return false;
+    }
+
+    type = static_cast<__itt_metadata_type>(value);
+    return true;
+}
+
+template<typename T>
+static void append_value(std::vector<unsigned char>& data, __itt_metadata_type type, T value)
+{
+    auto append = [&data](auto typed_value)
+    {
+        const unsigned char* bytes = reinterpret_cast<const unsigned char*>(&typed_value);
+        data.insert(data.end(), bytes, bytes + sizeof(typed_value));
+    };
+
+    switch (type)
+    {
+    case __itt_metadata_u64:
+        return append(static_cast<std::uint64_t>(value));
+    case __itt_metadata_s64:
+        return append(static_cast<std::int64_t>(value));
+    case __itt_metadata_u32:
+        return append(static_cast<std::uint32_t>(value));
+    case __itt_metadata_s32:
+        return append(static_cast<std::int32_t>(value));
+    case __itt_metadata_u16:
+        return append(static_cast<std::uint16_t>(value));
+    case __itt_metadata_s16:
+        return append(static_cast<std::int16_t>(value));
+    case __itt_metadata_float:
+        return append(static_cast<float>(value));
+    default:
+        return append(static_cast<double>(value));
+    }
+}
+
+template<typename Key>
+static Py_ssize_t submit_counts(Histogram* self, std::map<Key, unsigned long long>& counts)
+{
+    std::vector<unsigned char> x_data;
+    std::vector<unsigned char> y_data;
+
+    for (const auto& [value, count] : counts)
+    {
+        append_value(x_data, self->x_type, value);
+        append_value(y_data, self->y_type, count);
+    }
+
+    const Py_ssize_t length = static_cast<Py_ssize_t>(counts.size());
+    if (length > 0)
+    {
+        __itt_histogram_submit(self->handle, static_cast<size_t>(length), x_data.data(), y_data.data());
+    }
+
+    counts.clear();
+    return length;
+}
+
+static PyObject* histogram_new(PyTypeObject* type, PyObject* args, PyObject* kwargs)
+{
+    pyext::pyobject_holder<Histogram> self = type->tp_alloc(type, 0);
+    if (self == nullptr)
+    {
+        return nullptr;
+    }
+
+    self->name = nullptr;
+    self->domain = nullptr;
+    self->handle = nullptr;
+    self->x_type = __itt_metadata_unknown;
+    self->y_type = __itt_metadata_unknown;
+    self->batch_size = 0;
+    self->accumulator = nullptr;
+
+    char name_key[] = { "name" };
+    char domain_key[] = { "domain" };
+    char x_type_key[] = { "x_type" };
+    char y_type_key[] = { "y_type" };
+    char batch_size_key[] = { "batch_size" };
+
+    char* kwlist[] = { name_key, domain_key, x_type_key, y_type_key, batch_size_key, nullptr };
+
+    PyObject* name = nullptr;
+    PyObject* domain = nullptr;
+    int x_type_value = __itt_metadata_u64;
+    int y_type_value = __itt_metadata_u64;
+    Py_ssize_t batch_size = 1024;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|Oiin", kwlist,
+        &name, &domain, &x_type_value, &y_type_value, &batch_size))
+    {
+        return nullptr;
+    }
+
+    if (name && PyUnicode_Check(name))
+    {
+        self->name = pyext::new_ref(name);
+    }
+    else if (auto string_handle_obj = pyext::pyobject_cast<StringHandle>(name))
+    {
+        self->name = pyext::xnew_ref(string_handle_get_string(string_handle_obj));
+    }
+    else
+    {
+        return PyErr_Format(PyExc_TypeError,
+            "The passed %s is not a valid instance of str or %s.", name_key, StringHandle::object_type.tp_name);
+    }
+
+    if (pyext::pyobject_cast<Domain>(domain))
+    {
+        self->domain = pyext::xnew_ref(domain);
+    }
+    else
+    {
+        PyObject* const domain_type = reinterpret_cast<PyObject*>(&Domain::object_type);
+
+        if (domain == nullptr)
+        {
+            self->domain = PyObject_CallObject(domain_type, nullptr);
+        }
+        else
+        {
+            pyext::pyobject_holder<PyObject> ctor_args = PyTuple_Pack(1, domain);
+            if (ctor_args == nullptr)
+            {
+                return nullptr;
+            }
+
+            self->domain = PyObject_CallObject(domain_type, ctor_args.get());
+        }
+    }
+
+    auto domain_obj = pyext::pyobject_cast<Domain>(self->domain);
+    if (self->domain == nullptr)
+    {
+        return pyext::error::format_from_cause(PyExc_ValueError, "The %s object cannot be created for the instance of %s.",
+            Domain::object_type.tp_name, Histogram::object_type.tp_name);
+    }
+
+    if (!get_histogram_type(x_type_value, x_type_key, self->x_type) ||
+        !get_histogram_type(y_type_value, y_type_key, self->y_type))
+    {
+        return nullptr;
+    }
+
+    if (batch_size <= 0)
+    {
+        return PyErr_Format(PyExc_ValueError, "The passed %s must be a positive number.", batch_size_key);
+    }
+
+    self->batch_size = batch_size;
+
+    self->accumulator = new (std::nothrow) histogram_accumulator();
+    if (self->accumulator == nullptr)
+    {
+        return PyErr_NoMemory();
+    }
+
+    pyext::string name_str = pyext::string::from_unicode(self->name);
+    if (name_str.c_str() == nullptr)
+    {
+        return nullptr;
+    }
+
+#if defined(_WIN32)
+    self->handle = __itt_histogram_createW(domain_get_handle(domain_obj), name_str.c_str(), self->x_type, self->y_type);
+#else
+    self->handle = __itt_histogram_create(domain_get_handle(domain_obj), name_str.c_str(), self->x_type, self->y_type);
+#endif
+
+    return self.release();
+}
+
+static void histogram_dealloc(PyObject* self)
+{
+    Histogram* obj = pyext::pyobject_cast<Histogram>(self);
+    if (obj)
+    {
+        if (obj->accumulator)
+        {
+            if (obj->handle)
+            {
+                histogram_flush_internal(obj);
+            }
+
+            delete obj->accumulator;
+        }
+
+        Py_XDECREF(obj->name);
+        Py_XDECREF(obj->domain);
+    }
+
+    Py_TYPE(self)->tp_free(self);
+}
+
+static PyObject* histogram_repr(PyObject* self)
+{
+    Histogram* obj = pyext::pyobject_cast<Histogram>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", Histogram::object_type.tp_name);
+    }
+
+    return PyUnicode_FromFormat("%s(%R, %R, %d, %d, %zd)", obj->object_type.tp_name, obj->name, obj->domain,
+        static_cast<int>(obj->x_type), static_cast<int>(obj->y_type), obj->batch_size);
+}
+
+static PyObject* histogram_str(PyObject* self)
+{
+    Histogram* obj = pyext::pyobject_cast<Histogram>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", Histogram::object_type.tp_name);
+    }
+
+    return pyext::new_ref(obj->name);
+}
+
+static bool get_histogram_buffer(PyObject* obj, const char* name, __itt_metadata_type type, Py_buffer& buffer)
+{
+    if (PyObject_GetBuffer(obj, &buffer, PyBUF_FORMAT | PyBUF_ANY_CONTIGUOUS) < 0)
+    {
+        return false;
+    }
+
+    if (get_buffer_metadata_type(buffer) != type)
+    {
+        PyErr_Format(PyExc_TypeError, "The passed %s have the format '%s' that does not match the histogram data type.",
+            name, buffer.format ? buffer.format : "B");
+        PyBuffer_Release(&buffer);
+        return false;
+    }
+
+    return true;
+}
+
+static PyObject* histogram_submit(PyObject* self, PyObject* args)
+{
+    Histogram* obj = pyext::pyobject_cast<Histogram>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", Histogram::object_type.tp_name);
+    }
+
+    PyObject* x_values = nullptr;
+    PyObject* y_values = nullptr;
+
+    if (!PyArg_ParseTuple(args, "OO", &x_values, &y_values))
+    {
+        return nullptr;
+    }
+
+    Py_buffer y_buffer;
+    if (!get_histogram_buffer(y_values, "y values", obj->y_type, y_buffer))
+    {
+        return nullptr;
+    }
+
+    const Py_ssize_t length = y_buffer.len / y_buffer.itemsize;
+
+    /* If x values are not passed, the indices of y values are used as x values. */
+    if (x_values == Py_None)
+    {
+        __itt_histogram_submit(obj->handle, static_cast<size_t>(length), nullptr, y_buffer.buf);
+
+        PyBuffer_Release(&y_buffer);
+        return PyLong_FromSsize_t(length);
+    }
+
+    Py_buffer x_buffer;
+    if (!get_histogram_buffer(x_values, "x values", obj->x_type, x_buffer))
+    {
+        PyBuffer_Release(&y_buffer);
+        return nullptr;
+    }
+
+    if (x_buffer.len / x_buffer.itemsize != length)
+    {
+        PyBuffer_Release(&x_buffer);
+        PyBuffer_Release(&y_buffer);
+        return PyErr_Format(PyExc_ValueError, "The passed x values and y values have different lengths.");
+    }
+
+    /* The values are passed to ITT as is, without copying. */
+    __itt_histogram_submit(obj->handle, static_cast<size_t>(length), x_buffer.buf, y_buffer.buf);
+
+    PyBuffer_Release(&x_buffer);
+    PyBuffer_Release(&y_buffer);
+    return PyLong_FromSsize_t(length);
+}
+
+static PyObject* histogram_record(PyObject* self, PyObject* value)
+{
+    Histogram* obj = pyext::pyobject_cast<Histogram>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", Histogram::object_type.tp_name);
+    }
+
+    double float_value = 0.0;
+    long long signed_value = 0;
+    unsigned long long unsigned_value = 0;
+
+    if (is_floating_point_type(obj->x_type))
+    {
+        float_value = PyFloat_AsDouble(value);
+        if (float_value == -1.0 && PyErr_Occurred())
+        {
+            return nullptr;
+        }
+    }
+    else if (is_signed_integer_type(obj->x_type))
+    {
+        signed_value = PyLong_AsLongLong(value);
+        if (signed_value == -1 && PyErr_Occurred())
+        {
+            return nullptr;
+        }
+
+        if (!is_in_integer_type_range(obj->x_type, signed_value))
+        {
+            return PyErr_Format(PyExc_OverflowError,
+                "The passed value %lld is out of the range of the histogram data type.", signed_value);
+        }
+    }
+    else
+    {
+        unsigned_value = PyLong_AsUnsignedLongLong(value);
+        if (unsigned_value == std::numeric_limits<unsigned long long>::max() && PyErr_Occurred())
+        {
+            return nullptr;
+        }
+
+        if (!is_in_integer_type_range(obj->x_type, unsigned_value))
+        {
+            return PyErr_Format(PyExc_OverflowError,
+                "The passed value %llu is out of the range of the histogram data type.", unsigned_value);
+        }
+    }
+
+    histogram_accumulator& accumulator = *obj->accumulator;
+    std::lock_guard<std::mutex> guard(accumulator.lock);
+
+    unsigned long long count = 0;
+    if (is_floating_point_type(obj->x_type))
+    {
+        count = ++accumulator.float_counts[float_value];
+    }
+    else if (is_signed_integer_type(obj->x_type))
+    {
+        count = ++accumulator.signed_counts[signed_value];
+    }
+    else
+    {
+        count = ++accumulator.unsigned_counts[unsigned_value];
+    }
+
+    /* The counts are submitted early if the next count of the value would not fit into the data type of y values. */
+    if (++accumulator.pending >= obj->batch_size || !is_in_integer_type_range(obj->y_type, count + 1))
+    {
+        submit_accumulated_counts(obj);
+    }
+
+    Py_RETURN_NONE;
+}
+
+static PyObject* histogram_flush(PyObject* self, PyObject* Py_UNUSED(args))
+{
+    Histogram* obj = pyext::pyobject_cast<Histogram>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", Histogram::object_type.tp_name);
+    }
+
+    return PyLong_FromSsize_t(histogram_flush_internal(obj));
+}
+
+static Py_ssize_t histogram_flush_internal(Histogram* self)
+{
+    std::lock_guard<std::mutex> guard(self->accumulator->lock);
+    return submit_accumulated_counts(self);
+}
+
+static Py_ssize_t submit_accumulated_counts(Histogram* self)
+{
+    histogram_accumulator& accumulator = *self->accumulator;
+
+    accumulator.pending = 0;
+    if (is_floating_point_type(self->x_type))
+    {
+        return submit_counts(self, accumulator.float_counts);
+    }
+    else if (is_signed_integer_type(self->x_type))
+    {
+        return submit_counts(self, accumulator.signed_counts);
+    }
+
+    return submit_counts(self, accumulator.unsigned_counts);
+}
+
+int exec_histogram(PyObject* module)
+{
+    return pyext::add_type(module, &Histogram::object_type);
+}
+
+} // namespace pyitt
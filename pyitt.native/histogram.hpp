@@ -0,0 +1,31 @@
+#pragma once
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#include <ittnotify.h>
+
+
+namespace pyitt
+{
+
+struct histogram_accumulator;
+
+struct Histogram
+{
+	PyObject_HEAD
+	PyObject* name;
+	PyObject* domain;
+	__itt_histogram* handle;
+	__itt_metadata_type x_type;
+	__itt_metadata_type y_type;
+	Py_ssize_t batch_size;
+
+	histogram_accumulator* accumulator;
+
+	static PyTypeObject object_type;
+};
+
+int exec_histogram(PyObject* module);
+
+} // namespace pyitt
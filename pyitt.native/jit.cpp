@@ -0,0 +1,349 @@
+#include "jit.hpp"
+
+#include <jitprofiling.h>
+
+#include "extensions/error_template.hpp"
+#include "extensions/python.hpp"
+
+/*
+ The JIT support relies on PEP 523 frame evaluation API and on the accessors for the interpreter frames that have
+ been introduced in CPython 3.12. The trampolines are generated for Linux on x86-64 and AArch64 only.
+ */
+#if PY_VERSION_HEX >= 0x030C0000 && !defined(PYPY_VERSION) && defined(__linux__) && \
+    (defined(__x86_64__) || defined(__aarch64__))
+# define PYITT_JIT_TRAMPOLINE_SUPPORT
+#endif
+
+#if defined(PYITT_JIT_TRAMPOLINE_SUPPORT)
+# include <sys/mman.h>
+# include <unistd.h>
+
+# include <atomic>
+# include <cstring>
+# include <mutex>
+# include <string>
+#endif
+
+
+namespace pyitt
+{
+
+#if defined(PYITT_JIT_TRAMPOLINE_SUPPORT)
+
+/*
+ The trampoline is a tiny function that calls the frame evaluation function passed as its fourth argument.
+ Every registered code object gets its own copy of the trampoline, and the address range of the copy is reported
+ to the profiler as a JIT-compiled method. As a result, the samples that hit the interpreter loop are attributed to
+ the Python function that is being evaluated.
+ */
+# if defined(__x86_64__)
+static constexpr unsigned char trampoline_template[] =
+{
+    0x55,             /* push %rbp       */
+    0x48, 0x89, 0xe5, /* mov  %rsp, %rbp */
+    0xff, 0xd1,       /* call *%rcx      */
+    0x5d,             /* pop  %rbp       */
+    0xc3,             /* ret             */
+};
+# else
+static constexpr unsigned int trampoline_template[] =
+{
+    0xa9bf7bfd,       /* stp x29, x30, [sp, -16]! */
+    0x910003fd,       /* mov x29, sp              */
+    0xd63f0060,       /* blr x3                   */
+    0xa8c17bfd,       /* ldp x29, x30, [sp], 16   */
+    0xd65f03c0,       /* ret                      */
+};
+# endif
+
+static constexpr std::size_t trampoline_size = (sizeof(trampoline_template) + 15) & ~std::size_t(15);
+static constexpr std::size_t trampoline_arena_size = 1 << 20;
+
+using trampoline_func = PyObject* (*)(PyThreadState*, _PyInterpreterFrame*, int, _PyFrameEvalFunction);
+
+class trampoline_arena
+{
+public:
+    void* allocate();
+
+private:
+    bool grow();
+
+    char* m_next = nullptr;
+    char* m_end = nullptr;
+};
+
+struct jit_state
+{
+    std::mutex lock;
+    trampoline_arena arena;
+    Py_ssize_t code_extra_index = -1;
+    _PyFrameEvalFunction original_eval_frame = nullptr;
+    std::atomic<bool> auto_registration = false;
+    bool explicit_registration = false;
+};
+
+static jit_state& get_jit_state();
+static bool install_eval_frame_hook();
+static void uninstall_eval_frame_hook();
+static void* register_code_object(PyObject* code);
+static void notify_method_load(PyCodeObject* code, void* address);
+static PyObject* jit_eval_frame(PyThreadState* tstate, _PyInterpreterFrame* frame, int throw_flag);
+
+void* trampoline_arena::allocate()
+{
+    if (m_next == m_end && !grow())
+    {
+        return nullptr;
+    }
+
+    void* trampoline = m_next;
+    m_next += trampoline_size;
+
+    return trampoline;
+}
+
+bool trampoline_arena::grow()
+{
+    /* The arenas are never released, since the trampolines can be used while their code objects are alive. */
+    void* memory = mmap(nullptr, trampoline_arena_size, PROT_READ | PROT_WRITE, MAP_PRIVATE | MAP_ANONYMOUS, -1, 0);
+    if (memory == MAP_FAILED)
+    {
+        return false;
+    }
+
+    char* const begin = static_cast<char*>(memory);
+    char* const end = begin + (trampoline_arena_size / trampoline_size) * trampoline_size;
+
+    for (char* trampoline = begin; trampoline != end; trampoline += trampoline_size)
+    {
+        std::memcpy(trampoline, trampoline_template, sizeof(trampoline_template));
+    }
+
+    __builtin___clear_cache(begin, end);
+
+    if (mprotect(memory, trampoline_arena_size, PROT_READ | PROT_EXEC) != 0)
+    {
+        munmap(memory, trampoline_arena_size);
+        return false;
+    }
+
+    m_next = begin;
+    m_end = end;
+
+    return true;
+}
+
+static jit_state& get_jit_state()
+{
+    static jit_state state;
+    return state;
+}
+
+static bool install_eval_frame_hook()
+{
+    jit_state& state = get_jit_state();
+
+    if (state.code_extra_index < 0)
+    {
+        state.code_extra_index = PyUnstable_Eval_RequestCodeExtraIndex(nullptr);
+        if (state.code_extra_index < 0)
+        {
+            PyErr_SetString(PyExc_RuntimeError, "Cannot reserve an extra slot for code objects.");
+            return false;
+        }
+    }
+
+    PyInterpreterState* interpreter = PyInterpreterState_Get();
+    _PyFrameEvalFunction current_eval_frame = _PyInterpreterState_GetEvalFrameFunc(interpreter);
+    if (current_eval_frame != jit_eval_frame)
+    {
+        state.original_eval_frame = current_eval_frame;
+        _PyInterpreterState_SetEvalFrameFunc(interpreter, jit_eval_frame);
+    }
+
+    return true;
+}
+
+static void uninstall_eval_frame_hook()
+{
+    jit_state& state = get_jit_state();
+
+    /* The hook is kept for the explicitly registered code objects, since their trampolines are called by it. */
+    if (state.explicit_registration || state.original_eval_frame == nullptr)
+    {
+        return;
+    }
+
+    /* Another hook could be installed on top of ours, it cannot be removed without removing the other one. */
+    PyInterpreterState* interpreter = PyInterpreterState_Get();
+    if (_PyInterpreterState_GetEvalFrameFunc(interpreter) == jit_eval_frame)
+    {
+        _PyInterpreterState_SetEvalFrameFunc(interpreter, state.original_eval_frame);
+    }
+}
+
+static void* register_code_object(PyObject* code)
+{
+    jit_state& state = get_jit_state();
+    std::lock_guard<std::mutex> guard(state.lock);
+
+    void* trampoline = nullptr;
+    if (PyUnstable_Code_GetExtra(code, state.code_extra_index, &trampoline) < 0)
+    {
+        return nullptr;
+    }
+
+    if (trampoline)
+    {
+        return trampoline;
+    }
+
+    trampoline = state.arena.allocate();
+    if (trampoline == nullptr)
+    {
+        PyErr_NoMemory();
+        return nullptr;
+    }
+
+    if (PyUnstable_Code_SetExtra(code, state.code_extra_index, trampoline) < 0)
+    {
+        return nullptr;
+    }
+
+    notify_method_load(reinterpret_cast<PyCodeObject*>(code), trampoline);
+
+    return trampoline;
+}
+
+static void notify_method_load(PyCodeObject* code, void* address)
+{
+    const char* qualname = PyUnicode_AsUTF8(code->co_qualname);
+    const char* filename = PyUnicode_AsUTF8(code->co_filename);
+    if (qualname == nullptr || filename == nullptr)
+    {
+        pyext::error::clear_error_indicator();
+    }
+
+    std::string method_name = std::string("py::") + (qualname ? qualname : "<unknown>");
+    std::string source_file_name = filename ? filename : "<unknown>";
+
+    LineNumberInfo line_info = { 0, static_cast<unsigned int>(code->co_firstlineno) };
+
+    iJIT_Method_Load method = {};
+    method.method_id = iJIT_GetNewMethodID();
+    method.method_name = method_name.data();
+    method.method_load_address = address;
+    method.method_size = static_cast<unsigned int>(trampoline_size);
+    method.line_number_size = 1;
+    method.line_number_table = &line_info;
+    method.source_file_name = source_file_name.data();
+
+    iJIT_NotifyEvent(iJVM_EVENT_TYPE_METHOD_LOAD_FINISHED, &method);
+}
+
+static PyObject* jit_eval_frame(PyThreadState* tstate, _PyInterpreterFrame* frame, int throw_flag)
+{
+    jit_state& state = get_jit_state();
+
+    void* trampoline = nullptr;
+    PyObject* code = PyUnstable_InterpreterFrame_GetCode(frame);
+    if (code && PyCode_Check(code))
+    {
+        if (PyUnstable_Code_GetExtra(code, state.code_extra_index, &trampoline) < 0)
+        {
+            pyext::error::clear_error_indicator();
+            trampoline = nullptr;
+        }
+
+        if (trampoline == nullptr && state.auto_registration)
+        {
+            trampoline = register_code_object(code);
+            if (trampoline == nullptr)
+            {
+                pyext::error::clear_error_indicator();
+            }
+        }
+    }
+    Py_XDECREF(code);
+
+    if (trampoline)
+    {
+        return reinterpret_cast<trampoline_func>(trampoline)(tstate, frame, throw_flag, state.original_eval_frame);
+    }
+
+    return state.original_eval_frame(tstate, frame, throw_flag);
+}
+
+#else
+
+static PyObject* jit_not_implemented_exception()
+{
+    PyErr_SetString(PyExc_NotImplementedError,
+        "pyitt.native is built without JIT trampoline support for this interpreter or platform.");
+    return nullptr;
+}
+
+#endif
+
+PyObject* jit_is_profiling_active(PyObject* Py_UNUSED(self), PyObject* Py_UNUSED(args))
+{
+    return PyBool_FromLong(iJIT_IsProfilingActive() == iJIT_SAMPLING_ON);
+}
+
+PyObject* jit_register_code(PyObject* Py_UNUSED(self), PyObject* code)
+{
+    if (!PyCode_Check(code))
+    {
+        return PyErr_Format(PyExc_TypeError, pyext::error::invalid_argument_type_tmpl, "code", "code");
+    }
+
+#if defined(PYITT_JIT_TRAMPOLINE_SUPPORT)
+    if (iJIT_IsProfilingActive() != iJIT_SAMPLING_ON)
+    {
+        Py_RETURN_FALSE;
+    }
+
+    if (!install_eval_frame_hook() || register_code_object(code) == nullptr)
+    {
+        return nullptr;
+    }
+
+    get_jit_state().explicit_registration = true;
+    Py_RETURN_TRUE;
+#else
+    return jit_not_implemented_exception();
+#endif
+}
+
+PyObject* jit_set_auto_registration(PyObject* Py_UNUSED(self), PyObject* enabled)
+{
+    int is_enabled = PyObject_IsTrue(enabled);
+    if (is_enabled < 0)
+    {
+        return nullptr;
+    }
+
+#if defined(PYITT_JIT_TRAMPOLINE_SUPPORT)
+    jit_state& state = get_jit_state();
+
+    if (!is_enabled || iJIT_IsProfilingActive() != iJIT_SAMPLING_ON)
+    {
+        state.auto_registration = false;
+        uninstall_eval_frame_hook();
+        Py_RETURN_FALSE;
+    }
+
+    if (!install_eval_frame_hook())
+    {
+        return nullptr;
+    }
+
+    state.auto_registration = true;
+    Py_RETURN_TRUE;
+#else
+    return jit_not_implemented_exception();
+#endif
+}
+
+} // namespace pyitt
@@ -0,0 +1,14 @@
+#pragma once
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+
+namespace pyitt
+{
+
+PyObject* jit_is_profiling_active(PyObject* self, PyObject* args);
+PyObject* jit_register_code(PyObject* self, PyObject* code);
+PyObject* jit_set_auto_registration(PyObject* self, PyObject* enabled);
+
+} // namespace pyitt
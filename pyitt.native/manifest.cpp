@@ -0,0 +1,70 @@
+#include "manifest.hpp"
+
+#include "extensions/python.hpp"
+
+
+namespace pyitt
+{
+
+std::atomic<bool> manifest_recording_flag = false;
+
+/* The sets of the recorded names are accessed only while the GIL is held. */
+static PyObject* manifest_names[] = { nullptr, nullptr };
+
+void manifest_record_name(manifest_name_type type, PyObject* name)
+{
+    PyObject*& names = manifest_names[static_cast<int>(type)];
+    if (names == nullptr)
+    {
+        names = PySet_New(nullptr);
+    }
+
+    if (names == nullptr || PySet_Add(names, name) < 0)
+    {
+        /* The manifest is a hint for the next start, so the creation of the handle does not fail. */
+        pyext::error::clear_error_indicator();
+    }
+}
+
+PyObject* manifest_recording_enable(PyObject* Py_UNUSED(self), PyObject* Py_UNUSED(args))
+{
+    manifest_recording_flag.store(true, std::memory_order_relaxed);
+    Py_RETURN_NONE;
+}
+
+PyObject* manifest_recording_disable(PyObject* Py_UNUSED(self), PyObject* Py_UNUSED(args))
+{
+    manifest_recording_flag.store(false, std::memory_order_relaxed);
+    Py_RETURN_NONE;
+}
+
+static PyObject* manifest_get_names(manifest_name_type type)
+{
+    PyObject* names = manifest_names[static_cast<int>(type)];
+    pyext::pyobject_holder<PyObject> names_list = names ? PySequence_List(names) : PyList_New(0);
+    if (names_list == nullptr || PyList_Sort(names_list.get()) < 0)
+    {
+        return nullptr;
+    }
+
+    return names_list.release();
+}
+
+PyObject* manifest_snapshot(PyObject* Py_UNUSED(self), PyObject* Py_UNUSED(args))
+{
+    pyext::pyobject_holder<PyObject> string_handle_names = manifest_get_names(manifest_name_type::string_handle);
+    if (string_handle_names == nullptr)
+    {
+        return nullptr;
+    }
+
+    pyext::pyobject_holder<PyObject> domain_names = manifest_get_names(manifest_name_type::domain);
+    if (domain_names == nullptr)
+    {
+        return nullptr;
+    }
+
+    return PyTuple_Pack(2, string_handle_names.get(), domain_names.get());
+}
+
+} // namespace pyitt
@@ -0,0 +1,40 @@
+#pragma once
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#include <atomic>
+
+
+namespace pyitt
+{
+
+enum class manifest_name_type
+{
+	string_handle = 0,
+	domain = 1,
+};
+
+extern std::atomic<bool> manifest_recording_flag;
+
+inline bool manifest_is_recording()
+{
+	return manifest_recording_flag.load(std::memory_order_relaxed);
+}
+
+/* Adds the name to the manifest if the names are recorded. The calling thread must hold the GIL. */
+void manifest_record_name(manifest_name_type type, PyObject* name);
+
+inline void manifest_record(manifest_name_type type, PyObject* name)
+{
+	if (manifest_is_recording())
+	{
+		manifest_record_name(type, name);
+	}
+}
+
+PyObject* manifest_recording_enable(PyObject* self, PyObject* args);
+PyObject* manifest_recording_disable(PyObject* self, PyObject* args);
+PyObject* manifest_snapshot(PyObject* self, PyObject* args);
+
+} // namespace pyitt
@@ -0,0 +1,73 @@
+#include "marker.hpp"
+
+#include <ittnotify.h>
+
+#include "domain.hpp"
+#include "id.hpp"
+#include "recorder.hpp"
+#include "string_handle.hpp"
+
+#include "extensions/error_template.hpp"
+#include "extensions/python.hpp"
+
+
+namespace pyitt
+{
+
+PyObject* marker(PyObject* self, PyObject* args)
+{
+    PyObject* domain = nullptr;
+    PyObject* name_string_handle = nullptr;
+    int scope_value = 0;
+    PyObject* marker_id = nullptr;
+
+    if (!PyArg_ParseTuple(args, "OOi|O", &domain, &name_string_handle, &scope_value, &marker_id))
+    {
+        return nullptr;
+    }
+
+    Domain* domain_obj = pyext::pyobject_cast<Domain>(domain);
+    if (domain_obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "domain", Domain::object_type.tp_name);
+    }
+
+    StringHandle* name_string_handle_obj = pyext::pyobject_cast<StringHandle>(name_string_handle);
+    if (name_string_handle_obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "name", StringHandle::object_type.tp_name);
+    }
+
+    if (scope_value < __itt_marker_scope_global || scope_value > __itt_marker_scope_task)
+    {
+        return PyErr_Format(PyExc_ValueError, "The passed scope %d is not a valid marker scope.", scope_value);
+    }
+
+    __itt_id id = __itt_null;
+    if (marker_id && marker_id != Py_None)
+    {
+        Id* marker_id_obj = pyext::pyobject_cast<Id>(marker_id);
+        if (marker_id_obj == nullptr)
+        {
+            return PyErr_Format(PyExc_TypeError,
+                pyext::error::invalid_argument_type_tmpl, "id", Id::object_type.tp_name);
+        }
+
+        id = id_get_handle(marker_id_obj);
+    }
+
+    __itt_marker(domain_get_handle(domain_obj), id, string_handle_get_handle(name_string_handle_obj),
+        static_cast<__itt_scope>(scope_value));
+
+    if (recorder_is_enabled())
+    {
+        recorder_write(recorder_record_type::marker, string_handle_get_name_id(name_string_handle_obj),
+            domain_get_name_id(domain_obj), static_cast<std::uint64_t>(scope_value));
+    }
+
+    Py_RETURN_NONE;
+}
+
+} // namespace pyitt
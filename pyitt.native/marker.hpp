@@ -0,0 +1,12 @@
+#pragma once
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+
+namespace pyitt
+{
+
+PyObject* marker(PyObject* self, PyObject* args);
+
+} // namespace pyitt
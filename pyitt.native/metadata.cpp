@@ -0,0 +1,234 @@
+#include "metadata.hpp"
+
+#include <bit>
+
+#include <ittnotify.h>
+
+#include "domain.hpp"
+#include "id.hpp"
+#include "string_handle.hpp"
+
+#include "extensions/error_template.hpp"
+#include "extensions/python.hpp"
+#include "extensions/string.hpp"
+
+
+namespace pyitt
+{
+
+static __itt_metadata_type get_integer_metadata_type(bool is_signed, Py_ssize_t item_size)
+{
+    switch (item_size)
+    {
+    case 2:
+        return is_signed ? __itt_metadata_s16 : __itt_metadata_u16;
+    case 4:
+        return is_signed ? __itt_metadata_s32 : __itt_metadata_u32;
+    case 8:
+        return is_signed ? __itt_metadata_s64 : __itt_metadata_u64;
+    default:
+        return __itt_metadata_unknown;
+    }
+}
+
+__itt_metadata_type get_buffer_metadata_type(const Py_buffer& buffer)
+{
+    /* The buffer without format contains unsigned bytes that are not supported by ITT metadata. */
+    const char* format = buffer.format ? buffer.format : "B";
+
+    constexpr bool is_little_endian = std::endian::native == std::endian::little;
+    switch (*format)
+    {
+    case '@':
+    case '=':
+        ++format;
+        break;
+    case '<':
+        if (!is_little_endian)
+        {
+            return __itt_metadata_unknown;
+        }
+        ++format;
+        break;
+    case '>':
+    case '!':
+        if (is_little_endian)
+        {
+            return __itt_metadata_unknown;
+        }
+        ++format;
+        break;
+    default:
+        break;
+    }
+
+    if (format[0] == '\0' || format[1] != '\0')
+    {
+        return __itt_metadata_unknown;
+    }
+
+    switch (format[0])
+    {
+    case 'h':
+    case 'i':
+    case 'l':
+    case 'q':
+    case 'n':
+        return get_integer_metadata_type(true, buffer.itemsize);
+    case 'H':
+    case 'I':
+    case 'L':
+    case 'Q':
+    case 'N':
+        return get_integer_metadata_type(false, buffer.itemsize);
+    case 'f':
+        return buffer.itemsize == sizeof(float) ? __itt_metadata_float : __itt_metadata_unknown;
+    case 'd':
+        return buffer.itemsize == sizeof(double) ? __itt_metadata_double : __itt_metadata_unknown;
+    default:
+        return __itt_metadata_unknown;
+    }
+}
+
+static PyObject* metadata_add_long(const __itt_domain* domain, __itt_id id, __itt_string_handle* name, PyObject* value)
+{
+    int overflow = 0;
+    long long signed_value = PyLong_AsLongLongAndOverflow(value, &overflow);
+    if (signed_value == -1 && PyErr_Occurred())
+    {
+        return nullptr;
+    }
+
+    if (overflow == 0)
+    {
+        __itt_metadata_add(domain, id, name, __itt_metadata_s64, 1, &signed_value);
+        Py_RETURN_NONE;
+    }
+
+    unsigned long long unsigned_value = PyLong_AsUnsignedLongLong(value);
+    if (unsigned_value == static_cast<unsigned long long>(-1) && PyErr_Occurred())
+    {
+        return nullptr;
+    }
+
+    __itt_metadata_add(domain, id, name, __itt_metadata_u64, 1, &unsigned_value);
+    Py_RETURN_NONE;
+}
+
+static PyObject* metadata_add_float(const __itt_domain* domain, __itt_id id, __itt_string_handle* name, PyObject* value)
+{
+    double double_value = PyFloat_AsDouble(value);
+    if (double_value == -1.0 && PyErr_Occurred())
+    {
+        return nullptr;
+    }
+
+    __itt_metadata_add(domain, id, name, __itt_metadata_double, 1, &double_value);
+    Py_RETURN_NONE;
+}
+
+static PyObject* metadata_add_str(const __itt_domain* domain, __itt_id id, __itt_string_handle* name, PyObject* value)
+{
+    pyext::string str_wrapper = pyext::string::from_unicode(value);
+    if (str_wrapper.c_str() == nullptr)
+    {
+        return nullptr;
+    }
+
+#if defined(_WIN32)
+    __itt_metadata_str_addW(domain, id, name, str_wrapper.c_str(), str_wrapper.length());
+#else
+    __itt_metadata_str_add(domain, id, name, str_wrapper.c_str(), str_wrapper.length());
+#endif
+
+    Py_RETURN_NONE;
+}
+
+static PyObject* metadata_add_buffer(const __itt_domain* domain, __itt_id id, __itt_string_handle* name, PyObject* value)
+{
+    Py_buffer buffer;
+    if (PyObject_GetBuffer(value, &buffer, PyBUF_FORMAT | PyBUF_ANY_CONTIGUOUS) < 0)
+    {
+        return nullptr;
+    }
+
+    const __itt_metadata_type type = get_buffer_metadata_type(buffer);
+    if (type == __itt_metadata_unknown)
+    {
+        PyErr_Format(PyExc_TypeError,
+            "The passed values have an unsupported format '%s'.", buffer.format ? buffer.format : "B");
+        PyBuffer_Release(&buffer);
+        return nullptr;
+    }
+
+    /* The values are passed to ITT as is, without copying. */
+    __itt_metadata_add(domain, id, name, type, static_cast<size_t>(buffer.len / buffer.itemsize), buffer.buf);
+
+    PyBuffer_Release(&buffer);
+    Py_RETURN_NONE;
+}
+
+PyObject* metadata_add(PyObject* self, PyObject* args)
+{
+    PyObject* domain = nullptr;
+    PyObject* name_string_handle = nullptr;
+    PyObject* value = nullptr;
+    PyObject* metadata_id = nullptr;
+
+    if (!PyArg_ParseTuple(args, "OOO|O", &domain, &name_string_handle, &value, &metadata_id))
+    {
+        return nullptr;
+    }
+
+    Domain* domain_obj = pyext::pyobject_cast<Domain>(domain);
+    if (domain_obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "domain", Domain::object_type.tp_name);
+    }
+
+    StringHandle* name_string_handle_obj = pyext::pyobject_cast<StringHandle>(name_string_handle);
+    if (name_string_handle_obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "name", StringHandle::object_type.tp_name);
+    }
+
+    __itt_id id = __itt_null;
+    if (metadata_id && metadata_id != Py_None)
+    {
+        Id* metadata_id_obj = pyext::pyobject_cast<Id>(metadata_id);
+        if (metadata_id_obj == nullptr)
+        {
+            return PyErr_Format(PyExc_TypeError,
+                pyext::error::invalid_argument_type_tmpl, "id", Id::object_type.tp_name);
+        }
+
+        id = id_get_handle(metadata_id_obj);
+    }
+
+    const __itt_domain* domain_handle = domain_get_handle(domain_obj);
+    __itt_string_handle* name_handle = string_handle_get_handle(name_string_handle_obj);
+
+    if (PyLong_Check(value))
+    {
+        return metadata_add_long(domain_handle, id, name_handle, value);
+    }
+    else if (PyFloat_Check(value))
+    {
+        return metadata_add_float(domain_handle, id, name_handle, value);
+    }
+    else if (PyUnicode_Check(value))
+    {
+        return metadata_add_str(domain_handle, id, name_handle, value);
+    }
+    else if (PyObject_CheckBuffer(value))
+    {
+        return metadata_add_buffer(domain_handle, id, name_handle, value);
+    }
+
+    return PyErr_Format(PyExc_TypeError,
+        pyext::error::invalid_argument_type_tmpl, "value", "int, float, str or buffer");
+}
+
+} // namespace pyitt
@@ -0,0 +1,17 @@
+#pragma once
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#include <ittnotify.h>
+
+
+namespace pyitt
+{
+
+/* Returns the metadata type of the buffer items or __itt_metadata_unknown if the format of the buffer is not supported. */
+__itt_metadata_type get_buffer_metadata_type(const Py_buffer& buffer);
+
+PyObject* metadata_add(PyObject* self, PyObject* args);
+
+} // namespace pyitt
@@ -0,0 +1,156 @@
+#include "name_registry.hpp"
+
+#include "extensions/python.hpp"
+
+
+namespace pyitt
+{
+
+struct name_registry
+{
+    /* The list of interned names, the name with identifier N is stored at position N. */
+    PyObject* names = nullptr;
+    PyObject* name_ids = nullptr;
+
+    /* The instances that are interned by their types and keys, e.g. the unpickled or preloaded domains. */
+    PyObject* instances = nullptr;
+};
+
+static name_registry& get_name_registry()
+{
+    static name_registry registry;
+    return registry;
+}
+
+std::uint32_t intern_name(PyObject* name)
+{
+    name_registry& registry = get_name_registry();
+
+    if (name == nullptr || !PyUnicode_Check(name))
+    {
+        return 0;
+    }
+
+    if (registry.names == nullptr)
+    {
+        registry.names = PyList_New(0);
+        registry.name_ids = PyDict_New();
+        if (registry.names == nullptr || registry.name_ids == nullptr || PyList_Append(registry.names, Py_None) < 0)
+        {
+            Py_CLEAR(registry.names);
+            Py_CLEAR(registry.name_ids);
+            pyext::error::clear_error_indicator();
+            return 0;
+        }
+    }
+
+    PyObject* id = PyDict_GetItemWithError(registry.name_ids, name);
+    if (id)
+    {
+        return static_cast<std::uint32_t>(PyLong_AsUnsignedLong(id));
+    }
+
+    pyext::pyobject_holder<PyObject> new_id = PyLong_FromSsize_t(PyList_GET_SIZE(registry.names));
+    if (new_id == nullptr
+        || PyDict_SetItem(registry.name_ids, name, new_id.get()) < 0
+        || PyList_Append(registry.names, name) < 0)
+    {
+        pyext::error::clear_error_indicator();
+        return 0;
+    }
+
+    return static_cast<std::uint32_t>(PyLong_AsUnsignedLong(new_id.get()));
+}
+
+PyObject* get_interned_names()
+{
+    name_registry& registry = get_name_registry();
+    return registry.names ? PyList_GetSlice(registry.names, 0, PY_SSIZE_T_MAX) : PyList_New(0);
+}
+
+static PyObject* get_interned_instances(PyTypeObject* type)
+{
+    name_registry& registry = get_name_registry();
+
+    if (registry.instances == nullptr)
+    {
+        registry.instances = PyDict_New();
+        if (registry.instances == nullptr)
+        {
+            return nullptr;
+        }
+    }
+
+    PyObject* type_obj = reinterpret_cast<PyObject*>(type);
+    PyObject* instances = PyDict_GetItemWithError(registry.instances, type_obj);
+    if (instances || PyErr_Occurred())
+    {
+        return instances;
+    }
+
+    pyext::pyobject_holder<PyObject> new_instances = PyDict_New();
+    if (new_instances == nullptr || PyDict_SetItem(registry.instances, type_obj, new_instances.get()) < 0)
+    {
+        return nullptr;
+    }
+
+    return new_instances.get();
+}
+
+PyObject* get_interned_instance(PyTypeObject* type, PyObject* key, PyObject* args)
+{
+    PyObject* instances = get_interned_instances(type);
+    if (instances == nullptr)
+    {
+        return nullptr;
+    }
+
+    PyObject* instance = PyDict_GetItemWithError(instances, key);
+    if (instance)
+    {
+        return pyext::new_ref(instance);
+    }
+    else if (PyErr_Occurred())
+    {
+        return nullptr;
+    }
+
+    pyext::pyobject_holder<PyObject> new_instance = PyObject_Call(reinterpret_cast<PyObject*>(type), args, nullptr);
+    if (new_instance == nullptr || PyDict_SetItem(instances, key, new_instance.get()) < 0)
+    {
+        return nullptr;
+    }
+
+    return new_instance.release();
+}
+
+PyObject* intern_instance(PyTypeObject* type, PyObject* key, PyObject* instance)
+{
+    PyObject* instances = get_interned_instances(type);
+    if (instances == nullptr || PyDict_SetItem(instances, key, instance) < 0)
+    {
+        return nullptr;
+    }
+
+    return pyext::new_ref(instance);
+}
+
+PyObject* find_interned_instance(PyTypeObject* type, PyObject* key)
+{
+    name_registry& registry = get_name_registry();
+    if (registry.instances == nullptr)
+    {
+        return nullptr;
+    }
+
+    PyObject* instances = PyDict_GetItemWithError(registry.instances, reinterpret_cast<PyObject*>(type));
+    PyObject* instance = instances ? PyDict_GetItemWithError(instances, key) : nullptr;
+    if (instance == nullptr)
+    {
+        pyext::error::clear_error_indicator();
+    }
+
+    return instance;
+}
+
+} // namespace pyitt
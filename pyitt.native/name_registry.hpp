@@ -0,0 +1,44 @@
+#pragma once
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#include <cstdint>
+
+
+namespace pyitt
+{
+
+/**
+ Interns the string and returns its identifier. The identifier 0 is never assigned to a string.
+ The calling thread must hold the GIL.
+ */
+std::uint32_t intern_name(PyObject* name);
+
+/**
+ Returns a new list of the interned names. The name with identifier N is stored at position N.
+ The calling thread must hold the GIL.
+ */
+PyObject* get_interned_names();
+
+/**
+ Returns a new reference to the instance of the type that is interned for the key. If there is no such instance yet,
+ it is created by calling the type with the passed arguments.
+ The calling thread must hold the GIL.
+ */
+PyObject* get_interned_instance(PyTypeObject* type, PyObject* key, PyObject* args);
+
+/**
+ Interns the instance of the type for the key and returns a new reference to it.
+ The calling thread must hold the GIL.
+ */
+PyObject* intern_instance(PyTypeObject* type, PyObject* key, PyObject* instance);
+
+/**
+ Returns a borrowed reference to the instance of the type that is interned for the key, or nullptr if there is no such
+ instance. The error indicator is never set.
+ The calling thread must hold the GIL.
+ */
+PyObject* find_interned_instance(PyTypeObject* type, PyObject* key);
+
+} // namespace pyitt
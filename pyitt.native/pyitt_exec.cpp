@@ -1,15 +1,31 @@
 #define PY_SSIZE_T_CLEAN
 #include <Python.h>
 
+#include "activator.hpp"
+#include "clock_domain.hpp"
 #include "collection_control.hpp"
 #include "counter.hpp"
 #include "domain.hpp"
 #include "event.hpp"
+#include "fork.hpp"
 #include "frame.hpp"
+#include "gauge.hpp"
+#include "heap.hpp"
+#include "histogram.hpp"
 #include "id.hpp"
+#include "jit.hpp"
+#include "manifest.hpp"
+#include "marker.hpp"
+#include "metadata.hpp"
 #include "pt_region.hpp"
+#include "recorder.hpp"
+#include "relation.hpp"
+#include "stats.hpp"
 #include "string_handle.hpp"
+#include "sync.hpp"
 #include "task.hpp"
+#include "task_factory.hpp"
+#include "task_stack.hpp"
 #include "thread_naming.hpp"
 
 
@@ -24,20 +40,76 @@ static int exec_pyitt_module(PyObject* module)
 {
     static PyMethodDef pyitt_functions[] =
     {
+        /* Clock Domain API */
+        {"clock_domain_reset",    clock_domain_reset,    METH_NOARGS,  "Requests the clock information of all clock domains again."},
         /* Collection Control API */
         {"pause",                 pause,                 METH_NOARGS,  "Pause data collection."},
         {"resume",                resume,                METH_NOARGS,  "Resume data collection."},
         {"detach",                detach,                METH_NOARGS,  "Detach data collection."},
+        {"collection_region_begin", collection_region_begin, METH_VARARGS, "Enters a reference-counted collection region on the calling thread."},
+        {"collection_region_end", collection_region_end, METH_O,       "Exits the most recently entered collection region on the calling thread."},
+        {"collection_schedule_start", collection_schedule_start, METH_VARARGS, "Starts a native timer thread that resumes and pauses data collection periodically."},
+        {"collection_schedule_stop", collection_schedule_stop, METH_NOARGS,  "Stops the collection schedule and pauses data collection."},
+        {"collection_schedule_is_active", collection_schedule_is_active, METH_NOARGS,  "Checks if the collection schedule is running."},
+        /* Domain API */
+        {"domain_set_enabled",    domain_set_enabled,    METH_VARARGS, "Enables or disables all domains with the given name."},
+        {"domain_set_allowlist",  domain_set_allowlist,  METH_O,       "Enables only the domains with the given names, or all domains if None is passed."},
+        /* Fork Support */
+        {"after_fork_in_child",   after_fork_in_child,   METH_NOARGS,  "Reinitializes the native state in a child process."},
         /* Frame API */
-        {"frame_begin",           frame_begin,           METH_VARARGS, "Marks the beginning of a frame instance."},
-        {"frame_end",             frame_end,             METH_VARARGS, "Marks the end of a frame instance."},
+        {"frame_begin",           pyext::function_cast(frame_begin), METH_VARARGS | METH_KEYWORDS, "Marks the beginning of a frame instance."},
+        {"frame_end",             pyext::function_cast(frame_end), METH_VARARGS | METH_KEYWORDS, "Marks the end of a frame instance."},
+        {"frame_submit",          pyext::function_cast(frame_submit), METH_VARARGS | METH_KEYWORDS, "Submits a frame instance with the given begin and end timestamps."},
+        {"frame_submit_many",     pyext::function_cast(frame_submit_many), METH_VARARGS | METH_KEYWORDS, "Submits frame instances with the begin and end timestamps from buffers."},
+        {"get_timestamp",         get_timestamp,         METH_NOARGS,  "Returns the current ITT timestamp."},
+        /* Gauges */
+        {"gauge_source_start",    gauge_source_start,    METH_VARARGS, "Starts sampling of a built-in source into a counter by a native thread."},
+        {"gauge_source_stop",     gauge_source_stop,     METH_VARARGS, "Stops sampling of a built-in source."},
+        {"gauge_source_sample",   gauge_source_sample,   METH_O,       "Returns the current value of a built-in source."},
+        /* Heap API */
+        {"heap_tracking_enable",  heap_tracking_enable,  METH_VARARGS, "Reports the sampled allocations of an allocator domain through ITT Heap API."},
+        {"heap_tracking_disable", heap_tracking_disable, METH_VARARGS, "Restores the original allocator of an allocator domain."},
+        {"heap_tracking_is_active", heap_tracking_is_active, METH_VARARGS, "Checks if the allocations of an allocator domain are reported."},
+        /* JIT Profiling API */
+        {"jit_is_profiling_active", jit_is_profiling_active, METH_NOARGS,  "Checks if the JIT profiling is active."},
+        {"jit_register_code",     jit_register_code,     METH_O,       "Registers a code object as a JIT method."},
+        {"jit_set_auto_registration", jit_set_auto_registration, METH_O,       "Enables or disables automatic registration of code objects."},
+        /* Marker API */
+        {"marker",                marker,                METH_VARARGS, "Marks an instant in the given scope."},
+        /* Metadata API */
+        {"metadata_add",          metadata_add,          METH_VARARGS, "Adds metadata to the current task or to the task with the given id."},
+        /* Relation API */
+        {"relation_add",          relation_add,          METH_VARARGS, "Adds a relation between two instances identified by ids."},
+        {"relation_add_to_current", relation_add_to_current, METH_VARARGS, "Adds a relation between the current task and an instance identified by id."},
+        /* Name Manifest */
+        {"manifest_recording_enable", manifest_recording_enable, METH_NOARGS,  "Enables recording of the names of the created string handles and domains."},
+        {"manifest_recording_disable", manifest_recording_disable, METH_NOARGS,  "Disables recording of the names of the created string handles and domains."},
+        {"manifest_snapshot",     manifest_snapshot,     METH_NOARGS,  "Returns the recorded names of the string handles and of the domains."},
+        /* Trace Recorder */
+        {"recorder_enable",       recorder_enable,       METH_VARARGS, "Enables recording of ITT calls into per-thread ring buffers."},
+        {"recorder_disable",      recorder_disable,      METH_NOARGS,  "Disables recording of ITT calls."},
+        {"recorder_is_active",    recorder_is_active,    METH_NOARGS,  "Checks if recording of ITT calls is enabled."},
+        {"recorder_clear",        recorder_clear,        METH_NOARGS,  "Discards the recorded ITT calls."},
+        {"recorder_snapshot",     recorder_snapshot,     METH_NOARGS,  "Returns the interned names and the recorded ITT calls."},
+        /* Duration Statistics */
+        {"stats_enable",          stats_enable,          METH_NOARGS,  "Enables aggregation of task, frame and event durations."},
+        {"stats_disable",         stats_disable,         METH_NOARGS,  "Disables aggregation of durations."},
+        {"stats_is_active",       stats_is_active,       METH_NOARGS,  "Checks if aggregation of durations is enabled."},
+        {"stats_reset",           stats_reset,           METH_NOARGS,  "Discards the aggregated durations."},
+        {"stats_snapshot",        stats_snapshot,        METH_NOARGS,  "Returns the aggregated durations for each region name."},
         /* Thread Naming API */
         {"thread_set_name",       thread_set_name,       METH_O,       "Sets a name for current thread."},
         /* Task API */
-        {"task_begin",            task_begin,            METH_VARARGS, "Marks the beginning of a task."},
-        {"task_end",              task_end,              METH_VARARGS, "Marks the end of a task."},
-        {"task_begin_overlapped", task_begin_overlapped, METH_VARARGS, "Marks the beginning of an overlapped task."},
-        {"task_end_overlapped",   task_end_overlapped,   METH_VARARGS, "Marks the end of an overlapped task."},
+        {"task_begin",            pyext::function_cast(task_begin), METH_VARARGS | METH_KEYWORDS, "Marks the beginning of a task."},
+        {"task_end",              pyext::function_cast(task_end), METH_VARARGS | METH_KEYWORDS, "Marks the end of a task."},
+        {"task_begin_overlapped", pyext::function_cast(task_begin_overlapped), METH_VARARGS | METH_KEYWORDS, "Marks the beginning of an overlapped task."},
+        {"task_end_overlapped",   pyext::function_cast(task_end_overlapped), METH_VARARGS | METH_KEYWORDS, "Marks the end of an overlapped task."},
+        {"task_begin_ex",         pyext::function_cast(task_begin_ex), METH_VARARGS | METH_KEYWORDS, "Marks the beginning of a task at the given timestamp."},
+        {"task_end_ex",           pyext::function_cast(task_end_ex), METH_VARARGS | METH_KEYWORDS, "Marks the end of a task at the given timestamp."},
+        {"task_begin_overlapped_ex", pyext::function_cast(task_begin_overlapped_ex), METH_VARARGS | METH_KEYWORDS, "Marks the beginning of an overlapped task at the given timestamp."},
+        {"task_end_overlapped_ex", pyext::function_cast(task_end_overlapped_ex), METH_VARARGS | METH_KEYWORDS, "Marks the end of an overlapped task at the given timestamp."},
+        {"task_stack",            task_stack,            METH_NOARGS,  "Returns the active tasks of the calling thread and context from the outermost to the innermost."},
+        {"current_task",          current_task,          METH_NOARGS,  "Returns the innermost active task of the calling thread and context."},
         /* marks end of array */
         { nullptr },
     };
@@ -53,6 +125,8 @@ static int exec_pyitt_module(PyObject* module)
 
 static void destroy_pyitt_module(void*)
 {
+    collection_schedule_shutdown();
+    gauge_shutdown();
     __itt_release_resources();
 }
 
@@ -68,7 +142,13 @@ PyObject* init_pyitt_module()
         { Py_mod_exec, reinterpret_cast<void*>(exec_event) },
         { Py_mod_exec, reinterpret_cast<void*>(exec_id) },
         { Py_mod_exec, reinterpret_cast<void*>(exec_counter) },
+        { Py_mod_exec, reinterpret_cast<void*>(exec_histogram) },
         { Py_mod_exec, reinterpret_cast<void*>(exec_pt_region) },
+        { Py_mod_exec, reinterpret_cast<void*>(exec_sync_object) },
+        { Py_mod_exec, reinterpret_cast<void*>(exec_clock_domain) },
+        { Py_mod_exec, reinterpret_cast<void*>(exec_activators) },
+        { Py_mod_exec, reinterpret_cast<void*>(exec_task_stack) },
+        { Py_mod_exec, reinterpret_cast<void*>(exec_task_factory) },
         { 0, nullptr }
     };
 
@@ -0,0 +1,341 @@
+#include "recorder.hpp"
+
+#include <algorithm>
+#include <chrono>
+#include <cstring>
+#include <deque>
+#include <iterator>
+#include <memory>
+#include <mutex>
+#include <new>
+#include <vector>
+
+#include "fork.hpp"
+#include "name_registry.hpp"
+
+#include "extensions/python.hpp"
+
+
+namespace pyitt
+{
+
+std::atomic<bool> recorder_enabled_flag = false;
+
+struct recorder_buffer
+{
+    recorder_buffer(unsigned long tid, std::size_t size)
+        : thread_id(tid)
+        , capacity(size)
+        , count(0)
+        , records(new recorder_record[size])
+    {}
+
+    unsigned long thread_id;
+    std::size_t capacity;
+    std::atomic<std::uint64_t> count;
+    std::unique_ptr<recorder_record[]> records;
+};
+
+struct recorder_state
+{
+    std::mutex lock;
+    std::atomic<std::uint64_t> generation = 0;
+    std::size_t capacity = 0;
+
+    /* The buffers of the current capacity, the buffers of finished threads are kept to be exported. */
+    std::vector<std::unique_ptr<recorder_buffer>> buffers;
+    std::deque<recorder_buffer*> finished_buffers;
+
+    /* The buffers of the previous capacities, they are destroyed as soon as their threads stop using them. */
+    std::vector<std::unique_ptr<recorder_buffer>> retired_buffers;
+};
+
+struct recorder_thread_cache
+{
+    ~recorder_thread_cache();
+
+    recorder_buffer* buffer = nullptr;
+    std::uint64_t generation = 0;
+};
+
+static constexpr Py_ssize_t recorder_default_capacity = 1 << 16;
+
+/* The maximum number of the buffers of finished threads, the oldest ones are destroyed when it is exceeded. */
+static constexpr std::size_t recorder_max_finished_buffers = 16;
+
+static thread_local recorder_thread_cache thread_cache;
+
+static unsigned long get_thread_id();
+static std::uint64_t get_timestamp();
+
+static recorder_state*& get_recorder_state_pointer()
+{
+    static recorder_state* state = new recorder_state();
+    return state;
+}
+
+static recorder_state& get_recorder_state()
+{
+    return *get_recorder_state_pointer();
+}
+
+using recorder_buffers = std::vector<std::unique_ptr<recorder_buffer>>;
+
+static recorder_buffers::iterator find_buffer(recorder_buffers& buffers, recorder_buffer* buffer)
+{
+    return std::find_if(buffers.begin(), buffers.end(), [buffer](const auto& item) { return item.get() == buffer; });
+}
+
+static bool erase_buffer(recorder_buffers& buffers, recorder_buffer* buffer)
+{
+    auto it = find_buffer(buffers, buffer);
+    if (it == buffers.end())
+    {
+        return false;
+    }
+
+    buffers.erase(it);
+    return true;
+}
+
+/* Releases the buffer that is not used by its thread anymore, the state must be locked. */
+static void release_buffer(recorder_state& state, recorder_buffer* buffer)
+{
+    if (erase_buffer(state.retired_buffers, buffer))
+    {
+        return;
+    }
+
+    /* The buffer can be unknown in a child process, since the state of the parent process has been replaced. */
+    if (find_buffer(state.buffers, buffer) == state.buffers.end())
+    {
+        return;
+    }
+
+    state.finished_buffers.push_back(buffer);
+    if (state.finished_buffers.size() > recorder_max_finished_buffers)
+    {
+        erase_buffer(state.buffers, state.finished_buffers.front());
+        state.finished_buffers.pop_front();
+    }
+}
+
+/*
+ Retires all buffers, the state must be locked. The buffers of finished threads are destroyed, the others are kept until
+ their threads drop them on the next write, since the threads can be writing to them at the moment.
+ */
+static void retire_buffers(recorder_state& state)
+{
+    for (recorder_buffer* buffer : state.finished_buffers)
+    {
+        erase_buffer(state.buffers, buffer);
+    }
+    state.finished_buffers.clear();
+
+    std::move(state.buffers.begin(), state.buffers.end(), std::back_inserter(state.retired_buffers));
+    state.buffers.clear();
+
+    state.generation.fetch_add(1, std::memory_order_release);
+}
+
+recorder_thread_cache::~recorder_thread_cache()
+{
+    if (buffer)
+    {
+        recorder_state& state = get_recorder_state();
+        std::lock_guard<std::mutex> guard(state.lock);
+
+        release_buffer(state, buffer);
+        buffer = nullptr;
+    }
+}
+
+static recorder_buffer* get_thread_buffer()
+{
+    recorder_state& state = get_recorder_state();
+
+    if (thread_cache.buffer && thread_cache.generation == state.generation.load(std::memory_order_acquire))
+    {
+        return thread_cache.buffer;
+    }
+
+    std::lock_guard<std::mutex> guard(state.lock);
+
+    if (thread_cache.buffer)
+    {
+        release_buffer(state, thread_cache.buffer);
+        thread_cache.buffer = nullptr;
+    }
+
+    recorder_buffer* buffer = nullptr;
+    try
+    {
+        state.buffers.push_back(std::make_unique<recorder_buffer>(get_thread_id(), state.capacity));
+        buffer = state.buffers.back().get();
+    }
+    catch (const std::bad_alloc&)
+    {
+        return nullptr;
+    }
+
+    thread_cache.buffer = buffer;
+    thread_cache.generation = state.generation.load(std::memory_order_relaxed);
+
+    return buffer;
+}
+
+static unsigned long get_thread_id()
+{
+#if defined(PYPY_VERSION)
+    return PyThread_get_thread_ident();
+#else
+    return PyThread_get_thread_native_id();
+#endif
+}
+
+static std::uint64_t get_timestamp()
+{
+    auto since_epoch = std::chrono::steady_clock::now().time_since_epoch();
+    return static_cast<std::uint64_t>(std::chrono::duration_cast<std::chrono::nanoseconds>(since_epoch).count());
+}
+
+void recorder_write(recorder_record_type type, std::uint32_t name, std::uint32_t domain, std::uint64_t value)
+{
+    recorder_buffer* buffer = get_thread_buffer();
+    if (buffer == nullptr)
+    {
+        return;
+    }
+
+    const std::uint64_t index = buffer->count.load(std::memory_order_relaxed);
+
+    recorder_record& record = buffer->records[index % buffer->capacity];
+    record.timestamp = get_timestamp();
+    record.type = static_cast<std::uint32_t>(type);
+    record.name = name;
+    record.domain = domain;
+    record.reserved = 0;
+    record.value = value;
+
+    buffer->count.store(index + 1, std::memory_order_release);
+}
+
+void recorder_after_fork_in_child()
+{
+    /*
+     The mutex of the state could be locked by another thread of the parent process at the moment of fork, so the state
+     is replaced instead of being reset. The old state is leaked intentionally.
+     */
+    recorder_state*& state = get_recorder_state_pointer();
+
+    recorder_state* new_state = new (std::nothrow) recorder_state();
+    if (new_state == nullptr)
+    {
+        recorder_enabled_flag.store(false, std::memory_order_relaxed);
+        return;
+    }
+
+    new_state->capacity = state->capacity;
+    new_state->generation.store(state->generation.load(std::memory_order_relaxed) + 1, std::memory_order_release);
+    state = new_state;
+}
+
+PyObject* recorder_enable(PyObject* Py_UNUSED(self), PyObject* args)
+{
+    Py_ssize_t capacity = recorder_default_capacity;
+    if (!PyArg_ParseTuple(args, "|n", &capacity))
+    {
+        return nullptr;
+    }
+
+    if (capacity <= 0)
+    {
+        return PyErr_Format(PyExc_ValueError, "The passed capacity must be a positive number.");
+    }
+
+    if (!register_after_fork_in_child())
+    {
+        return nullptr;
+    }
+
+    recorder_state& state = get_recorder_state();
+    {
+        std::lock_guard<std::mutex> guard(state.lock);
+
+        if (static_cast<std::size_t>(capacity) != state.capacity)
+        {
+            state.capacity = static_cast<std::size_t>(capacity);
+            retire_buffers(state);
+        }
+    }
+
+    recorder_enabled_flag.store(true, std::memory_order_relaxed);
+
+    Py_RETURN_NONE;
+}
+
+PyObject* recorder_disable(PyObject* Py_UNUSED(self), PyObject* Py_UNUSED(args))
+{
+    recorder_enabled_flag.store(false, std::memory_order_relaxed);
+    Py_RETURN_NONE;
+}
+
+PyObject* recorder_is_active(PyObject* Py_UNUSED(self), PyObject* Py_UNUSED(args))
+{
+    return PyBool_FromLong(recorder_is_enabled());
+}
+
+PyObject* recorder_clear(PyObject* Py_UNUSED(self), PyObject* Py_UNUSED(args))
+{
+    recorder_state& state = get_recorder_state();
+    std::lock_guard<std::mutex> guard(state.lock);
+
+    /* The buffers are not reset in place, since other threads can be writing to them while recording is active. */
+    retire_buffers(state);
+
+    Py_RETURN_NONE;
+}
+
+PyObject* recorder_snapshot(PyObject* Py_UNUSED(self), PyObject* Py_UNUSED(args))
+{
+    recorder_state& state = get_recorder_state();
+    std::lock_guard<std::mutex> guard(state.lock);
+
+    pyext::pyobject_holder<PyObject> names = get_interned_names();
+    pyext::pyobject_holder<PyObject> threads = PyList_New(0);
+    if (names == nullptr || threads == nullptr)
+    {
+        return nullptr;
+    }
+
+    for (auto& buffer : state.buffers)
+    {
+        const std::uint64_t count = buffer->count.load(std::memory_order_acquire);
+        const std::size_t size = static_cast<std::size_t>(std::min<std::uint64_t>(count, buffer->capacity));
+        const std::size_t first = static_cast<std::size_t>((count - size) % buffer->capacity);
+        const std::size_t head_size = std::min(size, buffer->capacity - first);
+
+        pyext::pyobject_holder<PyObject> records = PyBytes_FromStringAndSize(
+            nullptr, static_cast<Py_ssize_t>(size * sizeof(recorder_record)));
+        if (records == nullptr)
+        {
+            return nullptr;
+        }
+
+        char* data = PyBytes_AS_STRING(records.get());
+        std::memcpy(data, buffer->records.get() + first, head_size * sizeof(recorder_record));
+        std::memcpy(data + head_size * sizeof(recorder_record),
+                    buffer->records.get(),
+                    (size - head_size) * sizeof(recorder_record));
+
+        pyext::pyobject_holder<PyObject> thread = Py_BuildValue("(kO)", buffer->thread_id, records.get());
+        if (thread == nullptr || PyList_Append(threads.get(), thread.get()) < 0)
+        {
+            return nullptr;
+        }
+    }
+
+    return PyTuple_Pack(2, names.get(), threads.get());
+}
+
+} // namespace pyitt
@@ -0,0 +1,57 @@
+#pragma once
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#include <atomic>
+#include <cstdint>
+
+
+namespace pyitt
+{
+
+enum class recorder_record_type : std::uint32_t
+{
+	task_begin = 1,
+	task_end = 2,
+	task_begin_overlapped = 3,
+	task_end_overlapped = 4,
+	frame_begin = 5,
+	frame_end = 6,
+	event_begin = 7,
+	event_end = 8,
+	counter = 9,
+	thread_name = 10,
+	marker = 11,
+};
+
+/* The layout of the record is a part of the interface, since records are exported as raw bytes. */
+struct recorder_record
+{
+	std::uint64_t timestamp;
+	std::uint32_t type;
+	std::uint32_t name;
+	std::uint32_t domain;
+	std::uint32_t reserved;
+	std::uint64_t value;
+};
+
+extern std::atomic<bool> recorder_enabled_flag;
+
+inline bool recorder_is_enabled()
+{
+	return recorder_enabled_flag.load(std::memory_order_relaxed);
+}
+
+void recorder_write(recorder_record_type type, std::uint32_t name, std::uint32_t domain, std::uint64_t value);
+
+/* Discards the records of the parent process in a child process. */
+void recorder_after_fork_in_child();
+
+PyObject* recorder_enable(PyObject* self, PyObject* args);
+PyObject* recorder_disable(PyObject* self, PyObject* args);
+PyObject* recorder_is_active(PyObject* self, PyObject* args);
+PyObject* recorder_clear(PyObject* self, PyObject* args);
+PyObject* recorder_snapshot(PyObject* self, PyObject* args);
+
+} // namespace pyitt
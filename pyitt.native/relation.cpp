@@ -0,0 +1,107 @@
+#include "relation.hpp"
+
+#include <ittnotify.h>
+
+#include "domain.hpp"
+#include "id.hpp"
+
+#include "extensions/error_template.hpp"
+#include "extensions/python.hpp"
+
+
+namespace pyitt
+{
+
+static bool get_relation(int value, __itt_relation& relation)
+{
+    if (value <= __itt_relation_is_unknown || value > __itt_relation_is_predecessor_to)
+    {
+        PyErr_Format(PyExc_ValueError, "The passed relation %d is not a valid relation.", value);
+        return false;
+    }
+
+    relation = static_cast<__itt_relation>(value);
+    return true;
+}
+
+PyObject* relation_add(PyObject* self, PyObject* args)
+{
+    PyObject* domain = nullptr;
+    PyObject* head_id = nullptr;
+    int relation_value = 0;
+    PyObject* tail_id = nullptr;
+
+    if (!PyArg_ParseTuple(args, "OOiO", &domain, &head_id, &relation_value, &tail_id))
+    {
+        return nullptr;
+    }
+
+    Domain* domain_obj = pyext::pyobject_cast<Domain>(domain);
+    if (domain_obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "domain", Domain::object_type.tp_name);
+    }
+
+    Id* head_id_obj = pyext::pyobject_cast<Id>(head_id);
+    if (head_id_obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "head", Id::object_type.tp_name);
+    }
+
+    __itt_relation relation = __itt_relation_is_unknown;
+    if (!get_relation(relation_value, relation))
+    {
+        return nullptr;
+    }
+
+    Id* tail_id_obj = pyext::pyobject_cast<Id>(tail_id);
+    if (tail_id_obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "tail", Id::object_type.tp_name);
+    }
+
+    __itt_relation_add(domain_get_handle(domain_obj), id_get_handle(head_id_obj), relation, id_get_handle(tail_id_obj));
+
+    Py_RETURN_NONE;
+}
+
+PyObject* relation_add_to_current(PyObject* self, PyObject* args)
+{
+    PyObject* domain = nullptr;
+    int relation_value = 0;
+    PyObject* tail_id = nullptr;
+
+    if (!PyArg_ParseTuple(args, "OiO", &domain, &relation_value, &tail_id))
+    {
+        return nullptr;
+    }
+
+    Domain* domain_obj = pyext::pyobject_cast<Domain>(domain);
+    if (domain_obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "domain", Domain::object_type.tp_name);
+    }
+
+    __itt_relation relation = __itt_relation_is_unknown;
+    if (!get_relation(relation_value, relation))
+    {
+        return nullptr;
+    }
+
+    Id* tail_id_obj = pyext::pyobject_cast<Id>(tail_id);
+    if (tail_id_obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "tail", Id::object_type.tp_name);
+    }
+
+    __itt_relation_add_to_current(domain_get_handle(domain_obj), relation, id_get_handle(tail_id_obj));
+
+    Py_RETURN_NONE;
+}
+
+} // namespace pyitt
@@ -0,0 +1,13 @@
+#pragma once
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+
+namespace pyitt
+{
+
+PyObject* relation_add(PyObject* self, PyObject* args);
+PyObject* relation_add_to_current(PyObject* self, PyObject* args);
+
+} // namespace pyitt
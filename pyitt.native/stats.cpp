@@ -0,0 +1,538 @@
+#include "stats.hpp"
+
+#include <algorithm>
+#include <array>
+#include <bit>
+#include <chrono>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <new>
+#include <utility>
+#include <vector>
+
+#include "fork.hpp"
+#include "name_registry.hpp"
+
+#include "extensions/python.hpp"
+
+
+namespace pyitt
+{
+
+std::atomic<bool> stats_enabled_flag = false;
+
+/*
+ The histograms use logarithmic buckets: the values below 8 have their own buckets, and every power of two above is
+ split into 8 linear sub-buckets. So, the relative error of the reported percentiles does not exceed 12.5%.
+ */
+static constexpr unsigned int histogram_sub_bucket_bits = 3;
+static constexpr std::size_t histogram_sub_bucket_count = std::size_t(1) << histogram_sub_bucket_bits;
+static constexpr std::size_t histogram_bucket_count = (64 - histogram_sub_bucket_bits + 1) * histogram_sub_bucket_count;
+
+/* The histograms of a thread are stored in a two-level table indexed by the identifier of the interned name. */
+static constexpr std::size_t histogram_chunk_size = 256;
+static constexpr std::size_t histogram_chunk_count = 1024;
+
+/* Every histogram is updated only by its owner thread, and it is read by any thread while the statistics are merged. */
+struct stats_histogram
+{
+    void add(std::uint64_t value);
+
+    std::atomic<std::uint64_t> count;
+    std::atomic<std::uint64_t> total;
+    std::atomic<std::uint64_t> max;
+    std::array<std::atomic<std::uint64_t>, histogram_bucket_count> buckets;
+};
+
+struct stats_histogram_chunk
+{
+    std::array<std::atomic<stats_histogram*>, histogram_chunk_size> histograms;
+};
+
+using stats_region_key = std::pair<std::uint32_t, std::uint64_t>;
+using stats_region_start = std::pair<std::uint32_t, std::uint64_t>;
+
+struct stats_thread_block
+{
+    stats_histogram* get_histogram(std::uint32_t name);
+
+    std::array<std::atomic<stats_histogram_chunk*>, histogram_chunk_count> chunks;
+
+    /* The regions that are started by the owner thread. */
+    std::uint64_t generation = 0;
+    std::vector<stats_region_start> tasks;
+    std::vector<stats_region_start> events;
+    std::map<stats_region_key, std::uint64_t> frames;
+};
+
+struct stats_thread_holder
+{
+    ~stats_thread_holder();
+
+    stats_thread_block* block = nullptr;
+};
+
+struct stats_state
+{
+    std::mutex lock;
+    std::atomic<std::uint64_t> generation = 0;
+
+    /* Blocks are never destroyed, the blocks of finished threads are reused by new threads. */
+    std::vector<std::unique_ptr<stats_thread_block>> blocks;
+    std::vector<stats_thread_block*> free_blocks;
+
+    std::mutex overlapped_tasks_lock;
+    std::map<stats_region_key, stats_region_start> overlapped_tasks;
+};
+
+static thread_local stats_thread_holder thread_holder;
+
+static stats_state*& get_stats_state_pointer()
+{
+    static stats_state* state = new stats_state();
+    return state;
+}
+
+static stats_state& get_stats_state()
+{
+    return *get_stats_state_pointer();
+}
+
+static std::uint64_t get_timestamp()
+{
+    auto since_epoch = std::chrono::steady_clock::now().time_since_epoch();
+    return static_cast<std::uint64_t>(std::chrono::duration_cast<std::chrono::nanoseconds>(since_epoch).count());
+}
+
+static std::size_t get_bucket_index(std::uint64_t value)
+{
+    if (value < histogram_sub_bucket_count)
+    {
+        return static_cast<std::size_t>(value);
+    }
+
+    const unsigned int exponent = 63 - static_cast<unsigned int>(std::countl_zero(value));
+    const unsigned int shift = exponent - histogram_sub_bucket_bits;
+
+    return (shift + 1) * histogram_sub_bucket_count
+        + static_cast<std::size_t>((value >> shift) & (histogram_sub_bucket_count - 1));
+}
+
+static std::uint64_t get_bucket_upper_bound(std::size_t index)
+{
+    if (index < histogram_sub_bucket_count)
+    {
+        return index;
+    }
+
+    const std::size_t shift = index / histogram_sub_bucket_count - 1;
+    const std::uint64_t lower_bound = (histogram_sub_bucket_count + index % histogram_sub_bucket_count) << shift;
+
+    return lower_bound + ((std::uint64_t(1) << shift) - 1);
+}
+
+void stats_histogram::add(std::uint64_t value)
+{
+    /* There is a single writer, so plain load/store pairs are enough and no locked instructions are needed. */
+    count.store(count.load(std::memory_order_relaxed) + 1, std::memory_order_relaxed);
+    total.store(total.load(std::memory_order_relaxed) + value, std::memory_order_relaxed);
+    if (value > max.load(std::memory_order_relaxed))
+    {
+        max.store(value, std::memory_order_relaxed);
+    }
+
+    std::atomic<std::uint64_t>& bucket = buckets[get_bucket_index(value)];
+    bucket.store(bucket.load(std::memory_order_relaxed) + 1, std::memory_order_relaxed);
+}
+
+stats_histogram* stats_thread_block::get_histogram(std::uint32_t name)
+{
+    const std::size_t chunk_index = name / histogram_chunk_size;
+    if (name == 0 || chunk_index >= histogram_chunk_count)
+    {
+        return nullptr;
+    }
+
+    stats_histogram_chunk* chunk = chunks[chunk_index].load(std::memory_order_relaxed);
+    if (chunk == nullptr)
+    {
+        chunk = new (std::nothrow) stats_histogram_chunk();
+        if (chunk == nullptr)
+        {
+            return nullptr;
+        }
+
+        chunks[chunk_index].store(chunk, std::memory_order_release);
+    }
+
+    std::atomic<stats_histogram*>& slot = chunk->histograms[name % histogram_chunk_size];
+    stats_histogram* histogram = slot.load(std::memory_order_relaxed);
+    if (histogram == nullptr)
+    {
+        histogram = new (std::nothrow) stats_histogram();
+        if (histogram == nullptr)
+        {
+            return nullptr;
+        }
+
+        slot.store(histogram, std::memory_order_release);
+    }
+
+    return histogram;
+}
+
+stats_thread_holder::~stats_thread_holder()
+{
+    if (block)
+    {
+        stats_state& state = get_stats_state();
+        std::lock_guard<std::mutex> guard(state.lock);
+
+        state.free_blocks.push_back(block);
+    }
+}
+
+static stats_thread_block* get_thread_block()
+{
+    stats_state& state = get_stats_state();
+    stats_thread_block* block = thread_holder.block;
+
+    if (block == nullptr)
+    {
+        std::lock_guard<std::mutex> guard(state.lock);
+
+        if (state.free_blocks.empty())
+        {
+            try
+            {
+                state.blocks.push_back(std::make_unique<stats_thread_block>());
+                block = state.blocks.back().get();
+            }
+            catch (const std::bad_alloc&)
+            {
+                return nullptr;
+            }
+        }
+        else
+        {
+            block = state.free_blocks.back();
+            state.free_blocks.pop_back();
+        }
+
+        block->generation = 0;
+        thread_holder.block = block;
+    }
+
+    const std::uint64_t generation = state.generation.load(std::memory_order_acquire);
+    if (block->generation != generation)
+    {
+        block->tasks.clear();
+        block->events.clear();
+        block->frames.clear();
+        block->generation = generation;
+    }
+
+    return block;
+}
+
+static void add_duration(stats_thread_block* block, std::uint32_t name, std::uint64_t begin, std::uint64_t end)
+{
+    if (stats_histogram* histogram = block->get_histogram(name))
+    {
+        histogram->add(end > begin ? end - begin : 0);
+    }
+}
+
+void stats_task_begin(std::uint32_t name)
+{
+    if (stats_thread_block* block = get_thread_block())
+    {
+        block->tasks.emplace_back(name, get_timestamp());
+    }
+}
+
+void stats_task_end()
+{
+    const std::uint64_t timestamp = get_timestamp();
+
+    stats_thread_block* block = get_thread_block();
+    if (block && !block->tasks.empty())
+    {
+        add_duration(block, block->tasks.back().first, block->tasks.back().second, timestamp);
+        block->tasks.pop_back();
+    }
+}
+
+void stats_task_begin_overlapped(std::uint32_t name, std::uint32_t domain, std::uint64_t id)
+{
+    const std::uint64_t timestamp = get_timestamp();
+
+    stats_state& state = get_stats_state();
+    std::lock_guard<std::mutex> guard(state.overlapped_tasks_lock);
+
+    state.overlapped_tasks[stats_region_key(domain, id)] = stats_region_start(name, timestamp);
+}
+
+void stats_task_end_overlapped(std::uint32_t domain, std::uint64_t id)
+{
+    const std::uint64_t timestamp = get_timestamp();
+
+    stats_region_start start;
+    {
+        stats_state& state = get_stats_state();
+        std::lock_guard<std::mutex> guard(state.overlapped_tasks_lock);
+
+        auto it = state.overlapped_tasks.find(stats_region_key(domain, id));
+        if (it == state.overlapped_tasks.end())
+        {
+            return;
+        }
+
+        start = it->second;
+        state.overlapped_tasks.erase(it);
+    }
+
+    if (stats_thread_block* block = get_thread_block())
+    {
+        add_duration(block, start.first, start.second, timestamp);
+    }
+}
+
+void stats_frame_begin(std::uint32_t domain, std::uint64_t id)
+{
+    if (stats_thread_block* block = get_thread_block())
+    {
+        block->frames[stats_region_key(domain, id)] = get_timestamp();
+    }
+}
+
+void stats_frame_end(std::uint32_t domain, std::uint64_t id)
+{
+    const std::uint64_t timestamp = get_timestamp();
+
+    if (stats_thread_block* block = get_thread_block())
+    {
+        auto it = block->frames.find(stats_region_key(domain, id));
+        if (it != block->frames.end())
+        {
+            add_duration(block, domain, it->second, timestamp);
+            block->frames.erase(it);
+        }
+    }
+}
+
+void stats_event_begin(std::uint32_t name)
+{
+    if (stats_thread_block* block = get_thread_block())
+    {
+        block->events.emplace_back(name, get_timestamp());
+    }
+}
+
+void stats_event_end(std::uint32_t name)
+{
+    const std::uint64_t timestamp = get_timestamp();
+
+    if (stats_thread_block* block = get_thread_block())
+    {
+        auto it = std::find_if(block->events.rbegin(), block->events.rend(),
+                               [name](const stats_region_start& start) { return start.first == name; });
+        if (it != block->events.rend())
+        {
+            add_duration(block, name, it->second, timestamp);
+            block->events.erase(std::next(it).base());
+        }
+    }
+}
+
+void stats_after_fork_in_child()
+{
+    /*
+     The mutexes of the state could be locked by other threads of the parent process at the moment of fork, so the
+     state is replaced instead of being reset. The old state and the blocks of the parent threads are leaked
+     intentionally.
+     */
+    stats_state*& state = get_stats_state_pointer();
+
+    stats_state* new_state = new (std::nothrow) stats_state();
+    if (new_state == nullptr)
+    {
+        stats_enabled_flag.store(false, std::memory_order_relaxed);
+        return;
+    }
+
+    new_state->generation.store(state->generation.load(std::memory_order_relaxed) + 1, std::memory_order_release);
+    state = new_state;
+
+    /* Only the thread that has called fork exists in the child process. */
+    thread_holder.block = nullptr;
+}
+
+PyObject* stats_enable(PyObject* Py_UNUSED(self), PyObject* Py_UNUSED(args))
+{
+    if (!register_after_fork_in_child())
+    {
+        return nullptr;
+    }
+
+    stats_state& state = get_stats_state();
+
+    if (!stats_enabled_flag.exchange(true))
+    {
+        /* The regions that have been started while the statistics were disabled are discarded. */
+        state.generation.fetch_add(1, std::memory_order_release);
+
+        std::lock_guard<std::mutex> guard(state.overlapped_tasks_lock);
+        state.overlapped_tasks.clear();
+    }
+
+    Py_RETURN_NONE;
+}
+
+PyObject* stats_disable(PyObject* Py_UNUSED(self), PyObject* Py_UNUSED(args))
+{
+    stats_enabled_flag.store(false, std::memory_order_relaxed);
+    Py_RETURN_NONE;
+}
+
+PyObject* stats_is_active(PyObject* Py_UNUSED(self), PyObject* Py_UNUSED(args))
+{
+    return PyBool_FromLong(stats_is_enabled());
+}
+
+PyObject* stats_reset(PyObject* Py_UNUSED(self), PyObject* Py_UNUSED(args))
+{
+    stats_state& state = get_stats_state();
+    std::lock_guard<std::mutex> guard(state.lock);
+
+    for (auto& block : state.blocks)
+    {
+        for (auto& chunk_slot : block->chunks)
+        {
+            stats_histogram_chunk* chunk = chunk_slot.load(std::memory_order_acquire);
+            if (chunk == nullptr)
+            {
+                continue;
+            }
+
+            for (auto& histogram_slot : chunk->histograms)
+            {
+                stats_histogram* histogram = histogram_slot.load(std::memory_order_acquire);
+                if (histogram == nullptr)
+                {
+                    continue;
+                }
+
+                histogram->count.store(0, std::memory_order_relaxed);
+                histogram->total.store(0, std::memory_order_relaxed);
+                histogram->max.store(0, std::memory_order_relaxed);
+                for (auto& bucket : histogram->buckets)
+                {
+                    bucket.store(0, std::memory_order_relaxed);
+                }
+            }
+        }
+    }
+
+    Py_RETURN_NONE;
+}
+
+struct stats_merged_histogram
+{
+    std::uint64_t count = 0;
+    std::uint64_t total = 0;
+    std::uint64_t max = 0;
+    std::array<std::uint64_t, histogram_bucket_count> buckets = {};
+};
+
+static std::uint64_t get_percentile(const stats_merged_histogram& histogram, std::uint64_t percent)
+{
+    const std::uint64_t rank = std::max<std::uint64_t>(1, (histogram.count * percent + 99) / 100);
+
+    std::uint64_t count = 0;
+    for (std::size_t index = 0; index < histogram_bucket_count; ++index)
+    {
+        count += histogram.buckets[index];
+        if (count >= rank)
+        {
+            return std::min(get_bucket_upper_bound(index), histogram.max);
+        }
+    }
+
+    return histogram.max;
+}
+
+static void merge_histogram(stats_merged_histogram& merged, const stats_histogram& histogram)
+{
+    merged.count += histogram.count.load(std::memory_order_relaxed);
+    merged.total += histogram.total.load(std::memory_order_relaxed);
+    merged.max = std::max(merged.max, histogram.max.load(std::memory_order_relaxed));
+
+    for (std::size_t index = 0; index < histogram_bucket_count; ++index)
+    {
+        merged.buckets[index] += histogram.buckets[index].load(std::memory_order_relaxed);
+    }
+}
+
+PyObject* stats_snapshot(PyObject* Py_UNUSED(self), PyObject* Py_UNUSED(args))
+{
+    std::map<std::uint32_t, stats_merged_histogram> merged_histograms;
+    {
+        stats_state& state = get_stats_state();
+        std::lock_guard<std::mutex> guard(state.lock);
+
+        for (auto& block : state.blocks)
+        {
+            for (std::size_t chunk_index = 0; chunk_index < histogram_chunk_count; ++chunk_index)
+            {
+                stats_histogram_chunk* chunk = block->chunks[chunk_index].load(std::memory_order_acquire);
+                if (chunk == nullptr)
+                {
+                    continue;
+                }
+
+                for (std::size_t index = 0; index < histogram_chunk_size; ++index)
+                {
+                    stats_histogram* histogram = chunk->histograms[index].load(std::memory_order_acquire);
+                    if (histogram && histogram->count.load(std::memory_order_relaxed))
+                    {
+                        const auto name = static_cast<std::uint32_t>(chunk_index * histogram_chunk_size + index);
+                        merge_histogram(merged_histograms[name], *histogram);
+                    }
+                }
+            }
+        }
+    }
+
+    pyext::pyobject_holder<PyObject> names = get_interned_names();
+    pyext::pyobject_holder<PyObject> result = PyDict_New();
+    if (names == nullptr || result == nullptr)
+    {
+        return nullptr;
+    }
+
+    for (const auto& [name, histogram] : merged_histograms)
+    {
+        if (histogram.count == 0 || static_cast<Py_ssize_t>(name) >= PyList_GET_SIZE(names.get()))
+        {
+            continue;
+        }
+
+        pyext::pyobject_holder<PyObject> value = Py_BuildValue("(KKKKKK)",
+            static_cast<unsigned long long>(histogram.count),
+            static_cast<unsigned long long>(histogram.total),
+            static_cast<unsigned long long>(get_percentile(histogram, 50)),
+            static_cast<unsigned long long>(get_percentile(histogram, 90)),
+            static_cast<unsigned long long>(get_percentile(histogram, 99)),
+            static_cast<unsigned long long>(histogram.max));
+        if (value == nullptr || PyDict_SetItem(result.get(), PyList_GET_ITEM(names.get(), name), value.get()) < 0)
+        {
+            return nullptr;
+        }
+    }
+
+    return result.release();
+}
+
+} // namespace pyitt
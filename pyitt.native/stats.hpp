@@ -0,0 +1,38 @@
+#pragma once
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#include <atomic>
+#include <cstdint>
+
+
+namespace pyitt
+{
+
+extern std::atomic<bool> stats_enabled_flag;
+
+inline bool stats_is_enabled()
+{
+	return stats_enabled_flag.load(std::memory_order_relaxed);
+}
+
+void stats_task_begin(std::uint32_t name);
+void stats_task_end();
+void stats_task_begin_overlapped(std::uint32_t name, std::uint32_t domain, std::uint64_t id);
+void stats_task_end_overlapped(std::uint32_t domain, std::uint64_t id);
+void stats_frame_begin(std::uint32_t domain, std::uint64_t id);
+void stats_frame_end(std::uint32_t domain, std::uint64_t id);
+void stats_event_begin(std::uint32_t name);
+void stats_event_end(std::uint32_t name);
+
+/* Discards the statistics of the parent process in a child process. */
+void stats_after_fork_in_child();
+
+PyObject* stats_enable(PyObject* self, PyObject* args);
+PyObject* stats_disable(PyObject* self, PyObject* args);
+PyObject* stats_is_active(PyObject* self, PyObject* args);
+PyObject* stats_reset(PyObject* self, PyObject* args);
+PyObject* stats_snapshot(PyObject* self, PyObject* args);
+
+} // namespace pyitt
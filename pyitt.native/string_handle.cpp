@@ -2,6 +2,8 @@
 
 #include <structmember.h>
 
+#include "manifest.hpp"
+
 #include "extensions/error_template.hpp"
 #include "extensions/python.hpp"
 #include "extensions/string.hpp"
@@ -16,12 +18,24 @@ static void string_handle_dealloc(PyObject* self);
 static PyObject* string_handle_repr(PyObject* self);
 static PyObject* string_handle_str(PyObject* self);
 
+static PyObject* string_handle_reduce(PyObject* self, PyObject* args);
+static PyObject* string_handle_from_string(PyObject* cls, PyObject* str);
+static PyObject* string_handle_create_many(PyObject* cls, PyObject* strings);
+
 static PyMemberDef string_handle_attrs[] =
 {
     {"_str",  T_OBJECT, offsetof(StringHandle, str), READONLY, "a string for which the handle has been created"},
     {nullptr},
 };
 
+static PyMethodDef string_handle_methods[] =
+{
+    {"__reduce__",   string_handle_reduce,      METH_NOARGS,         "Returns the state of the string handle for pickling."},
+    {"_from_string", string_handle_from_string, METH_O | METH_CLASS, "Returns the interned string handle for the given string."},
+    {"create_many",  string_handle_create_many, METH_O | METH_CLASS, "Creates the interned string handles for the given strings."},
+    {nullptr},
+};
+
 PyTypeObject StringHandle::object_type =
 {
     .ob_base              = PyVarObject_HEAD_INIT(nullptr, 0)
@@ -75,7 +89,7 @@ PyTypeObject StringHandle::object_type =
     .tp_iternext          = nullptr,
 
     /* Attribute descriptor and subclassing stuff */
-    .tp_methods           = nullptr,
+    .tp_methods           = string_handle_methods,
     .tp_members           = string_handle_attrs,
     .tp_getset            = nullptr,
 
@@ -120,6 +134,7 @@ static PyObject* string_handle_new(PyTypeObject* type, PyObject* args, PyObject*
 
     self->str = nullptr;
     self->handle = nullptr;
+    self->name_id = 0;
 
     char str_key[] = { "str" };
     char* kwlist[] = { str_key, nullptr };
@@ -139,6 +154,15 @@ static PyObject* string_handle_new(PyTypeObject* type, PyObject* args, PyObject*
         return PyErr_Format(PyExc_TypeError, pyext::error::invalid_argument_type_tmpl, "string", "str");
     }
 
+    manifest_record(manifest_name_type::string_handle, self->str);
+
+    /* The handle of the interned instance is reused to avoid the encoding of the string and the lookup in ITT. */
+    if (StringHandle* interned_obj = pyext::pyobject_cast<StringHandle>(find_interned_instance(type, self->str)))
+    {
+        self->handle = interned_obj->handle;
+        return self.release();
+    }
+
     pyext::string str_wrapper = pyext::string::from_unicode(self->str);
     if (str_wrapper.c_str() == nullptr)
     {
@@ -189,6 +213,72 @@ static PyObject* string_handle_str(PyObject* self)
     return pyext::new_ref(obj->str);
 }
 
+static PyObject* string_handle_reduce(PyObject* self, PyObject* Py_UNUSED(args))
+{
+    StringHandle* obj = pyext::pyobject_cast<StringHandle>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", StringHandle::object_type.tp_name);
+    }
+
+    pyext::pyobject_holder<PyObject> from_string = PyObject_GetAttrString(
+        reinterpret_cast<PyObject*>(&StringHandle::object_type), "_from_string");
+    if (from_string == nullptr)
+    {
+        return nullptr;
+    }
+
+    return Py_BuildValue("(O(O))", from_string.get(), obj->str);
+}
+
+static PyObject* string_handle_from_string(PyObject* cls, PyObject* str)
+{
+    pyext::pyobject_holder<PyObject> args = PyTuple_Pack(1, str);
+    if (args == nullptr)
+    {
+        return nullptr;
+    }
+
+    return get_interned_instance(reinterpret_cast<PyTypeObject*>(cls), str, args.get());
+}
+
+static PyObject* string_handle_create_many(PyObject* cls, PyObject* strings)
+{
+    pyext::pyobject_holder<PyObject> string_sequence = PySequence_Fast(strings,
+                                                                       "The passed strings are not a sequence.");
+    if (string_sequence == nullptr)
+    {
+        return nullptr;
+    }
+
+    Py_ssize_t count = PySequence_Fast_GET_SIZE(string_sequence.get());
+    pyext::pyobject_holder<PyObject> string_handles = PyList_New(count);
+    if (string_handles == nullptr)
+    {
+        return nullptr;
+    }
+
+    for (Py_ssize_t i = 0; i < count; ++i)
+    {
+        PyObject* str = PySequence_Fast_GET_ITEM(string_sequence.get(), i);
+        if (!PyUnicode_Check(str))
+        {
+            return PyErr_Format(PyExc_TypeError, pyext::error::invalid_argument_type_tmpl, "string", "str");
+        }
+
+        PyObject* string_handle = string_handle_from_string(cls, str);
+        if (string_handle == nullptr)
+        {
+            return nullptr;
+        }
+
+        PyList_SET_ITEM(string_handles.get(), i, string_handle);
+    }
+
+    return string_handles.release();
+}
+
 int exec_string_handle(PyObject* module)
 {
     return pyext::add_type(module, &StringHandle::object_type);
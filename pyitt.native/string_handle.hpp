@@ -5,6 +5,8 @@
 
 #include <ittnotify.h>
 
+#include "name_registry.hpp"
+
 
 namespace pyitt
 {
@@ -15,6 +17,8 @@ struct StringHandle
 	PyObject* str;
 	__itt_string_handle* handle;
 
+	std::uint32_t name_id;
+
 	static PyTypeObject object_type;
 };
 
@@ -28,6 +32,16 @@ inline PyObject* string_handle_get_string(const StringHandle* obj)
 	return obj ? obj->str : nullptr;
 }
 
+inline std::uint32_t string_handle_get_name_id(StringHandle* obj)
+{
+	if (obj && obj->name_id == 0)
+	{
+		obj->name_id = intern_name(obj->str);
+	}
+
+	return obj ? obj->name_id : 0;
+}
+
 int exec_string_handle(PyObject* module);
 
 } // namespace pyitt
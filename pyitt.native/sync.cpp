@@ -0,0 +1,383 @@
+#include "sync.hpp"
+
+#include <structmember.h>
+
+#include <ittnotify.h>
+
+#include "string_handle.hpp"
+
+#include "extensions/error_template.hpp"
+#include "extensions/python.hpp"
+#include "extensions/string.hpp"
+
+
+namespace pyitt
+{
+
+static PyObject* sync_object_new(PyTypeObject* type, PyObject* args, PyObject* kwargs);
+static void sync_object_dealloc(PyObject* self);
+
+static PyObject* sync_object_repr(PyObject* self);
+static PyObject* sync_object_str(PyObject* self);
+
+static PyObject* sync_object_prepare(PyObject* self, PyObject* Py_UNUSED(args));
+static PyObject* sync_object_cancel(PyObject* self, PyObject* Py_UNUSED(args));
+static PyObject* sync_object_acquired(PyObject* self, PyObject* Py_UNUSED(args));
+static PyObject* sync_object_releasing(PyObject* self, PyObject* Py_UNUSED(args));
+
+static PyObject* sync_object_acquire(PyObject* self, PyObject* args);
+static PyObject* sync_object_release(PyObject* self, PyObject* args);
+
+static PyMemberDef sync_object_attrs[] =
+{
+    {"name",  T_OBJECT_EX, offsetof(SyncObject, name), READONLY, "a name of the synchronization object"},
+    {"type",  T_OBJECT_EX, offsetof(SyncObject, type), READONLY, "a type of the synchronization object, e.g. 'Lock'"},
+    {nullptr},
+};
+
+static PyMethodDef sync_object_methods[] =
+{
+    {"prepare",   sync_object_prepare,   METH_NOARGS,  "Marks the beginning of waiting for the object."},
+    {"cancel",    sync_object_cancel,    METH_NOARGS,  "Marks that waiting for the object is cancelled."},
+    {"acquired",  sync_object_acquired,  METH_NOARGS,  "Marks that the object is acquired."},
+    {"releasing", sync_object_releasing, METH_NOARGS,  "Marks the beginning of releasing the object."},
+    {"acquire",   sync_object_acquire,   METH_VARARGS, "Calls the acquire function and marks the waiting for the object."},
+    {"release",   sync_object_release,   METH_VARARGS, "Marks the releasing of the object and calls the release function."},
+    {nullptr},
+};
+
+PyTypeObject SyncObject::object_type =
+{
+    .ob_base              = PyVarObject_HEAD_INIT(nullptr, 0)
+    .tp_name              = "pyitt.native.SyncObject",
+    .tp_basicsize         = sizeof(SyncObject),
+    .tp_itemsize          = 0,
+
+    /* Methods to implement standard operations */
+    .tp_dealloc           = sync_object_dealloc,
+    .tp_vectorcall_offset = 0,
+    .tp_getattr           = nullptr,
+    .tp_setattr           = nullptr,
+    .tp_as_async          = nullptr,
+    .tp_repr              = sync_object_repr,
+
+    /* Method suites for standard classes */
+    .tp_as_number         = nullptr,
+    .tp_as_sequence       = nullptr,
+    .tp_as_mapping        = nullptr,
+
+    /* More standard operations (here for binary compatibility) */
+    .tp_hash              = nullptr,
+    .tp_call              = nullptr,
+    .tp_str               = sync_object_str,
+    .tp_getattro          = nullptr,
+    .tp_setattro          = nullptr,
+
+    /* Functions to access object as input/output buffer */
+    .tp_as_buffer         = nullptr,
+
+    /* Flags to define presence of optional/expanded features */
+    .tp_flags             = Py_TPFLAGS_DEFAULT,
+
+    /* Documentation string */
+    .tp_doc               = "A class that represents an ITT synchronization object.",
+
+    /* Assigned meaning in release 2.0 call function for all accessible objects */
+    .tp_traverse          = nullptr,
+
+    /* Delete references to contained objects */
+    .tp_clear             = nullptr,
+
+    /* Assigned meaning in release 2.1 rich comparisons */
+    .tp_richcompare       = nullptr,
+
+    /* weak reference enabler */
+    .tp_weaklistoffset    = 0,
+
+    /* Iterators */
+    .tp_iter              = nullptr,
+    .tp_iternext          = nullptr,
+
+    /* Attribute descriptor and subclassing stuff */
+    .tp_methods           = sync_object_methods,
+    .tp_members           = sync_object_attrs,
+    .tp_getset            = nullptr,
+
+    /* Strong reference on a heap type, borrowed reference on a static type */
+    .tp_base              = nullptr,
+    .tp_dict              = nullptr,
+    .tp_descr_get         = nullptr,
+    .tp_descr_set         = nullptr,
+    .tp_dictoffset        = 0,
+    .tp_init              = nullptr,
+    .tp_alloc             = nullptr,
+    .tp_new               = sync_object_new,
+
+    /* Low-level free-memory routine */
+    .tp_free              = nullptr,
+
+    /* For PyObject_IS_GC */
+    .tp_is_gc             = nullptr,
+    .tp_bases             = nullptr,
+
+    /* method resolution order */
+    .tp_mro               = nullptr,
+    .tp_cache             = nullptr,
+    .tp_subclasses        = nullptr,
+    .tp_weaklist          = nullptr,
+    .tp_del               = nullptr,
+
+    /* Type attribute cache version tag. Added in version 2.6 */
+    .tp_version_tag       = 0,
+
+    .tp_finalize          = nullptr,
+    .tp_vectorcall        = nullptr,
+};
+
+static PyObject* sync_object_new(PyTypeObject* type, PyObject* args, PyObject* kwargs)
+{
+    pyext::pyobject_holder<SyncObject> self = type->tp_alloc(type, 0);
+    if (self == nullptr)
+    {
+        return nullptr;
+    }
+
+    self->name = nullptr;
+    self->type = nullptr;
+
+    char name_key[] = { "name" };
+    char type_key[] = { "type" };
+    char* kwlist[] = { name_key, type_key, nullptr };
+
+    PyObject* name = nullptr;
+    PyObject* sync_type = nullptr;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|O", kwlist, &name, &sync_type))
+    {
+        return nullptr;
+    }
+
+    if (name && PyUnicode_Check(name))
+    {
+        self->name = pyext::new_ref(name);
+    }
+    else if (auto string_handle_obj = pyext::pyobject_cast<StringHandle>(name))
+    {
+        self->name = pyext::xnew_ref(string_handle_get_string(string_handle_obj));
+    }
+    else
+    {
+        return PyErr_Format(PyExc_TypeError,
+            "The passed %s is not a valid instance of str or %s.", name_key, StringHandle::object_type.tp_name);
+    }
+
+    if (sync_type == nullptr)
+    {
+        self->type = PyUnicode_FromString("Lock");
+        if (self->type == nullptr)
+        {
+            return nullptr;
+        }
+    }
+    else if (PyUnicode_Check(sync_type))
+    {
+        self->type = pyext::new_ref(sync_type);
+    }
+    else
+    {
+        return PyErr_Format(PyExc_TypeError, pyext::error::invalid_argument_type_tmpl, type_key, "str");
+    }
+
+    pyext::string name_str = pyext::string::from_unicode(self->name);
+    if (name_str.c_str() == nullptr)
+    {
+        return nullptr;
+    }
+
+    pyext::string type_str = pyext::string::from_unicode(self->type);
+    if (type_str.c_str() == nullptr)
+    {
+        return nullptr;
+    }
+
+    /* The address of the Python object identifies the synchronization object while the object is alive. */
+#if defined(_WIN32)
+    __itt_sync_createW(self.get(), type_str.c_str(), name_str.c_str(), __itt_attr_mutex);
+#else
+    __itt_sync_create(self.get(), type_str.c_str(), name_str.c_str(), __itt_attr_mutex);
+#endif
+
+    return self.release();
+}
+
+static void sync_object_dealloc(PyObject* self)
+{
+    SyncObject* obj = pyext::pyobject_cast<SyncObject>(self);
+    if (obj)
+    {
+        if (obj->name)
+        {
+            __itt_sync_destroy(self);
+        }
+
+        Py_XDECREF(obj->name);
+        Py_XDECREF(obj->type);
+    }
+
+    Py_TYPE(self)->tp_free(self);
+}
+
+static PyObject* sync_object_repr(PyObject* self)
+{
+    SyncObject* obj = pyext::pyobject_cast<SyncObject>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", SyncObject::object_type.tp_name);
+    }
+
+    return PyUnicode_FromFormat("%s(%R, %R)", obj->object_type.tp_name, obj->name, obj->type);
+}
+
+static PyObject* sync_object_str(PyObject* self)
+{
+    SyncObject* obj = pyext::pyobject_cast<SyncObject>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", SyncObject::object_type.tp_name);
+    }
+
+    return pyext::new_ref(obj->name);
+}
+
+static PyObject* sync_object_prepare(PyObject* self, PyObject* Py_UNUSED(args))
+{
+    SyncObject* obj = pyext::pyobject_cast<SyncObject>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", SyncObject::object_type.tp_name);
+    }
+
+    __itt_sync_prepare(self);
+
+    Py_RETURN_NONE;
+}
+
+static PyObject* sync_object_cancel(PyObject* self, PyObject* Py_UNUSED(args))
+{
+    SyncObject* obj = pyext::pyobject_cast<SyncObject>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", SyncObject::object_type.tp_name);
+    }
+
+    __itt_sync_cancel(self);
+
+    Py_RETURN_NONE;
+}
+
+static PyObject* sync_object_acquired(PyObject* self, PyObject* Py_UNUSED(args))
+{
+    SyncObject* obj = pyext::pyobject_cast<SyncObject>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", SyncObject::object_type.tp_name);
+    }
+
+    __itt_sync_acquired(self);
+
+    Py_RETURN_NONE;
+}
+
+static PyObject* sync_object_releasing(PyObject* self, PyObject* Py_UNUSED(args))
+{
+    SyncObject* obj = pyext::pyobject_cast<SyncObject>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", SyncObject::object_type.tp_name);
+    }
+
+    __itt_sync_releasing(self);
+
+    Py_RETURN_NONE;
+}
+
+static PyObject* sync_object_call_function(PyObject* args)
+{
+    if (PyTuple_GET_SIZE(args) == 0)
+    {
+        return PyErr_Format(PyExc_TypeError, "The function to call is not passed.");
+    }
+
+    PyObject* func = PyTuple_GET_ITEM(args, 0);
+    if (!PyCallable_Check(func))
+    {
+        return PyErr_Format(PyExc_TypeError, pyext::error::invalid_argument_type_tmpl, "function", "callable");
+    }
+
+    pyext::pyobject_holder<PyObject> func_args = PyTuple_GetSlice(args, 1, PyTuple_GET_SIZE(args));
+    if (func_args == nullptr)
+    {
+        return nullptr;
+    }
+
+    return PyObject_CallObject(func, func_args.get());
+}
+
+static PyObject* sync_object_acquire(PyObject* self, PyObject* args)
+{
+    SyncObject* obj = pyext::pyobject_cast<SyncObject>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", SyncObject::object_type.tp_name);
+    }
+
+    __itt_sync_prepare(self);
+
+    pyext::pyobject_holder<PyObject> result = sync_object_call_function(args);
+    if (result == nullptr)
+    {
+        __itt_sync_cancel(self);
+        return nullptr;
+    }
+
+    /* The acquire function returns False if the object is not acquired in the non-blocking mode or on timeout. */
+    const int is_acquired = PyObject_IsTrue(result.get());
+    if (is_acquired > 0)
+    {
+        __itt_sync_acquired(self);
+    }
+    else
+    {
+        __itt_sync_cancel(self);
+    }
+
+    return is_acquired < 0 ? nullptr : result.release();
+}
+
+static PyObject* sync_object_release(PyObject* self, PyObject* args)
+{
+    SyncObject* obj = pyext::pyobject_cast<SyncObject>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", SyncObject::object_type.tp_name);
+    }
+
+    __itt_sync_releasing(self);
+
+    return sync_object_call_function(args);
+}
+
+int exec_sync_object(PyObject* module)
+{
+    return pyext::add_type(module, &SyncObject::object_type);
+}
+
+} // namespace pyitt
@@ -0,0 +1,21 @@
+#pragma once
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+
+namespace pyitt
+{
+
+struct SyncObject
+{
+	PyObject_HEAD
+	PyObject* name;
+	PyObject* type;
+
+	static PyTypeObject object_type;
+};
+
+int exec_sync_object(PyObject* module);
+
+} // namespace pyitt
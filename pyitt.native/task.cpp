@@ -2,9 +2,13 @@
 
 #include <ittnotify.h>
 
+#include "clock_domain.hpp"
 #include "domain.hpp"
 #include "id.hpp"
+#include "recorder.hpp"
+#include "stats.hpp"
 #include "string_handle.hpp"
+#include "task_stack.hpp"
 
 #include "extensions/error_template.hpp"
 #include "extensions/python.hpp"
@@ -13,14 +17,65 @@
 namespace pyitt
 {
 
-PyObject* task_begin(PyObject* self, PyObject* args)
+/* The names of the keyword arguments. */
+static char domain_key[] = "domain";
+static char name_key[] = "name";
+static char id_key[] = "id";
+static char parent_id_key[] = "parent_id";
+static char clock_domain_key[] = "clock_domain";
+static char timestamp_key[] = "timestamp";
+
+static bool get_clock_domain_handle(PyObject* clock_domain, __itt_clock_domain*& handle)
+{
+    handle = nullptr;
+    if (clock_domain && clock_domain != Py_None)
+    {
+        ClockDomain* clock_domain_obj = pyext::pyobject_cast<ClockDomain>(clock_domain);
+        if (clock_domain_obj == nullptr)
+        {
+            PyErr_Format(PyExc_TypeError,
+                pyext::error::invalid_argument_type_tmpl, "clock_domain", ClockDomain::object_type.tp_name);
+            return false;
+        }
+
+        handle = clock_domain_get_handle(clock_domain_obj);
+    }
+
+    return true;
+}
+
+static bool get_optional_id(PyObject* id, const char* name, Id*& id_obj)
+{
+    id_obj = nullptr;
+    if (id && id != Py_None)
+    {
+        id_obj = pyext::pyobject_cast<Id>(id);
+        if (id_obj == nullptr)
+        {
+            PyErr_Format(PyExc_TypeError, pyext::error::invalid_argument_type_tmpl, name, Id::object_type.tp_name);
+            return false;
+        }
+    }
+
+    return true;
+}
+
+PyObject* task_begin(PyObject* self, PyObject* args, PyObject* kwargs)
 {
+    /* The task of a disabled domain is kept on the stack, so its end does not end another task. */
+    if (domain_is_disabled_in_args(args, kwargs))
+    {
+        task_stack_push_unreported();
+        Py_RETURN_NONE;
+    }
+
     PyObject* domain = nullptr;
     PyObject* name_string_handle = nullptr;
     PyObject* task_id = nullptr;
     PyObject* parent_id = nullptr;
 
-    if (!PyArg_ParseTuple(args, "OO|OO", &domain, &name_string_handle, &task_id, &parent_id))
+    static char* kwlist[] = { domain_key, name_key, id_key, parent_id_key, nullptr };
+    if (!pyext::parse_arguments(args, kwargs, "OO|OO", kwlist, &domain, &name_string_handle, &task_id, &parent_id))
     {
         return nullptr;
     }
@@ -39,43 +94,58 @@ PyObject* task_begin(PyObject* self, PyObject* args)
             pyext::error::invalid_argument_type_tmpl, "name", StringHandle::object_type.tp_name);
     }
 
-    __itt_id id = __itt_null;
-    if (task_id && task_id != Py_None)
+    Id* task_id_obj = nullptr;
+    Id* parent_id_obj = nullptr;
+    if (!get_optional_id(task_id, "id", task_id_obj) || !get_optional_id(parent_id, "parent_id", parent_id_obj))
     {
-        Id* task_id_obj = pyext::pyobject_cast<Id>(task_id);
-        if (task_id_obj == nullptr)
-        {
-            return PyErr_Format(PyExc_TypeError,
-                pyext::error::invalid_argument_type_tmpl, "id", Id::object_type.tp_name);
-        }
-
-        id = id_get_handle(task_id_obj);
+        return nullptr;
     }
 
-    __itt_id p_id = __itt_null;
-    if (parent_id && parent_id != Py_None)
+    return task_begin_checked(domain_obj, name_string_handle_obj, task_id_obj, parent_id_obj);
+}
+
+PyObject* task_begin_checked(Domain* domain_obj,
+                             StringHandle* name_string_handle_obj,
+                             Id* task_id_obj,
+                             Id* parent_id_obj)
+{
+    PyObject* parent_id = reinterpret_cast<PyObject*>(parent_id_obj);
+    if (!task_stack_get_nested_parent_id(parent_id))
     {
-        Id* parent_id_obj = pyext::pyobject_cast<Id>(parent_id);
-        if (parent_id_obj == nullptr)
-        {
-            return PyErr_Format(PyExc_TypeError,
-                pyext::error::invalid_argument_type_tmpl, "parent_id", Id::object_type.tp_name);
-        }
+        return nullptr;
+    }
 
-        p_id = id_get_handle(parent_id_obj);
+    __itt_task_begin(domain_get_handle(domain_obj),
+                     id_get_handle(task_id_obj),
+                     id_get_handle(pyext::pyobject_cast<Id>(parent_id)),
+                     string_handle_get_handle(name_string_handle_obj));
+    task_stack_push(string_handle_get_string(name_string_handle_obj),
+                    domain_get_name(domain_obj),
+                    reinterpret_cast<PyObject*>(task_id_obj),
+                    parent_id);
+
+    if (recorder_is_enabled())
+    {
+        recorder_write(recorder_record_type::task_begin,
+                       string_handle_get_name_id(name_string_handle_obj),
+                       domain_get_name_id(domain_obj),
+                       0);
     }
 
-    __itt_task_begin(domain_get_handle(domain_obj), id, p_id, string_handle_get_handle(name_string_handle_obj));
+    if (stats_is_enabled())
+    {
+        stats_task_begin(string_handle_get_name_id(name_string_handle_obj));
+    }
 
     Py_RETURN_NONE;
 }
 
-PyObject* task_end(PyObject* self, PyObject* args)
+PyObject* task_end(PyObject* self, PyObject* args, PyObject* kwargs)
 {
-
     PyObject* domain = nullptr;
 
-    if (!PyArg_ParseTuple(args, "O", &domain))
+    static char* kwlist[] = { domain_key, nullptr };
+    if (!pyext::parse_arguments(args, kwargs, "O", kwlist, &domain))
     {
         return nullptr;
     }
@@ -87,19 +157,46 @@ PyObject* task_end(PyObject* self, PyObject* args)
             pyext::error::invalid_argument_type_tmpl, "domain", Domain::object_type.tp_name);
     }
 
+    return task_end_checked(domain_obj);
+}
+
+PyObject* task_end_checked(Domain* domain_obj)
+{
+    /* The end is reported only if the beginning of the task is reported. */
+    if (!task_stack_pop(domain_is_enabled(domain_obj)))
+    {
+        Py_RETURN_NONE;
+    }
+
     __itt_task_end(domain_get_handle(domain_obj));
 
+    if (recorder_is_enabled())
+    {
+        recorder_write(recorder_record_type::task_end, 0, domain_get_name_id(domain_obj), 0);
+    }
+
+    if (stats_is_enabled())
+    {
+        stats_task_end();
+    }
+
     Py_RETURN_NONE;
 }
 
-PyObject* task_begin_overlapped(PyObject* self, PyObject* args)
+PyObject* task_begin_overlapped(PyObject* self, PyObject* args, PyObject* kwargs)
 {
+    if (domain_is_disabled_in_args(args, kwargs))
+    {
+        Py_RETURN_NONE;
+    }
+
     PyObject* domain = nullptr;
     PyObject* name_string_handle = nullptr;
     PyObject* task_id = nullptr;
     PyObject* parent_id = nullptr;
 
-    if (!PyArg_ParseTuple(args, "OOO|O", &domain, &name_string_handle, &task_id, &parent_id))
+    static char* kwlist[] = { domain_key, name_key, id_key, parent_id_key, nullptr };
+    if (!pyext::parse_arguments(args, kwargs, "OOO|O", kwlist, &domain, &name_string_handle, &task_id, &parent_id))
     {
         return nullptr;
     }
@@ -125,34 +222,60 @@ PyObject* task_begin_overlapped(PyObject* self, PyObject* args)
             pyext::error::invalid_argument_type_tmpl, "id", Id::object_type.tp_name);
     }
 
-    __itt_id p_id = __itt_null;
-    if (parent_id && parent_id != Py_None)
+    Id* parent_id_obj = nullptr;
+    if (!get_optional_id(parent_id, "parent_id", parent_id_obj))
     {
-        Id* parent_id_obj = pyext::pyobject_cast<Id>(parent_id);
-        if (parent_id_obj == nullptr)
-        {
-            return PyErr_Format(PyExc_TypeError,
-                pyext::error::invalid_argument_type_tmpl, "parent_id", Id::object_type.tp_name);
-        }
+        return nullptr;
+    }
 
-        p_id = id_get_handle(parent_id_obj);
+    return task_begin_overlapped_checked(domain_obj, name_string_handle_obj, task_id_obj, parent_id_obj);
+}
+
+PyObject* task_begin_overlapped_checked(Domain* domain_obj,
+                                        StringHandle* name_string_handle_obj,
+                                        Id* task_id_obj,
+                                        Id* parent_id_obj)
+{
+    /* The parent is set to the enclosing task if it is not passed. */
+    PyObject* parent_id = reinterpret_cast<PyObject*>(parent_id_obj);
+    if (!task_stack_push_overlapped(string_handle_get_string(name_string_handle_obj),
+                                    domain_get_name(domain_obj),
+                                    reinterpret_cast<PyObject*>(task_id_obj),
+                                    parent_id))
+    {
+        return nullptr;
     }
 
     __itt_task_begin_overlapped(domain_get_handle(domain_obj),
                                 id_get_handle(task_id_obj),
-                                p_id,
+                                id_get_handle(pyext::pyobject_cast<Id>(parent_id)),
                                 string_handle_get_handle(name_string_handle_obj));
 
+    if (recorder_is_enabled())
+    {
+        recorder_write(recorder_record_type::task_begin_overlapped,
+                       string_handle_get_name_id(name_string_handle_obj),
+                       domain_get_name_id(domain_obj),
+                       id_get_handle(task_id_obj).d1);
+    }
+
+    if (stats_is_enabled())
+    {
+        stats_task_begin_overlapped(string_handle_get_name_id(name_string_handle_obj),
+                                    domain_get_name_id(domain_obj),
+                                    id_get_handle(task_id_obj).d1);
+    }
+
     Py_RETURN_NONE;
 }
 
-PyObject* task_end_overlapped(PyObject* self, PyObject* args)
+PyObject* task_end_overlapped(PyObject* self, PyObject* args, PyObject* kwargs)
 {
-
     PyObject* domain = nullptr;
     PyObject* task_id = nullptr;
 
-    if (!PyArg_ParseTuple(args, "OO", &domain, &task_id))
+    static char* kwlist[] = { domain_key, id_key, nullptr };
+    if (!pyext::parse_arguments(args, kwargs, "OO", kwlist, &domain, &task_id))
     {
         return nullptr;
     }
@@ -171,8 +294,272 @@ PyObject* task_end_overlapped(PyObject* self, PyObject* args)
             pyext::error::invalid_argument_type_tmpl, "id", Id::object_type.tp_name);
     }
 
+    return task_end_overlapped_checked(domain_obj, task_id_obj);
+}
+
+PyObject* task_end_overlapped_checked(Domain* domain_obj, Id* task_id_obj)
+{
+    /* The end is reported only if the beginning of the task is reported. */
+    bool is_reported = false;
+    if (!task_stack_remove_overlapped(reinterpret_cast<PyObject*>(task_id_obj), is_reported))
+    {
+        return nullptr;
+    }
+
+    if (!is_reported)
+    {
+        Py_RETURN_NONE;
+    }
+
     __itt_task_end_overlapped(domain_get_handle(domain_obj), id_get_handle(task_id_obj));
 
+    if (recorder_is_enabled())
+    {
+        recorder_write(recorder_record_type::task_end_overlapped,
+                       0,
+                       domain_get_name_id(domain_obj),
+                       id_get_handle(task_id_obj).d1);
+    }
+
+    if (stats_is_enabled())
+    {
+        stats_task_end_overlapped(domain_get_name_id(domain_obj), id_get_handle(task_id_obj).d1);
+    }
+
+    Py_RETURN_NONE;
+}
+
+/*
+ The timestamped variants of the task functions are not recorded and not aggregated, since the passed timestamps may
+ belong to another clock domain and may be in the past. They are tracked as current tasks like the other variants, so
+ their ends do not end other tasks on the stack.
+ */
+PyObject* task_begin_ex(PyObject* self, PyObject* args, PyObject* kwargs)
+{
+    /* The task of a disabled domain is kept on the stack, so its end does not end another task. */
+    if (domain_is_disabled_in_args(args, kwargs))
+    {
+        task_stack_push_unreported();
+        Py_RETURN_NONE;
+    }
+
+    PyObject* domain = nullptr;
+    PyObject* clock_domain = nullptr;
+    unsigned long long timestamp = 0;
+    PyObject* name_string_handle = nullptr;
+    PyObject* task_id = nullptr;
+    PyObject* parent_id = nullptr;
+
+    static char* kwlist[] = { domain_key, clock_domain_key, timestamp_key, name_key, id_key, parent_id_key, nullptr };
+    if (!pyext::parse_arguments(args, kwargs, "OOKO|OO", kwlist,
+        &domain, &clock_domain, &timestamp, &name_string_handle, &task_id, &parent_id))
+    {
+        return nullptr;
+    }
+
+    Domain* domain_obj = pyext::pyobject_cast<Domain>(domain);
+    if (domain_obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "domain", Domain::object_type.tp_name);
+    }
+
+    __itt_clock_domain* clock_domain_handle = nullptr;
+    if (!get_clock_domain_handle(clock_domain, clock_domain_handle))
+    {
+        return nullptr;
+    }
+
+    StringHandle* name_string_handle_obj = pyext::pyobject_cast<StringHandle>(name_string_handle);
+    if (name_string_handle_obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "name", StringHandle::object_type.tp_name);
+    }
+
+    Id* task_id_obj = nullptr;
+    Id* parent_id_obj = nullptr;
+    if (!get_optional_id(task_id, "id", task_id_obj) || !get_optional_id(parent_id, "parent_id", parent_id_obj))
+    {
+        return nullptr;
+    }
+
+    PyObject* implicit_parent_id = reinterpret_cast<PyObject*>(parent_id_obj);
+    if (!task_stack_get_nested_parent_id(implicit_parent_id))
+    {
+        return nullptr;
+    }
+
+    __itt_task_begin_ex(domain_get_handle(domain_obj),
+                        clock_domain_handle,
+                        timestamp,
+                        id_get_handle(task_id_obj),
+                        id_get_handle(pyext::pyobject_cast<Id>(implicit_parent_id)),
+                        string_handle_get_handle(name_string_handle_obj));
+    task_stack_push(string_handle_get_string(name_string_handle_obj),
+                    domain_get_name(domain_obj),
+                    reinterpret_cast<PyObject*>(task_id_obj),
+                    implicit_parent_id);
+
+    Py_RETURN_NONE;
+}
+
+PyObject* task_end_ex(PyObject* self, PyObject* args, PyObject* kwargs)
+{
+    PyObject* domain = nullptr;
+    PyObject* clock_domain = nullptr;
+    unsigned long long timestamp = 0;
+
+    static char* kwlist[] = { domain_key, clock_domain_key, timestamp_key, nullptr };
+    if (!pyext::parse_arguments(args, kwargs, "OOK", kwlist, &domain, &clock_domain, &timestamp))
+    {
+        return nullptr;
+    }
+
+    Domain* domain_obj = pyext::pyobject_cast<Domain>(domain);
+    if (domain_obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "domain", Domain::object_type.tp_name);
+    }
+
+    __itt_clock_domain* clock_domain_handle = nullptr;
+    if (!get_clock_domain_handle(clock_domain, clock_domain_handle))
+    {
+        return nullptr;
+    }
+
+    if (!task_stack_pop(domain_is_enabled(domain_obj)))
+    {
+        Py_RETURN_NONE;
+    }
+
+    __itt_task_end_ex(domain_get_handle(domain_obj), clock_domain_handle, timestamp);
+
+    Py_RETURN_NONE;
+}
+
+PyObject* task_begin_overlapped_ex(PyObject* self, PyObject* args, PyObject* kwargs)
+{
+    if (domain_is_disabled_in_args(args, kwargs))
+    {
+        Py_RETURN_NONE;
+    }
+
+    PyObject* domain = nullptr;
+    PyObject* clock_domain = nullptr;
+    unsigned long long timestamp = 0;
+    PyObject* name_string_handle = nullptr;
+    PyObject* task_id = nullptr;
+    PyObject* parent_id = nullptr;
+
+    static char* kwlist[] = { domain_key, clock_domain_key, timestamp_key, name_key, id_key, parent_id_key, nullptr };
+    if (!pyext::parse_arguments(args, kwargs, "OOKOO|O", kwlist,
+        &domain, &clock_domain, &timestamp, &name_string_handle, &task_id, &parent_id))
+    {
+        return nullptr;
+    }
+
+    Domain* domain_obj = pyext::pyobject_cast<Domain>(domain);
+    if (domain_obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "domain", Domain::object_type.tp_name);
+    }
+
+    __itt_clock_domain* clock_domain_handle = nullptr;
+    if (!get_clock_domain_handle(clock_domain, clock_domain_handle))
+    {
+        return nullptr;
+    }
+
+    StringHandle* name_string_handle_obj = pyext::pyobject_cast<StringHandle>(name_string_handle);
+    if (name_string_handle_obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "name", StringHandle::object_type.tp_name);
+    }
+
+    Id* task_id_obj = pyext::pyobject_cast<Id>(task_id);
+    if (task_id_obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "id", Id::object_type.tp_name);
+    }
+
+    Id* parent_id_obj = nullptr;
+    if (!get_optional_id(parent_id, "parent_id", parent_id_obj))
+    {
+        return nullptr;
+    }
+
+    /* The parent is set to the enclosing task if it is not passed. */
+    PyObject* implicit_parent_id = reinterpret_cast<PyObject*>(parent_id_obj);
+    if (!task_stack_push_overlapped(string_handle_get_string(name_string_handle_obj),
+                                    domain_get_name(domain_obj),
+                                    reinterpret_cast<PyObject*>(task_id_obj),
+                                    implicit_parent_id))
+    {
+        return nullptr;
+    }
+
+    __itt_task_begin_overlapped_ex(domain_get_handle(domain_obj),
+                                   clock_domain_handle,
+                                   timestamp,
+                                   id_get_handle(task_id_obj),
+                                   id_get_handle(pyext::pyobject_cast<Id>(implicit_parent_id)),
+                                   string_handle_get_handle(name_string_handle_obj));
+
+    Py_RETURN_NONE;
+}
+
+PyObject* task_end_overlapped_ex(PyObject* self, PyObject* args, PyObject* kwargs)
+{
+    PyObject* domain = nullptr;
+    PyObject* clock_domain = nullptr;
+    unsigned long long timestamp = 0;
+    PyObject* task_id = nullptr;
+
+    static char* kwlist[] = { domain_key, clock_domain_key, timestamp_key, id_key, nullptr };
+    if (!pyext::parse_arguments(args, kwargs, "OOKO", kwlist, &domain, &clock_domain, &timestamp, &task_id))
+    {
+        return nullptr;
+    }
+
+    Domain* domain_obj = pyext::pyobject_cast<Domain>(domain);
+    if (domain_obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "domain", Domain::object_type.tp_name);
+    }
+
+    __itt_clock_domain* clock_domain_handle = nullptr;
+    if (!get_clock_domain_handle(clock_domain, clock_domain_handle))
+    {
+        return nullptr;
+    }
+
+    Id* task_id_obj = pyext::pyobject_cast<Id>(task_id);
+    if (task_id_obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "id", Id::object_type.tp_name);
+    }
+
+    bool is_reported = false;
+    if (!task_stack_remove_overlapped(reinterpret_cast<PyObject*>(task_id_obj), is_reported))
+    {
+        return nullptr;
+    }
+
+    if (is_reported)
+    {
+        __itt_task_end_overlapped_ex(domain_get_handle(domain_obj),
+                                     clock_domain_handle,
+                                     timestamp,
+                                     id_get_handle(task_id_obj));
+    }
+
     Py_RETURN_NONE;
 }
 
@@ -3,13 +3,27 @@
 #define PY_SSIZE_T_CLEAN
 #include <Python.h>
 
+#include "domain.hpp"
+#include "id.hpp"
+#include "string_handle.hpp"
+
 
 namespace pyitt
 {
 
-PyObject* task_begin(PyObject* self, PyObject* args);
-PyObject* task_end(PyObject* self, PyObject* args);
-PyObject* task_begin_overlapped(PyObject* self, PyObject* args);
-PyObject* task_end_overlapped(PyObject* self, PyObject* args);
+PyObject* task_begin(PyObject* self, PyObject* args, PyObject* kwargs);
+PyObject* task_end(PyObject* self, PyObject* args, PyObject* kwargs);
+PyObject* task_begin_overlapped(PyObject* self, PyObject* args, PyObject* kwargs);
+PyObject* task_end_overlapped(PyObject* self, PyObject* args, PyObject* kwargs);
+PyObject* task_begin_ex(PyObject* self, PyObject* args, PyObject* kwargs);
+PyObject* task_end_ex(PyObject* self, PyObject* args, PyObject* kwargs);
+PyObject* task_begin_overlapped_ex(PyObject* self, PyObject* args, PyObject* kwargs);
+PyObject* task_end_overlapped_ex(PyObject* self, PyObject* args, PyObject* kwargs);
+
+/* The variants of the task functions for the validated arguments of an enabled domain, the ids may be nullptr. */
+PyObject* task_begin_checked(Domain* domain, StringHandle* name, Id* id, Id* parent_id);
+PyObject* task_end_checked(Domain* domain);
+PyObject* task_begin_overlapped_checked(Domain* domain, StringHandle* name, Id* id, Id* parent_id);
+PyObject* task_end_overlapped_checked(Domain* domain, Id* id);
 
 } // namespace pyitt
@@ -0,0 +1,489 @@
+#include "task_factory.hpp"
+
+#include <structmember.h>
+
+#include "domain.hpp"
+#include "id.hpp"
+#include "string_handle.hpp"
+#include "task.hpp"
+#include "task_stack.hpp"
+
+#include "extensions/error_template.hpp"
+#include "extensions/python.hpp"
+
+
+namespace pyitt
+{
+
+/*
+ The task factory resolves the domain once and caches the tasks by their names, so a task for a dynamic name is
+ created with a single lookup. Nested tasks do not have a state, so the cached task is returned for the name, while a
+ new task with a new id is created for each call of the factory of overlapped tasks. The cache is not bounded, just as
+ ITT keeps all string handles until the process exits.
+ */
+static PyObject* task_factory_new(PyTypeObject* type, PyObject* args, PyObject* kwargs);
+static void task_factory_dealloc(PyObject* self);
+static PyObject* task_factory_repr(PyObject* self);
+static PyObject* task_factory_call(PyObject* self, PyObject* args, PyObject* kwargs);
+
+static PyObject* factory_task_new(PyTypeObject* type, PyObject* args, PyObject* kwargs);
+static void factory_task_dealloc(PyObject* self);
+static PyObject* factory_task_repr(PyObject* self);
+static PyObject* factory_task_begin(PyObject* self, PyObject* Py_UNUSED(args));
+static PyObject* factory_task_end(PyObject* self, PyObject* Py_UNUSED(args));
+static PyObject* factory_task_enter(PyObject* self, PyObject* Py_UNUSED(args));
+static PyObject* factory_task_exit(PyObject* self, PyObject* Py_UNUSED(args));
+
+static PyMemberDef task_factory_attrs[] =
+{
+    {"domain",     T_OBJECT, offsetof(TaskFactory, domain),     READONLY, "a domain of the created tasks"},
+    {"overlapped", T_BOOL,   offsetof(TaskFactory, overlapped), READONLY, "True if the created tasks are overlapped"},
+    {nullptr},
+};
+
+static PyMemberDef factory_task_attrs[] =
+{
+    {"domain", T_OBJECT, offsetof(FactoryTask, domain), READONLY, "a domain of the task"},
+    {"name",   T_OBJECT, offsetof(FactoryTask, name),   READONLY, "a string handle of the task name"},
+    {"id",     T_OBJECT, offsetof(FactoryTask, id),     READONLY, "an id of the overlapped task or None"},
+    {nullptr},
+};
+
+static PyMethodDef factory_task_methods[] =
+{
+    {"begin",     factory_task_begin, METH_NOARGS,  "Marks the beginning of the task."},
+    {"end",       factory_task_end,   METH_NOARGS,  "Marks the end of the task."},
+    {"__enter__", factory_task_enter, METH_NOARGS,  "Marks the beginning of the task."},
+    {"__exit__",  factory_task_exit,  METH_VARARGS, "Marks the end of the task."},
+    {nullptr},
+};
+
+PyTypeObject TaskFactory::object_type =
+{
+    .ob_base              = PyVarObject_HEAD_INIT(nullptr, 0)
+    .tp_name              = "pyitt.native.TaskFactory",
+    .tp_basicsize         = sizeof(TaskFactory),
+    .tp_itemsize          = 0,
+
+    /* Methods to implement standard operations */
+    .tp_dealloc           = task_factory_dealloc,
+    .tp_vectorcall_offset = 0,
+    .tp_getattr           = nullptr,
+    .tp_setattr           = nullptr,
+    .tp_as_async          = nullptr,
+    .tp_repr              = task_factory_repr,
+
+    /* Method suites for standard classes */
+    .tp_as_number         = nullptr,
+    .tp_as_sequence       = nullptr,
+    .tp_as_mapping        = nullptr,
+
+    /* More standard operations (here for binary compatibility) */
+    .tp_hash              = nullptr,
+    .tp_call              = task_factory_call,
+    .tp_str               = nullptr,
+    .tp_getattro          = nullptr,
+    .tp_setattro          = nullptr,
+
+    /* Functions to access object as input/output buffer */
+    .tp_as_buffer         = nullptr,
+
+    /* Flags to define presence of optional/expanded features */
+    .tp_flags             = Py_TPFLAGS_DEFAULT,
+
+    /* Documentation string */
+    .tp_doc               = "A class that creates the tasks of a domain with the domain resolved once.",
+
+    /* Assigned meaning in release 2.0 call function for all accessible objects */
+    .tp_traverse          = nullptr,
+
+    /* Delete references to contained objects */
+    .tp_clear             = nullptr,
+
+    /* Assigned meaning in release 2.1 rich comparisons */
+    .tp_richcompare       = nullptr,
+
+    /* weak reference enabler */
+    .tp_weaklistoffset    = 0,
+
+    /* Iterators */
+    .tp_iter              = nullptr,
+    .tp_iternext          = nullptr,
+
+    /* Attribute descriptor and subclassing stuff */
+    .tp_methods           = nullptr,
+    .tp_members           = task_factory_attrs,
+    .tp_getset            = nullptr,
+
+    /* Strong reference on a heap type, borrowed reference on a static type */
+    .tp_base              = nullptr,
+    .tp_dict              = nullptr,
+    .tp_descr_get         = nullptr,
+    .tp_descr_set         = nullptr,
+    .tp_dictoffset        = 0,
+    .tp_init              = nullptr,
+    .tp_alloc             = nullptr,
+    .tp_new               = task_factory_new,
+
+    /* Low-level free-memory routine */
+    .tp_free              = nullptr,
+
+    /* For PyObject_IS_GC */
+    .tp_is_gc             = nullptr,
+    .tp_bases             = nullptr,
+
+    /* method resolution order */
+    .tp_mro               = nullptr,
+    .tp_cache             = nullptr,
+    .tp_subclasses        = nullptr,
+    .tp_weaklist          = nullptr,
+    .tp_del               = nullptr,
+
+    /* Type attribute cache version tag. Added in version 2.6 */
+    .tp_version_tag       = 0,
+
+    .tp_finalize          = nullptr,
+    .tp_vectorcall        = nullptr,
+};
+
+PyTypeObject FactoryTask::object_type =
+{
+    .ob_base              = PyVarObject_HEAD_INIT(nullptr, 0)
+    .tp_name              = "pyitt.native.FactoryTask",
+    .tp_basicsize         = sizeof(FactoryTask),
+    .tp_itemsize          = 0,
+
+    /* Methods to implement standard operations */
+    .tp_dealloc           = factory_task_dealloc,
+    .tp_vectorcall_offset = 0,
+    .tp_getattr           = nullptr,
+    .tp_setattr           = nullptr,
+    .tp_as_async          = nullptr,
+    .tp_repr              = factory_task_repr,
+
+    /* Method suites for standard classes */
+    .tp_as_number         = nullptr,
+    .tp_as_sequence       = nullptr,
+    .tp_as_mapping        = nullptr,
+
+    /* More standard operations (here for binary compatibility) */
+    .tp_hash              = nullptr,
+    .tp_call              = nullptr,
+    .tp_str               = nullptr,
+    .tp_getattro          = nullptr,
+    .tp_setattro          = nullptr,
+
+    /* Functions to access object as input/output buffer */
+    .tp_as_buffer         = nullptr,
+
+    /* Flags to define presence of optional/expanded features */
+    .tp_flags             = Py_TPFLAGS_DEFAULT,
+
+    /* Documentation string */
+    .tp_doc               = "A class that represents a task created by a task factory.",
+
+    /* Assigned meaning in release 2.0 call function for all accessible objects */
+    .tp_traverse          = nullptr,
+
+    /* Delete references to contained objects */
+    .tp_clear             = nullptr,
+
+    /* Assigned meaning in release 2.1 rich comparisons */
+    .tp_richcompare       = nullptr,
+
+    /* weak reference enabler */
+    .tp_weaklistoffset    = 0,
+
+    /* Iterators */
+    .tp_iter              = nullptr,
+    .tp_iternext          = nullptr,
+
+    /* Attribute descriptor and subclassing stuff */
+    .tp_methods           = factory_task_methods,
+    .tp_members           = factory_task_attrs,
+    .tp_getset            = nullptr,
+
+    /* Strong reference on a heap type, borrowed reference on a static type */
+    .tp_base              = nullptr,
+    .tp_dict              = nullptr,
+    .tp_descr_get         = nullptr,
+    .tp_descr_set         = nullptr,
+    .tp_dictoffset        = 0,
+    .tp_init              = nullptr,
+    .tp_alloc             = nullptr,
+    .tp_new               = factory_task_new,
+
+    /* Low-level free-memory routine */
+    .tp_free              = nullptr,
+
+    /* For PyObject_IS_GC */
+    .tp_is_gc             = nullptr,
+    .tp_bases             = nullptr,
+
+    /* method resolution order */
+    .tp_mro               = nullptr,
+    .tp_cache             = nullptr,
+    .tp_subclasses        = nullptr,
+    .tp_weaklist          = nullptr,
+    .tp_del               = nullptr,
+
+    /* Type attribute cache version tag. Added in version 2.6 */
+    .tp_version_tag       = 0,
+
+    .tp_finalize          = nullptr,
+    .tp_vectorcall        = nullptr,
+};
+
+static PyObject* task_factory_new(PyTypeObject* type, PyObject* args, PyObject* kwargs)
+{
+    pyext::pyobject_holder<TaskFactory> self = type->tp_alloc(type, 0);
+    if (self == nullptr)
+    {
+        return nullptr;
+    }
+
+    self->domain = nullptr;
+    self->tasks = nullptr;
+    self->overlapped = 0;
+
+    char domain_key[] = { "domain" };
+    char overlapped_key[] = { "overlapped" };
+    char* kwlist[] = { domain_key, overlapped_key, nullptr };
+
+    PyObject* domain = nullptr;
+    int overlapped = 0;
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|p", kwlist, &domain, &overlapped))
+    {
+        return nullptr;
+    }
+
+    if (pyext::pyobject_cast<Domain>(domain) == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, domain_key, Domain::object_type.tp_name);
+    }
+
+    self->domain = pyext::new_ref(domain);
+    self->overlapped = overlapped ? 1 : 0;
+    self->tasks = PyDict_New();
+    if (self->tasks == nullptr)
+    {
+        return nullptr;
+    }
+
+    return self.release();
+}
+
+static void task_factory_dealloc(PyObject* self)
+{
+    TaskFactory* obj = pyext::pyobject_cast<TaskFactory>(self);
+    if (obj)
+    {
+        Py_XDECREF(obj->domain);
+        Py_XDECREF(obj->tasks);
+    }
+
+    Py_TYPE(self)->tp_free(self);
+}
+
+static PyObject* task_factory_repr(PyObject* self)
+{
+    TaskFactory* obj = pyext::pyobject_cast<TaskFactory>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", TaskFactory::object_type.tp_name);
+    }
+
+    return PyUnicode_FromFormat("%s(%R, overlapped=%s)",
+                                obj->object_type.tp_name, obj->domain, obj->overlapped ? "True" : "False");
+}
+
+static PyObject* factory_task_create(PyObject* domain, PyObject* name, PyObject* id)
+{
+    FactoryTask* task = PyObject_New(FactoryTask, &FactoryTask::object_type);
+    if (task == nullptr)
+    {
+        return nullptr;
+    }
+
+    task->domain = pyext::new_ref(domain);
+    task->name = pyext::new_ref(name);
+    task->id = pyext::xnew_ref(id);
+
+    return reinterpret_cast<PyObject*>(task);
+}
+
+static PyObject* task_factory_get_task(TaskFactory* factory, PyObject* name)
+{
+    PyObject* task = PyDict_GetItemWithError(factory->tasks, name);
+    if (task || PyErr_Occurred())
+    {
+        return task;
+    }
+
+    pyext::pyobject_holder<PyObject> name_string_handle;
+    if (PyUnicode_Check(name))
+    {
+        name_string_handle = PyObject_CallFunctionObjArgs(
+            reinterpret_cast<PyObject*>(&StringHandle::object_type), name, nullptr);
+        if (name_string_handle == nullptr)
+        {
+            return nullptr;
+        }
+    }
+    else if (pyext::pyobject_cast<StringHandle>(name))
+    {
+        name_string_handle = pyext::new_ref(name);
+    }
+    else
+    {
+        return PyErr_Format(PyExc_TypeError,
+            "The passed name is not a valid instance of str or %s.", StringHandle::object_type.tp_name);
+    }
+
+    pyext::pyobject_holder<PyObject> new_task = factory_task_create(factory->domain, name_string_handle.get(), nullptr);
+    if (new_task == nullptr || PyDict_SetItem(factory->tasks, name, new_task.get()) < 0)
+    {
+        return nullptr;
+    }
+
+    /* The dictionary holds the reference. */
+    return new_task.get();
+}
+
+static PyObject* task_factory_call(PyObject* self, PyObject* args, PyObject* kwargs)
+{
+    TaskFactory* obj = pyext::pyobject_cast<TaskFactory>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", TaskFactory::object_type.tp_name);
+    }
+
+    char name_key[] = { "name" };
+    char* kwlist[] = { name_key, nullptr };
+
+    PyObject* name = nullptr;
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O", kwlist, &name))
+    {
+        return nullptr;
+    }
+
+    PyObject* task = task_factory_get_task(obj, name);
+    if (task == nullptr)
+    {
+        return nullptr;
+    }
+
+    if (!obj->overlapped)
+    {
+        return pyext::new_ref(task);
+    }
+
+    pyext::pyobject_holder<PyObject> id = PyObject_CallFunctionObjArgs(
+        reinterpret_cast<PyObject*>(&Id::object_type), obj->domain, nullptr);
+    if (id == nullptr)
+    {
+        return nullptr;
+    }
+
+    return factory_task_create(obj->domain, reinterpret_cast<FactoryTask*>(task)->name, id.get());
+}
+
+static PyObject* factory_task_new(PyTypeObject* Py_UNUSED(type), PyObject* Py_UNUSED(args), PyObject* Py_UNUSED(kwargs))
+{
+    return PyErr_Format(PyExc_TypeError, "The instances of %s are created by %s.",
+                        FactoryTask::object_type.tp_name, TaskFactory::object_type.tp_name);
+}
+
+static void factory_task_dealloc(PyObject* self)
+{
+    FactoryTask* obj = pyext::pyobject_cast<FactoryTask>(self);
+    if (obj)
+    {
+        Py_XDECREF(obj->domain);
+        Py_XDECREF(obj->name);
+        Py_XDECREF(obj->id);
+    }
+
+    Py_TYPE(self)->tp_free(self);
+}
+
+static PyObject* factory_task_repr(PyObject* self)
+{
+    FactoryTask* obj = pyext::pyobject_cast<FactoryTask>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", FactoryTask::object_type.tp_name);
+    }
+
+    return PyUnicode_FromFormat("%s('%S', '%S')", obj->object_type.tp_name, obj->name, obj->domain);
+}
+
+static PyObject* factory_task_begin(PyObject* self, PyObject* Py_UNUSED(args))
+{
+    FactoryTask* obj = pyext::pyobject_cast<FactoryTask>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", FactoryTask::object_type.tp_name);
+    }
+
+    Domain* domain_obj = pyext::pyobject_cast<Domain>(obj->domain);
+    Id* id_obj = pyext::pyobject_cast<Id>(obj->id);
+    if (!domain_is_enabled(domain_obj))
+    {
+        if (id_obj == nullptr)
+        {
+            task_stack_push_unreported();
+        }
+
+        Py_RETURN_NONE;
+    }
+
+    StringHandle* name_obj = pyext::pyobject_cast<StringHandle>(obj->name);
+
+    return id_obj
+        ? task_begin_overlapped_checked(domain_obj, name_obj, id_obj, nullptr)
+        : task_begin_checked(domain_obj, name_obj, nullptr, nullptr);
+}
+
+static PyObject* factory_task_end(PyObject* self, PyObject* Py_UNUSED(args))
+{
+    FactoryTask* obj = pyext::pyobject_cast<FactoryTask>(self);
+    if (obj == nullptr)
+    {
+        return PyErr_Format(PyExc_TypeError,
+            pyext::error::invalid_argument_type_tmpl, "object", FactoryTask::object_type.tp_name);
+    }
+
+    Domain* domain_obj = pyext::pyobject_cast<Domain>(obj->domain);
+    Id* id_obj = pyext::pyobject_cast<Id>(obj->id);
+
+    return id_obj ? task_end_overlapped_checked(domain_obj, id_obj) : task_end_checked(domain_obj);
+}
+
+static PyObject* factory_task_enter(PyObject* self, PyObject* Py_UNUSED(args))
+{
+    pyext::pyobject_holder<PyObject> result = factory_task_begin(self, nullptr);
+    return result == nullptr ? nullptr : pyext::new_ref(self);
+}
+
+static PyObject* factory_task_exit(PyObject* self, PyObject* Py_UNUSED(args))
+{
+    return factory_task_end(self, nullptr);
+}
+
+int exec_task_factory(PyObject* module)
+{
+    if (pyext::add_type(module, &TaskFactory::object_type) < 0)
+    {
+        return -1;
+    }
+
+    return pyext::add_type(module, &FactoryTask::object_type);
+}
+
+} // namespace pyitt
@@ -0,0 +1,32 @@
+#pragma once
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+
+namespace pyitt
+{
+
+struct TaskFactory
+{
+	PyObject_HEAD
+	PyObject* domain;
+	PyObject* tasks;
+	char overlapped;
+
+	static PyTypeObject object_type;
+};
+
+struct FactoryTask
+{
+	PyObject_HEAD
+	PyObject* domain;
+	PyObject* name;
+	PyObject* id;
+
+	static PyTypeObject object_type;
+};
+
+int exec_task_factory(PyObject* module);
+
+} // namespace pyitt
@@ -0,0 +1,445 @@
+#include "task_stack.hpp"
+
+#include <algorithm>
+#include <cstddef>
+#include <functional>
+#include <unordered_map>
+#include <vector>
+
+#include "id.hpp"
+
+#include "extensions/python.hpp"
+
+
+namespace pyitt
+{
+
+/*
+ * Nested tasks are strictly nested on a thread, so they are kept in a thread-local stack. Overlapped tasks can be
+ * suspended together with coroutines, so they are kept in a context variable, which asyncio copies into the tasks it
+ * creates. The variable holds the innermost overlapped task as an immutable node that links to the enclosing one, so
+ * a task is pushed onto the stack of a context without copying the stack. Each overlapped task records the depth of
+ * the nested stack at its beginning, so both stacks can be merged.
+ *
+ * An overlapped task can be ended in another context, e.g. in another thread, where its node cannot be unlinked.
+ * Therefore, each beginning of an overlapped task gets an instance number, the active instances are kept by their task
+ * ids, and the nodes of the ended instances are skipped and dropped on the next update of their context. The tasks of
+ * a decorated coroutine function share the same id, so the instance that is ended in another context is the most
+ * recent one.
+ *
+ * The nested tasks of the disabled domains are kept on the stack without their names, so their ends do not end other
+ * tasks, but they are skipped by the queries. The overlapped tasks of the disabled domains are not kept, so their ends
+ * are not reported.
+ *
+ * The innermost active task becomes the parent of an overlapped task, and of the first nested task on a thread, if no
+ * parent is passed. So the tasks of coroutines and executor jobs are linked to the task that has created them. Deeper
+ * nested tasks have the implicit parent in ITT.
+ */
+struct task_stack_entry
+{
+    PyObject* name;
+    PyObject* domain;
+    PyObject* id;
+    PyObject* parent_id;
+};
+
+/* The references of the entries that are left when a thread exits are leaked, as the GIL is not held there. */
+static thread_local std::vector<task_stack_entry> nested_tasks;
+
+struct task_id_hash
+{
+    std::size_t operator()(const __itt_id& id) const
+    {
+        std::hash<unsigned long long> hash;
+        return hash(id.d1) ^ (hash(id.d2) << 1) ^ (hash(id.d3) << 2);
+    }
+};
+
+struct task_id_equal
+{
+    bool operator()(const __itt_id& lhs, const __itt_id& rhs) const
+    {
+        return lhs.d1 == rhs.d1 && lhs.d2 == rhs.d2 && lhs.d3 == rhs.d3;
+    }
+};
+
+/* The active instances are accessed only while the GIL is held. */
+static std::unordered_map<__itt_id, std::vector<unsigned long long>, task_id_hash, task_id_equal>*
+    active_overlapped_tasks =
+        new std::unordered_map<__itt_id, std::vector<unsigned long long>, task_id_hash, task_id_equal>();
+static unsigned long long last_overlapped_task_instance = 0;
+
+static PyObject* overlapped_tasks_get = nullptr;
+static PyObject* overlapped_tasks_set = nullptr;
+
+enum overlapped_task_field : Py_ssize_t
+{
+    overlapped_task_name = 0,
+    overlapped_task_domain,
+    overlapped_task_id,
+    overlapped_task_parent_id,
+    overlapped_task_depth,
+    overlapped_task_instance,
+    overlapped_task_outer,
+};
+
+static PyObject* new_ref_or_none(PyObject* obj)
+{
+    return pyext::new_ref(obj ? obj : Py_None);
+}
+
+void task_stack_push(PyObject* name, PyObject* domain, PyObject* id, PyObject* parent_id)
+{
+    nested_tasks.push_back({
+        pyext::new_ref(name), pyext::new_ref(domain), new_ref_or_none(id), new_ref_or_none(parent_id) });
+}
+
+void task_stack_push_unreported()
+{
+    nested_tasks.push_back({ nullptr, nullptr, nullptr, nullptr });
+}
+
+bool task_stack_pop(bool is_reported_if_empty)
+{
+    if (nested_tasks.empty())
+    {
+        return is_reported_if_empty;
+    }
+
+    task_stack_entry entry = nested_tasks.back();
+    nested_tasks.pop_back();
+
+    if (entry.name == nullptr)
+    {
+        return false;
+    }
+
+    Py_DECREF(entry.name);
+    Py_DECREF(entry.domain);
+    Py_DECREF(entry.id);
+    Py_DECREF(entry.parent_id);
+    return true;
+}
+
+/* Returns the number of the nested tasks up to the innermost reported one. */
+static std::size_t get_nested_task_depth()
+{
+    std::size_t depth = nested_tasks.size();
+    while (depth > 0 && nested_tasks[depth - 1].name == nullptr)
+    {
+        --depth;
+    }
+
+    return depth;
+}
+
+/* Returns the innermost overlapped task of the current context or None. */
+static PyObject* get_overlapped_tasks()
+{
+    return PyObject_CallFunctionObjArgs(overlapped_tasks_get, Py_None, nullptr);
+}
+
+static bool set_overlapped_tasks(PyObject* task)
+{
+    pyext::pyobject_holder<PyObject> token = PyObject_CallFunctionObjArgs(overlapped_tasks_set, task, nullptr);
+    return token != nullptr;
+}
+
+static PyObject* get_outer_overlapped_task(PyObject* task)
+{
+    PyObject* outer = PyTuple_GET_ITEM(task, overlapped_task_outer);
+    return outer == Py_None ? nullptr : outer;
+}
+
+static const __itt_id& get_overlapped_task_id(PyObject* task)
+{
+    return id_get_handle(pyext::pyobject_cast<Id>(PyTuple_GET_ITEM(task, overlapped_task_id)));
+}
+
+static std::size_t get_overlapped_task_depth(PyObject* task)
+{
+    return static_cast<std::size_t>(PyLong_AsSsize_t(PyTuple_GET_ITEM(task, overlapped_task_depth)));
+}
+
+static unsigned long long get_overlapped_task_instance(PyObject* task)
+{
+    return PyLong_AsUnsignedLongLong(PyTuple_GET_ITEM(task, overlapped_task_instance));
+}
+
+static bool is_overlapped_task_active(PyObject* task)
+{
+    auto it = active_overlapped_tasks->find(get_overlapped_task_id(task));
+    return it != active_overlapped_tasks->end()
+        && std::find(it->second.begin(), it->second.end(), get_overlapped_task_instance(task)) != it->second.end();
+}
+
+static bool is_null_id(PyObject* id)
+{
+    return id == nullptr || id == Py_None;
+}
+
+static PyObject* get_innermost_overlapped_task(PyObject* task)
+{
+    for (; task && task != Py_None; task = get_outer_overlapped_task(task))
+    {
+        if (is_overlapped_task_active(task))
+        {
+            return task;
+        }
+    }
+
+    return nullptr;
+}
+
+bool task_stack_get_nested_parent_id(PyObject*& parent_id)
+{
+    if (!is_null_id(parent_id) || get_nested_task_depth() != 0 || active_overlapped_tasks->empty())
+    {
+        return true;
+    }
+
+    pyext::pyobject_holder<PyObject> tasks = get_overlapped_tasks();
+    if (tasks == nullptr)
+    {
+        return false;
+    }
+
+    /* The node is kept alive by the context variable. */
+    PyObject* task = get_innermost_overlapped_task(tasks.get());
+    if (task)
+    {
+        parent_id = PyTuple_GET_ITEM(task, overlapped_task_id);
+    }
+
+    return true;
+}
+
+bool task_stack_push_overlapped(PyObject* name, PyObject* domain, PyObject* id, PyObject*& parent_id)
+{
+    pyext::pyobject_holder<PyObject> tasks = get_overlapped_tasks();
+    if (tasks == nullptr)
+    {
+        return false;
+    }
+
+    /* The nodes of the ended tasks on top of the stack are dropped. */
+    PyObject* outer = get_innermost_overlapped_task(tasks.get());
+    if (is_null_id(parent_id))
+    {
+        std::size_t nested_depth = get_nested_task_depth();
+        PyObject* nested_id = nested_depth == 0 ? Py_None : nested_tasks[nested_depth - 1].id;
+        if (nested_id != Py_None && (outer == nullptr || get_overlapped_task_depth(outer) < nested_depth))
+        {
+            parent_id = nested_id;
+        }
+        else if (outer)
+        {
+            parent_id = PyTuple_GET_ITEM(outer, overlapped_task_id);
+        }
+    }
+
+    unsigned long long instance = ++last_overlapped_task_instance;
+    pyext::pyobject_holder<PyObject> task = Py_BuildValue("(OOOOnKO)",
+                                                          name,
+                                                          domain,
+                                                          id,
+                                                          is_null_id(parent_id) ? Py_None : parent_id,
+                                                          static_cast<Py_ssize_t>(nested_tasks.size()),
+                                                          instance,
+                                                          outer ? outer : Py_None);
+    if (task == nullptr || !set_overlapped_tasks(task.get()))
+    {
+        return false;
+    }
+
+    (*active_overlapped_tasks)[get_overlapped_task_id(task.get())].push_back(instance);
+    return true;
+}
+
+/* Links the copies of the inner tasks, from the outermost one, to the outer task. */
+static PyObject* relink_overlapped_tasks(PyObject* outer, const std::vector<PyObject*>& inner_tasks)
+{
+    pyext::pyobject_holder<PyObject> tasks = new_ref_or_none(outer);
+    for (auto it = inner_tasks.rbegin(); it != inner_tasks.rend(); ++it)
+    {
+        PyObject* task = PyTuple_New(PyTuple_GET_SIZE(*it));
+        if (task == nullptr)
+        {
+            return nullptr;
+        }
+
+        for (Py_ssize_t i = 0; i < overlapped_task_outer; ++i)
+        {
+            PyTuple_SET_ITEM(task, i, pyext::new_ref(PyTuple_GET_ITEM(*it, i)));
+        }
+
+        PyTuple_SET_ITEM(task, overlapped_task_outer, tasks.release());
+        tasks = task;
+    }
+
+    return tasks.release();
+}
+
+bool task_stack_remove_overlapped(PyObject* id, bool& is_reported)
+{
+    const __itt_id& handle = id_get_handle(pyext::pyobject_cast<Id>(id));
+
+    auto it = active_overlapped_tasks->find(handle);
+    is_reported = it != active_overlapped_tasks->end();
+    if (!is_reported)
+    {
+        return true;
+    }
+
+    pyext::pyobject_holder<PyObject> tasks = get_overlapped_tasks();
+    if (tasks == nullptr)
+    {
+        return false;
+    }
+
+    /* The most recent active node of the task in the current context is unlinked. */
+    std::vector<PyObject*> inner_tasks;
+    PyObject* task = get_innermost_overlapped_task(tasks.get());
+    for (; task && !task_id_equal()(get_overlapped_task_id(task), handle);
+         task = get_innermost_overlapped_task(get_outer_overlapped_task(task)))
+    {
+        inner_tasks.push_back(task);
+    }
+
+    std::vector<unsigned long long>& instances = it->second;
+    instances.erase(task ? std::find(instances.begin(), instances.end(), get_overlapped_task_instance(task))
+                         : instances.end() - 1);
+    if (instances.empty())
+    {
+        active_overlapped_tasks->erase(it);
+    }
+
+    if (task == nullptr)
+    {
+        return true;
+    }
+
+    pyext::pyobject_holder<PyObject> new_tasks = relink_overlapped_tasks(
+        get_innermost_overlapped_task(get_outer_overlapped_task(task)), inner_tasks);
+    return new_tasks != nullptr && set_overlapped_tasks(new_tasks.get());
+}
+
+static PyObject* get_nested_task_info(const task_stack_entry& entry)
+{
+    return Py_BuildValue("(OOOOO)", entry.name, entry.domain, entry.id, entry.parent_id, Py_False);
+}
+
+static PyObject* get_overlapped_task_info(PyObject* task)
+{
+    return Py_BuildValue("(OOOOO)",
+                         PyTuple_GET_ITEM(task, overlapped_task_name),
+                         PyTuple_GET_ITEM(task, overlapped_task_domain),
+                         PyTuple_GET_ITEM(task, overlapped_task_id),
+                         PyTuple_GET_ITEM(task, overlapped_task_parent_id),
+                         Py_True);
+}
+
+PyObject* task_stack(PyObject* Py_UNUSED(self), PyObject* Py_UNUSED(args))
+{
+    pyext::pyobject_holder<PyObject> tasks = get_overlapped_tasks();
+    if (tasks == nullptr)
+    {
+        return nullptr;
+    }
+
+    pyext::pyobject_holder<PyObject> result = PyList_New(0);
+    if (result == nullptr)
+    {
+        return nullptr;
+    }
+
+    /* The active overlapped tasks are merged with the nested tasks from the outermost ones. */
+    std::vector<PyObject*> overlapped_tasks;
+    for (PyObject* task = get_innermost_overlapped_task(tasks.get());
+         task;
+         task = get_innermost_overlapped_task(get_outer_overlapped_task(task)))
+    {
+        overlapped_tasks.push_back(task);
+    }
+
+    std::size_t nested_index = 0;
+    for (auto it = overlapped_tasks.rbegin(); ; ++it)
+    {
+        PyObject* task = it != overlapped_tasks.rend() ? *it : nullptr;
+
+        /* The nested tasks that have begun before the overlapped task are outer to it. */
+        std::size_t depth = task ? get_overlapped_task_depth(task) : nested_tasks.size();
+        for (; nested_index < nested_tasks.size() && nested_index < depth; ++nested_index)
+        {
+            if (nested_tasks[nested_index].name == nullptr)
+            {
+                continue;
+            }
+
+            pyext::pyobject_holder<PyObject> info = get_nested_task_info(nested_tasks[nested_index]);
+            if (info == nullptr || PyList_Append(result.get(), info.get()) < 0)
+            {
+                return nullptr;
+            }
+        }
+
+        if (task == nullptr)
+        {
+            break;
+        }
+
+        pyext::pyobject_holder<PyObject> info = get_overlapped_task_info(task);
+        if (info == nullptr || PyList_Append(result.get(), info.get()) < 0)
+        {
+            return nullptr;
+        }
+    }
+
+    return PyList_AsTuple(result.get());
+}
+
+PyObject* current_task(PyObject* Py_UNUSED(self), PyObject* Py_UNUSED(args))
+{
+    pyext::pyobject_holder<PyObject> tasks = get_overlapped_tasks();
+    if (tasks == nullptr)
+    {
+        return nullptr;
+    }
+
+    std::size_t nested_depth = get_nested_task_depth();
+    PyObject* task = get_innermost_overlapped_task(tasks.get());
+    if (task && get_overlapped_task_depth(task) >= nested_depth)
+    {
+        return get_overlapped_task_info(task);
+    }
+
+    if (nested_depth != 0)
+    {
+        return get_nested_task_info(nested_tasks[nested_depth - 1]);
+    }
+
+    Py_RETURN_NONE;
+}
+
+int exec_task_stack(PyObject* Py_UNUSED(module))
+{
+    pyext::pyobject_holder<PyObject> contextvars = PyImport_ImportModule("contextvars");
+    if (contextvars == nullptr)
+    {
+        return -1;
+    }
+
+    pyext::pyobject_holder<PyObject> overlapped_tasks = PyObject_CallMethod(
+        contextvars.get(), "ContextVar", "s", "pyitt_overlapped_tasks");
+    if (overlapped_tasks == nullptr)
+    {
+        return -1;
+    }
+
+    overlapped_tasks_get = PyObject_GetAttrString(overlapped_tasks.get(), "get");
+    overlapped_tasks_set = PyObject_GetAttrString(overlapped_tasks.get(), "set");
+
+    return overlapped_tasks_get && overlapped_tasks_set ? 0 : -1;
+}
+
+} // namespace pyitt
@@ -0,0 +1,42 @@
+#pragma once
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+
+
+namespace pyitt
+{
+
+/*
+ * Sets the missing parent_id of a nested task that is the first one on the calling thread to the id of the innermost
+ * overlapped task of the current context. Returns false if an exception is raised.
+ */
+bool task_stack_get_nested_parent_id(PyObject*& parent_id);
+/* Pushes a nested task onto the stack of the calling thread. */
+void task_stack_push(PyObject* name, PyObject* domain, PyObject* id, PyObject* parent_id);
+/* Pushes a nested task of a disabled domain, which is not reported and is not seen as an active task. */
+void task_stack_push_unreported();
+/*
+ * Pops the most recent nested task of the calling thread. Returns false if the task is not reported, so its end is not
+ * reported either. If the stack is empty, returns the passed value.
+ */
+bool task_stack_pop(bool is_reported_if_empty);
+
+/*
+ * Adds an overlapped task to the tasks of the current context. The missing parent_id is set to the id of the innermost
+ * active task. Returns false if an exception is raised.
+ */
+bool task_stack_push_overlapped(PyObject* name, PyObject* domain, PyObject* id, PyObject*& parent_id);
+/*
+ * Removes an overlapped task from the tasks of the current context. Sets is_reported to false if the task has not been
+ * begun while its domain is enabled, so its end is not reported either. Returns false if an exception is raised.
+ */
+bool task_stack_remove_overlapped(PyObject* id, bool& is_reported);
+
+PyObject* task_stack(PyObject* self, PyObject* args);
+PyObject* current_task(PyObject* self, PyObject* args);
+
+int exec_task_stack(PyObject* module);
+
+} // namespace pyitt
@@ -2,6 +2,8 @@
 
 #include <ittnotify.h>
 
+#include "name_registry.hpp"
+#include "recorder.hpp"
 #include "string_handle.hpp"
 
 
@@ -37,6 +39,11 @@ PyObject* thread_set_name(PyObject* Py_UNUSED(self), PyObject* name)
     __itt_thread_set_name(name_str.c_str());
 #endif
 
+    if (recorder_is_enabled())
+    {
+        recorder_write(recorder_record_type::thread_name, intern_name(name), 0, 0);
+    }
+
     Py_RETURN_NONE;
 }
 
@@ -4,17 +4,55 @@ Python binding to Intel Instrumentation and Tracing Technology (ITT) API.
 This module provides a convenient way to mark up the Python code for further performance analysis using performance
 analyzers from Intel like Intel VTune or others.
 """
+from importlib import import_module as _import_module
+from os import environ as _environ
+
 from pyitt.native import Counter
-from pyitt.native import Domain, Id, StringHandle
+from pyitt.native import ClockDomain, Domain, Id, StringHandle
+from pyitt.native import CountWindowActivator, LatencyTriggeredActivator, ProbabilisticActivator
 from pyitt.native import frame_begin, frame_end
 from pyitt.native import task_begin, task_end, task_begin_overlapped, task_end_overlapped
+from .clock_domain import clock_domain, clock_domain_reset
 from .collection_control import detach, pause, resume, active_region, paused_region, ActiveRegion, PausedRegion
+from .collection_control import collect_windows, collection_schedule, collection_schedule_is_active
+from .collection_control import collection_schedule_stop
 from .counter import counter
-from .domain import domain
+from .domain import domain, set_domain_enabled
 from .event import event, Event
-from .frame import frame, Frame
+from .frame import frame, frame_submit, frame_submit_many, get_timestamp, Frame
+from .gauge import gauge
+from .gc_tracing import trace_gc
+from .histogram import histogram
 from .id import id
+from .marker import marker
+from .metadata import metadata
+from .relation import relation, relation_to_current
 from .string_handle import string_handle
 from .task import NestedTask, OverlappedTask, task, nested_task, overlapped_task
+from .task import current_task, task_stack, task_factory, TaskInfo
 from .pt_region import PTRegion, pt_region
-from .thread_naming import thread_set_name
+from .thread_naming import auto_name_threads, thread_set_name
+
+
+# The optional integrations patch the standard library or register hooks, so they are imported on the first access,
+# e.g. pyitt.jit, or at the start if they are enabled through their environment variables.
+_LAZY_SUBMODULES = ('asyncio', 'fork', 'futures', 'heap', 'jit', 'manifest', 'recorder', 'statistics', 'sync')
+_LAZY_ATTRIBUTES = {'preload': 'manifest', 'stats': 'statistics'}
+_ENVIRONMENT_SUBMODULES = {'PYITT_MANIFEST': 'manifest', 'PYITT_NAME_CHILD_PROCESSES': 'fork'}
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        return _import_module(f'.{name}', __name__)
+
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(_import_module(f'.{_LAZY_ATTRIBUTES[name]}', __name__), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+for _variable, _submodule in _ENVIRONMENT_SUBMODULES.items():
+    if _environ.get(_variable):
+        _import_module(f'.{_submodule}', __name__)
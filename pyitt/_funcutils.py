@@ -2,6 +2,7 @@
 _funcutils.py - Python module with internal tools for working with callable objects
 """
 from asyncio import iscoroutinefunction as _asyncio_iscoroutinefunction
+from functools import partial as _partial
 from inspect import iscoroutinefunction as _iscoroutinefunction
 from sys import version_info
 
@@ -20,3 +21,16 @@ def mark_coroutine_function(func):
     if version_info >= (3, 12):
         from inspect import markcoroutinefunction
         markcoroutinefunction(func)
+
+
+def get_callable_name(func):
+    """Gets a name of a callable object."""
+    func = getattr(func, 'func', func) if isinstance(func, _partial) else func
+
+    if hasattr(func, '__qualname__'):
+        return func.__qualname__
+
+    if hasattr(func, '__name__'):
+        return func.__name__
+
+    return f'{func.__class__.__qualname__}.__call__'
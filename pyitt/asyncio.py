@@ -0,0 +1,161 @@
+"""
+asyncio.py - Python module that reports the activity of asyncio event loops through ITT
+
+Each iteration of an instrumented event loop is reported as a frame, and each callback, including the steps of the
+asyncio tasks, is reported as a nested task named by the callback or by the coroutine of the task. The time spent
+waiting for I/O events in the selector is reported as the 'idle' task, the callbacks that run longer than the threshold
+are flagged with markers, and the number of the ready callbacks is reported through a counter at the beginning of each
+iteration. The loops are instrumented through the internals of asyncio.BaseEventLoop, so the loops of other
+implementations (e.g. uvloop) are not supported.
+"""
+import asyncio as _asyncio
+from asyncio import events as _events
+from collections import namedtuple as _namedtuple
+from functools import partial as _partial
+from time import perf_counter as _perf_counter
+
+from pyitt.native import Counter as _Counter, Domain as _Domain
+from pyitt.native import frame_begin as _frame_begin, frame_end as _frame_end
+
+from .marker import marker as _marker
+from .task import task_factory as _task_factory
+
+
+DEFAULT_DOMAIN = 'pyitt.asyncio'
+
+IDLE_TASK_NAME = 'idle'
+READY_COUNTER_NAME = 'asyncio ready callbacks'
+SLOW_CALLBACK_MARKER_TEMPLATE = 'slow callback {}'
+
+
+def _get_callback_name(callback) -> str:
+    """Gets the name of the callback, the steps of the asyncio tasks are named by their coroutines."""
+    while isinstance(callback, _partial):
+        callback = callback.func
+
+    owner = getattr(callback, '__self__', None)
+    if isinstance(owner, _asyncio.Task):
+        coro = owner.get_coro()
+        return getattr(coro, '__qualname__', None) or owner.get_name()
+
+    return getattr(callback, '__qualname__', None) or type(callback).__qualname__
+
+
+_LoopMarkup = _namedtuple('_LoopMarkup', ('domain', 'tasks', 'idle_task', 'ready_counter'))
+_LoopMethods = _namedtuple('_LoopMethods', ('run_once', 'select', 'close'))
+
+
+class _LoopInstrumentation:
+    """
+    A class that holds the state of the instrumentation of an event loop. The methods of the loop and of its selector
+    are replaced by the attributes of the instances, so the original methods are restored by deleting them.
+    """
+    def __init__(self, loop, domain, slow_callback_ms):
+        self.__loop = loop
+        self.__selector = loop._selector  # pylint: disable=W0212
+
+        domain = _Domain(domain)
+        tasks = _task_factory(domain)
+        self.__markup = _LoopMarkup(domain, tasks, tasks(IDLE_TASK_NAME), _Counter(READY_COUNTER_NAME, domain))
+        self.__ready_count = 0
+        self.__slow_callback_duration = (loop.slow_callback_duration if slow_callback_ms is None
+                                         else slow_callback_ms / 1000)
+
+        self.__original = _LoopMethods(loop._run_once, self.__selector.select, loop.close)  # pylint: disable=W0212
+
+    def install(self):
+        """Replaces the methods of the loop and of its selector."""
+        self.__loop._run_once = self.__run_once  # pylint: disable=W0212
+        self.__loop.close = self.__close
+        self.__selector.select = self.__select
+
+    def uninstall(self):
+        """Restores the original methods of the loop and of its selector."""
+        for obj, name in ((self.__loop, '_run_once'), (self.__loop, 'close'), (self.__selector, 'select')):
+            if name in vars(obj):
+                delattr(obj, name)
+
+    def run_handle(self, handle):
+        """Runs the callback of the handle as a nested task and marks it if it is slow."""
+        name = _get_callback_name(handle._callback)  # pylint: disable=W0212
+
+        start = _perf_counter()
+        with self.__markup.tasks(name):
+            _original_handle_run(handle)
+
+        if _perf_counter() - start >= self.__slow_callback_duration:
+            _marker(SLOW_CALLBACK_MARKER_TEMPLATE.format(name), 'thread', self.__markup.domain)
+
+    def __run_once(self):
+        ready_count = len(self.__loop._ready)  # pylint: disable=W0212
+        if ready_count != self.__ready_count:
+            self.__ready_count = ready_count
+            self.__markup.ready_counter.set(ready_count)
+
+        _frame_begin(self.__markup.domain)
+        try:
+            self.__original.run_once()
+        finally:
+            _frame_end(self.__markup.domain)
+
+    def __select(self, *args, **kwargs):
+        with self.__markup.idle_task:
+            return self.__original.select(*args, **kwargs)
+
+    def __close(self):
+        uninstrument_loop(self.__loop)
+        self.__original.close()
+
+
+_instrumented_loops = {}
+_original_handle_run = _events.Handle._run  # pylint: disable=W0212
+
+
+def _handle_run(handle):
+    """Runs the callback of the handle, the callbacks of the instrumented loops are reported as tasks."""
+    instrumentation = _instrumented_loops.get(handle._loop)  # pylint: disable=W0212
+    if instrumentation is None:
+        _original_handle_run(handle)
+    else:
+        instrumentation.run_handle(handle)
+
+
+def instrument_loop(loop, domain=DEFAULT_DOMAIN, slow_callback_ms=None) -> None:
+    """
+    Starts reporting of the iterations, the callbacks and the idle time of the event loop. The loop is instrumented
+    until uninstrument_loop() is called or until the loop is closed.
+    :param loop: an instance of asyncio.BaseEventLoop, e.g. the loop returned by asyncio.get_running_loop()
+    :param domain: a domain of the frames, the tasks, the markers and the counter
+    :param slow_callback_ms: the duration of a callback in milliseconds, starting from which it is marked as slow. By
+                             default, the slow_callback_duration of the loop is used.
+    """
+    if not isinstance(loop, _asyncio.BaseEventLoop) or not hasattr(loop, '_selector'):
+        raise TypeError('The passed loop is not a valid instance of asyncio.BaseEventLoop with a selector.')
+
+    if loop in _instrumented_loops:
+        return
+
+    instrumentation = _LoopInstrumentation(loop, domain, slow_callback_ms)
+    instrumentation.install()
+    _instrumented_loops[loop] = instrumentation
+
+    if _events.Handle._run is not _handle_run:  # pylint: disable=W0212
+        _events.Handle._run = _handle_run  # pylint: disable=W0212
+
+
+def uninstrument_loop(loop) -> None:
+    """
+    Stops reporting of the activity of the event loop.
+    :param loop: an instrumented event loop
+    """
+    instrumentation = _instrumented_loops.pop(loop, None)
+    if instrumentation is not None:
+        instrumentation.uninstall()
+
+    if not _instrumented_loops:
+        _events.Handle._run = _original_handle_run  # pylint: disable=W0212
+
+
+def is_instrumented(loop) -> bool:
+    """Returns True if the event loop is instrumented, otherwise returns False."""
+    return loop in _instrumented_loops
@@ -0,0 +1,26 @@
+"""
+clock_domain.py - Python module wrapper for ITT Clock Domain API
+
+Clock domains allow passing timestamps of a custom clock, e.g. time.perf_counter_ns(), to the timestamped ITT calls.
+The timestamps of the default ITT clock are taken with pyitt.get_timestamp().
+"""
+from pyitt.native import ClockDomain as _ClockDomain
+from pyitt.native import clock_domain_reset as _clock_domain_reset
+
+
+def clock_domain(fn_or_frequency, base: int = 0):
+    """
+    Creates a clock domain.
+    :param fn_or_frequency: a frequency of the clock in Hz or a function that returns a tuple of the frequency of the
+                            clock and the current value of the clock. The function may be called by the collector
+                            again after clock_domain_reset().
+    :param base: a value of the clock at the moment of creation of the clock domain, it is used only if a frequency is
+                 passed
+    :return: a handle to the created clock domain
+    """
+    return _ClockDomain(fn_or_frequency, base)
+
+
+def clock_domain_reset() -> None:
+    """Requests the clock information of all clock domains again, e.g. after the frequency of the clock is changed."""
+    _clock_domain_reset()
@@ -2,6 +2,11 @@
 collection_control.py - Python module wrapper for ITT Collection Control API
 """
 from pyitt.native import detach as _detach, pause as _pause, resume as _resume
+from pyitt.native import collection_region_begin as _collection_region_begin
+from pyitt.native import collection_region_end as _collection_region_end
+from pyitt.native import collection_schedule_start as _collection_schedule_start
+from pyitt.native import collection_schedule_stop as _collection_schedule_stop
+from pyitt.native import collection_schedule_is_active as _collection_schedule_is_active
 
 from ._region import _Region
 
@@ -10,6 +15,10 @@ class _CollectionRegion(_Region):
     """
     An abstract base class that provides common functionality for subclasses that represent paused/resumed collection
     regions.
+
+    The regions are reference-counted in the native layer across all threads and all regions of the same kind, so the
+    collection state is changed only on the first entry and on the last exit, even if a region is nested or entered
+    from multiple threads concurrently.
     """
     def __init__(self, func=None, activator=None):
         """
@@ -17,14 +26,15 @@ class _CollectionRegion(_Region):
         :param func: a callable object that represents the collection region, e.g. function.
         :param activator: a callable object that determines if the region is active or not. The callable object should
                           not take any arguments and should return True if the region is active, otherwise should return
-                          False. If the region is active, _CollectionRegion performs _begin()/_end() calls to inform
-                          subclasses about the start and end of the region. Otherwise, it does nothing.
+                          False. The activator is called on each entry to the region, and the result is passed to
+                          _begin() of subclasses, so inactive entries do not affect the collection state. If the
+                          callable object has complete() method, e.g. LatencyTriggeredActivator, it is called at the
+                          end of each region.
         """
         super().__init__(func)
         self.activator = activator
-        self.__is_active = False
 
-    def _begin(self):
+    def _begin(self, is_active):
         raise NotImplementedError()
 
     def _end(self):
@@ -32,19 +42,15 @@ class _CollectionRegion(_Region):
 
     def begin(self):
         """Marks the beginning of a collection region."""
-        if callable(self.activator):
-            self.__is_active = bool(self.activator())
-
-            if self.__is_active:
-                self._begin()
-        else:
-            self.__is_active = True
-            self._begin()
+        self._begin(bool(self.activator()) if callable(self.activator) else True)
 
     def end(self):
         """Marks the end of a collection region."""
-        if self.__is_active:
-            self._end()
+        complete = getattr(self.activator, 'complete', None)
+        if complete is not None:
+            complete()
+
+        self._end()
 
 
 def detach() -> None:
@@ -62,6 +68,45 @@ def resume() -> None:
     _resume()
 
 
+def collection_schedule(on_ms: int, off_ms: int, delay_ms: int = 0) -> None:
+    """
+    Starts collecting profiling data in periodic windows, e.g. to keep a profiler attached to a long-running service
+    with bounded result size and overhead. The collection is resumed for on_ms and paused for off_ms by a native timer
+    thread, so the windows are not delayed by Python code that holds the GIL. The collection of profiling data have to
+    be run in Start Paused mode. The previous schedule, if any, is stopped. The schedule bypasses the active and paused
+    regions, e.g. a window resumes the collection even inside an entered paused region.
+    :param on_ms: a duration of a collection window in milliseconds
+    :param off_ms: a duration of a pause between collection windows in milliseconds
+    :param delay_ms: a delay before the first collection window in milliseconds
+    """
+    _collection_schedule_start(on_ms, off_ms, 0, delay_ms)
+
+
+def collect_windows(count: int, on_ms: int, off_ms: int, delay_ms: int = 0) -> None:
+    """
+    Starts collecting profiling data in the given number of periodic windows. The collection remains paused after the
+    last window. The previous schedule, if any, is stopped.
+    :param count: a number of collection windows
+    :param on_ms: a duration of a collection window in milliseconds
+    :param off_ms: a duration of a pause between collection windows in milliseconds
+    :param delay_ms: a delay before the first collection window in milliseconds
+    """
+    if count <= 0:
+        raise ValueError('The number of collection windows must be greater than zero.')
+
+    _collection_schedule_start(on_ms, off_ms, count, delay_ms)
+
+
+def collection_schedule_stop() -> None:
+    """Stops the collection schedule. The collection is paused if it is stopped during a collection window."""
+    _collection_schedule_stop()
+
+
+def collection_schedule_is_active() -> bool:
+    """Returns True if the collection schedule is running, otherwise returns False."""
+    return _collection_schedule_is_active()
+
+
 class ManualCollectionRegionActivator:
     """
     A class that provides ability to activate/deactivate paused/resumed regions.
@@ -88,6 +133,14 @@ class ManualCollectionRegionActivator:
         self.__state = self.INACTIVE
 
 
+# The activators that are implemented natively, so they add no Python calls to the regions, are exported by pyitt:
+#  - CountWindowActivator(first, last) activates the invocations from first to last, the invocations are numbered
+#    from 1;
+#  - ProbabilisticActivator(probability) activates the given percent of invocations at random;
+#  - LatencyTriggeredActivator(threshold_ms, count) activates the next count invocations after an invocation that has
+#    taken longer than threshold_ms.
+
+
 class ActiveRegion(_CollectionRegion):
     """
     A class that represents resumed collection region.
@@ -102,16 +155,17 @@ class ActiveRegion(_CollectionRegion):
         :param activator: a callable object that determines if the region is active or not. The callable object should
                           not take any arguments and should return True if the region is active, otherwise should return
                           False. If the region is active, a call of begin() method of the instance will resume
-                          the collection of profiling data and a call of end() method will pause the collection again.
+                          the collection of profiling data unless another active region is entered already, and a call
+                          of end() method will pause the collection again when the last active region is exited.
                           Otherwise, these calls do nothing.
         """
         super().__init__(func, activator)
 
-    def _begin(self):
-        resume()
+    def _begin(self, is_active):
+        _collection_region_begin(self, False, is_active)
 
     def _end(self):
-        pause()
+        _collection_region_end(self)
 
 
 def active_region(func=None, activator=ManualCollectionRegionActivator()):
@@ -142,16 +196,17 @@ class PausedRegion(_CollectionRegion):
         :param activator: a callable object that determines if the region is active or not. The callable object should
                           not take any arguments and should return True if the region is active, otherwise should return
                           False. If the region is active, a call of begin() method for the instance will pause
-                          the collection of profiling data and a call of end() method will resume the collection again.
+                          the collection of profiling data unless another paused region is entered already, and a call
+                          of end() method will resume the collection again when the last paused region is exited.
                           Otherwise, these calls do nothing.
         """
         super().__init__(func, activator)
 
-    def _begin(self):
-        pause()
+    def _begin(self, is_active):
+        _collection_region_begin(self, True, is_active)
 
     def _end(self):
-        resume()
+        _collection_region_end(self)
 
 
 def paused_region(func=None, activator=ManualCollectionRegionActivator()):
@@ -1,7 +1,21 @@
 """
 domain.py - Python module wrapper for ITT Domain API
+
+The beginnings of the tasks of a disabled domain return before their arguments are processed, and the beginnings of
+the frames only note that the frames are not reported, so the regions of the disabled domains cost almost nothing. A
+domain is disabled by set_domain_enabled() or by the collector, which clears the flags of the ITT domain, and the end
+of a region is reported only if its beginning has been reported, the frames are matched per thread, domain and id. If
+the PYITT_DOMAINS environment variable is set to a comma-separated list of domain names, only these domains are
+enabled.
 """
+from os import environ as _environ
+
 from pyitt.native import Domain as _Domain
+from pyitt.native import domain_set_allowlist as _domain_set_allowlist
+from pyitt.native import domain_set_enabled as _domain_set_enabled
+
+
+DOMAINS_ENVIRONMENT_VARIABLE = 'PYITT_DOMAINS'
 
 
 def domain(name=None):
@@ -12,3 +26,22 @@ def domain(name=None):
      Otherwise, returns handle to default domain.
     """
     return _Domain(name)
+
+
+def set_domain_enabled(name: str, enabled: bool) -> None:
+    """
+    Enables or disables the domains with the given name, including the domains that are created later.
+    :param name: a name of the domain, 'pyitt' for the default domain
+    :param enabled: True to enable the domain, False to disable it
+    """
+    _domain_set_enabled(name, enabled)
+
+
+def _get_allowlist(value):
+    """Gets the names of the enabled domains from the value of the environment variable, None if it is not set."""
+    names = tuple(name.strip() for name in value.split(',') if name.strip()) if value else ()
+    return names or None
+
+
+if DOMAINS_ENVIRONMENT_VARIABLE in _environ:
+    _domain_set_allowlist(_get_allowlist(_environ[DOMAINS_ENVIRONMENT_VARIABLE]))
@@ -0,0 +1,86 @@
+"""
+fork.py - Python module that names the child processes
+
+The child processes are named, so their threads can be distinguished from the threads of the parent process in the
+analysis results. The naming is passed to the multiprocessing child processes that are started with the spawn method
+through the PYITT_NAME_CHILD_PROCESSES environment variable, which is set only while such a process is being started.
+The native state of the parent process (e.g. the recorded calls and the aggregated statistics) is discarded in the
+child process by the native module itself, whether this module is imported or not.
+"""
+import os as _os
+import threading as _threading
+from multiprocessing import current_process as _current_process
+from multiprocessing.process import BaseProcess as _BaseProcess
+from multiprocessing.util import register_after_fork as _register_after_fork
+
+from .thread_naming import thread_set_name as _thread_set_name
+
+
+ENVIRONMENT_VARIABLE = 'PYITT_NAME_CHILD_PROCESSES'
+
+# The variable is meant only for this process, so it is not inherited by the processes that are started by it.
+_naming = {'enabled': _os.environ.pop(ENVIRONMENT_VARIABLE, None) == '1', 'starting_processes': 0}
+_naming_lock = _threading.Lock()
+_starting_process = _threading.local()
+_original_process_start = _BaseProcess.start
+
+
+def name_child_processes(enabled: bool = True) -> None:
+    """
+    Enables or disables naming of child processes.
+
+    The main thread of a multiprocessing child process is named by the name of the process, e.g. 'ForkPoolWorker-1'.
+    The thread of a child process that is created by os.fork() is named by the name of the thread that has called
+    fork and the process id.
+    :param enabled: True to name child processes, False to stop naming them
+    """
+    _naming['enabled'] = bool(enabled)
+    _BaseProcess.start = _start_process if enabled else _original_process_start
+
+
+def _start_process(process):
+    """
+    Starts the multiprocessing process. The environment variable is set during the start, so the process that is
+    started with the spawn or forkserver method inherits the naming.
+    """
+    with _naming_lock:
+        _naming['starting_processes'] += 1
+        _os.environ[ENVIRONMENT_VARIABLE] = '1'
+
+    _starting_process.active = True
+    try:
+        _original_process_start(process)
+    finally:
+        _starting_process.active = False
+
+        with _naming_lock:
+            _naming['starting_processes'] -= 1
+            if not _naming['starting_processes']:
+                _os.environ.pop(ENVIRONMENT_VARIABLE, None)
+
+
+def _reinitialize_in_child():
+    """
+    Names the child process that is created by os.fork(). The child process of multiprocessing is named by the name
+    of the process after its start instead.
+    """
+    if getattr(_starting_process, 'active', False):
+        _starting_process.active = False
+        _naming['starting_processes'] = 0
+        _os.environ.pop(ENVIRONMENT_VARIABLE, None)
+    elif _naming['enabled']:
+        _thread_set_name(f'{_threading.current_thread().name} ({_os.getpid()})')
+
+
+def _name_started_process(_):
+    """Names the main thread of the child process that is started by multiprocessing."""
+    if _naming['enabled']:
+        _thread_set_name(_current_process().name)
+
+
+if hasattr(_os, 'register_at_fork'):
+    _os.register_at_fork(after_in_child=_reinitialize_in_child)
+_register_after_fork(_name_started_process, _name_started_process)
+
+if _naming['enabled']:
+    name_child_processes()
@@ -1,7 +1,11 @@
 """
 frame.py - Python module wrapper for ITT Frame API
 """
+from array import array as _array
+
 from pyitt.native import frame_begin as _frame_begin, frame_end as _frame_end
+from pyitt.native import frame_submit as _frame_submit, frame_submit_many as _frame_submit_many
+from pyitt.native import get_timestamp as _get_timestamp
 
 from .domain import domain as _domain
 from ._region import _Region
@@ -63,3 +67,48 @@ def frame(region=None, domain=None, id=None) -> Frame:
     :return: a Frame instance
     """
     return Frame(region, domain, id)
+
+
+def get_timestamp() -> int:
+    """
+    Returns the current ITT timestamp. The timestamps that are passed to frame_submit() should be taken with this
+    function.
+    :return: the current timestamp
+    """
+    return _get_timestamp()
+
+
+def frame_submit(domain, begin_ts: int, end_ts: int, id=None) -> None:
+    """
+    Submits a frame instance that has been measured out of band.
+    :param domain: a frame domain
+    :param begin_ts: a timestamp of the beginning of the frame
+    :param end_ts: a timestamp of the end of the frame
+    :param id: a frame id
+    """
+    _frame_submit(_get_domain(domain), begin_ts, end_ts, id)
+
+
+def frame_submit_many(domain, begins, ends) -> int:
+    """
+    Submits frame instances that have been measured out of band. The timestamps are passed to ITT without copying if
+    they are buffers of 64-bit integers, e.g. array('Q') or numpy.ndarray of uint64 type.
+    :param domain: a frame domain
+    :param begins: a buffer or a sequence of timestamps of the beginning of the frames
+    :param ends: a buffer or a sequence of timestamps of the end of the frames
+    :return: the number of submitted frames
+    """
+    return _frame_submit_many(_get_domain(domain), _get_timestamps(begins), _get_timestamps(ends))
+
+
+def _get_domain(domain):
+    """Gets the domain for the frame."""
+    return _domain(domain) if domain is None or isinstance(domain, str) else domain
+
+
+def _get_timestamps(timestamps):
+    """Gets the buffer of timestamps or converts the sequence of timestamps to an array."""
+    if isinstance(timestamps, (list, tuple)):
+        return _array('Q', timestamps)
+
+    return timestamps
@@ -0,0 +1,286 @@
+"""
+futures.py - Python module for instrumentation of concurrent.futures executors
+
+Every callable that is submitted to an instrumented executor is represented by ITT tasks for the submission, the
+waiting in the executor queue and the execution. The tasks are linked by ITT ids, so the queueing delay is visible in
+the timeline next to the execution time.
+"""
+from collections import namedtuple as _namedtuple
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor, ThreadPoolExecutor as _ThreadPoolExecutor
+from functools import lru_cache as _lru_cache, partial as _partial
+from itertools import count as _count
+from multiprocessing import current_process as _current_process
+from threading import current_thread as _current_thread
+
+from pyitt.native import relation_add as _relation_add
+from pyitt.native import task_begin as _task_begin, task_end as _task_end
+from pyitt.native import task_begin_overlapped as _task_begin_overlapped, task_end_overlapped as _task_end_overlapped
+
+from ._funcutils import get_callable_name as _get_callable_name
+from .counter import counter as _counter
+from .domain import domain as _domain
+from .id import id as _id
+from .relation import RELATIONS as _RELATIONS
+from .string_handle import string_handle as _string_handle
+from .thread_naming import thread_set_name as _thread_set_name
+
+
+_executor_numbers = _count(1)
+
+_CALL_NAMES_CACHE_SIZE = 1024
+
+_CallNames = _namedtuple('_CallNames', ('name', 'submit', 'queue_wait', 'pending', 'execution'))
+_ThreadPoolInstrumentation = _namedtuple('_ThreadPoolInstrumentation', ('domain', 'queue_depth', 'busy_workers'))
+
+
+def _create_call_names(name):
+    """Creates string handles for the tasks of a submitted callable object."""
+    return _CallNames(name, _string_handle(f'{name} submit'), _string_handle(f'{name} queue wait'),
+                      _string_handle(f'{name} pending'), _string_handle(name))
+
+
+def _create_submit(domain, submit_call):
+    """
+    Creates a function that submits callable objects to an executor in the scope of the submit task.
+    :param domain: a domain for the tasks
+    :param submit_call: a function that submits the callable object using the original submit function of the executor
+    :return: a function that takes the original submit function of the executor, a callable object and its arguments
+    """
+    get_call_names = _lru_cache(maxsize=_CALL_NAMES_CACHE_SIZE)(_create_call_names)
+
+    def submit(submit_func, fn, /, *args, **kwargs):
+        names = get_call_names(_get_callable_name(fn))
+        submit_id = _id(domain)
+
+        _task_begin(domain, names.submit, submit_id)
+        try:
+            return submit_call(submit_func, names, submit_id, fn, *args, **kwargs)
+        finally:
+            _task_end(domain)
+
+    return submit
+
+
+def _create_thread_pool_submit(name, domain):
+    """
+    Creates a function that instruments the submission of callable objects to a thread pool.
+
+    The queue-wait task begins in the submitting thread and ends in the worker thread right before the execution.
+    """
+    instrumentation = _ThreadPoolInstrumentation(domain, _counter(f'{name} queue depth', domain, 0),
+                                                 _counter(f'{name} busy workers', domain, 0))
+
+    def submit_call(submit_func, names, submit_id, fn, /, *args, **kwargs):
+        queue_wait_id = _id(domain)
+        call = _ThreadPoolCall(instrumentation, names, submit_id, queue_wait_id, fn)
+
+        _task_begin_overlapped(domain, names.queue_wait, queue_wait_id, submit_id)
+        instrumentation.queue_depth.inc()
+        try:
+            future = submit_func(call, *args, **kwargs)
+        except BaseException:
+            call.cancel()
+            raise
+
+        future.add_done_callback(call.on_done)
+        return future
+
+    return _create_submit(domain, submit_call)
+
+
+class _ThreadPoolCall:
+    """
+    A class that wraps the callable object that is submitted to a thread pool.
+    """
+    def __init__(self, instrumentation, names, submit_id, queue_wait_id, fn):
+        self.__instrumentation = instrumentation
+        self.__names = names
+        self.__submit_id = submit_id
+        self.__queue_wait_id = queue_wait_id
+        self.__fn = fn
+        self.__is_started = False
+
+    def __call__(self, *args, **kwargs):
+        instrumentation = self.__instrumentation
+        domain = instrumentation.domain
+
+        self.__end_queue_wait()
+        instrumentation.busy_workers.inc()
+
+        execution_id = _id(domain)
+        _task_begin(domain, self.__names.execution, execution_id, self.__submit_id)
+        _relation_add(domain, execution_id, _RELATIONS['continuation_of'], self.__queue_wait_id)
+        try:
+            return self.__fn(*args, **kwargs)
+        finally:
+            _task_end(domain)
+            instrumentation.busy_workers.dec()
+
+    def cancel(self):
+        """Finishes the queue-wait task if the callable object has not been executed."""
+        if not self.__is_started:
+            self.__end_queue_wait()
+
+    def on_done(self, future):
+        """Finishes the queue-wait task if the future is cancelled before the execution."""
+        if future.cancelled():
+            self.cancel()
+
+    def __end_queue_wait(self):
+        """Finishes the queue-wait task."""
+        self.__is_started = True
+        _task_end_overlapped(self.__instrumentation.domain, self.__queue_wait_id)
+        self.__instrumentation.queue_depth.dec()
+
+
+def _create_process_pool_submit(name, domain):
+    """
+    Creates a function that instruments the submission of callable objects to a process pool.
+
+    The start of the execution in a worker process cannot be observed from the submitting process, so instead of the
+    queue-wait task the pending task spans the time from the submission to the completion of the future, and the
+    execution task is marked in the worker process. The number of pending calls is tracked instead of the queue depth.
+    """
+    pending_calls = _counter(f'{name} pending calls', domain, 0)
+
+    def on_done(pending_id, _):
+        _task_end_overlapped(domain, pending_id)
+        pending_calls.dec()
+
+    def submit_call(submit_func, names, submit_id, fn, /, *args, **kwargs):
+        pending_id = _id(domain)
+        call = _partial(_call_in_process, domain.name, names.name, fn)
+
+        _task_begin_overlapped(domain, names.pending, pending_id, submit_id)
+        pending_calls.inc()
+
+        on_pending_done = _partial(on_done, pending_id)
+        try:
+            future = submit_func(call, *args, **kwargs)
+        except BaseException:
+            on_pending_done(None)
+            raise
+
+        future.add_done_callback(on_pending_done)
+        return future
+
+    return _create_submit(domain, submit_call)
+
+
+def _call_in_process(domain_name, name, fn, /, *args, **kwargs):
+    """
+    Calls the callable object that is submitted to a process pool in the scope of the execution task. The call is
+    pickled, so only the names of the domain and the task are passed.
+    """
+    domain = _domain(domain_name)
+
+    _task_begin(domain, _string_handle(name))
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        _task_end(domain)
+
+
+def _initialize_thread_worker(initializer, initargs):
+    """Names the worker thread and calls the original initializer."""
+    _thread_set_name(_current_thread().name)
+
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _initialize_process_worker(initializer, initargs):
+    """Names the main thread of the worker process and calls the original initializer."""
+    _thread_set_name(_current_process().name)
+
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _create_worker_context_factory(create_worker_context, initialize_worker):
+    """
+    Creates the factory of the worker contexts that initialize the workers of ThreadPoolExecutor in Python 3.14+, where
+    the initializer is kept by the contexts instead of the executor.
+    """
+    def create_instrumented_worker_context():
+        context = create_worker_context()
+        context.initialize = _partial(initialize_worker, context.initialize, ())
+        return context
+
+    return create_instrumented_worker_context
+
+
+def _get_executor_name(executor, name):
+    """Gets the name of the executor that is used as a prefix for the names of counters."""
+    if name is not None:
+        return name
+
+    return getattr(executor, '_thread_name_prefix', None) or f'{executor.__class__.__name__}-{next(_executor_numbers)}'
+
+
+class InstrumentedThreadPoolExecutor(_ThreadPoolExecutor):
+    """
+    A thread pool executor that marks up the submission, the queue waiting and the execution of every callable object
+    with ITT tasks, names the worker threads and tracks the queue depth and the number of busy workers with ITT
+    counters.
+    """
+    def __init__(self, *args, name=None, domain=None, **kwargs):
+        """
+        Creates the instrumented thread pool executor.
+        :param args: positional arguments of ThreadPoolExecutor, e.g. max_workers and thread_name_prefix
+        :param name: a name of the executor that is used as a prefix for the names of counters
+        :param domain: a domain for the tasks and counters
+        :param kwargs: keyword arguments of ThreadPoolExecutor, e.g. initializer and initargs
+        """
+        super().__init__(*args, **kwargs)
+        instrument_executor(self, name, domain)
+
+
+class InstrumentedProcessPoolExecutor(_ProcessPoolExecutor):
+    """
+    A process pool executor that marks up the submission, the pending state and the execution of every callable
+    object with ITT tasks, names the worker processes and tracks the number of pending calls with an ITT counter.
+    """
+    def __init__(self, *args, name=None, domain=None, **kwargs):
+        """
+        Creates the instrumented process pool executor.
+        :param args: positional arguments of ProcessPoolExecutor, e.g. max_workers and mp_context
+        :param name: a name of the executor that is used as a prefix for the names of counters
+        :param domain: a domain for the tasks and counters
+        :param kwargs: keyword arguments of ProcessPoolExecutor, e.g. initializer and initargs
+        """
+        super().__init__(*args, **kwargs)
+        instrument_executor(self, name, domain)
+
+
+def instrument_executor(executor, name=None, domain=None):
+    """
+    Instruments an existing thread or process pool executor in place.
+
+    The worker threads or processes that are started after this call are named, the already started ones are not.
+    :param executor: an instance of ThreadPoolExecutor or ProcessPoolExecutor
+    :param name: a name of the executor that is used as a prefix for the names of counters
+    :param domain: a domain for the tasks and counters
+    :return: the passed executor
+    """
+    domain = _domain(domain) if domain is None or isinstance(domain, str) else domain
+
+    if isinstance(executor, _ThreadPoolExecutor):
+        submit = _create_thread_pool_submit(_get_executor_name(executor, name), domain)
+        initialize_worker = _initialize_thread_worker
+    elif isinstance(executor, _ProcessPoolExecutor):
+        submit = _create_process_pool_submit(_get_executor_name(executor, name), domain)
+        initialize_worker = _initialize_process_worker
+    else:
+        raise TypeError('The passed executor is not a valid instance of ThreadPoolExecutor or ProcessPoolExecutor.')
+
+    # pylint: disable=W0212
+    if hasattr(executor, '_create_worker_context'):
+        executor._create_worker_context = _create_worker_context_factory(executor._create_worker_context,
+                                                                         initialize_worker)
+    else:
+        executor._initializer = _partial(initialize_worker, executor._initializer, executor._initargs)
+        executor._initargs = ()
+    executor.submit = _partial(submit, executor.submit)
+
+    return executor
@@ -0,0 +1,219 @@
+"""
+gauge.py - Python module for the periodically sampled counters
+
+A gauge samples a value periodically and publishes it through an ITT counter, so e.g. the memory consumption or the
+depth of a queue is shown next to the tasks. The built-in sources are sampled by a native thread that never takes the
+GIL. The callables need the GIL anyway, so they are called by a single Python daemon thread that is shared by all
+gauges.
+"""
+import os as _os
+import threading as _threading
+from atexit import register as _atexit_register
+from time import monotonic as _monotonic
+
+from pyitt.native import Counter as _Counter
+from pyitt.native import gauge_source_sample as _gauge_source_sample
+from pyitt.native import gauge_source_start as _gauge_source_start
+from pyitt.native import gauge_source_stop as _gauge_source_stop
+
+
+SOURCES = ('rss', 'threads', 'fds', 'context_switches')
+
+
+class Gauge:
+    """
+    An abstract base class that represents a gauge, i.e. a counter with the periodically sampled value.
+    """
+    def __init__(self, counter, interval_ms: int) -> None:
+        self._counter = counter
+        self._interval_ms = interval_ms
+        self._is_active = True
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}('{self.name}', interval_ms={self.interval_ms})"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def name(self) -> str:
+        """Returns the name of the counter."""
+        return self._counter.name
+
+    @property
+    def counter(self):
+        """Returns the counter to which the sampled values are published."""
+        return self._counter
+
+    @property
+    def interval_ms(self) -> int:
+        """Returns the sampling interval in milliseconds."""
+        return self._interval_ms
+
+    @property
+    def is_active(self) -> bool:
+        """Returns True if the gauge is sampled."""
+        return self._is_active
+
+    def stop(self) -> None:
+        """Stops sampling of the gauge."""
+        raise NotImplementedError()
+
+
+class _SourceGauge(Gauge):
+    """
+    A gauge of a built-in source that is sampled by the native thread.
+    """
+    def __init__(self, counter, source: str, interval_ms: int) -> None:
+        super().__init__(counter, interval_ms)
+        self.__id = _gauge_source_start(source, counter, interval_ms)
+
+    def stop(self) -> None:
+        """Stops sampling of the gauge."""
+        if self._is_active:
+            self._is_active = False
+            _gauge_source_stop(self.__id)
+
+
+class _CallableGauge(Gauge):
+    """
+    A gauge of a callable object that is called by the sampling thread of pyitt.
+    """
+    def __init__(self, counter, func, interval_ms: int) -> None:
+        super().__init__(counter, interval_ms)
+        self.__func = func
+        self.__exception = None
+        _sampler.add(self)
+
+    @property
+    def exception(self):
+        """Returns the exception that has been raised by the callable object and has stopped the gauge, or None."""
+        return self.__exception
+
+    def stop(self) -> None:
+        """Stops sampling of the gauge."""
+        if self._is_active:
+            self._is_active = False
+            _sampler.remove(self)
+
+    def sample(self) -> None:
+        """Calls the callable object and publishes the returned value, unless it is None."""
+        if not self._is_active:
+            return
+
+        try:
+            value = self.__func()
+            if value is not None:
+                self._counter.set(value)
+        except Exception as exception:  # pylint: disable=W0703
+            self.__exception = exception
+            self.stop()
+
+
+class _GaugeSampler:
+    """
+    A class that calls the callable objects of the gauges on a daemon thread. The thread is started when the first
+    gauge is added and exits when the last gauge is removed.
+    """
+    def __init__(self):
+        self.__condition = _threading.Condition()
+        self.__next_samples = {}
+        self.__thread = None
+        self.__hooks_registered = False
+
+    def add(self, gauge) -> None:
+        """Adds the gauge, the first sample of which is taken immediately."""
+        with self.__condition:
+            self.__next_samples[gauge] = _monotonic()
+            if not self.__hooks_registered:
+                self.__register_hooks()
+            if self.__thread is None:
+                self.__thread = _threading.Thread(target=self.__run, name='pyitt gauge sampler', daemon=True)
+                self.__thread.start()
+            self.__condition.notify()
+
+    def remove(self, gauge) -> None:
+        """Removes the gauge."""
+        with self.__condition:
+            self.__next_samples.pop(gauge, None)
+            self.__condition.notify()
+
+    def stop(self) -> None:
+        """Stops all gauges, e.g. at exit, so the callable objects are not called during the interpreter shutdown."""
+        with self.__condition:
+            gauges = list(self.__next_samples)
+        for gauge in gauges:
+            gauge.stop()
+
+    def reset_in_child(self) -> None:
+        """Discards the gauges of the parent process in a child process, the sampling thread does not exist there."""
+        self.__condition = _threading.Condition()
+        self.__next_samples = {}
+        self.__thread = None
+
+    def __register_hooks(self):
+        """Registers the hooks on the first use, so importing pyitt does not register them."""
+        self.__hooks_registered = True
+        _atexit_register(self.stop)
+        if hasattr(_os, 'register_at_fork'):
+            _os.register_at_fork(after_in_child=self.reset_in_child)
+
+    def __run(self):
+        while True:
+            with self.__condition:
+                if not self.__next_samples:
+                    self.__thread = None
+                    return
+
+                now = _monotonic()
+                due_gauges = [gauge for gauge, next_sample in self.__next_samples.items() if next_sample <= now]
+                if not due_gauges:
+                    self.__condition.wait(min(self.__next_samples.values()) - now)
+                    continue
+
+                for gauge in due_gauges:
+                    self.__next_samples[gauge] = now + gauge.interval_ms / 1000
+
+            for gauge in due_gauges:
+                gauge.sample()
+
+
+_sampler = _GaugeSampler()
+
+
+def gauge(name, fn, interval_ms: int = 1000, domain=None) -> Gauge:
+    """
+    Creates a gauge that publishes a sampled value through a counter every interval_ms milliseconds until it is
+    stopped. If the callable object raises an exception, the gauge is stopped and the exception is kept in its
+    exception property.
+    :param name: a name of the counter
+    :param fn: a callable object without arguments that returns a non-negative integer or None to skip the sample, or
+               a name of a built-in source from SOURCES that is sampled without the GIL (Linux only): 'rss' for the
+               resident set size in bytes, 'threads' for the number of threads, 'fds' for the number of open file
+               descriptors and 'context_switches' for the total number of context switches of the process
+    :param interval_ms: the sampling interval in milliseconds
+    :param domain: a domain of the counter
+    :return: an instance of Gauge
+    """
+    if interval_ms <= 0:
+        raise ValueError('The sampling interval must be greater than zero.')
+
+    counter = _Counter(name, domain)
+    if isinstance(fn, str):
+        return _SourceGauge(counter, fn, interval_ms)
+    if callable(fn):
+        return _CallableGauge(counter, fn, interval_ms)
+
+    raise TypeError('The passed fn is neither a callable object nor a name of a built-in source.')
+
+
+def read_source(source: str):
+    """
+    Returns the current value of a built-in source.
+    :param source: a name of a built-in source from SOURCES
+    :return: the value of the source, or None if it cannot be read
+    """
+    return _gauge_source_sample(source)
@@ -0,0 +1,98 @@
+"""
+gc_tracing.py - Python module that reports the garbage collections through ITT
+
+Each collection of the garbage collector is reported as a nested task of the thread that has triggered it, and the
+numbers of collected and uncollectable objects and the cumulative pause time are reported through counters. All ITT
+objects are created when the tracing is enabled, so the callback of the garbage collector only calls the native
+functions.
+"""
+import gc as _gc
+from time import perf_counter_ns as _perf_counter_ns
+
+from pyitt.native import Counter as _Counter, Domain as _Domain, StringHandle as _StringHandle
+from pyitt.native import task_begin as _task_begin, task_end as _task_end
+
+
+DEFAULT_DOMAIN = 'pyitt.gc'
+
+TASK_NAME_TEMPLATE = 'gc generation {}'
+COLLECTED_COUNTER_NAME = 'gc collected objects'
+UNCOLLECTABLE_COUNTER_NAME = 'gc uncollectable objects'
+PAUSE_TIME_COUNTER_NAME = 'gc pause time (us)'
+
+
+def _create_callback(domain):
+    """Creates the callback of the garbage collector that reports the collections to the domain."""
+    task_names = tuple(_StringHandle(TASK_NAME_TEMPLATE.format(generation)) for generation in range(3))
+    collected_counter = _Counter(COLLECTED_COUNTER_NAME, domain)
+    uncollectable_counter = _Counter(UNCOLLECTABLE_COUNTER_NAME, domain)
+    pause_time_counter = _Counter(PAUSE_TIME_COUNTER_NAME, domain)
+    pause_time = [0, 0]
+
+    def callback(phase, info):
+        if phase == 'start':
+            _task_begin(domain, task_names[min(info['generation'], 2)])
+            pause_time[1] = _perf_counter_ns()
+            return
+
+        pause_time[0] += _perf_counter_ns() - pause_time[1]
+        _task_end(domain)
+
+        if info['collected']:
+            collected_counter.inc(info['collected'])
+        if info['uncollectable']:
+            uncollectable_counter.inc(info['uncollectable'])
+        pause_time_counter.set(pause_time[0] // 1000)
+
+    return callback
+
+
+class _GcTracing:
+    """
+    A class that holds the state of tracing of the garbage collector.
+    """
+    def __init__(self):
+        self.__callback = None
+        self.__callbacks = {}
+
+    @property
+    def enabled(self):
+        """Returns True if the garbage collections are reported."""
+        return self.__callback is not None
+
+    def enable(self, domain):
+        """Starts reporting of the garbage collections to the domain, the counters are kept for each domain."""
+        domain = _Domain(domain)
+        callback = self.__callbacks.get(domain.name)
+        if callback is None:
+            callback = self.__callbacks[domain.name] = _create_callback(domain)
+
+        self.disable()
+        self.__callback = callback
+        _gc.callbacks.append(callback)
+
+    def disable(self):
+        """Stops reporting of the garbage collections."""
+        if self.__callback is not None:
+            if self.__callback in _gc.callbacks:
+                _gc.callbacks.remove(self.__callback)
+            self.__callback = None
+
+
+_gc_tracing = _GcTracing()
+
+
+def trace_gc(enabled: bool = True, domain=DEFAULT_DOMAIN) -> None:
+    """
+    Enables or disables reporting of the garbage collections.
+
+    When enabled, each collection is reported as a nested task named 'gc generation N', where N is the collected
+    generation, and the counters 'gc collected objects', 'gc uncollectable objects' and 'gc pause time (us)' are
+    updated after the collection.
+    :param enabled: True to report the garbage collections, False to stop reporting them
+    :param domain: a domain of the tasks and the counters
+    """
+    if enabled:
+        _gc_tracing.enable(domain)
+    else:
+        _gc_tracing.disable()
@@ -0,0 +1,59 @@
+"""
+heap.py - Python module wrapper for ITT Heap API
+
+When the heap tracking is enabled, the allocators of the selected Python memory domains are wrapped, and the sampled
+allocations are reported through ITT Heap API. It allows the memory consumption analysis of Intel VTune Profiler to
+attribute Python allocations to tasks with much lower overhead than tracemalloc has.
+"""
+from pyitt.native import heap_tracking_disable as _heap_tracking_disable
+from pyitt.native import heap_tracking_enable as _heap_tracking_enable
+from pyitt.native import heap_tracking_is_active as _heap_tracking_is_active
+
+
+ALLOCATOR_DOMAINS = {
+    'raw': 0,
+    'mem': 1,
+    'object': 2,
+}
+
+
+def enable(domains=('object',), min_size: int = 0, sample_every: int = 1) -> None:
+    """
+    Enables reporting of allocations of the given allocator domains.
+    Only the allocations that are not smaller than min_size are sampled, and only every sample_every-th of them is
+    reported. The release of memory blocks is reported only for the reported blocks.
+    :param domains: a name or a sequence of names of allocator domains, the keys of ALLOCATOR_DOMAINS
+    :param min_size: the minimal size of a reported allocation in bytes
+    :param sample_every: the sampling period, 1 to report every allocation
+    """
+    for domain in _get_domains(domains):
+        _heap_tracking_enable(domain, min_size, sample_every)
+
+
+def disable(domains=tuple(ALLOCATOR_DOMAINS)) -> None:
+    """
+    Disables reporting of allocations of the given allocator domains.
+    If another hook, e.g. tracemalloc, has wrapped the allocator after enabling, the allocator is not restored to keep
+    that hook working, and the wrapper only forwards the calls.
+    :param domains: a name or a sequence of names of allocator domains, by default all domains
+    """
+    for domain in _get_domains(domains):
+        _heap_tracking_disable(domain)
+
+
+def is_enabled(domain: str = 'object') -> bool:
+    """
+    Returns True if allocations of the allocator domain are reported, otherwise returns False.
+    :param domain: a name of an allocator domain
+    """
+    return _heap_tracking_is_active(_get_domains(domain)[0])
+
+
+def _get_domains(domains):
+    """Gets the values of the allocator domains for their names."""
+    domains = (domains,) if isinstance(domains, str) else domains
+    try:
+        return [ALLOCATOR_DOMAINS[domain] for domain in domains]
+    except KeyError as error:
+        raise ValueError(f'Unknown allocator domain: {error.args[0]!r}. '
+                         f'Supported domains: {", ".join(ALLOCATOR_DOMAINS)}.') from None
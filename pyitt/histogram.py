@@ -0,0 +1,44 @@
+"""
+histogram.py - Python module wrapper for ITT Histogram API
+"""
+from pyitt.native import Histogram as _Histogram
+
+
+DATA_TYPES = {
+    'u64': 1,
+    's64': 2,
+    'u32': 3,
+    's32': 4,
+    'u16': 5,
+    's16': 6,
+    'float': 7,
+    'double': 8,
+}
+
+
+def histogram(name, domain=None, x_type: str = 'u64', y_type: str = 'u64', batch_size: int = 1024):
+    """
+    Creates a histogram with the given name, domain and data types.
+
+    The histogram can be used in two ways. The submit(x, y) method passes the x and y values from buffer objects (e.g.
+    NumPy arrays or array.array) to ITT without copying. The record(value) method counts the value natively, and the
+    distribution of the recorded values, i.e. the values and their counts, is submitted when batch_size values are
+    recorded, when a count would exceed the range of y_type or when the flush() method is called. The record(value)
+    method raises OverflowError for the values that are out of the range of x_type.
+    :param name: a name of the histogram
+    :param domain: a domain of the histogram
+    :param x_type: a data type of x values, one of the keys of DATA_TYPES
+    :param y_type: a data type of y values, one of the keys of DATA_TYPES
+    :param batch_size: a number of recorded values after which the distribution is submitted
+    :return: an instance of Histogram
+    """
+    return _Histogram(name, domain, _get_data_type(x_type), _get_data_type(y_type), batch_size)
+
+
+def _get_data_type(data_type):
+    """Gets the value of the ITT metadata type for its name."""
+    try:
+        return DATA_TYPES[data_type]
+    except KeyError:
+        raise ValueError(f'Unknown histogram data type: {data_type!r}. '
+                         f'Supported types: {", ".join(DATA_TYPES)}.') from None
@@ -0,0 +1,36 @@
+"""
+jit.py - Python module wrapper for ITT JIT Profiling API
+"""
+from pyitt.native import jit_is_profiling_active as _jit_is_profiling_active
+from pyitt.native import jit_register_code as _jit_register_code
+from pyitt.native import jit_set_auto_registration as _jit_set_auto_registration
+
+
+def is_profiling_active() -> bool:
+    """Returns True if a profiler collects JIT profiling data (e.g. hardware sampling), otherwise returns False."""
+    return _jit_is_profiling_active()
+
+
+def register_code(code) -> bool:
+    """
+    Registers a code object as a JIT-compiled method.
+
+    A separate trampoline is generated for the registered code object, and its execution is routed through
+    the trampoline. As a result, the samples that are taken while the code object is being executed are attributed
+    to the Python function instead of the interpreter loop.
+    :param code: a code object or a function
+    :return: True if the code object has been registered, or False if JIT profiling is not active
+    """
+    return _jit_register_code(getattr(code, '__code__', code))
+
+
+def auto_register(enabled: bool = True) -> bool:
+    """
+    Enables or disables automatic registration of code objects.
+
+    If automatic registration is enabled, every code object is registered before its first execution. Disabling it
+    restores the original frame evaluation function, unless code objects have been registered with register_code().
+    :param enabled: True to enable automatic registration, False to disable it
+    :return: True if automatic registration is active, otherwise False
+    """
+    return _jit_set_auto_registration(enabled)
@@ -0,0 +1,95 @@
+"""
+manifest.py - Python module wrapper for preloading of string handles and domains
+
+The first creation of a string handle or a domain with a new name encodes the name and looks it up in ITT. The
+preloaded names are created at once, and the string handles and domains that are created for them later reuse the
+preloaded ITT handles. A manifest is a JSON file with the names that were seen during a run, so they can be preloaded
+at the next start. If the PYITT_MANIFEST environment variable is set to a path, the names of the manifest are
+preloaded at import, and the names seen during the run are added to the manifest at exit.
+"""
+from atexit import register as _atexit_register
+from json import dump as _json_dump, load as _json_load
+from os import environ as _environ, fspath as _fspath
+from os.path import exists as _exists
+
+from pyitt.native import Domain as _Domain, StringHandle as _StringHandle
+from pyitt.native import manifest_recording_disable as _manifest_recording_disable
+from pyitt.native import manifest_recording_enable as _manifest_recording_enable
+from pyitt.native import manifest_snapshot as _manifest_snapshot
+
+
+MANIFEST_ENVIRONMENT_VARIABLE = 'PYITT_MANIFEST'
+
+
+def preload(names=(), domains=(), manifest=None) -> None:
+    """
+    Creates the string handles and the domains for the given names in advance.
+    :param names: a sequence of names of string handles, e.g. task names
+    :param domains: a sequence of names of domains
+    :param manifest: a path to the manifest file, the names of which are preloaded as well, if the file exists
+    """
+    if manifest is not None and _exists(manifest):
+        manifest_names, manifest_domains = load(manifest)
+        names = [*names, *manifest_names]
+        domains = [*domains, *manifest_domains]
+
+    _StringHandle.create_many(names)
+    _Domain.create_many(domains)
+
+
+def record(path=None) -> None:
+    """
+    Enables recording of the names of the string handles and of the domains that are created afterwards.
+    :param path: a path to the manifest file to which the recorded names are saved at exit
+    """
+    _manifest_recording_enable()
+
+    if path is not None:
+        _atexit_register(save, path)
+
+
+def stop_recording() -> None:
+    """Disables recording of the names. The recorded names are kept and can be saved."""
+    _manifest_recording_disable()
+
+
+def snapshot():
+    """
+    Returns the recorded names.
+    :return: a tuple of the sorted list of the names of string handles and of the sorted list of the domain names
+    """
+    return _manifest_snapshot()
+
+
+def save(path) -> None:
+    """
+    Saves the recorded names into the manifest file.
+    :param path: a path to the manifest file
+    """
+    names, domains = _manifest_snapshot()
+    with open(_fspath(path), 'w', encoding='utf-8') as manifest_file:
+        _json_dump({'names': names, 'domains': domains}, manifest_file, indent=1)
+
+
+def load(path):
+    """
+    Loads the names from the manifest file.
+    :param path: a path to the manifest file
+    :return: a tuple of the list of the names of string handles and of the list of the domain names
+    """
+    with open(_fspath(path), 'r', encoding='utf-8') as manifest_file:
+        manifest = _json_load(manifest_file)
+    return list(manifest.get('names', ())), list(manifest.get('domains', ()))
+
+
+def _preload_and_record(path):
+    """
+    Preloads the names of the manifest if it exists, and records the names into it at exit. The recording is enabled
+    first, so the preloaded names are kept in the manifest even if they are not seen during the run.
+    """
+    record(path)
+    preload(manifest=path)
+
+
+if _environ.get(MANIFEST_ENVIRONMENT_VARIABLE):
+    _preload_and_record(_environ[MANIFEST_ENVIRONMENT_VARIABLE])
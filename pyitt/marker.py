@@ -0,0 +1,68 @@
+"""
+marker.py - Python module wrapper for ITT Marker API
+"""
+from functools import lru_cache as _lru_cache
+
+from pyitt.native import marker as _marker
+
+from .domain import domain as _domain
+from .string_handle import string_handle as _string_handle
+
+
+SCOPES = {
+    'global': 1,
+    'process': 2,
+    'thread': 3,
+    'task': 4,
+}
+
+# The names of markers are often built dynamically, so only the recently used string handles and domains are cached.
+_CACHE_SIZE = 1024
+
+
+def marker(name, scope: str = 'thread', domain=None, id=None) -> None:
+    """
+    Marks an instant of zero duration, e.g. the start of garbage collection or the reload of a configuration.
+    The string handles for the recently used names and domains are cached.
+    :param name: a name of the marker
+    :param scope: a scope of the marker, one of the keys of SCOPES
+    :param domain: a domain of the marker
+    :param id: an id of the marker
+    """
+    _marker(_get_domain(domain), _get_name(name), _get_scope(scope), id)
+
+
+def _get_domain(domain):
+    """Gets the cached domain for its name or returns the passed domain as is."""
+    if domain is not None and not isinstance(domain, str):
+        return domain
+
+    return _create_domain(domain)
+
+
+def _get_name(name):
+    """Gets the cached string handle for the name or returns the passed string handle as is."""
+    if not isinstance(name, str):
+        return name
+
+    return _create_name(name)
+
+
+@_lru_cache(maxsize=_CACHE_SIZE)
+def _create_domain(domain):
+    """Creates the domain for its name."""
+    return _domain(domain)
+
+
+@_lru_cache(maxsize=_CACHE_SIZE)
+def _create_name(name):
+    """Creates the string handle for the name."""
+    return _string_handle(name)
+
+
+def _get_scope(scope):
+    """Gets the value of the ITT marker scope for its name."""
+    try:
+        return SCOPES[scope]
+    except KeyError:
+        raise ValueError(f'Unknown marker scope: {scope!r}. Supported scopes: {", ".join(SCOPES)}.') from None
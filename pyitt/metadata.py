@@ -0,0 +1,48 @@
+"""
+metadata.py - Python module wrapper for ITT Metadata API
+"""
+from array import array as _array
+
+from pyitt.native import metadata_add as _metadata_add
+
+from .domain import domain as _domain
+from .string_handle import string_handle as _string_handle
+
+
+def metadata(domain, name, values, id=None) -> None:
+    """
+    Adds metadata to the current task or to the task with the given id.
+
+    Buffer objects (e.g. NumPy arrays, array.array or memoryview) of 16-, 32- and 64-bit integers, floats and doubles
+    are passed to ITT without copying. Lists and tuples of numbers are converted to an array of 64-bit integers or
+    doubles. The integers are converted to signed 64-bit integers, unless there are values that do not fit into them,
+    in which case they are converted to unsigned 64-bit integers.
+    :param domain: a domain of the task
+    :param name: a name of the metadata
+    :param values: an int, a float, a str, a contiguous buffer object or a sequence of numbers
+    :param id: an id of the task
+    """
+    domain = _domain(domain) if domain is None or isinstance(domain, str) else domain
+    name = _string_handle(name) if isinstance(name, str) else name
+
+    if isinstance(values, (list, tuple)):
+        values = _sequence_to_array(values)
+
+    _metadata_add(domain, name, values, id)
+
+
+_S64_MAX = 2**63 - 1
+
+
+def _sequence_to_array(values):
+    """Converts a sequence of numbers to an array of doubles, signed or unsigned 64-bit integers."""
+    if any(isinstance(value, float) for value in values):
+        return _array('d', values)
+
+    if any(value > _S64_MAX for value in values):
+        if any(value < 0 for value in values):
+            raise OverflowError('The passed integers cannot be represented as either signed or unsigned 64-bit '
+                                'integers.')
+        return _array('Q', values)
+
+    return _array('q', values)
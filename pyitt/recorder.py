@@ -0,0 +1,158 @@
+"""
+recorder.py - Python module wrapper for the in-process trace recorder
+
+The recorder is a backend of pyitt.native that stores task, frame, event and counter calls in per-thread ring
+buffers. The recorded calls can be exported in Chrome trace event format that is supported by chrome://tracing and
+Perfetto UI, so the same markup produces timelines on the hosts where Intel VTune is not available.
+"""
+from atexit import register as _atexit_register
+from collections import namedtuple as _namedtuple
+from json import dump as _json_dump
+from os import fspath as _fspath, getpid as _getpid
+from struct import Struct as _Struct
+
+from pyitt.native import recorder_clear as _recorder_clear, recorder_disable as _recorder_disable
+from pyitt.native import recorder_enable as _recorder_enable, recorder_is_active as _recorder_is_active
+from pyitt.native import recorder_snapshot as _recorder_snapshot
+
+
+DEFAULT_CAPACITY = 65536
+
+_Record = _namedtuple('_Record', ('timestamp', 'type', 'name', 'domain', 'reserved', 'value'))
+_RECORD_LAYOUT = _Struct('=QIIIIQ')
+
+_TASK_BEGIN = 1
+_TASK_END = 2
+_TASK_BEGIN_OVERLAPPED = 3
+_TASK_END_OVERLAPPED = 4
+_FRAME_BEGIN = 5
+_FRAME_END = 6
+_EVENT_BEGIN = 7
+_EVENT_END = 8
+_COUNTER = 9
+_THREAD_NAME = 10
+_MARKER = 11
+
+_MARKER_SCOPES = {1: 'g', 2: 'p', 3: 't', 4: 't'}
+
+_exit_export = {'output': None, 'registered': False}
+
+
+def enable(capacity: int = DEFAULT_CAPACITY, output=None) -> None:
+    """
+    Enables recording of task, frame, event and counter calls.
+    :param capacity: the maximum number of records that are kept for each thread. If the buffer of a thread is full,
+                     the oldest records are overwritten.
+    :param output: a path to the file to which the recorded calls are exported in Chrome trace event format at exit.
+                   If it is passed several times, the calls are exported to the last passed path.
+    """
+    _recorder_enable(capacity)
+
+    if output is not None:
+        _exit_export['output'] = output
+        if not _exit_export['registered']:
+            _exit_export['registered'] = True
+            _atexit_register(_export_chrome_trace_at_exit)
+
+
+def disable() -> None:
+    """Disables recording. The recorded calls are kept and can be exported."""
+    _recorder_disable()
+
+
+def is_enabled() -> bool:
+    """Returns True if recording is enabled, otherwise returns False."""
+    return _recorder_is_active()
+
+
+def clear() -> None:
+    """Discards the recorded calls."""
+    _recorder_clear()
+
+
+def chrome_trace_events() -> list:
+    """
+    Converts the recorded calls to Chrome trace events.
+    :return: a list of trace events
+    """
+    names, threads = _recorder_snapshot()
+    pid = _getpid()
+    overlapped_task_names = {}
+
+    def name(name_id):
+        """Gets the interned name by its identifier."""
+        value = names[name_id] if 0 < name_id < len(names) else None
+        return '' if value is None else value
+
+    events = []
+    for thread_id, records in threads:
+        for record in map(_Record._make, _RECORD_LAYOUT.iter_unpack(records)):
+            converter = _CONVERTERS.get(record.type)
+            if converter is None:
+                continue
+
+            event = converter(record, name, overlapped_task_names)
+            event.update(ts=record.timestamp / 1000, pid=pid, tid=thread_id)
+            events.append(event)
+
+    return events
+
+
+def export_chrome_trace(file) -> None:
+    """
+    Exports the recorded calls in Chrome trace event format.
+    :param file: a path to the file or a file object
+    """
+    trace = {'traceEvents': chrome_trace_events(), 'displayTimeUnit': 'ns'}
+
+    if hasattr(file, 'write'):
+        _json_dump(trace, file)
+    else:
+        with open(_fspath(file), 'w', encoding='utf-8') as trace_file:
+            _json_dump(trace, trace_file)
+
+
+def _export_chrome_trace_at_exit():
+    """Exports the recorded calls to the last output passed to enable()."""
+    export_chrome_trace(_exit_export['output'])
+
+
+def _task_begin_overlapped_event(record, name, overlapped_task_names):
+    """Converts the begin of an overlapped task, the name is kept for the end of the task."""
+    overlapped_task_names[(record.domain, record.value)] = task_name = name(record.name)
+    return {'ph': 'b', 'name': task_name, 'cat': name(record.domain), 'id': hex(record.value)}
+
+
+def _task_end_overlapped_event(record, name, overlapped_task_names):
+    """Converts the end of an overlapped task with the name of its begin."""
+    task_name = overlapped_task_names.pop((record.domain, record.value), '')
+    return {'ph': 'e', 'name': task_name, 'cat': name(record.domain), 'id': hex(record.value)}
+
+
+def _counter_event(record, name, _):
+    """Converts the value of a counter."""
+    counter_name = name(record.name)
+    return {'ph': 'C', 'name': counter_name, 'cat': name(record.domain), 'args': {counter_name: record.value}}
+
+
+def _marker_event(record, name, _):
+    """Converts a marker."""
+    return {'ph': 'i', 'name': name(record.name), 'cat': name(record.domain),
+            's': _MARKER_SCOPES.get(record.value, 't')}
+
+
+_CONVERTERS = {
+    _TASK_BEGIN: lambda record, name, _: {'ph': 'B', 'name': name(record.name), 'cat': name(record.domain)},
+    _TASK_END: lambda record, name, _: {'ph': 'E', 'cat': name(record.domain)},
+    _TASK_BEGIN_OVERLAPPED: _task_begin_overlapped_event,
+    _TASK_END_OVERLAPPED: _task_end_overlapped_event,
+    _FRAME_BEGIN: lambda record, name, _: {'ph': 'b', 'name': name(record.domain), 'cat': 'frame',
+                                           'id': hex(record.value)},
+    _FRAME_END: lambda record, name, _: {'ph': 'e', 'name': name(record.domain), 'cat': 'frame',
+                                         'id': hex(record.value)},
+    _EVENT_BEGIN: lambda record, name, _: {'ph': 'B', 'name': name(record.name), 'cat': 'event'},
+    _EVENT_END: lambda record, name, _: {'ph': 'E', 'name': name(record.name), 'cat': 'event'},
+    _COUNTER: _counter_event,
+    _THREAD_NAME: lambda record, name, _: {'ph': 'M', 'name': 'thread_name', 'args': {'name': name(record.name)}},
+    _MARKER: _marker_event,
+}
@@ -0,0 +1,56 @@
+"""
+relation.py - Python module wrapper for ITT Relation API
+"""
+from pyitt.native import relation_add as _relation_add, relation_add_to_current as _relation_add_to_current
+
+from .domain import domain as _domain
+
+
+RELATIONS = {
+    'dependent_on': 1,
+    'sibling_of': 2,
+    'parent_of': 3,
+    'continuation_of': 4,
+    'child_of': 5,
+    'continued_by': 6,
+    'predecessor_to': 7,
+}
+
+
+def relation(domain, head, kind: str, tail) -> None:
+    """
+    Adds a relation between two instances, e.g. tasks: "head <kind> tail".
+    :param domain: a domain of the instances
+    :param head: a task or an id of the first instance
+    :param kind: a kind of the relation, one of the keys of RELATIONS
+    :param tail: a task or an id of the second instance
+    """
+    _relation_add(_get_domain(domain), _get_id(head), _get_relation(kind), _get_id(tail))
+
+
+def relation_to_current(domain, kind: str, tail) -> None:
+    """
+    Adds a relation between the current task and an instance, e.g. another task: "current task <kind> tail".
+    :param domain: a domain of the instances
+    :param kind: a kind of the relation, one of the keys of RELATIONS
+    :param tail: a task or an id of the instance
+    """
+    _relation_add_to_current(_get_domain(domain), _get_relation(kind), _get_id(tail))
+
+
+def _get_domain(domain):
+    """Gets the domain for the relation."""
+    return _domain(domain) if domain is None or isinstance(domain, str) else domain
+
+
+def _get_id(instance):
+    """Gets the id of the task or returns the passed object as is."""
+    return getattr(instance, 'id', instance)
+
+
+def _get_relation(kind):
+    """Gets the value of the ITT relation for its name."""
+    try:
+        return RELATIONS[kind]
+    except KeyError:
+        raise ValueError(f'Unknown relation kind: {kind!r}. Supported kinds: {", ".join(RELATIONS)}.') from None
@@ -0,0 +1,51 @@
+"""
+statistics.py - Python module wrapper for the in-process duration statistics
+
+The statistics are a backend of pyitt.native that aggregates durations of tasks, frames and events into per-thread
+histograms with logarithmic buckets. The histograms are updated without locks and they are merged on read, so the
+existing markup can be used as always-on latency telemetry without Intel VTune.
+"""
+from collections import namedtuple as _namedtuple
+
+from pyitt.native import stats_disable as _stats_disable, stats_enable as _stats_enable
+from pyitt.native import stats_is_active as _stats_is_active, stats_reset as _stats_reset
+from pyitt.native import stats_snapshot as _stats_snapshot
+
+
+RegionStats = _namedtuple('RegionStats', ('count', 'total', 'p50', 'p90', 'p99', 'max'))
+RegionStats.__doc__ = """
+Duration statistics of a region. All durations are in nanoseconds. The percentiles are approximated by the upper
+bound of the histogram bucket, so the relative error does not exceed 12.5%.
+"""
+
+
+def enable() -> None:
+    """
+    Enables aggregation of durations of tasks, frames and events.
+    The regions that are started before the aggregation is enabled are not taken into account.
+    """
+    _stats_enable()
+
+
+def disable() -> None:
+    """Disables aggregation of durations. The aggregated statistics are kept."""
+    _stats_disable()
+
+
+def is_enabled() -> bool:
+    """Returns True if aggregation of durations is enabled, otherwise returns False."""
+    return _stats_is_active()
+
+
+def reset() -> None:
+    """Discards the aggregated statistics."""
+    _stats_reset()
+
+
+def stats() -> dict:
+    """
+    Returns the aggregated duration statistics.
+    Tasks and events are aggregated by their names, frames are aggregated by the names of their domains.
+    :return: a dictionary that maps a region name to RegionStats
+    """
+    return {name: RegionStats._make(values) for name, values in _stats_snapshot().items()}
@@ -0,0 +1,300 @@
+"""
+sync.py - Python module wrapper for ITT Synchronization API
+
+The locks of this module are drop-in replacements for the locks of threading and asyncio modules. They report the
+waiting for, the acquisition and the release of the lock, so the wait and hold times of the locks are shown by the
+threading analysis of Intel VTune Profiler.
+"""
+import asyncio as _asyncio
+import threading as _threading
+from _thread import LockType as _LockType
+from os.path import basename as _basename
+from sys import _getframe
+
+from pyitt.native import SyncObject as _SyncObject
+
+
+_RLOCK_TYPES = (type(_threading.RLock()), _threading._PyRLock)  # pylint: disable=W0212
+
+
+def _get_default_name(type_name, frame_number):
+    """Gets a name of the synchronization object based on its type and the call site of its constructor."""
+    caller = _getframe(frame_number + 1)
+    return f'{type_name} {_basename(caller.f_code.co_filename)}:{caller.f_lineno}'
+
+
+class _InstrumentedLock:
+    """
+    A base class that reports the acquisition and the release of a wrapped lock.
+    """
+    _TYPE_NAME = 'Lock'
+    _CALLER_FRAME = 2
+
+    def __init__(self, lock, name=None):
+        name = _get_default_name(self._TYPE_NAME, self._CALLER_FRAME) if name is None else name
+
+        self._lock = lock
+        self._sync_object = _SyncObject(name, self._TYPE_NAME)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}('{self.name}', {self._lock!r})"
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *args):
+        self.release()
+
+    @property
+    def name(self) -> str:
+        """Returns the name of the lock."""
+        return self._sync_object.name
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        """
+        Acquires the lock.
+        :param blocking: True to wait until the lock is acquired, False to return immediately
+        :param timeout: the maximum number of seconds to wait, -1 to wait without a limit
+        :return: True if the lock is acquired, otherwise False
+        """
+        return self._sync_object.acquire(self._lock.acquire, blocking, timeout)
+
+    def release(self) -> None:
+        """Releases the lock."""
+        self._sync_object.release(self._lock.release)
+
+
+class Lock(_InstrumentedLock):
+    """
+    A primitive lock that reports its wait and hold times to ITT.
+    """
+    def __init__(self, name=None, *, lock=None):
+        """
+        Creates the lock.
+        :param name: a name of the lock, by default the name is derived from the call site
+        :param lock: an instance of threading.Lock to wrap, by default a new lock is created
+        """
+        super().__init__(_threading.Lock() if lock is None else lock, name)
+
+    def locked(self) -> bool:
+        """Returns True if the lock is acquired."""
+        return self._lock.locked()
+
+    def _is_owned(self):
+        """Returns True if the lock is acquired. It is used by threading.Condition."""
+        if self._lock.acquire(False):
+            self._lock.release()
+            return False
+        return True
+
+
+class RLock(_InstrumentedLock):
+    """
+    A reentrant lock that reports its wait and hold times to ITT. Only the outermost acquisition and release of the
+    lock by the owning thread are reported.
+    """
+    _TYPE_NAME = 'RLock'
+
+    def __init__(self, name=None, *, lock=None):
+        """
+        Creates the reentrant lock.
+        :param name: a name of the lock, by default the name is derived from the call site
+        :param lock: an instance of threading.RLock to wrap, by default a new lock is created
+        """
+        super().__init__(_threading.RLock() if lock is None else lock, name)
+        self.__owner = None
+        self.__count = 0
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        """
+        Acquires the lock. The nested acquisition by the owning thread is not reported.
+        :param blocking: True to wait until the lock is acquired, False to return immediately
+        :param timeout: the maximum number of seconds to wait, -1 to wait without a limit
+        :return: True if the lock is acquired, otherwise False
+        """
+        if self.__owner == _threading.get_ident():
+            self._lock.acquire()
+            self.__count += 1
+            return True
+
+        is_acquired = super().acquire(blocking, timeout)
+        if is_acquired:
+            self.__owner = _threading.get_ident()
+            self.__count = 1
+        return is_acquired
+
+    def release(self) -> None:
+        """Releases the lock. The nested release by the owning thread is not reported."""
+        if self.__owner != _threading.get_ident():
+            raise RuntimeError('cannot release un-acquired lock')
+
+        if self.__count > 1:
+            self.__count -= 1
+            self._lock.release()
+        else:
+            self.__owner = None
+            self.__count = 0
+            super().release()
+
+    def _is_owned(self):
+        """Returns True if the lock is acquired by the current thread. It is used by threading.Condition."""
+        return self.__owner == _threading.get_ident()
+
+    def _release_save(self):
+        """Releases the lock completely and returns its state. It is used by threading.Condition."""
+        if not self._is_owned():
+            raise RuntimeError('cannot release un-acquired lock')
+
+        count = self.__count
+        self.__owner = None
+        self.__count = 0
+
+        self._sync_object.releasing()
+        for _ in range(count):
+            self._lock.release()
+        return count
+
+    def _acquire_restore(self, count):
+        """Acquires the lock and restores its state. It is used by threading.Condition."""
+        self._sync_object.prepare()
+        for _ in range(count):
+            self._lock.acquire()
+        self._sync_object.acquired()
+
+        self.__owner = _threading.get_ident()
+        self.__count = count
+
+
+class Condition(_threading.Condition):
+    """
+    A condition variable that reports waiting for notifications to ITT. The underlying lock is instrumented, so its
+    wait and hold times are reported as well.
+    """
+    def __init__(self, lock=None, name=None):
+        """
+        Creates the condition variable.
+        :param lock: an instance of pyitt.sync.Lock or pyitt.sync.RLock, by default a new RLock is created
+        :param name: a name of the condition variable, by default the name is derived from the call site
+        """
+        name = _get_default_name('Condition', 1) if name is None else name
+        super().__init__(RLock(f'{name} lock') if lock is None else lock)
+        self._sync_object = _SyncObject(name, 'Condition')
+
+    @property
+    def name(self) -> str:
+        """Returns the name of the condition variable."""
+        return self._sync_object.name
+
+    def wait(self, timeout=None):
+        """
+        Waits until notified or until the timeout occurs.
+        :param timeout: the maximum number of seconds to wait, None to wait without a limit
+        :return: True if notified, False on timeout
+        """
+        return self._sync_object.acquire(super().wait, timeout)
+
+    def notify(self, n=1):
+        """
+        Wakes up the threads that are waiting on the condition variable.
+        :param n: the maximum number of threads to wake up
+        """
+        self._sync_object.release(super().notify, n)
+
+
+class Semaphore(_InstrumentedLock):
+    """
+    A semaphore that reports its wait and hold times to ITT.
+    """
+    _TYPE_NAME = 'Semaphore'
+
+    def __init__(self, value=1, name=None, *, semaphore=None):
+        """
+        Creates the semaphore.
+        :param value: an initial value of the internal counter
+        :param name: a name of the semaphore, by default the name is derived from the call site
+        :param semaphore: an instance of threading.Semaphore to wrap, by default a new semaphore is created
+        """
+        super().__init__(_threading.Semaphore(value) if semaphore is None else semaphore, name)
+
+    def acquire(self, blocking: bool = True, timeout: float = None) -> bool:
+        """
+        Acquires the semaphore.
+        :param blocking: True to wait until the semaphore is acquired, False to return immediately
+        :param timeout: the maximum number of seconds to wait, None to wait without a limit
+        :return: True if the semaphore is acquired, otherwise False
+        """
+        return self._sync_object.acquire(self._lock.acquire, blocking, timeout)
+
+    def release(self, n: int = 1) -> None:  # pylint: disable=W0221
+        """
+        Releases the semaphore.
+        :param n: a number to increment the internal counter by
+        """
+        # threading.Semaphore.release() accepts n since Python 3.9
+        self._sync_object.release(self._lock.release, *((n,) if n != 1 else ()))
+
+
+class AsyncLock(_InstrumentedLock):
+    """
+    An asyncio lock that reports its wait and hold times to ITT.
+
+    The coroutines that wait for the lock run in the same thread, and ITT tracks the waits per thread. So the waits of
+    interleaved coroutines are reported as repeated starts of the wait of this thread (__itt_sync_prepare), and the wait
+    time is attributed to the thread rather than to a particular coroutine.
+    """
+    _TYPE_NAME = 'asyncio.Lock'
+
+    def __init__(self, name=None, *, lock=None):
+        """
+        Creates the asyncio lock.
+        :param name: a name of the lock, by default the name is derived from the call site
+        :param lock: an instance of asyncio.Lock to wrap, by default a new lock is created
+        """
+        super().__init__(_asyncio.Lock() if lock is None else lock, name)
+
+    async def __aenter__(self):
+        await self.acquire()
+
+    async def __aexit__(self, *args):
+        self.release()
+
+    def __enter__(self):
+        raise TypeError(f'{self.__class__.__name__} must be used with "async with"')
+
+    def locked(self) -> bool:
+        """Returns True if the lock is acquired."""
+        return self._lock.locked()
+
+    async def acquire(self) -> bool:  # pylint: disable=W0236,W0221
+        """Acquires the lock."""
+        self._sync_object.prepare()
+        try:
+            is_acquired = await self._lock.acquire()
+        except BaseException:
+            self._sync_object.cancel()
+            raise
+
+        self._sync_object.acquired()
+        return is_acquired
+
+
+def instrument(lock, name=None):
+    """
+    Wraps an existing lock, so its wait and hold times are reported to ITT.
+    :param lock: an instance of threading.Lock, threading.RLock, threading.Semaphore or asyncio.Lock
+    :param name: a name of the lock, by default the name is derived from the call site
+    :return: the wrapper of the lock that should be used instead of the original lock
+    """
+    name = _get_default_name(type(lock).__name__, 1) if name is None else name
+
+    if isinstance(lock, _asyncio.Lock):
+        return AsyncLock(name, lock=lock)
+    if isinstance(lock, _threading.Semaphore):
+        return Semaphore(name=name, semaphore=lock)
+    if isinstance(lock, _RLOCK_TYPES):
+        return RLock(name, lock=lock)
+    if isinstance(lock, _LockType):
+        return Lock(name, lock=lock)
+
+    raise TypeError('The passed lock is not a valid instance of threading.Lock, threading.RLock, '
+                    'threading.Semaphore or asyncio.Lock.')
@@ -1,15 +1,27 @@
 """
 task.py - Python module wrapper for ITT Task API
 """
+from collections import namedtuple as _namedtuple
+
+from pyitt.native import current_task as _current_task, task_stack as _task_stack
 from pyitt.native import task_begin as _task_begin, task_end as _task_end
 from pyitt.native import task_begin_overlapped as _task_begin_overlapped, task_end_overlapped as _task_end_overlapped
+from pyitt.native import task_begin_ex as _task_begin_ex, task_end_ex as _task_end_ex
+from pyitt.native import task_begin_overlapped_ex as _task_begin_overlapped_ex
+from pyitt.native import task_end_overlapped_ex as _task_end_overlapped_ex
+from pyitt.native import TaskFactory as _TaskFactory
 
 from ._funcutils import is_coroutine_function as _is_coroutine_function
 from .domain import domain as _domain
 from .id import id as _id
+from .metadata import metadata as _metadata
+from .relation import relation as _relation
 from ._named_region import _CallSite, _NamedRegion
 
 
+TaskInfo = _namedtuple('TaskInfo', ('name', 'domain', 'id', 'parent_id', 'overlapped'))
+
+
 class _Task(_NamedRegion):
     """
     An abstract base class that provides common functionality for subtypes that represent ITT Tasks.
@@ -21,7 +33,8 @@ class _Task(_NamedRegion):
                      the name of this object is used as a name for the task.
         :param domain: a task domain
         :param id: a task id
-        :param parent: a parent task or an id of the parent
+        :param parent: a parent task or an id of the parent. If it is None, the innermost active task becomes the
+                       parent of an overlapped task and of the outermost nested task of a thread when the task begins.
         """
         super().__init__(task)
 
@@ -52,14 +65,38 @@ class _Task(_NamedRegion):
         """Gets the parent id for the task."""
         return self.__parent_id
 
-    def begin(self) -> None:
-        """Marks the beginning of the task."""
+    def begin(self, timestamp=None, clock_domain=None) -> None:
+        """
+        Marks the beginning of the task.
+        :param timestamp: a timestamp of the beginning of the task, by default the current time is used
+        :param clock_domain: a clock domain of the timestamp, by default the timestamp is taken with get_timestamp()
+        """
         raise NotImplementedError()
 
-    def end(self) -> None:
-        """Marks the end of the task."""
+    def end(self, timestamp=None, clock_domain=None) -> None:
+        """
+        Marks the end of the task.
+        :param timestamp: a timestamp of the end of the task, by default the current time is used
+        :param clock_domain: a clock domain of the timestamp, by default the timestamp is taken with get_timestamp()
+        """
         raise NotImplementedError()
 
+    def add_metadata(self, name, values) -> None:
+        """
+        Adds metadata to the task.
+        :param name: a name of the metadata
+        :param values: an int, a float, a str, a contiguous buffer object or a sequence of numbers
+        """
+        _metadata(self.domain, name, values, self.id)
+
+    def relate(self, other, kind: str = 'dependent_on') -> None:
+        """
+        Adds a relation between the task and another task: "self <kind> other".
+        :param other: another task or its id
+        :param kind: a kind of the relation, e.g. 'dependent_on', 'parent_of', 'child_of', 'continuation_of'
+        """
+        _relation(self.domain, self.id, kind, other)
+
     @staticmethod
     def __get_task_domain(original_domain):
         """Gets the domain of the task."""
@@ -76,7 +113,16 @@ class _Task(_NamedRegion):
     @staticmethod
     def __get_parent_id(original_parent):
         """Gets parent id."""
-        return original_parent.id() if isinstance(original_parent, task.__class__) else original_parent
+        return original_parent.id if isinstance(original_parent, _Task) else original_parent
+
+
+def _is_timestamped(timestamp, clock_domain) -> bool:
+    """Checks if the timestamped variant of the task API should be called."""
+    if timestamp is None:
+        if clock_domain is not None:
+            raise ValueError('The timestamp must be passed together with the clock domain.')
+        return False
+    return True
 
 
 class NestedTask(_Task):
@@ -86,13 +132,19 @@ class NestedTask(_Task):
     Nested tasks implicitly support a concept of embedded execution. This means that the call end() finalizes the
     most recent begin() call of the same or another nested task.
     """
-    def begin(self) -> None:
+    def begin(self, timestamp=None, clock_domain=None) -> None:
         """Marks the beginning of the task."""
-        _task_begin(self.domain, self.name, self.id, self.parent_id)
+        if _is_timestamped(timestamp, clock_domain):
+            _task_begin_ex(self.domain, clock_domain, timestamp, self.name, self.id, self.parent_id)
+        else:
+            _task_begin(self.domain, self.name, self.id, self.parent_id)
 
-    def end(self) -> None:
+    def end(self, timestamp=None, clock_domain=None) -> None:
         """Marks the end of the task."""
-        _task_end(self.domain)
+        if _is_timestamped(timestamp, clock_domain):
+            _task_end_ex(self.domain, clock_domain, timestamp)
+        else:
+            _task_end(self.domain)
 
 
 def nested_task(task=None, /, domain=None, id=None, parent=None):
@@ -114,13 +166,19 @@ class OverlappedTask(_Task):
 
     Execution regions of overlapped tasks may intersect.
     """
-    def begin(self) -> None:
+    def begin(self, timestamp=None, clock_domain=None) -> None:
         """Marks the beginning of the task."""
-        _task_begin_overlapped(self.domain, self.name, self.id, self.parent_id)
+        if _is_timestamped(timestamp, clock_domain):
+            _task_begin_overlapped_ex(self.domain, clock_domain, timestamp, self.name, self.id, self.parent_id)
+        else:
+            _task_begin_overlapped(self.domain, self.name, self.id, self.parent_id)
 
-    def end(self) -> None:
+    def end(self, timestamp=None, clock_domain=None) -> None:
         """Marks the end of the task."""
-        _task_end_overlapped(self.domain, self.id)
+        if _is_timestamped(timestamp, clock_domain):
+            _task_end_overlapped_ex(self.domain, clock_domain, timestamp, self.id)
+        else:
+            _task_end_overlapped(self.domain, self.id)
 
 
 def overlapped_task(task=None, /, domain=None, id=None, parent=None):
@@ -148,3 +206,35 @@ def task(task=None, /, domain=None, id=None, parent=None):
     can_be_overlapped = _is_coroutine_function(task)
     task = _CallSite(_CallSite.CallerFrame) if task is None else task
     return OverlappedTask(task, domain, id, parent) if can_be_overlapped else NestedTask(task, domain, id, parent)
+
+
+def task_factory(domain=None, overlapped: bool = False):
+    """
+    Creates a factory of tasks with the domain resolved once. The factory is called with a name of the task, either
+    str or StringHandle, and returns a lightweight task that can be used as a context manager or with begin() and end().
+    The tasks are cached by their names, so dynamic tasks, e.g. `with factory(f'shard-{i}'):`, are created cheaply.
+    The tasks do not support timestamps, ids, parents and wrapping of callable objects.
+    :param domain: a task domain
+    :param overlapped: True to create overlapped tasks, each with a new id, otherwise nested tasks are created
+    :return: an instance of pyitt.native.TaskFactory
+    """
+    domain = _domain(domain) if domain is None or isinstance(domain, str) else domain
+    return _TaskFactory(domain, overlapped)
+
+
+def current_task():
+    """
+    Returns the innermost active task, i.e. the most recent nested task of the calling thread or the most recent
+    overlapped task of the current context (e.g. of the current asyncio task), whichever has begun later.
+    :return: a TaskInfo of the task, or None if there is no active task
+    """
+    info = _current_task()
+    return None if info is None else TaskInfo._make(info)
+
+
+def task_stack():
+    """
+    Returns the active tasks of the calling thread and of the current context.
+    :return: a tuple of TaskInfo from the outermost task to the innermost one
+    """
+    return tuple(TaskInfo._make(info) for info in _task_stack())
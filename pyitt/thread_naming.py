@@ -1,6 +1,9 @@
 """
 thread_naming.py - Python module wrapper for ITT Thread Naming API
 """
+import threading as _threading
+from functools import wraps as _wraps
+
 from pyitt.native import thread_set_name as _thread_set_name
 
 
@@ -10,3 +13,44 @@ def thread_set_name(name: str):
     :param name: the thread name
     """
     _thread_set_name(name)
+
+
+# Every Python thread, including the workers of concurrent.futures.ThreadPoolExecutor, starts in
+# threading.Thread._bootstrap_inner() before its run() method is called, even if run() is overridden. Therefore, this
+# method is wrapped while the naming is enabled, and the thread is named there, so nothing is added to the calls made by
+# the thread.
+_naming = {'enabled': False, 'bootstrap_inner': None}
+
+
+def _wrap_bootstrap_inner(original_bootstrap_inner):
+    """Gets the wrapper of threading.Thread._bootstrap_inner() that names the thread."""
+    @_wraps(original_bootstrap_inner)
+    def _bootstrap_inner(thread):
+        if _naming['enabled']:
+            _thread_set_name(thread.name)
+        original_bootstrap_inner(thread)
+
+    return _bootstrap_inner
+
+
+def auto_name_threads(enabled: bool = True) -> None:
+    """
+    Enables or disables automatic naming of Python threads.
+
+    When enabled, each thread started afterwards is named with its Thread.name as soon as it starts. This includes the
+    worker threads of thread pools, e.g. 'ThreadPoolExecutor-0_0'. The threads that are already running are not
+    renamed. When disabled, the original threading.Thread._bootstrap_inner() is restored, unless it has been wrapped
+    again since then.
+    :param enabled: True to name threads at start, False to stop naming them
+    """
+    _naming['enabled'] = bool(enabled)
+
+    thread_class = _threading.Thread
+    current_bootstrap_inner = thread_class._bootstrap_inner  # pylint: disable=W0212
+    bootstrap_inner = _naming['bootstrap_inner']
+    if enabled and bootstrap_inner is None:
+        _naming['bootstrap_inner'] = _wrap_bootstrap_inner(current_bootstrap_inner)
+        thread_class._bootstrap_inner = _naming['bootstrap_inner']  # pylint: disable=W0212
+    elif not enabled and bootstrap_inner is not None and current_bootstrap_inner is bootstrap_inner:
+        thread_class._bootstrap_inner = bootstrap_inner.__wrapped__  # pylint: disable=W0212
+        _naming['bootstrap_inner'] = None
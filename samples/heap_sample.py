@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+import pyitt
+
+# pylint: disable=C0411
+from argparse import ArgumentParser
+from timeit import repeat
+from vtune_tool import run_vtune_memory_consumption_collection
+
+
+@pyitt.task
+def allocate_small_objects():
+    return [(i, str(i)) for i in range(100000)]
+
+
+@pyitt.task
+def allocate_large_buffers():
+    return [bytearray(64 * 1024) for _ in range(100)]
+
+
+def run_sample():
+    pyitt.heap.enable(('mem', 'object'))
+
+    small_objects = allocate_small_objects()
+    large_buffers = allocate_large_buffers()
+    del small_objects, large_buffers
+
+    pyitt.heap.disable()
+
+
+def allocation_workload():
+    return [{'key': str(i), 'value': [i] * 4} for i in range(10000)]
+
+
+def measure(setup=None):
+    if setup is not None:
+        setup()
+    try:
+        return min(repeat(allocation_workload, number=10, repeat=5)) / 10
+    finally:
+        pyitt.heap.disable()
+
+
+def run_benchmark():
+    configurations = [
+        ('without hook', None),
+        ('every allocation', lambda: pyitt.heap.enable(('raw', 'mem', 'object'))),
+        ('every 100th allocation', lambda: pyitt.heap.enable(('raw', 'mem', 'object'), sample_every=100)),
+        ('allocations >= 1 KiB', lambda: pyitt.heap.enable(('raw', 'mem', 'object'), min_size=1024)),
+    ]
+
+    baseline = None
+    for name, setup in configurations:
+        duration = measure(setup)
+        baseline = duration if baseline is None else baseline
+        print(f'{name:<24} {duration * 1e3:8.3f} ms  overhead {(duration / baseline - 1) * 100:6.1f}%')
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description='The sample that demonstrates the use of wrappers for the Heap API.')
+    parser.add_argument('--run-sample',
+                        help='Runs code that uses wrappers for the Heap API.',
+                        action='store_true')
+    parser.add_argument('--benchmark',
+                        help='Measures the overhead of the allocator hook with different sampling settings.',
+                        action='store_true')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        run_benchmark()
+    elif args.run_sample:
+        run_sample()
+    else:
+        run_vtune_memory_consumption_collection(['python', __file__, '--run-sample'])
@@ -30,7 +30,14 @@ class VTuneTool:
         self._tool_path = path.join(self.path, 'bin64', 'vtune.exe' if platform == 'win32' else 'vtune')
 
     def run_hotspot_collection(self, app_args, additional_collection_args=None):
-        collection_args = [self._tool_path, '-collect', 'hotspots', '-knob', 'enable-characterization-insights=false']
+        return self._run_collection(['-collect', 'hotspots', '-knob', 'enable-characterization-insights=false'],
+                                    app_args, additional_collection_args)
+
+    def run_memory_consumption_collection(self, app_args, additional_collection_args=None):
+        return self._run_collection(['-collect', 'memory-consumption'], app_args, additional_collection_args)
+
+    def _run_collection(self, analysis_args, app_args, additional_collection_args):
+        collection_args = [self._tool_path] + analysis_args
 
         if isinstance(additional_collection_args, list):
             collection_args.extend(additional_collection_args)
@@ -53,3 +60,7 @@ class VTuneTool:
 
 def run_vtune_hotspot_collection(app_args, additional_collection_args=None):
     return VTuneTool().run_hotspot_collection(app_args, additional_collection_args)
+
+
+def run_vtune_memory_consumption_collection(app_args, additional_collection_args=None):
+    return VTuneTool().run_memory_consumption_collection(app_args, additional_collection_args)
@@ -44,7 +44,8 @@ def is_x86_arch():
 build_itt_with_ipt_support = get_environment_flag('PYITT_BUILD_WITH_ITT_API_IPT_SUPPORT')
 build_itt_with_ipt_support = build_itt_with_ipt_support if build_itt_with_ipt_support is not None else is_x86_arch()
 
-itt_source = [os.path.join(ITT_DIR, 'src', 'ittnotify', 'ittnotify_static.c')]
+itt_source = [os.path.join(ITT_DIR, 'src', 'ittnotify', 'ittnotify_static.c'),
+              os.path.join(ITT_DIR, 'src', 'ittnotify', 'jitprofiling.c')]
 itt_include_dirs = [os.path.join(ITT_DIR, 'include')]
 itt_license_files = [os.path.join(ITT_DIR, 'LICENSES', 'BSD-3-Clause.txt')]
 
@@ -62,15 +63,32 @@ else:
 pyitt_license_files = ['LICENSE']
 pyitt_native_sources = ['pyitt.native/extensions/python.cpp',
                         'pyitt.native/extensions/string.cpp',
+                        'pyitt.native/activator.cpp',
+                        'pyitt.native/clock_domain.cpp',
                         'pyitt.native/collection_control.cpp',
                         'pyitt.native/counter.cpp',
                         'pyitt.native/domain.cpp',
                         'pyitt.native/event.cpp',
+                        'pyitt.native/fork.cpp',
                         'pyitt.native/frame.cpp',
+                        'pyitt.native/gauge.cpp',
+                        'pyitt.native/heap.cpp',
+                        'pyitt.native/histogram.cpp',
                         'pyitt.native/id.cpp',
+                        'pyitt.native/jit.cpp',
+                        'pyitt.native/manifest.cpp',
+                        'pyitt.native/marker.cpp',
+                        'pyitt.native/metadata.cpp',
+                        'pyitt.native/name_registry.cpp',
                         'pyitt.native/pt_region.cpp',
+                        'pyitt.native/recorder.cpp',
+                        'pyitt.native/relation.cpp',
+                        'pyitt.native/stats.cpp',
                         'pyitt.native/string_handle.cpp',
+                        'pyitt.native/sync.cpp',
                         'pyitt.native/task.cpp',
+                        'pyitt.native/task_factory.cpp',
+                        'pyitt.native/task_stack.cpp',
                         'pyitt.native/thread_naming.cpp',
                         'pyitt.native/pyitt_exec.cpp',
                         'pyitt.native/pyitt.cpp']
@@ -0,0 +1,119 @@
+from threading import Thread
+from time import sleep
+from unittest import main as unittest_main, TestCase
+
+from pyitt.native import CountWindowActivator, LatencyTriggeredActivator, ProbabilisticActivator
+
+
+class CountWindowActivatorTests(TestCase):
+    def test_count_window_activator_creation(self):
+        activator = CountWindowActivator(3, 5)
+        self.assertEqual(activator.first, 3)
+        self.assertEqual(activator.last, 5)
+        self.assertEqual(repr(activator), f'pyitt.native.{CountWindowActivator.__name__}(3, 5)')
+
+    def test_count_window_activator_creation_with_invalid_window(self):
+        with self.assertRaises(ValueError):
+            CountWindowActivator(0, 5)
+
+        with self.assertRaises(ValueError):
+            CountWindowActivator(5, 3)
+
+    def test_count_window_activator_call(self):
+        activator = CountWindowActivator(3, 5)
+        self.assertEqual([activator() for _ in range(7)], [False, False, True, True, True, False, False])
+
+        activator.reset()
+        self.assertEqual([activator() for _ in range(3)], [False, False, True])
+
+    def test_count_window_activator_call_with_arguments(self):
+        with self.assertRaises(TypeError):
+            CountWindowActivator(1, 1)(42)
+
+    def test_count_window_activator_call_from_multiple_threads(self):
+        activator = CountWindowActivator(1, 100)
+        results = []
+
+        def worker():
+            results.extend(activator() for _ in range(100))
+
+        threads = [Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results.count(True), 100)
+
+
+class ProbabilisticActivatorTests(TestCase):
+    def test_probabilistic_activator_creation(self):
+        activator = ProbabilisticActivator(12.5)
+        self.assertEqual(activator.probability, 12.5)
+        self.assertEqual(repr(activator), f'pyitt.native.{ProbabilisticActivator.__name__}(12.5)')
+
+    def test_probabilistic_activator_creation_with_invalid_probability(self):
+        with self.assertRaises(ValueError):
+            ProbabilisticActivator(-1)
+
+        with self.assertRaises(ValueError):
+            ProbabilisticActivator(100.5)
+
+    def test_probabilistic_activator_call(self):
+        self.assertFalse(any(ProbabilisticActivator(0)() for _ in range(1000)))
+        self.assertTrue(all(ProbabilisticActivator(100)() for _ in range(1000)))
+
+        activator = ProbabilisticActivator(50)
+        self.assertTrue(4000 < sum(activator() for _ in range(10000)) < 6000)
+
+
+class LatencyTriggeredActivatorTests(TestCase):
+    def test_latency_triggered_activator_creation(self):
+        activator = LatencyTriggeredActivator(2.5, 3)
+        self.assertEqual(activator.threshold_ms, 2.5)
+        self.assertEqual(activator.count, 3)
+        self.assertEqual(repr(activator), f'pyitt.native.{LatencyTriggeredActivator.__name__}(2.5, 3)')
+
+    def test_latency_triggered_activator_creation_with_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            LatencyTriggeredActivator(-1, 3)
+
+        with self.assertRaises(ValueError):
+            LatencyTriggeredActivator(1, 0)
+
+    def test_latency_triggered_activator_call(self):
+        activator = LatencyTriggeredActivator(5, 2)
+
+        self.assertFalse(activator())
+        activator.complete()
+        self.assertFalse(activator())
+        sleep(0.02)
+        activator.complete()
+
+        results = []
+        for _ in range(3):
+            results.append(activator())
+            activator.complete()
+
+        self.assertEqual(results, [True, True, False])
+
+    def test_latency_triggered_activator_for_nested_invocations(self):
+        activator = LatencyTriggeredActivator(5, 1)
+
+        self.assertFalse(activator())
+        sleep(0.02)
+        self.assertFalse(activator())
+        activator.complete()
+        self.assertFalse(activator())
+        activator.complete()
+        activator.complete()
+
+        self.assertTrue(activator())
+        activator.complete()
+
+    def test_latency_triggered_activator_complete_without_call(self):
+        self.assertIsNone(LatencyTriggeredActivator(5, 1).complete())
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
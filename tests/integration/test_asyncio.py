@@ -0,0 +1,54 @@
+import asyncio
+from unittest import main as unittest_main, TestCase
+
+from pyitt import current_task
+from pyitt.asyncio import instrument_loop, is_instrumented, uninstrument_loop
+
+
+class AsyncioTests(TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        uninstrument_loop(self.loop)
+        self.loop.close()
+
+    def test_coroutine_step_is_reported_as_task(self):
+        async def my_coroutine():
+            return current_task()
+
+        instrument_loop(self.loop, domain='my loop domain')
+        task = self.loop.run_until_complete(my_coroutine())
+
+        self.assertEqual((task.name, task.domain), (my_coroutine.__qualname__, 'my loop domain'))
+
+    def test_callback_is_reported_as_task(self):
+        tasks = []
+
+        def callback():
+            tasks.append(current_task())
+            self.loop.stop()
+
+        outer_task = current_task()
+        instrument_loop(self.loop, domain='my loop domain')
+        self.loop.call_soon(callback)
+        self.loop.run_forever()
+
+        self.assertEqual([(task.name, task.domain) for task in tasks], [(callback.__qualname__, 'my loop domain')])
+        self.assertEqual(current_task(), outer_task)
+
+    def test_loop_is_uninstrumented_on_close(self):
+        selector = self.loop._selector  # pylint: disable=W0212
+
+        instrument_loop(self.loop)
+        self.assertTrue(is_instrumented(self.loop))
+        self.loop.run_until_complete(asyncio.sleep(0.001))
+        self.loop.close()
+
+        self.assertFalse(is_instrumented(self.loop))
+        self.assertNotIn('_run_once', vars(self.loop))
+        self.assertNotIn('select', vars(selector))
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
@@ -0,0 +1,54 @@
+from time import perf_counter_ns
+from unittest import main as unittest_main, TestCase
+
+from pyitt.native import ClockDomain, clock_domain_reset
+
+
+class ClockDomainTests(TestCase):
+    def test_clock_domain_creation_with_frequency(self):
+        clock_domain = ClockDomain(1_000_000_000)
+        self.assertEqual(clock_domain.source, 1_000_000_000)
+        self.assertEqual(repr(clock_domain), f'pyitt.native.{ClockDomain.__name__}(1000000000)')
+
+    def test_clock_domain_creation_with_frequency_and_base(self):
+        clock_domain = ClockDomain(1000, base=42)
+        self.assertEqual(clock_domain.source, 1000)
+
+    def test_clock_domain_creation_with_function(self):
+        def get_clock_info():
+            return 1_000_000_000, perf_counter_ns()
+
+        clock_domain = ClockDomain(get_clock_info)
+        self.assertIs(clock_domain.source, get_clock_info)
+        self.assertIsNone(clock_domain_reset())
+
+    def test_clock_domain_creation_with_zero_frequency(self):
+        with self.assertRaises(ValueError) as context:
+            ClockDomain(0)
+
+        self.assertEqual(str(context.exception), 'The clock frequency must be greater than zero.')
+
+        with self.assertRaises(ValueError) as context:
+            ClockDomain(lambda: (0, 0))
+
+        self.assertEqual(str(context.exception), 'The clock frequency must be greater than zero.')
+
+    def test_clock_domain_creation_with_invalid_function(self):
+        with self.assertRaises(TypeError) as context:
+            ClockDomain(lambda: 1000)
+
+        self.assertEqual(str(context.exception),
+                         'The clock information function must return a tuple of frequency and base.')
+
+        with self.assertRaises(ZeroDivisionError):
+            ClockDomain(lambda: 1 / 0)
+
+    def test_clock_domain_creation_with_invalid_source(self):
+        with self.assertRaises(TypeError) as context:
+            ClockDomain('1000')
+
+        self.assertEqual(str(context.exception), 'The passed source is not a valid instance of int or callable.')
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
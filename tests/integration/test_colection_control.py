@@ -1,6 +1,9 @@
+from time import monotonic, sleep
 from unittest import main as unittest_main, TestCase
 
 from pyitt.native import pause, resume, detach
+from pyitt.native import collection_region_begin, collection_region_end
+from pyitt.native import collection_schedule_start, collection_schedule_stop, collection_schedule_is_active
 
 
 class CollectionControlTests(TestCase):
@@ -14,5 +17,71 @@ class CollectionControlTests(TestCase):
         self.assertIsNone(detach())
 
 
+class CollectionScheduleTests(TestCase):
+    def tearDown(self):
+        collection_schedule_stop()
+
+    def test_collection_schedule_start_and_stop(self):
+        self.assertIsNone(collection_schedule_start(10, 10))
+        self.assertTrue(collection_schedule_is_active())
+
+        self.assertIsNone(collection_schedule_stop())
+        self.assertFalse(collection_schedule_is_active())
+
+    def test_collection_schedule_restart(self):
+        self.assertIsNone(collection_schedule_start(10, 10))
+        self.assertIsNone(collection_schedule_start(20, 20, 0, 10))
+        self.assertTrue(collection_schedule_is_active())
+
+    def test_collection_schedule_stop_without_schedule(self):
+        self.assertIsNone(collection_schedule_stop())
+        self.assertFalse(collection_schedule_is_active())
+
+    def test_collection_schedule_with_limited_number_of_windows(self):
+        self.assertIsNone(collection_schedule_start(1, 1, 2))
+
+        deadline = monotonic() + 5
+        while collection_schedule_is_active() and monotonic() < deadline:
+            sleep(0.01)
+
+        self.assertFalse(collection_schedule_is_active())
+
+    def test_collection_schedule_stop_during_long_window(self):
+        collection_schedule_start(60 * 60 * 1000, 0)
+
+        start = monotonic()
+        collection_schedule_stop()
+        self.assertLess(monotonic() - start, 5)
+
+    def test_collection_schedule_with_zero_window(self):
+        with self.assertRaises(ValueError) as context:
+            collection_schedule_start(0, 10)
+
+        self.assertEqual(str(context.exception), 'The duration of the collection window must be greater than zero.')
+
+
+class CollectionRegionTests(TestCase):
+    def test_collection_region_begin_and_end(self):
+        region = object()
+        self.assertIsNone(collection_region_begin(region, False, True))
+        self.assertIsNone(collection_region_begin(region, False, False))
+        self.assertIsNone(collection_region_end(region))
+        self.assertIsNone(collection_region_end(region))
+
+    def test_nested_collection_regions_of_different_kinds(self):
+        active_region, paused_region = object(), object()
+        self.assertIsNone(collection_region_begin(active_region, False, True))
+        self.assertIsNone(collection_region_begin(paused_region, True, True))
+        self.assertIsNone(collection_region_end(active_region))
+        self.assertIsNone(collection_region_end(paused_region))
+
+    def test_collection_region_end_without_begin(self):
+        self.assertIsNone(collection_region_end(object()))
+
+    def test_collection_region_begin_with_invalid_arguments(self):
+        with self.assertRaises(TypeError):
+            collection_region_begin(object())
+
+
 if __name__ == '__main__':
     unittest_main()  # pragma: no cover
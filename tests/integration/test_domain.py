@@ -1,7 +1,16 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import Context
 from platform import python_implementation
+from struct import iter_unpack
+from threading import Barrier, Thread
 from unittest import main as unittest_main, TestCase
 
-from pyitt.native import Domain, StringHandle
+from pyitt.native import Domain, Id, StringHandle
+from pyitt.native import current_task, task_stack
+from pyitt.native import domain_set_allowlist, domain_set_enabled, frame_begin, frame_end, frame_submit_many
+from pyitt.native import recorder_clear, recorder_disable, recorder_enable, recorder_snapshot
+from pyitt.native import stats_disable, stats_enable, stats_reset, stats_snapshot
+from pyitt.native import task_begin, task_end, task_begin_overlapped, task_end_overlapped
 
 
 class DomainTests(TestCase):
@@ -67,5 +76,224 @@ class DomainTests(TestCase):
         self.assertEqual(str(context.exception), exception_str)
 
 
+class DomainEnablingTests(TestCase):
+    def test_domain_is_enabled_by_default(self):
+        self.assertTrue(Domain('enabled domain').enabled)
+
+    def test_domain_disabling(self):
+        domain = Domain('disabled domain')
+        domain_set_enabled('disabled domain', False)
+
+        self.assertFalse(domain.enabled)
+        self.assertFalse(Domain('disabled domain').enabled)
+
+        domain_set_enabled('disabled domain', True)
+        self.assertTrue(domain.enabled)
+
+    def test_calls_for_disabled_domain_return_before_argument_parsing(self):
+        domain = Domain('skipped domain')
+        domain_set_enabled('skipped domain', False)
+
+        self.assertIsNone(task_begin(domain, None))
+        self.assertIsNone(task_end(domain))
+        self.assertEqual(frame_submit_many(domain, None, None), 0)
+
+        domain_set_enabled('skipped domain', True)
+        with self.assertRaises(TypeError):
+            task_begin(domain, None)
+
+    def test_calls_for_disabled_domain_passed_as_keyword_return_before_argument_parsing(self):
+        domain = Domain('skipped keyword domain')
+        domain_set_enabled('skipped keyword domain', False)
+
+        self.assertIsNone(task_begin(domain=domain, name=None))
+        self.assertIsNone(task_end(domain=domain))
+        self.assertIsNone(task_begin_overlapped(domain=domain, name=None, id=None))
+        self.assertEqual(frame_submit_many(domain=domain, begins=None, ends=None), 0)
+
+        domain_set_enabled('skipped keyword domain', True)
+        with self.assertRaises(TypeError):
+            task_begin(domain=domain, name=None)
+
+    def test_calls_with_keyword_arguments(self):
+        domain = Domain('my keyword domain')
+
+        task_begin(domain=domain, name=StringHandle('my keyword task'))
+        try:
+            self.assertEqual(current_task()[:2], ('my keyword task', 'my keyword domain'))
+        finally:
+            task_end(domain=domain)
+
+        frame_begin(domain=domain, id=None)
+        frame_end(domain=domain, id=None)
+
+    def test_domain_set_enabled_with_non_string_name(self):
+        with self.assertRaises(TypeError):
+            domain_set_enabled(42, False)
+
+    def test_domain_allowlist(self):
+        listed_domain = Domain('listed domain')
+        unlisted_domain = Domain('unlisted domain')
+
+        domain_set_allowlist(['listed domain'])
+        try:
+            self.assertTrue(listed_domain.enabled)
+            self.assertFalse(unlisted_domain.enabled)
+            self.assertFalse(Domain('new unlisted domain').enabled)
+        finally:
+            domain_set_allowlist(None)
+
+        self.assertTrue(unlisted_domain.enabled)
+        self.assertTrue(Domain('new unlisted domain').enabled)
+
+    def test_domain_allowlist_with_non_string_name(self):
+        with self.assertRaises(TypeError):
+            domain_set_allowlist([42])
+
+    def test_domain_create_many(self):
+        names = ['my first preloaded domain', 'my second preloaded domain']
+        domains = Domain.create_many(names)
+
+        self.assertEqual([domain.name for domain in domains], names)
+        self.assertIs(Domain._from_name('my first preloaded domain'), domains[0])  # pylint: disable=W0212
+        self.assertEqual(Domain('my second preloaded domain').name, 'my second preloaded domain')
+
+    def test_preloaded_domain_shares_state(self):
+        domain = Domain.create_many(['my preloaded domain'])[0]
+
+        domain_set_enabled('my preloaded domain', False)
+        try:
+            self.assertFalse(domain.enabled)
+            self.assertFalse(Domain('my preloaded domain').enabled)
+        finally:
+            domain_set_enabled('my preloaded domain', True)
+
+    def test_domain_create_many_with_non_string(self):
+        with self.assertRaises(TypeError) as context:
+            Domain.create_many([None])
+
+        self.assertEqual(str(context.exception), 'The passed name is not a valid instance of str type.')
+
+
+class DomainSwitchingTests(TestCase):
+    """The ends of the regions follow their beginnings when the domain is switched between them."""
+    domain_name = 'my switched domain'
+
+    def setUp(self):
+        recorder_enable()
+        stats_enable()
+
+    def tearDown(self):
+        domain_set_enabled(self.domain_name, True)
+        recorder_disable()
+        recorder_clear()
+        stats_disable()
+        stats_reset()
+
+    def run_with_switching(self, func):
+        """Runs the function in a new thread and context, so the tasks of other tests are not on the stack."""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            result = executor.submit(Context().run, func).result()
+
+        _, threads = recorder_snapshot()
+        record_types = [record[1] for _, records in threads for record in iter_unpack('=QIIIIQ', records)]
+        return result, record_types, stats_snapshot()
+
+    def switch_domain(self, enabled):
+        domain_set_enabled(self.domain_name, enabled)
+
+    def test_domain_switched_between_nested_task_begin_and_end(self):
+        domain = Domain(self.domain_name)
+
+        def run_tasks():
+            task_begin(domain, StringHandle('my outer task'))
+            self.switch_domain(False)
+            task_begin(domain, StringHandle('my inner task'))
+            self.switch_domain(True)
+            task_end(domain)
+            states = [current_task()[0]]
+
+            self.switch_domain(False)
+            task_end(domain)
+            self.switch_domain(True)
+            states.append(task_stack())
+            return states
+
+        states, record_types, stats = self.run_with_switching(run_tasks)
+
+        self.assertEqual(states, ['my outer task', ()])
+        self.assertEqual(record_types, [1, 2])
+        self.assertEqual(stats['my outer task'][0], 1)
+        self.assertNotIn('my inner task', stats)
+
+    def test_domain_switched_between_overlapped_task_begin_and_end(self):
+        domain = Domain(self.domain_name)
+        outer_id = Id(domain)
+        inner_id = Id(domain)
+
+        def run_tasks():
+            task_begin_overlapped(domain, StringHandle('my outer task'), outer_id)
+            self.switch_domain(False)
+            task_begin_overlapped(domain, StringHandle('my inner task'), inner_id)
+            self.switch_domain(True)
+            task_end_overlapped(domain, inner_id)
+            states = [current_task()[0]]
+
+            self.switch_domain(False)
+            task_end_overlapped(domain, outer_id)
+            self.switch_domain(True)
+            states.append(task_stack())
+            return states
+
+        states, record_types, stats = self.run_with_switching(run_tasks)
+
+        self.assertEqual(states, ['my outer task', ()])
+        self.assertEqual(record_types, [3, 4])
+        self.assertEqual(stats['my outer task'][0], 1)
+        self.assertNotIn('my inner task', stats)
+
+    def test_domain_switched_between_frame_begin_and_end(self):
+        domain = Domain(self.domain_name)
+
+        def run_frames():
+            frame_begin(domain)
+            self.switch_domain(False)
+            frame_end(domain)
+            frame_begin(domain)
+            self.switch_domain(True)
+            frame_end(domain)
+
+        _, record_types, stats = self.run_with_switching(run_frames)
+
+        self.assertEqual(record_types, [5, 6])
+        self.assertEqual(stats[self.domain_name][0], 1)
+
+    def test_domain_switched_between_frame_begin_and_end_in_two_threads(self):
+        domain = Domain(self.domain_name)
+        barrier = Barrier(2)
+
+        def run_reported_frame():
+            frame_begin(domain)
+            barrier.wait()
+            barrier.wait()
+            frame_end(domain)
+
+        def run_frames():
+            thread = Thread(target=run_reported_frame)
+            thread.start()
+            barrier.wait()
+            self.switch_domain(False)
+            frame_begin(domain)
+            self.switch_domain(True)
+            frame_end(domain)
+            barrier.wait()
+            thread.join()
+
+        _, record_types, stats = self.run_with_switching(run_frames)
+
+        self.assertEqual(record_types, [5, 6])
+        self.assertEqual(stats[self.domain_name][0], 1)
+
+
 if __name__ == '__main__':
     unittest_main()  # pragma: no cover
@@ -0,0 +1,122 @@
+import os
+import pickle
+import sys
+from struct import iter_unpack
+from subprocess import run
+from unittest import main as unittest_main, skipUnless, TestCase
+
+from pyitt.native import Counter, Domain, StringHandle
+from pyitt.native import after_fork_in_child
+from pyitt.native import recorder_clear, recorder_disable, recorder_enable, recorder_is_active, recorder_snapshot
+from pyitt.native import stats_disable, stats_enable, stats_is_active, stats_reset, stats_snapshot
+from pyitt.native import task_begin, task_end
+
+
+class PickleTests(TestCase):
+    def test_pickle_domain(self):
+        domain = Domain('my pickled domain')
+        restored_domain = pickle.loads(pickle.dumps(domain))
+
+        self.assertEqual(restored_domain.name, domain.name)
+        self.assertIs(pickle.loads(pickle.dumps(domain)), restored_domain)
+
+    def test_pickle_string_handle(self):
+        string_handle = StringHandle('my pickled string handle')
+        restored_string_handle = pickle.loads(pickle.dumps(string_handle))
+
+        self.assertEqual(str(restored_string_handle), str(string_handle))
+        self.assertIs(pickle.loads(pickle.dumps(string_handle)), restored_string_handle)
+
+    def test_pickle_counter(self):
+        counter = Counter('my pickled counter', Domain('my pickled domain'), 5)
+        restored_counter = pickle.loads(pickle.dumps(counter))
+
+        self.assertEqual(restored_counter.name, counter.name)
+        self.assertEqual(restored_counter.domain.name, counter.domain.name)
+        self.assertEqual(restored_counter.value, 5)
+        self.assertIs(pickle.loads(pickle.dumps(counter)), restored_counter)
+
+    def test_unpickle_counter_does_not_set_value(self):
+        counter = Counter('my live counter', Domain('my pickled domain'), 5)
+        data = pickle.dumps(counter)
+
+        recorder_enable()
+        try:
+            counter.set(7)
+            pickle.loads(data)
+        finally:
+            recorder_disable()
+
+        names, threads = recorder_snapshot()
+        recorder_clear()
+        values = [value for _, records in threads for _, _, name, _, _, value in iter_unpack('=QIIIIQ', records)
+                  if names[name] == 'my live counter']
+        self.assertEqual(values, [7])
+
+
+class AfterForkTests(TestCase):
+    def tearDown(self):
+        stats_disable()
+        stats_reset()
+
+    def test_after_fork_in_child_discards_stats(self):
+        domain = Domain('my domain')
+        stats_enable()
+        task_begin(domain, StringHandle('my forked task'))
+        task_end(domain)
+
+        after_fork_in_child()
+
+        self.assertTrue(stats_is_active())
+        self.assertNotIn('my forked task', stats_snapshot())
+
+    def test_after_fork_in_child_discards_recorded_calls(self):
+        domain = Domain('my domain')
+        recorder_enable(1024)
+        try:
+            task_begin(domain, StringHandle('my recorded task'))
+            task_end(domain)
+
+            after_fork_in_child()
+
+            self.assertTrue(recorder_is_active())
+            self.assertEqual(recorder_snapshot()[1], [])
+        finally:
+            recorder_disable()
+
+    @skipUnless(hasattr(os, 'fork'), 'os.fork() is not available')
+    def test_fork(self):
+        domain = Domain('my domain')
+        stats_enable()
+        task_begin(domain, StringHandle('my parent task'))
+        task_end(domain)
+
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover
+            status = 0 if 'my parent task' not in stats_snapshot() else 1
+            os._exit(status)  # pylint: disable=W0212
+
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(os.waitstatus_to_exitcode(status), 0)
+        self.assertIn('my parent task', stats_snapshot())
+
+
+class ImportTests(TestCase):
+    def test_import_does_not_load_optional_integrations(self):
+        code = ('import sys, pyitt; '
+                'print([name for name in pyitt._LAZY_SUBMODULES if f"pyitt.{name}" in sys.modules])')
+        environ = {name: value for name, value in os.environ.items() if not name.startswith('PYITT_')}
+        result = run([sys.executable, '-c', code], capture_output=True, check=True, env=environ, text=True)
+
+        self.assertEqual(result.stdout.strip(), '[]')
+
+    def test_import_loads_integrations_enabled_by_environment_variables(self):
+        code = 'import sys, pyitt; print("pyitt.fork" in sys.modules, "pyitt.jit" in sys.modules)'
+        environ = dict(os.environ, PYITT_NAME_CHILD_PROCESSES='1')
+        result = run([sys.executable, '-c', code], capture_output=True, check=True, env=environ, text=True)
+
+        self.assertEqual(result.stdout.split(), ['True', 'False'])
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
@@ -1,7 +1,8 @@
+from array import array
 from unittest import main as unittest_main, TestCase
 
 from pyitt.native import Domain, Id
-from pyitt.native import frame_begin, frame_end
+from pyitt.native import frame_begin, frame_end, frame_submit, frame_submit_many, get_timestamp
 
 
 class TaskBeginTests(TestCase):
@@ -78,5 +79,57 @@ class TaskEndTests(TestCase):
                                                  f' pyitt.native.{Id.__name__} type.')
 
 
+class FrameSubmitTests(TestCase):
+    def test_frame_submit(self):
+        domain = Domain('my domain')
+        begin = get_timestamp()
+        self.assertIsNone(frame_submit(domain, begin, begin + 10))
+        self.assertIsNone(frame_submit(domain, begin, begin + 10, Id(domain)))
+        self.assertIsNone(frame_submit(domain, begin, begin + 10, None))
+
+    def test_frame_submit_with_invalid_arguments(self):
+        domain = Domain('my domain')
+
+        with self.assertRaises(TypeError):
+            frame_submit(None, 1, 2)
+
+        with self.assertRaises(TypeError):
+            frame_submit(domain, 1, 2, 42)
+
+        with self.assertRaises(ValueError) as context:
+            frame_submit(domain, 2, 1)
+
+        self.assertEqual(str(context.exception), 'The passed end timestamp is less than the begin timestamp.')
+
+    def test_frame_submit_many(self):
+        domain = Domain('my domain')
+        self.assertEqual(frame_submit_many(domain, array('Q', [1, 3, 5]), array('Q', [2, 4, 6])), 3)
+        self.assertEqual(frame_submit_many(domain, array('q', [1]), memoryview(array('q', [2]))), 1)
+        self.assertEqual(frame_submit_many(domain, array('Q'), array('Q')), 0)
+
+    def test_frame_submit_many_with_invalid_buffers(self):
+        domain = Domain('my domain')
+
+        with self.assertRaises(TypeError) as context:
+            frame_submit_many(domain, array('i', [1]), array('Q', [2]))
+
+        self.assertEqual(str(context.exception),
+                         "The passed begins have an unsupported format 'i', 64-bit integers are expected.")
+
+        with self.assertRaises(TypeError):
+            frame_submit_many(domain, [1], array('Q', [2]))
+
+        with self.assertRaises(ValueError) as context:
+            frame_submit_many(domain, array('Q', [1, 2]), array('Q', [2]))
+
+        self.assertEqual(str(context.exception), 'The passed begins and ends have different lengths.')
+
+        with self.assertRaises(ValueError) as context:
+            frame_submit_many(domain, array('Q', [1, 3]), array('Q', [2, 2]))
+
+        self.assertEqual(str(context.exception),
+                         'The end timestamp is less than the begin timestamp for the frame 1.')
+
+
 if __name__ == '__main__':
     unittest_main()  # pragma: no cover
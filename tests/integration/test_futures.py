@@ -0,0 +1,41 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import main as unittest_main, TestCase
+
+from pyitt.futures import instrument_executor, InstrumentedProcessPoolExecutor, InstrumentedThreadPoolExecutor
+
+
+def square(x):
+    return x * x
+
+
+def fail():
+    raise ValueError('my error')
+
+
+class InstrumentedThreadPoolExecutorTests(TestCase):
+    def test_thread_pool_executor_submit(self):
+        with InstrumentedThreadPoolExecutor(2, domain='my domain') as executor:
+            self.assertEqual(executor.submit(square, 3).result(), 9)
+
+    def test_thread_pool_executor_map(self):
+        with InstrumentedThreadPoolExecutor(2, 'my_pool') as executor:
+            self.assertEqual(list(executor.map(square, range(10))), [x * x for x in range(10)])
+
+    def test_thread_pool_executor_propagates_exception(self):
+        with InstrumentedThreadPoolExecutor(1) as executor:
+            with self.assertRaises(ValueError):
+                executor.submit(fail).result()
+
+    def test_instrument_thread_pool_executor(self):
+        with instrument_executor(ThreadPoolExecutor(2), 'my pool') as executor:
+            self.assertEqual(executor.submit(square, 4).result(), 16)
+
+
+class InstrumentedProcessPoolExecutorTests(TestCase):
+    def test_process_pool_executor_map(self):
+        with InstrumentedProcessPoolExecutor(2, domain='my domain') as executor:
+            self.assertEqual(list(executor.map(square, range(10))), [x * x for x in range(10)])
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
@@ -0,0 +1,65 @@
+import os
+from sys import platform
+from threading import Event
+from unittest import main as unittest_main, skipUnless, TestCase
+
+from pyitt.native import Counter, gauge_source_sample, gauge_source_start, gauge_source_stop
+
+
+@skipUnless(platform.startswith('linux'), 'The built-in gauge sources are supported only on Linux.')
+class GaugeSourceTests(TestCase):
+    def test_gauge_source_sample(self):
+        self.assertGreater(gauge_source_sample('rss'), 0)
+        self.assertGreaterEqual(gauge_source_sample('threads'), 1)
+        self.assertGreaterEqual(gauge_source_sample('context_switches'), 0)
+
+    def test_gauge_source_sample_for_fds(self):
+        fds = gauge_source_sample('fds')
+
+        read_fd, write_fd = os.pipe()
+        try:
+            self.assertEqual(gauge_source_sample('fds'), fds + 2)
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+    def test_gauge_source_sample_with_unknown_source(self):
+        with self.assertRaises(ValueError) as context:
+            gauge_source_sample('my source')
+
+        self.assertEqual(str(context.exception), "Unknown gauge source: 'my source'.")
+
+    def test_gauge_source_sample_with_non_string_source(self):
+        with self.assertRaises(TypeError) as context:
+            gauge_source_sample(None)
+
+        self.assertEqual(str(context.exception), 'The passed source is not a valid instance of str type.')
+
+    def test_gauge_source_start_and_stop(self):
+        counter = Counter('my gauge')
+
+        first_id = gauge_source_start('rss', counter, 1)
+        second_id = gauge_source_start('threads', counter, 1)
+        Event().wait(0.01)
+
+        self.assertNotEqual(first_id, second_id)
+        self.assertIsNone(gauge_source_stop(first_id))
+        self.assertIsNone(gauge_source_stop(second_id))
+        self.assertIsNone(gauge_source_stop(second_id))
+
+    def test_gauge_source_start_with_invalid_counter(self):
+        with self.assertRaises(TypeError) as context:
+            gauge_source_start('rss', None, 1)
+
+        self.assertEqual(str(context.exception), f'The passed counter is not a valid instance of'
+                                                 f' pyitt.native.{Counter.__name__} type.')
+
+    def test_gauge_source_start_with_zero_interval(self):
+        with self.assertRaises(ValueError) as context:
+            gauge_source_start('rss', Counter('my gauge'), 0)
+
+        self.assertEqual(str(context.exception), 'The sampling interval must be greater than zero.')
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
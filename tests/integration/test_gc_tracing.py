@@ -0,0 +1,41 @@
+import gc
+from concurrent.futures import ThreadPoolExecutor
+from unittest import main as unittest_main, TestCase
+
+from pyitt import current_task, trace_gc
+
+
+class GcTracingTests(TestCase):
+    def test_gc_collection_is_reported_as_task(self):
+        tasks = []
+
+        def record_task(phase, _):
+            if phase == 'start':
+                tasks.append(current_task())
+
+        def collect():
+            trace_gc(domain='my gc domain')
+            gc.callbacks.append(record_task)
+            try:
+                gc.collect(1)
+            finally:
+                gc.callbacks.remove(record_task)
+                trace_gc(False)
+            return current_task()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            self.assertIsNone(executor.submit(collect).result())
+
+        self.assertEqual([(task.name, task.domain) for task in tasks], [('gc generation 1', 'my gc domain')])
+
+    def test_gc_tracing_is_disabled(self):
+        callbacks_count = len(gc.callbacks)
+
+        trace_gc()
+        trace_gc(False)
+
+        self.assertEqual(len(gc.callbacks), callbacks_count)
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
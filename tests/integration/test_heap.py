@@ -0,0 +1,90 @@
+import tracemalloc
+from threading import Thread
+from unittest import main as unittest_main, TestCase
+
+from pyitt.native import heap_tracking_disable, heap_tracking_enable, heap_tracking_is_active
+
+
+class HeapTrackingTests(TestCase):
+    def tearDown(self):
+        for domain in range(3):
+            heap_tracking_disable(domain)
+
+    def test_heap_tracking_enable_and_disable(self):
+        for domain in range(3):
+            heap_tracking_enable(domain)
+            self.assertTrue(heap_tracking_is_active(domain))
+
+            data = [str(i) * 10 for i in range(1000)]
+            self.assertEqual(len(data), 1000)
+
+            heap_tracking_disable(domain)
+            self.assertFalse(heap_tracking_is_active(domain))
+
+    def test_heap_tracking_for_blocks_allocated_before_enabling(self):
+        data = [bytearray(100) for _ in range(1000)]
+
+        heap_tracking_enable(2, 64, 10)
+        heap_tracking_enable(2, 0, 1)
+        del data
+
+        heap_tracking_disable(2)
+        heap_tracking_disable(2)
+
+    def test_heap_tracking_with_threads(self):
+        def workload():
+            for _ in range(1000):
+                _ = [bytes(i) for i in range(100)]
+
+        heap_tracking_enable(0, 0, 3)
+        heap_tracking_enable(1, 0, 3)
+        heap_tracking_enable(2, 0, 3)
+
+        threads = [Thread(target=workload) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def test_heap_tracking_disable_keeps_later_hooks(self):
+        heap_tracking_enable(2)
+        tracemalloc.start()
+        try:
+            heap_tracking_disable(2)
+            self.assertFalse(heap_tracking_is_active(2))
+
+            data = [bytearray(100) for _ in range(100)]
+            self.assertGreater(tracemalloc.get_traced_memory()[0], 100 * 100)
+            del data
+
+            heap_tracking_enable(2)
+            self.assertTrue(heap_tracking_is_active(2))
+        finally:
+            tracemalloc.stop()
+
+    def test_heap_tracking_for_reallocated_blocks(self):
+        heap_tracking_enable(1, 0, 7)
+        data = [bytearray() for _ in range(100)]
+        for _ in range(10):
+            for block in data:
+                block.extend(b'x' * 100)
+        del data
+
+    def test_heap_tracking_with_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            heap_tracking_enable(3)
+
+        with self.assertRaises(ValueError):
+            heap_tracking_enable(2, -1)
+
+        with self.assertRaises(ValueError):
+            heap_tracking_enable(2, 0, 0)
+
+        with self.assertRaises(ValueError):
+            heap_tracking_is_active(-1)
+
+        self.assertFalse(heap_tracking_is_active(2))
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
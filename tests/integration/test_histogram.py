@@ -0,0 +1,133 @@
+from array import array
+from unittest import main as unittest_main, TestCase
+
+from pyitt.native import Domain, Histogram, StringHandle
+
+
+class HistogramCreationTests(TestCase):
+    def test_histogram_creation(self):
+        histogram = Histogram('my histogram')
+        self.assertEqual(histogram.name, 'my histogram')
+        self.assertEqual(histogram.domain.name, Domain().name)
+        self.assertEqual(histogram.x_type, 1)
+        self.assertEqual(histogram.y_type, 1)
+        self.assertEqual(histogram.batch_size, 1024)
+        self.assertEqual(str(histogram), 'my histogram')
+        self.assertEqual(repr(histogram),
+                         f"pyitt.native.{Histogram.__name__}('my histogram', {histogram.domain!r}, 1, 1, 1024)")
+
+    def test_histogram_creation_with_all_arguments(self):
+        domain = Domain('my domain')
+        histogram = Histogram(StringHandle('my histogram'), domain, 8, 3, 16)
+        self.assertEqual(histogram.name, 'my histogram')
+        self.assertIs(histogram.domain, domain)
+        self.assertEqual(histogram.x_type, 8)
+        self.assertEqual(histogram.y_type, 3)
+        self.assertEqual(histogram.batch_size, 16)
+
+        self.assertEqual(Histogram('my histogram', 'my domain').domain.name, 'my domain')
+
+    def test_histogram_creation_with_invalid_arguments(self):
+        with self.assertRaises(TypeError):
+            Histogram(None)
+
+        with self.assertRaises(ValueError) as context:
+            Histogram('my histogram', None, 0)
+
+        self.assertEqual(str(context.exception), 'The passed x_type 0 is not a valid histogram data type.')
+
+        with self.assertRaises(ValueError):
+            Histogram('my histogram', None, 1, 9)
+
+        with self.assertRaises(ValueError):
+            Histogram('my histogram', None, 1, 1, 0)
+
+
+class HistogramSubmitTests(TestCase):
+    def test_histogram_submit(self):
+        histogram = Histogram('my histogram', None, 8, 1)
+        self.assertEqual(histogram.submit(array('d', [0.5, 1.5]), array('Q', [10, 20])), 2)
+        self.assertEqual(histogram.submit(None, memoryview(array('Q', [10, 20, 30]))), 3)
+
+    def test_histogram_submit_with_invalid_buffers(self):
+        histogram = Histogram('my histogram', None, 8, 1)
+
+        with self.assertRaises(TypeError) as context:
+            histogram.submit(array('f', [0.5]), array('Q', [10]))
+
+        self.assertEqual(str(context.exception),
+                         "The passed x values have the format 'f' that does not match the histogram data type.")
+
+        with self.assertRaises(TypeError):
+            histogram.submit(array('d', [0.5]), [10])
+
+        with self.assertRaises(ValueError) as context:
+            histogram.submit(array('d', [0.5]), array('Q', [10, 20]))
+
+        self.assertEqual(str(context.exception), 'The passed x values and y values have different lengths.')
+
+
+class HistogramRecordTests(TestCase):
+    def test_histogram_record_and_flush(self):
+        histogram = Histogram('my histogram', None, 2, 1, 100)
+        for value in (1, 2, 2, -3):
+            self.assertIsNone(histogram.record(value))
+
+        self.assertEqual(histogram.flush(), 3)
+        self.assertEqual(histogram.flush(), 0)
+
+    def test_histogram_record_submits_full_batch(self):
+        histogram = Histogram('my histogram', None, 7, 4, 4)
+        for value in (0.5, 0.5, 1.5, 2.5):
+            histogram.record(value)
+
+        self.assertEqual(histogram.flush(), 0)
+
+        histogram.record(0.5)
+        self.assertEqual(histogram.flush(), 1)
+
+    def test_histogram_record_with_invalid_value(self):
+        histogram = Histogram('my histogram')
+
+        with self.assertRaises(OverflowError):
+            histogram.record(-1)
+
+        with self.assertRaises(TypeError):
+            histogram.record('1')
+
+        self.assertEqual(histogram.flush(), 0)
+
+    def test_histogram_record_with_value_out_of_type_range(self):
+        type_ranges = ((3, (0, 2**32 - 1), (2**32,)),
+                       (4, (-2**31, 2**31 - 1), (-2**31 - 1, 2**31)),
+                       (5, (0, 2**16 - 1), (2**16,)),
+                       (6, (-2**15, 2**15 - 1), (-2**15 - 1, 2**15)))
+        for x_type, valid_values, invalid_values in type_ranges:
+            histogram = Histogram('my histogram', None, x_type)
+            for value in valid_values:
+                histogram.record(value)
+
+            for value in invalid_values:
+                with self.assertRaises(OverflowError) as context:
+                    histogram.record(value)
+
+                self.assertEqual(str(context.exception),
+                                 f'The passed value {value} is out of the range of the histogram data type.')
+
+            self.assertEqual(histogram.flush(), len(valid_values))
+
+    def test_histogram_record_submits_count_before_y_type_overflow(self):
+        for y_type, max_count in ((5, 2**16 - 1), (6, 2**15 - 1)):
+            histogram = Histogram('my histogram', None, 1, y_type, 2**20)
+            histogram.record(2)
+            for _ in range(max_count):
+                histogram.record(1)
+
+            self.assertEqual(histogram.flush(), 0)
+
+            histogram.record(1)
+            self.assertEqual(histogram.flush(), 1)
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
@@ -0,0 +1,47 @@
+from platform import python_implementation, system, machine
+from sys import version_info
+from unittest import main as unittest_main, skipIf, skipUnless, TestCase
+
+from pyitt.native import jit_is_profiling_active, jit_register_code, jit_set_auto_registration
+
+
+IS_TRAMPOLINE_SUPPORTED = (version_info >= (3, 12) and python_implementation() == 'CPython' and system() == 'Linux'
+                           and machine() in ('x86_64', 'aarch64'))
+
+
+def my_function():
+    return 42
+
+
+class JitTests(TestCase):
+    def test_jit_is_profiling_active(self):
+        self.assertIsInstance(jit_is_profiling_active(), bool)
+
+    def test_jit_register_code_with_not_code_object(self):
+        with self.assertRaises(TypeError) as context:
+            jit_register_code(my_function)
+
+        self.assertEqual(str(context.exception), 'The passed code is not a valid instance of code type.')
+
+    @skipUnless(IS_TRAMPOLINE_SUPPORTED, 'JIT trampolines are not supported.')
+    def test_jit_register_code(self):
+        self.assertEqual(jit_register_code(my_function.__code__), jit_is_profiling_active())
+        self.assertEqual(my_function(), 42)
+
+    @skipUnless(IS_TRAMPOLINE_SUPPORTED, 'JIT trampolines are not supported.')
+    def test_jit_set_auto_registration(self):
+        self.assertEqual(jit_set_auto_registration(True), jit_is_profiling_active())
+        self.assertEqual(my_function(), 42)
+        self.assertFalse(jit_set_auto_registration(False))
+
+    @skipIf(IS_TRAMPOLINE_SUPPORTED, 'JIT trampolines are supported.')
+    def test_jit_register_code_without_trampoline_support(self):
+        with self.assertRaises(NotImplementedError):
+            jit_register_code(my_function.__code__)
+
+        with self.assertRaises(NotImplementedError):
+            jit_set_auto_registration(True)
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
@@ -0,0 +1,40 @@
+from unittest import main as unittest_main, TestCase
+
+from pyitt.native import Domain, StringHandle
+from pyitt.native import manifest_recording_disable, manifest_recording_enable, manifest_snapshot
+
+
+class ManifestTests(TestCase):
+    def test_manifest_recording(self):
+        manifest_recording_enable()
+        try:
+            StringHandle('my recorded task')
+            StringHandle.create_many(['my recorded preloaded task'])
+            Domain('my recorded domain')
+        finally:
+            manifest_recording_disable()
+        StringHandle('my unrecorded task')
+
+        names, domains = manifest_snapshot()
+
+        self.assertIn('my recorded task', names)
+        self.assertIn('my recorded preloaded task', names)
+        self.assertNotIn('my unrecorded task', names)
+        self.assertIn('my recorded domain', domains)
+        self.assertNotIn('my recorded domain', names)
+        self.assertEqual(names, sorted(names))
+
+    def test_manifest_recording_for_preloaded_names(self):
+        StringHandle.create_many(['my preloaded task'])
+
+        manifest_recording_enable()
+        try:
+            StringHandle('my preloaded task')
+        finally:
+            manifest_recording_disable()
+
+        self.assertIn('my preloaded task', manifest_snapshot()[0])
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
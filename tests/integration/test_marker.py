@@ -0,0 +1,53 @@
+from unittest import main as unittest_main, TestCase
+
+from pyitt.native import Domain, Id, StringHandle
+from pyitt.native import marker
+from pyitt.native import recorder_clear, recorder_disable, recorder_enable, recorder_snapshot
+
+
+class MarkerTests(TestCase):
+    def test_marker(self):
+        domain = Domain('my domain')
+        name = StringHandle('my marker')
+
+        for scope in range(1, 5):
+            self.assertIsNone(marker(domain, name, scope))
+        self.assertIsNone(marker(domain, name, 3, None))
+        self.assertIsNone(marker(domain, name, 4, Id(domain)))
+
+    def test_marker_with_invalid_arguments(self):
+        domain = Domain('my domain')
+        name = StringHandle('my marker')
+
+        with self.assertRaises(TypeError):
+            marker(None, name, 1)
+
+        with self.assertRaises(TypeError):
+            marker(domain, 'my marker', 1)
+
+        with self.assertRaises(TypeError):
+            marker(domain, name, 1, 42)
+
+        with self.assertRaises(ValueError) as context:
+            marker(domain, name, 5)
+
+        self.assertEqual(str(context.exception), 'The passed scope 5 is not a valid marker scope.')
+
+    def test_marker_recording(self):
+        domain = Domain('my domain')
+        name = StringHandle('my recorded marker')
+
+        recorder_enable(16)
+        try:
+            marker(domain, name, 2)
+            names, threads = recorder_snapshot()
+        finally:
+            recorder_disable()
+            recorder_clear()
+
+        self.assertIn('my recorded marker', names)
+        self.assertTrue(any(records for _, records in threads))
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
@@ -0,0 +1,72 @@
+from array import array
+from unittest import main as unittest_main, TestCase
+
+from pyitt.native import Domain, Id, StringHandle
+from pyitt.native import metadata_add, task_begin, task_end
+
+
+class MetadataAddTests(TestCase):
+    def test_metadata_add_without_arguments(self):
+        with self.assertRaises(TypeError) as context:
+            metadata_add()
+
+        self.assertEqual(str(context.exception), 'function takes at least 3 arguments (0 given)')
+
+    def test_metadata_add_with_invalid_domain_object(self):
+        with self.assertRaises(TypeError) as context:
+            metadata_add(None, StringHandle('my metadata'), 1)
+
+        self.assertEqual(str(context.exception), f'The passed domain is not a valid instance of'
+                                                 f' pyitt.native.{Domain.__name__} type.')
+
+    def test_metadata_add_with_invalid_string_handle_object(self):
+        with self.assertRaises(TypeError) as context:
+            metadata_add(Domain('my domain'), None, 1)
+
+        self.assertEqual(str(context.exception), f'The passed name is not a valid instance of'
+                                                 f' pyitt.native.{StringHandle.__name__} type.')
+
+    def test_metadata_add_with_invalid_id_object(self):
+        with self.assertRaises(TypeError) as context:
+            metadata_add(Domain('my domain'), StringHandle('my metadata'), 1, 'id')
+
+        self.assertEqual(str(context.exception), f'The passed id is not a valid instance of'
+                                                 f' pyitt.native.{Id.__name__} type.')
+
+    def test_metadata_add_with_invalid_value(self):
+        with self.assertRaises(TypeError) as context:
+            metadata_add(Domain('my domain'), StringHandle('my metadata'), None)
+
+        self.assertEqual(str(context.exception), 'The passed value is not a valid instance of'
+                                                 ' int, float, str or buffer type.')
+
+    def test_metadata_add_with_unsupported_buffer_format(self):
+        with self.assertRaises(TypeError) as context:
+            metadata_add(Domain('my domain'), StringHandle('my metadata'), b'bytes')
+
+        self.assertEqual(str(context.exception), "The passed values have an unsupported format 'B'.")
+
+    def test_metadata_add_with_noncontiguous_buffer(self):
+        values = memoryview(array('i', range(6)))[::2]
+
+        with self.assertRaises(BufferError):
+            metadata_add(Domain('my domain'), StringHandle('my metadata'), values)
+
+    def test_metadata_add_for_task(self):
+        domain = Domain('my domain')
+        name = StringHandle('my metadata')
+        task_id = Id(domain)
+
+        task_begin(domain, StringHandle('my task'), task_id)
+        metadata_add(domain, name, 42)
+        metadata_add(domain, name, 2**64 - 1, task_id)
+        metadata_add(domain, name, 1.5, task_id)
+        metadata_add(domain, name, 'my value', task_id)
+        for type_code in 'hHiIlLqQfd':
+            metadata_add(domain, name, array(type_code, [1, 2, 3]), task_id)
+        metadata_add(domain, name, memoryview(array('d', [1.0, 2.0])), task_id)
+        task_end(domain)
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
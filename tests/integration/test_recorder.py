@@ -0,0 +1,124 @@
+from struct import iter_unpack
+from threading import Event, Thread
+from unittest import main as unittest_main, TestCase
+
+from pyitt.native import Counter, Domain, Id, StringHandle
+from pyitt.native import recorder_clear, recorder_disable, recorder_enable, recorder_is_active, recorder_snapshot
+from pyitt.native import task_begin, task_end, task_begin_overlapped, task_end_overlapped
+
+
+def get_records():
+    names, threads = recorder_snapshot()
+    return names, [record for _, records in threads for record in iter_unpack('=QIIIIQ', records)]
+
+
+class RecorderTests(TestCase):
+    def tearDown(self):
+        recorder_disable()
+        recorder_clear()
+
+    def test_recorder_enable_with_invalid_capacity(self):
+        with self.assertRaises(ValueError) as context:
+            recorder_enable(0)
+
+        self.assertEqual(str(context.exception), 'The passed capacity must be a positive number.')
+
+    def test_recorder_enable_and_disable(self):
+        recorder_enable()
+        self.assertTrue(recorder_is_active())
+
+        recorder_disable()
+        self.assertFalse(recorder_is_active())
+
+    def test_recorder_for_tasks(self):
+        domain = Domain('my domain')
+        name = StringHandle('my task')
+        task_id = Id(domain)
+
+        recorder_enable()
+        task_begin(domain, name)
+        task_end(domain)
+        task_begin_overlapped(domain, name, task_id)
+        task_end_overlapped(domain, task_id)
+        recorder_disable()
+
+        task_begin(domain, name)
+        task_end(domain)
+
+        names, records = get_records()
+        self.assertEqual([record[1] for record in records], [1, 2, 3, 4])
+        self.assertEqual(names[records[0][2]], 'my task')
+        self.assertEqual(names[records[0][3]], 'my domain')
+        self.assertEqual(records[2][5], records[3][5])
+        self.assertTrue(all(lhs[0] <= rhs[0] for lhs, rhs in zip(records, records[1:])))
+
+    def test_recorder_for_counter(self):
+        recorder_enable()
+        counter = Counter('my counter', 'my domain', 1)
+        counter.set(42)
+
+        names, records = get_records()
+        self.assertEqual([(names[record[2]], record[5]) for record in records], [('my counter', 1), ('my counter', 42)])
+
+    def test_recorder_overwrites_oldest_records(self):
+        domain = Domain('my domain')
+
+        recorder_enable(2)
+        for _ in range(3):
+            task_end(domain)
+
+        _, records = get_records()
+        self.assertEqual(len(records), 2)
+
+        recorder_enable()
+
+    def test_recorder_keeps_limited_number_of_finished_threads(self):
+        domain = Domain('my domain')
+
+        recorder_enable()
+        for _ in range(32):
+            thread = Thread(target=task_end, args=(domain,))
+            thread.start()
+            thread.join()
+
+        # The buffers are released after the threads are joined, so the last threads can be still counted.
+        _, threads = recorder_snapshot()
+        self.assertLess(len(threads), 32)
+
+    def test_recorder_clear(self):
+        recorder_enable()
+        task_end(Domain('my domain'))
+        recorder_clear()
+
+        _, records = get_records()
+        self.assertEqual(records, [])
+
+    def test_recorder_clear_while_another_thread_records(self):
+        domain = Domain('my domain')
+        name = StringHandle('my cleared task')
+        stopped = Event()
+
+        def record():
+            while not stopped.is_set():
+                task_begin(domain, name)
+                task_end(domain)
+
+        recorder_enable(16)
+        thread = Thread(target=record)
+        thread.start()
+        try:
+            for _ in range(100):
+                recorder_clear()
+        finally:
+            stopped.set()
+            thread.join()
+
+        recorder_clear()
+        task_end(domain)
+
+        _, records = get_records()
+        self.assertEqual([record[1] for record in records], [2])
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
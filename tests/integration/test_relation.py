@@ -0,0 +1,82 @@
+from unittest import main as unittest_main, TestCase
+
+from pyitt.native import Domain, Id, StringHandle
+from pyitt.native import relation_add, relation_add_to_current
+from pyitt.native import task_begin_overlapped, task_end_overlapped
+
+
+class RelationAddTests(TestCase):
+    def test_relation_add_with_invalid_domain_object(self):
+        domain = Domain('my domain')
+
+        with self.assertRaises(TypeError) as context:
+            relation_add(None, Id(domain), 1, Id(domain))
+
+        self.assertEqual(str(context.exception), f'The passed domain is not a valid instance of'
+                                                 f' pyitt.native.{Domain.__name__} type.')
+
+    def test_relation_add_with_invalid_head_object(self):
+        domain = Domain('my domain')
+
+        with self.assertRaises(TypeError) as context:
+            relation_add(domain, None, 1, Id(domain))
+
+        self.assertEqual(str(context.exception), f'The passed head is not a valid instance of'
+                                                 f' pyitt.native.{Id.__name__} type.')
+
+    def test_relation_add_with_invalid_tail_object(self):
+        domain = Domain('my domain')
+
+        with self.assertRaises(TypeError) as context:
+            relation_add(domain, Id(domain), 1, None)
+
+        self.assertEqual(str(context.exception), f'The passed tail is not a valid instance of'
+                                                 f' pyitt.native.{Id.__name__} type.')
+
+    def test_relation_add_with_invalid_relation(self):
+        domain = Domain('my domain')
+
+        with self.assertRaises(ValueError) as context:
+            relation_add(domain, Id(domain), 8, Id(domain))
+
+        self.assertEqual(str(context.exception), 'The passed relation 8 is not a valid relation.')
+
+    def test_relation_add_for_tasks(self):
+        domain = Domain('my domain')
+        producer_id = Id(domain)
+        consumer_id = Id(domain)
+
+        task_begin_overlapped(domain, StringHandle('producer'), producer_id)
+        task_begin_overlapped(domain, StringHandle('consumer'), consumer_id)
+        relation_add(domain, consumer_id, 1, producer_id)
+        task_end_overlapped(domain, producer_id)
+        task_end_overlapped(domain, consumer_id)
+
+
+class RelationAddToCurrentTests(TestCase):
+    def test_relation_add_to_current_with_invalid_relation(self):
+        domain = Domain('my domain')
+
+        with self.assertRaises(ValueError) as context:
+            relation_add_to_current(domain, 0, Id(domain))
+
+        self.assertEqual(str(context.exception), 'The passed relation 0 is not a valid relation.')
+
+    def test_relation_add_to_current_with_invalid_tail_object(self):
+        with self.assertRaises(TypeError) as context:
+            relation_add_to_current(Domain('my domain'), 1, None)
+
+        self.assertEqual(str(context.exception), f'The passed tail is not a valid instance of'
+                                                 f' pyitt.native.{Id.__name__} type.')
+
+    def test_relation_add_to_current_for_task(self):
+        domain = Domain('my domain')
+        task_id = Id(domain)
+
+        task_begin_overlapped(domain, StringHandle('my task'), task_id)
+        relation_add_to_current(domain, 5, Id(domain))
+        task_end_overlapped(domain, task_id)
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
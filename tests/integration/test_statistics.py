@@ -0,0 +1,111 @@
+from threading import Thread
+from unittest import main as unittest_main, TestCase
+
+from pyitt.native import Domain, Event, Id, StringHandle
+from pyitt.native import frame_begin, frame_end
+from pyitt.native import stats_disable, stats_enable, stats_is_active, stats_reset, stats_snapshot
+from pyitt.native import task_begin, task_end, task_begin_overlapped, task_end_overlapped
+
+
+class StatisticsTests(TestCase):
+    def tearDown(self):
+        stats_disable()
+        stats_reset()
+
+    def test_stats_enable_and_disable(self):
+        stats_enable()
+        self.assertTrue(stats_is_active())
+
+        stats_disable()
+        self.assertFalse(stats_is_active())
+
+    def test_stats_for_tasks(self):
+        domain = Domain('my domain')
+        name = StringHandle('my stats task')
+
+        stats_enable()
+        for _ in range(10):
+            task_begin(domain, name)
+            task_end(domain)
+        stats_disable()
+
+        task_begin(domain, name)
+        task_end(domain)
+
+        count, total, p50, p90, p99, maximum = stats_snapshot()['my stats task']
+        self.assertEqual(count, 10)
+        self.assertLessEqual(maximum, total)
+        self.assertLessEqual(p50, p90)
+        self.assertLessEqual(p90, p99)
+        self.assertLessEqual(p99, maximum)
+
+    def test_stats_for_nested_tasks(self):
+        domain = Domain('my domain')
+
+        stats_enable()
+        task_begin(domain, StringHandle('my outer task'))
+        task_begin(domain, StringHandle('my inner task'))
+        task_end(domain)
+        task_end(domain)
+
+        stats = stats_snapshot()
+        self.assertEqual(stats['my outer task'][0], 1)
+        self.assertEqual(stats['my inner task'][0], 1)
+        self.assertLessEqual(stats['my inner task'][1], stats['my outer task'][1])
+
+    def test_stats_for_overlapped_task_ended_in_another_thread(self):
+        domain = Domain('my domain')
+        task_id = Id(domain)
+
+        stats_enable()
+        task_begin_overlapped(domain, StringHandle('my overlapped task'), task_id)
+        thread = Thread(target=task_end_overlapped, args=(domain, task_id))
+        thread.start()
+        thread.join()
+
+        self.assertEqual(stats_snapshot()['my overlapped task'][0], 1)
+
+    def test_stats_for_frames_and_events(self):
+        domain = Domain('my frame domain')
+        event = Event('my stats event')
+
+        stats_enable()
+        frame_begin(domain)
+        event.begin()
+        event.end()
+        frame_end(domain)
+
+        stats = stats_snapshot()
+        self.assertEqual(stats['my frame domain'][0], 1)
+        self.assertEqual(stats['my stats event'][0], 1)
+
+    def test_stats_merges_threads(self):
+        def run_tasks():
+            domain = Domain('my domain')
+            name = StringHandle('my threaded task')
+            for _ in range(100):
+                task_begin(domain, name)
+                task_end(domain)
+
+        stats_enable()
+        threads = [Thread(target=run_tasks) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(stats_snapshot()['my threaded task'][0], 400)
+
+    def test_stats_reset(self):
+        domain = Domain('my domain')
+
+        stats_enable()
+        task_begin(domain, StringHandle('my reset task'))
+        task_end(domain)
+        stats_reset()
+
+        self.assertNotIn('my reset task', stats_snapshot())
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
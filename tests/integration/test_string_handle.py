@@ -59,6 +59,26 @@ class StringHandleTests(TestCase):
 
         self.assertEqual(str(context.exception), exception_str)
 
+    def test_string_handle_create_many(self):
+        str_handles = StringHandle.create_many(['my first str', 'my second str'])
+
+        self.assertEqual([str(str_handle) for str_handle in str_handles], ['my first str', 'my second str'])
+        self.assertIs(StringHandle.create_many(('my first str',))[0], str_handles[0])
+        self.assertIs(StringHandle._from_string('my second str'), str_handles[1])  # pylint: disable=W0212
+        self.assertEqual(str(StringHandle('my first str')), 'my first str')
+
+    def test_string_handle_create_many_with_non_string(self):
+        with self.assertRaises(TypeError) as context:
+            StringHandle.create_many(['my str', None])
+
+        self.assertEqual(str(context.exception), 'The passed string is not a valid instance of str type.')
+
+    def test_string_handle_create_many_with_non_sequence(self):
+        with self.assertRaises(TypeError) as context:
+            StringHandle.create_many(None)
+
+        self.assertEqual(str(context.exception), 'The passed strings are not a sequence.')
+
 
 if __name__ == '__main__':
     unittest_main()  # pragma: no cover
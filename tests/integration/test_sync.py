@@ -0,0 +1,66 @@
+from unittest import main as unittest_main, TestCase
+
+from pyitt.native import StringHandle, SyncObject
+
+
+class SyncObjectTests(TestCase):
+    def test_sync_object_creation(self):
+        sync_object = SyncObject('my lock')
+        self.assertEqual(sync_object.name, 'my lock')
+        self.assertEqual(sync_object.type, 'Lock')
+        self.assertEqual(str(sync_object), 'my lock')
+        self.assertEqual(repr(sync_object), f"pyitt.native.{SyncObject.__name__}('my lock', 'Lock')")
+
+    def test_sync_object_creation_with_string_handle_and_type(self):
+        sync_object = SyncObject(StringHandle('my semaphore'), 'Semaphore')
+        self.assertEqual(sync_object.name, 'my semaphore')
+        self.assertEqual(sync_object.type, 'Semaphore')
+
+    def test_sync_object_creation_with_invalid_arguments(self):
+        with self.assertRaises(TypeError):
+            SyncObject(None)
+
+        with self.assertRaises(TypeError):
+            SyncObject('my lock', 1)
+
+    def test_sync_object_markup(self):
+        sync_object = SyncObject('my lock')
+        self.assertIsNone(sync_object.prepare())
+        self.assertIsNone(sync_object.acquired())
+        self.assertIsNone(sync_object.releasing())
+        self.assertIsNone(sync_object.prepare())
+        self.assertIsNone(sync_object.cancel())
+
+    def test_sync_object_acquire_and_release(self):
+        calls = []
+
+        def acquire(*args):
+            calls.append(('acquire', args))
+            return args[0]
+
+        def release(*args):
+            calls.append(('release', args))
+
+        sync_object = SyncObject('my lock')
+        self.assertTrue(sync_object.acquire(acquire, True, -1))
+        self.assertFalse(sync_object.acquire(acquire, False))
+        self.assertIsNone(sync_object.release(release))
+        self.assertEqual(calls, [('acquire', (True, -1)), ('acquire', (False,)), ('release', ())])
+
+    def test_sync_object_acquire_with_exception(self):
+        def acquire():
+            raise KeyboardInterrupt()
+
+        with self.assertRaises(KeyboardInterrupt):
+            SyncObject('my lock').acquire(acquire)
+
+    def test_sync_object_acquire_with_invalid_function(self):
+        with self.assertRaises(TypeError):
+            SyncObject('my lock').acquire()
+
+        with self.assertRaises(TypeError):
+            SyncObject('my lock').release(None)
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
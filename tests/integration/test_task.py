@@ -1,7 +1,12 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import Context
 from unittest import main as unittest_main, TestCase
 
-from pyitt.native import Domain, StringHandle, Id
+from pyitt.native import ClockDomain, Domain, StringHandle, Id, TaskFactory
 from pyitt.native import task_begin, task_end, task_begin_overlapped, task_end_overlapped
+from pyitt.native import task_begin_ex, task_end_ex, task_begin_overlapped_ex, task_end_overlapped_ex
+from pyitt.native import current_task, get_timestamp, task_stack
 
 
 class TaskBeginTests(TestCase):
@@ -193,5 +198,393 @@ class TaskEndOverlappedTests(TestCase):
         self.assertIsNone(task_end_overlapped(domain, task_id))
 
 
+class TaskTimestampTests(TestCase):
+    def test_task_with_timestamps(self):
+        domain = Domain('my domain')
+        name = StringHandle('my task')
+        begin = get_timestamp()
+
+        self.assertIsNone(task_begin_ex(domain, None, begin, name))
+        self.assertIsNone(task_end_ex(domain, None, begin + 1))
+
+    def test_task_with_clock_domain(self):
+        domain = Domain('my domain')
+        clock_domain = ClockDomain(1000)
+        task_id = Id(domain)
+        parent_id = Id(domain)
+
+        self.assertIsNone(task_begin_ex(domain, clock_domain, 10, StringHandle('my task'), task_id, parent_id))
+        self.assertIsNone(task_end_ex(domain, clock_domain, 20))
+
+    def test_overlapped_task_with_clock_domain(self):
+        domain = Domain('my domain')
+        clock_domain = ClockDomain(1000)
+        task_id = Id(domain)
+
+        self.assertIsNone(task_begin_overlapped_ex(domain, clock_domain, 10, StringHandle('my task'), task_id))
+        self.assertIsNone(task_end_overlapped_ex(domain, clock_domain, 20, task_id))
+
+    def test_task_with_invalid_clock_domain_object(self):
+        domain = Domain('my domain')
+
+        with self.assertRaises(TypeError) as context:
+            task_begin_ex(domain, 42, 10, StringHandle('my task'))
+
+        self.assertEqual(str(context.exception), f'The passed clock_domain is not a valid instance of'
+                                                 f' pyitt.native.{ClockDomain.__name__} type.')
+
+        with self.assertRaises(TypeError) as context:
+            task_end_overlapped_ex(domain, 42, 20, Id(domain))
+
+        self.assertEqual(str(context.exception), f'The passed clock_domain is not a valid instance of'
+                                                 f' pyitt.native.{ClockDomain.__name__} type.')
+
+    def test_task_with_invalid_arguments(self):
+        domain = Domain('my domain')
+
+        with self.assertRaises(TypeError) as context:
+            task_begin_ex(None, None, 10, StringHandle('my task'))
+
+        self.assertEqual(str(context.exception), f'The passed domain is not a valid instance of'
+                                                 f' pyitt.native.{Domain.__name__} type.')
+
+        with self.assertRaises(TypeError) as context:
+            task_begin_overlapped_ex(domain, None, 10, StringHandle('my task'), None)
+
+        self.assertEqual(str(context.exception), f'The passed id is not a valid instance of'
+                                                 f' pyitt.native.{Id.__name__} type.')
+
+
+def run_in_new_thread(func, *args):
+    """Runs the function in a new thread, so the tasks of other tests are not on the stack."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(func, *args).result()
+
+
+class TaskStackTests(TestCase):
+    def test_task_stack_for_nested_tasks(self):
+        domain = Domain('my domain')
+        task_id = Id(domain)
+
+        def run_tasks():
+            states = [current_task()]
+
+            task_begin(domain, StringHandle('my outer task'))
+            task_begin(domain, StringHandle('my inner task'), task_id)
+            states.extend((task_stack(), current_task()))
+
+            task_end(domain)
+            states.append(current_task())
+
+            task_end(domain)
+            states.extend((current_task(), task_stack()))
+            return states
+
+        self.assertEqual(run_in_new_thread(run_tasks), [
+            None,
+            (('my outer task', 'my domain', None, None, False), ('my inner task', 'my domain', task_id, None, False)),
+            ('my inner task', 'my domain', task_id, None, False),
+            ('my outer task', 'my domain', None, None, False),
+            None,
+            (),
+        ])
+
+    def test_task_stack_for_overlapped_tasks_is_bound_to_context(self):
+        domain = Domain('my domain')
+        task_id = Id(domain)
+        context = Context()
+
+        def begin_task():
+            task_begin_overlapped(domain, StringHandle('my overlapped task'), task_id)
+            return current_task()
+
+        def run_tasks():
+            states = [context.run(begin_task), current_task()]
+
+            context.run(task_end_overlapped, domain, task_id)
+            states.append(context.run(current_task))
+            return states
+
+        self.assertEqual(run_in_new_thread(run_tasks),
+                         [('my overlapped task', 'my domain', task_id, None, True), None, None])
+
+    def test_task_stack_for_overlapped_task_ended_in_another_context(self):
+        domain = Domain('my domain')
+        task_id = Id(domain)
+        context = Context()
+
+        def run_tasks():
+            context.run(task_begin_overlapped, domain, StringHandle('my overlapped task'), task_id)
+            Context().run(task_end_overlapped, domain, task_id)
+            return context.run(current_task), context.run(task_stack)
+
+        self.assertEqual(run_in_new_thread(run_tasks), (None, ()))
+
+    def test_task_stack_for_overlapped_task_ended_out_of_order(self):
+        domain = Domain('my domain')
+        task_ids = [Id(domain) for _ in range(3)]
+
+        def run_tasks():
+            for index, task_id in enumerate(task_ids):
+                task_begin_overlapped(domain, StringHandle(f'my task {index}'), task_id)
+
+            task_end_overlapped(domain, task_ids[1])
+            states = [[info[0] for info in task_stack()]]
+
+            task_end_overlapped(domain, task_ids[2])
+            states.append([info[0] for info in task_stack()])
+
+            task_end_overlapped(domain, task_ids[0])
+            states.append(task_stack())
+            return states
+
+        self.assertEqual(run_in_new_thread(Context().run, run_tasks),
+                         [['my task 0', 'my task 2'], ['my task 0'], ()])
+
+    def test_task_stack_for_overlapped_tasks_with_same_id(self):
+        domain = Domain('my domain')
+        task_id = Id(domain)
+        contexts = (Context(), Context())
+
+        def run_tasks():
+            for context in contexts:
+                context.run(task_begin_overlapped, domain, StringHandle('my overlapped task'), task_id)
+
+            contexts[0].run(task_end_overlapped, domain, task_id)
+            states = [context.run(current_task) for context in contexts]
+
+            contexts[1].run(task_end_overlapped, domain, task_id)
+            states.extend(context.run(current_task) for context in contexts)
+            return states
+
+        self.assertEqual(run_in_new_thread(run_tasks),
+                         [None, ('my overlapped task', 'my domain', task_id, None, True), None, None])
+
+    def test_task_stack_for_mixed_tasks(self):
+        domain = Domain('my domain')
+        task_id = Id(domain)
+
+        def run_tasks():
+            task_begin(domain, StringHandle('my outer task'))
+            task_begin_overlapped(domain, StringHandle('my overlapped task'), task_id)
+            task_begin(domain, StringHandle('my inner task'))
+
+            stack = task_stack()
+
+            task_end(domain)
+            task_end_overlapped(domain, task_id)
+            task_end(domain)
+
+            return [info[0] for info in stack]
+
+        self.assertEqual(run_in_new_thread(Context().run, run_tasks),
+                         ['my outer task', 'my overlapped task', 'my inner task'])
+
+    def test_task_stack_is_inherited_by_asyncio_tasks(self):
+        domain = Domain('my domain')
+        task_id = Id(domain)
+
+        async def child():
+            return current_task()
+
+        async def parent():
+            task_begin_overlapped(domain, StringHandle('my parent task'), task_id)
+            try:
+                return await asyncio.create_task(child())
+            finally:
+                task_end_overlapped(domain, task_id)
+
+        self.assertEqual(run_in_new_thread(asyncio.run, parent()), ('my parent task', 'my domain', task_id, None, True))
+
+    def test_timestamped_tasks_are_tracked(self):
+        domain = Domain('my domain')
+        task_id = Id(domain)
+
+        def run_tasks():
+            task_begin(domain, StringHandle('my outer task'))
+            task_begin_ex(domain, None, get_timestamp(), StringHandle('my task'))
+            task_begin_overlapped_ex(domain, None, get_timestamp(), StringHandle('my overlapped task'), task_id)
+            states = [[info[0] for info in task_stack()]]
+
+            task_end_overlapped_ex(domain, None, get_timestamp(), task_id)
+            task_end_ex(domain, None, get_timestamp())
+            states.append(current_task()[0])
+
+            task_end(domain)
+            states.append(task_stack())
+            return states
+
+        self.assertEqual(run_in_new_thread(Context().run, run_tasks),
+                         [['my outer task', 'my task', 'my overlapped task'], 'my outer task', ()])
+
+
+class TaskParentTests(TestCase):
+    def test_overlapped_task_parent_is_enclosing_task(self):
+        domain = Domain('my domain')
+        outer_id = Id(domain)
+        overlapped_id = Id(domain)
+        inner_id = Id(domain)
+
+        def run_tasks():
+            task_begin(domain, StringHandle('my outer task'), outer_id)
+            task_begin_overlapped(domain, StringHandle('my overlapped task'), overlapped_id)
+            task_begin_overlapped(domain, StringHandle('my inner task'), inner_id)
+
+            stack = task_stack()
+
+            task_end_overlapped(domain, inner_id)
+            task_end_overlapped(domain, overlapped_id)
+            task_end(domain)
+
+            return [info[3] for info in stack]
+
+        self.assertEqual(run_in_new_thread(Context().run, run_tasks), [None, outer_id, overlapped_id])
+
+    def test_first_nested_task_parent_is_overlapped_task(self):
+        domain = Domain('my domain')
+        overlapped_id = Id(domain)
+
+        def run_tasks():
+            task_begin_overlapped(domain, StringHandle('my overlapped task'), overlapped_id)
+            task_begin(domain, StringHandle('my outer task'))
+            task_begin(domain, StringHandle('my inner task'))
+
+            stack = task_stack()
+
+            task_end(domain)
+            task_end(domain)
+            task_end_overlapped(domain, overlapped_id)
+
+            return [info[3] for info in stack]
+
+        self.assertEqual(run_in_new_thread(Context().run, run_tasks), [None, overlapped_id, None])
+
+    def test_passed_parent_is_kept(self):
+        domain = Domain('my domain')
+        overlapped_id = Id(domain)
+        parent_id = Id(domain)
+        task_id = Id(domain)
+
+        def run_tasks():
+            task_begin_overlapped(domain, StringHandle('my overlapped task'), overlapped_id)
+            task_begin_overlapped(domain, StringHandle('my task'), task_id, parent_id)
+            info = current_task()
+            task_end_overlapped(domain, task_id)
+            task_end_overlapped(domain, overlapped_id)
+            return info[3]
+
+        self.assertIs(run_in_new_thread(Context().run, run_tasks), parent_id)
+
+    def test_asyncio_task_parent_is_creating_task(self):
+        domain = Domain('my domain')
+        parent_id = Id(domain)
+        child_id = Id(domain)
+
+        async def child():
+            task_begin_overlapped(domain, StringHandle('my child task'), child_id)
+            try:
+                return current_task()[3]
+            finally:
+                task_end_overlapped(domain, child_id)
+
+        async def parent():
+            task_begin_overlapped(domain, StringHandle('my parent task'), parent_id)
+            try:
+                return await asyncio.create_task(child())
+            finally:
+                task_end_overlapped(domain, parent_id)
+
+        self.assertIs(run_in_new_thread(asyncio.run, parent()), parent_id)
+
+
+class TaskFactoryTests(TestCase):
+    def test_task_factory_creation(self):
+        domain = Domain('my domain')
+        factory = TaskFactory(domain)
+
+        self.assertIs(factory.domain, domain)
+        self.assertFalse(factory.overlapped)
+        self.assertTrue(TaskFactory(domain, overlapped=True).overlapped)
+        self.assertEqual(repr(factory), f'pyitt.native.{TaskFactory.__name__}({domain!r}, overlapped=False)')
+
+    def test_task_factory_with_invalid_domain_object(self):
+        with self.assertRaises(TypeError) as context:
+            TaskFactory('my domain')
+
+        self.assertEqual(str(context.exception), f'The passed domain is not a valid instance of'
+                                                 f' pyitt.native.{Domain.__name__} type.')
+
+    def test_task_factory_with_invalid_name_object(self):
+        with self.assertRaises(TypeError) as context:
+            TaskFactory(Domain('my domain'))(42)
+
+        self.assertEqual(str(context.exception), f'The passed name is not a valid instance of str or'
+                                                 f' pyitt.native.{StringHandle.__name__}.')
+
+    def test_nested_tasks_are_reused(self):
+        domain = Domain('my domain')
+        factory = TaskFactory(domain)
+        name = StringHandle('my string handle task')
+
+        task = factory('my task')
+
+        self.assertIs(factory('my task'), task)
+        self.assertIs(factory(name), factory(name))
+        self.assertIs(task.domain, domain)
+        self.assertEqual(str(task.name), 'my task')
+        self.assertIs(factory(name).name, name)
+        self.assertIsNone(task.id)
+
+    def test_overlapped_tasks_have_new_ids(self):
+        domain = Domain('my domain')
+        factory = TaskFactory(domain, overlapped=True)
+
+        first_task = factory('my task')
+        second_task = factory('my task')
+
+        self.assertIsNot(first_task, second_task)
+        self.assertIs(first_task.name, second_task.name)
+        self.assertIsInstance(first_task.id, Id)
+        self.assertNotEqual(first_task.id, second_task.id)
+
+    def test_factory_tasks_are_tracked(self):
+        domain = Domain('my domain')
+        nested_factory = TaskFactory(domain)
+        overlapped_factory = TaskFactory(domain, overlapped=True)
+
+        def run_tasks():
+            overlapped_task = overlapped_factory('my overlapped task')
+            with overlapped_task:
+                with nested_factory('my nested task') as nested_task:
+                    states = [current_task()]
+                states.append(current_task())
+            states.append(current_task())
+            return states, nested_task, overlapped_task
+
+        states, nested_task, overlapped_task = run_in_new_thread(Context().run, run_tasks)
+        self.assertEqual(states, [
+            ('my nested task', 'my domain', None, overlapped_task.id, False),
+            ('my overlapped task', 'my domain', overlapped_task.id, None, True),
+            None,
+        ])
+        self.assertIsNone(nested_task.id)
+
+    def test_factory_task_begin_and_end(self):
+        factory = TaskFactory(Domain('my domain'))
+
+        def run_task():
+            task = factory('my task')
+            task.begin()
+            info = current_task()
+            task.end()
+            return info, current_task()
+
+        self.assertEqual(run_in_new_thread(run_task), (('my task', 'my domain', None, None, False), None))
+
+    def test_factory_task_creation_is_not_allowed(self):
+        with self.assertRaises(TypeError):
+            type(TaskFactory(Domain('my domain'))('my task'))()
+
+
 if __name__ == '__main__':
     unittest_main()  # pragma: no cover
@@ -8,22 +8,73 @@ class PyittNativeMock(_ModuleType):
     def __init__(self):
         super().__init__(PYITT_NATIVE_MODULE_NAME)
         self.attrs = {
+            'after_fork_in_child': _Mock(),
+            'clock_domain_reset': _Mock(),
+            'current_task': _Mock(),
+            'collection_region_begin': _Mock(),
+            'collection_region_end': _Mock(),
+            'collection_schedule_is_active': _Mock(),
+            'collection_schedule_start': _Mock(),
+            'collection_schedule_stop': _Mock(),
             'detach': _Mock(),
+            'domain_set_allowlist': _Mock(),
+            'domain_set_enabled': _Mock(),
             'pause': _Mock(),
             'resume': _Mock(),
             'frame_begin': _Mock(),
             'frame_end': _Mock(),
+            'frame_submit': _Mock(),
+            'frame_submit_many': _Mock(),
+            'gauge_source_sample': _Mock(),
+            'gauge_source_start': _Mock(),
+            'gauge_source_stop': _Mock(),
+            'get_timestamp': _Mock(),
+            'heap_tracking_disable': _Mock(),
+            'heap_tracking_enable': _Mock(),
+            'heap_tracking_is_active': _Mock(),
+            'jit_is_profiling_active': _Mock(),
+            'jit_register_code': _Mock(),
+            'jit_set_auto_registration': _Mock(),
+            'manifest_recording_disable': _Mock(),
+            'manifest_recording_enable': _Mock(),
+            'manifest_snapshot': _Mock(),
+            'marker': _Mock(),
+            'metadata_add': _Mock(),
+            'recorder_clear': _Mock(),
+            'recorder_disable': _Mock(),
+            'recorder_enable': _Mock(),
+            'recorder_is_active': _Mock(),
+            'recorder_snapshot': _Mock(),
+            'stats_disable': _Mock(),
+            'stats_enable': _Mock(),
+            'stats_is_active': _Mock(),
+            'stats_reset': _Mock(),
+            'stats_snapshot': _Mock(),
+            'relation_add': _Mock(),
+            'relation_add_to_current': _Mock(),
             'task_begin': _Mock(),
             'task_end': _Mock(),
             'task_begin_overlapped': _Mock(),
             'task_end_overlapped': _Mock(),
+            'task_begin_ex': _Mock(),
+            'task_end_ex': _Mock(),
+            'task_begin_overlapped_ex': _Mock(),
+            'task_end_overlapped_ex': _Mock(),
+            'task_stack': _Mock(),
             'thread_set_name': _Mock(),
+            'ClockDomain': _Mock(),
             'Counter': _Mock(),
+            'CountWindowActivator': _Mock(),
+            'LatencyTriggeredActivator': _Mock(),
+            'ProbabilisticActivator': _Mock(),
             'Domain': _Mock(),
             'Event': _Mock(),
+            'Histogram': _Mock(),
             'Id': _Mock(),
             'PTRegion': _Mock(),
             'StringHandle': _Mock(),
+            'SyncObject': _Mock(),
+            'TaskFactory': _Mock(),
         }
 
     def __getattr__(self, item):
@@ -0,0 +1,179 @@
+import asyncio
+from functools import partial
+from unittest import main as unittest_main, TestCase
+from unittest.mock import MagicMock, Mock
+
+from .pyitt_native_mock import patch as pyitt_native_patch
+import pyitt  # pylint: disable=C0411
+
+
+class AsyncioTests(TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        pyitt.asyncio.uninstrument_loop(self.loop)
+        self.loop.close()
+
+    @staticmethod
+    def setup_task_factory(task_factory_class_mock):
+        tasks = {}
+        task_factory = Mock()
+        task_factory.side_effect = lambda name: tasks.setdefault(name, MagicMock())
+        task_factory_class_mock.return_value = task_factory
+        return tasks
+
+    @pyitt_native_patch('Counter')
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('TaskFactory')
+    @pyitt_native_patch('frame_begin')
+    @pyitt_native_patch('frame_end')
+    def test_instrument_loop(self, counter_class_mock, domain_class_mock, task_factory_class_mock, frame_begin_mock,
+                             frame_end_mock):
+        domain = Mock()
+        domain_class_mock.return_value = domain
+        tasks = self.setup_task_factory(task_factory_class_mock)
+
+        pyitt.asyncio.instrument_loop(self.loop, domain='my loop domain')
+        self.assertTrue(pyitt.asyncio.is_instrumented(self.loop))
+        domain_class_mock.assert_called_once_with('my loop domain')
+        task_factory_class_mock.assert_called_once_with(domain, False)
+        counter_class_mock.assert_called_once_with('asyncio ready callbacks', domain)
+
+        def callback():
+            pass
+
+        self.loop.call_soon(callback)
+        self.loop.call_soon(callback)
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+
+        counter_class_mock.return_value.set.assert_called_once_with(3)
+        frame_begin_mock.assert_called_with(domain)
+        frame_end_mock.assert_called_with(domain)
+        self.assertEqual(frame_begin_mock.call_count, frame_end_mock.call_count)
+
+        callback_task = tasks[callback.__qualname__]
+        self.assertEqual(callback_task.__enter__.call_count, 2)
+        self.assertEqual(callback_task.__exit__.call_count, 2)
+        self.assertEqual(tasks['idle'].__enter__.call_count, tasks['idle'].__exit__.call_count)
+        self.assertGreater(tasks['idle'].__enter__.call_count, 0)
+
+    @pyitt_native_patch('Counter')
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('TaskFactory')
+    def test_task_step_is_named_by_coroutine(self, counter_class_mock, domain_class_mock, task_factory_class_mock):
+        counter_class_mock.return_value = Mock()
+        domain_class_mock.return_value = Mock()
+        tasks = self.setup_task_factory(task_factory_class_mock)
+
+        async def my_coroutine():
+            await asyncio.sleep(0)
+
+        pyitt.asyncio.instrument_loop(self.loop)
+        self.loop.run_until_complete(my_coroutine())
+
+        self.assertEqual(tasks[my_coroutine.__qualname__].__enter__.call_count, 2)
+
+    @pyitt_native_patch('Counter')
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('TaskFactory')
+    @pyitt_native_patch('StringHandle')
+    @pyitt_native_patch('marker')
+    def test_slow_callback_is_marked(self, counter_class_mock, domain_class_mock, task_factory_class_mock,
+                                     string_handle_class_mock, marker_mock):
+        counter_class_mock.return_value = Mock()
+        string_handle_class_mock.side_effect = lambda x: x
+        domain = Mock()
+        domain_class_mock.return_value = domain
+        self.setup_task_factory(task_factory_class_mock)
+
+        def fast_callback():
+            pass
+
+        def slow_callback():
+            pass
+
+        pyitt.asyncio.instrument_loop(self.loop, slow_callback_ms=0)
+        self.loop.call_soon(slow_callback)
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+        pyitt.asyncio.uninstrument_loop(self.loop)
+
+        marker_names = [marker_call.args[1] for marker_call in marker_mock.call_args_list]
+        self.assertIn(f'slow callback {slow_callback.__qualname__}', marker_names)
+
+        marker_mock.reset_mock()
+        pyitt.asyncio.instrument_loop(self.loop, slow_callback_ms=60000)
+        self.loop.call_soon(fast_callback)
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+
+        marker_mock.assert_not_called()
+
+    @pyitt_native_patch('Counter')
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('TaskFactory')
+    def test_instrument_loop_twice(self, counter_class_mock, domain_class_mock, task_factory_class_mock):
+        counter_class_mock.return_value = Mock()
+        domain_class_mock.return_value = Mock()
+        self.setup_task_factory(task_factory_class_mock)
+
+        pyitt.asyncio.instrument_loop(self.loop)
+        run_once = self.loop._run_once  # pylint: disable=W0212
+        pyitt.asyncio.instrument_loop(self.loop)
+
+        self.assertIs(self.loop._run_once, run_once)  # pylint: disable=W0212
+        task_factory_class_mock.assert_called_once()
+
+    @pyitt_native_patch('Counter')
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('TaskFactory')
+    def test_uninstrument_loop(self, counter_class_mock, domain_class_mock, task_factory_class_mock):
+        counter_class_mock.return_value = Mock()
+        domain_class_mock.return_value = Mock()
+        self.setup_task_factory(task_factory_class_mock)
+        handle_run = asyncio.events.Handle._run  # pylint: disable=W0212
+
+        pyitt.asyncio.instrument_loop(self.loop)
+        self.assertIn('_run_once', vars(self.loop))
+        self.assertIsNot(asyncio.events.Handle._run, handle_run)  # pylint: disable=W0212
+
+        pyitt.asyncio.uninstrument_loop(self.loop)
+        self.assertFalse(pyitt.asyncio.is_instrumented(self.loop))
+        self.assertNotIn('_run_once', vars(self.loop))
+        self.assertNotIn('close', vars(self.loop))
+        self.assertNotIn('select', vars(self.loop._selector))  # pylint: disable=W0212
+        self.assertIs(asyncio.events.Handle._run, handle_run)  # pylint: disable=W0212
+
+    @pyitt_native_patch('Counter')
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('TaskFactory')
+    def test_close_uninstruments_loop(self, counter_class_mock, domain_class_mock, task_factory_class_mock):
+        counter_class_mock.return_value = Mock()
+        domain_class_mock.return_value = Mock()
+        self.setup_task_factory(task_factory_class_mock)
+
+        pyitt.asyncio.instrument_loop(self.loop)
+        self.loop.close()
+
+        self.assertFalse(pyitt.asyncio.is_instrumented(self.loop))
+        self.assertTrue(self.loop.is_closed())
+
+    def test_instrument_loop_with_invalid_loop(self):
+        with self.assertRaises(TypeError):
+            pyitt.asyncio.instrument_loop(Mock())
+
+    def test_callback_names(self):
+        def callback(*_):
+            pass
+
+        self.assertEqual(pyitt.asyncio._get_callback_name(callback),  # pylint: disable=W0212
+                         callback.__qualname__)
+        self.assertEqual(pyitt.asyncio._get_callback_name(partial(partial(callback, 1), 2)),  # pylint: disable=W0212
+                         callback.__qualname__)
+        self.assertEqual(pyitt.asyncio._get_callback_name(Mock()), 'Mock')  # pylint: disable=W0212
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
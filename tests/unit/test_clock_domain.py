@@ -0,0 +1,33 @@
+from unittest import main as unittest_main, TestCase
+
+from .pyitt_native_mock import patch as pyitt_native_patch
+import pyitt  # pylint: disable=C0411
+
+
+class ClockDomainTests(TestCase):
+    @pyitt_native_patch('ClockDomain')
+    def test_clock_domain_with_frequency(self, clock_domain_class_mock):
+        pyitt.clock_domain(1_000_000_000)
+        clock_domain_class_mock.assert_called_once_with(1_000_000_000, 0)
+
+    @pyitt_native_patch('ClockDomain')
+    def test_clock_domain_with_frequency_and_base(self, clock_domain_class_mock):
+        pyitt.clock_domain(1000, base=42)
+        clock_domain_class_mock.assert_called_once_with(1000, 42)
+
+    @pyitt_native_patch('ClockDomain')
+    def test_clock_domain_with_function(self, clock_domain_class_mock):
+        def get_clock_info():
+            return 1000, 42
+
+        pyitt.clock_domain(get_clock_info)
+        clock_domain_class_mock.assert_called_once_with(get_clock_info, 0)
+
+    @pyitt_native_patch('clock_domain_reset')
+    def test_clock_domain_reset(self, clock_domain_reset_mock):
+        pyitt.clock_domain_reset()
+        clock_domain_reset_mock.assert_called_once_with()
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
@@ -1,4 +1,5 @@
 from unittest import main as unittest_main, TestCase
+from unittest.mock import call
 
 # pylint: disable=C0411
 from .pyitt_native_mock import patch as pyitt_native_patch
@@ -26,7 +27,7 @@ class DirectCollectionControlTests(TestCase):
 class CollectionRegionAbstractMethodsTest(TestCase):
     def test_region_abstract_method_begin(self):
         with self.assertRaises(NotImplementedError):
-            _CollectionRegion._begin(_CollectionRegion())  # pylint: disable=W0212
+            _CollectionRegion._begin(_CollectionRegion(), True)  # pylint: disable=W0212
 
     def test_region_abstract_method_end(self):
         with self.assertRaises(NotImplementedError):
@@ -34,127 +35,180 @@ class CollectionRegionAbstractMethodsTest(TestCase):
 
 
 class ActiveRegionTests(TestCase):
-    @pyitt_native_patch('pause')
-    @pyitt_native_patch('resume')
-    def test_active_region_as_decorator(self, pause_mock, resume_mock):
+    @pyitt_native_patch('collection_region_begin')
+    @pyitt_native_patch('collection_region_end')
+    def test_active_region_as_decorator(self, collection_region_begin_mock, collection_region_end_mock):
         @pyitt.active_region
         def my_function():
             return 42
 
         self.assertEqual(my_function(), 42)
-        resume_mock.assert_called_once()
-        pause_mock.assert_called_once()
+        collection_region_begin_mock.assert_called_once_with(my_function, False, True)
+        collection_region_end_mock.assert_called_once_with(my_function)
 
-    @pyitt_native_patch('pause')
-    @pyitt_native_patch('resume')
-    def test_active_region_as_context_manager(self, pause_mock, resume_mock):
-        with pyitt.active_region():
+    @pyitt_native_patch('collection_region_begin')
+    @pyitt_native_patch('collection_region_end')
+    def test_active_region_as_context_manager(self, collection_region_begin_mock, collection_region_end_mock):
+        with pyitt.active_region() as region:
             pass
 
-        resume_mock.assert_called_once()
-        pause_mock.assert_called_once()
+        collection_region_begin_mock.assert_called_once_with(region, False, True)
+        collection_region_end_mock.assert_called_once_with(region)
 
-    @pyitt_native_patch('pause')
-    @pyitt_native_patch('resume')
-    def test_active_region_with_manual_activation(self, pause_mock, resume_mock):
+    @pyitt_native_patch('collection_region_begin')
+    @pyitt_native_patch('collection_region_end')
+    def test_active_region_with_manual_activation(self, collection_region_begin_mock, collection_region_end_mock):
         region = pyitt.active_region()
 
         region.activator.deactivate()
         with region:
             pass
 
-        resume_mock.assert_not_called()
-        pause_mock.assert_not_called()
-
         region.activator.activate()
         with region:
             pass
 
-        resume_mock.assert_called_once()
-        pause_mock.assert_called_once()
+        collection_region_begin_mock.assert_has_calls([call(region, False, False), call(region, False, True)])
+        collection_region_end_mock.assert_has_calls([call(region), call(region)])
 
-    @pyitt_native_patch('pause')
-    @pyitt_native_patch('resume')
-    def test_active_region_with_custom_activator(self, pause_mock, resume_mock):
+    @pyitt_native_patch('collection_region_begin')
+    @pyitt_native_patch('collection_region_end')
+    def test_active_region_with_custom_activator(self, collection_region_begin_mock, collection_region_end_mock):
         for i in range(4):
             with pyitt.active_region(activator=lambda: i % 2):  # pylint: disable=W0640
                 pass
 
-        self.assertEqual(resume_mock.call_count, 2)
-        self.assertEqual(pause_mock.call_count, 2)
+        self.assertEqual([c.args[2] for c in collection_region_begin_mock.call_args_list], [False, True, False, True])
+        self.assertEqual(collection_region_end_mock.call_count, 4)
 
-    @pyitt_native_patch('pause')
-    @pyitt_native_patch('resume')
-    def test_active_region_as_decorator_without_activator(self, pause_mock, resume_mock):
+    @pyitt_native_patch('collection_region_begin')
+    @pyitt_native_patch('collection_region_end')
+    def test_active_region_as_decorator_without_activator(self, collection_region_begin_mock,
+                                                          collection_region_end_mock):
         @pyitt.active_region(activator=None)
         def my_function():
             return 42
 
         self.assertEqual(my_function(), 42)
-        resume_mock.assert_called_once()
-        pause_mock.assert_called_once()
+        collection_region_begin_mock.assert_called_once_with(my_function, False, True)
+        collection_region_end_mock.assert_called_once_with(my_function)
+
+    @pyitt_native_patch('collection_region_begin')
+    @pyitt_native_patch('collection_region_end')
+    def test_active_region_with_completable_activator(self, collection_region_begin_mock, collection_region_end_mock):
+        calls = []
+
+        class CompletableActivator:
+            def __call__(self):
+                calls.append('call')
+                return len(calls) > 2
+
+            def complete(self):
+                calls.append('complete')
+
+        region = pyitt.active_region(activator=CompletableActivator())
+        for _ in range(2):
+            with region:
+                pass
+
+        self.assertEqual(calls, ['call', 'complete', 'call', 'complete'])
+        collection_region_begin_mock.assert_has_calls([call(region, False, False), call(region, False, True)])
+        self.assertEqual(collection_region_end_mock.call_count, 2)
 
 
 class PausedRegionTests(TestCase):
-    @pyitt_native_patch('pause')
-    @pyitt_native_patch('resume')
-    def test_paused_region_as_decorator(self, pause_mock, resume_mock):
+    @pyitt_native_patch('collection_region_begin')
+    @pyitt_native_patch('collection_region_end')
+    def test_paused_region_as_decorator(self, collection_region_begin_mock, collection_region_end_mock):
         @pyitt.paused_region
         def my_function():
             return 42
 
         self.assertEqual(my_function(), 42)
-        resume_mock.assert_called_once()
-        pause_mock.assert_called_once()
+        collection_region_begin_mock.assert_called_once_with(my_function, True, True)
+        collection_region_end_mock.assert_called_once_with(my_function)
 
-    @pyitt_native_patch('pause')
-    @pyitt_native_patch('resume')
-    def test_paused_region_as_context_manager(self, pause_mock, resume_mock):
-        with pyitt.paused_region():
+    @pyitt_native_patch('collection_region_begin')
+    @pyitt_native_patch('collection_region_end')
+    def test_paused_region_as_context_manager(self, collection_region_begin_mock, collection_region_end_mock):
+        with pyitt.paused_region() as region:
             pass
 
-        resume_mock.assert_called_once()
-        pause_mock.assert_called_once()
+        collection_region_begin_mock.assert_called_once_with(region, True, True)
+        collection_region_end_mock.assert_called_once_with(region)
 
-    @pyitt_native_patch('pause')
-    @pyitt_native_patch('resume')
-    def test_paused_region_with_manual_activation(self, pause_mock, resume_mock):
+    @pyitt_native_patch('collection_region_begin')
+    @pyitt_native_patch('collection_region_end')
+    def test_paused_region_with_manual_activation(self, collection_region_begin_mock, collection_region_end_mock):
         region = pyitt.paused_region()
 
         region.activator.deactivate()
         with region:
             pass
 
-        resume_mock.assert_not_called()
-        pause_mock.assert_not_called()
-
         region.activator.activate()
         with region:
             pass
 
-        resume_mock.assert_called_once()
-        pause_mock.assert_called_once()
+        collection_region_begin_mock.assert_has_calls([call(region, True, False), call(region, True, True)])
+        collection_region_end_mock.assert_has_calls([call(region), call(region)])
 
-    @pyitt_native_patch('pause')
-    @pyitt_native_patch('resume')
-    def test_paused_region_with_custom_activator(self, pause_mock, resume_mock):
+    @pyitt_native_patch('collection_region_begin')
+    @pyitt_native_patch('collection_region_end')
+    def test_paused_region_with_custom_activator(self, collection_region_begin_mock, collection_region_end_mock):
         for i in range(4):
             with pyitt.paused_region(activator=lambda: i % 2):  # pylint: disable=W0640
                 pass
 
-        self.assertEqual(resume_mock.call_count, 2)
-        self.assertEqual(pause_mock.call_count, 2)
+        self.assertEqual([c.args[2] for c in collection_region_begin_mock.call_args_list], [False, True, False, True])
+        self.assertEqual(collection_region_end_mock.call_count, 4)
 
-    @pyitt_native_patch('pause')
-    @pyitt_native_patch('resume')
-    def test_paused_region_as_decorator_without_activator(self, pause_mock, resume_mock):
+    @pyitt_native_patch('collection_region_begin')
+    @pyitt_native_patch('collection_region_end')
+    def test_paused_region_as_decorator_without_activator(self, collection_region_begin_mock,
+                                                          collection_region_end_mock):
         @pyitt.paused_region(activator=None)
         def my_function():
             return 42
 
         self.assertEqual(my_function(), 42)
-        resume_mock.assert_called_once()
-        pause_mock.assert_called_once()
+        collection_region_begin_mock.assert_called_once_with(my_function, True, True)
+        collection_region_end_mock.assert_called_once_with(my_function)
+
+
+class CollectionScheduleTests(TestCase):
+    @pyitt_native_patch('collection_schedule_start')
+    def test_collection_schedule(self, collection_schedule_start_mock):
+        pyitt.collection_schedule(100, 900)
+        collection_schedule_start_mock.assert_called_once_with(100, 900, 0, 0)
+
+    @pyitt_native_patch('collection_schedule_start')
+    def test_collection_schedule_with_delay(self, collection_schedule_start_mock):
+        pyitt.collection_schedule(100, 900, delay_ms=5000)
+        collection_schedule_start_mock.assert_called_once_with(100, 900, 0, 5000)
+
+    @pyitt_native_patch('collection_schedule_start')
+    def test_collect_windows(self, collection_schedule_start_mock):
+        pyitt.collect_windows(3, 100, 900)
+        collection_schedule_start_mock.assert_called_once_with(100, 900, 3, 0)
+
+    @pyitt_native_patch('collection_schedule_start')
+    def test_collect_windows_with_invalid_count(self, collection_schedule_start_mock):
+        with self.assertRaises(ValueError) as context:
+            pyitt.collect_windows(0, 100, 900)
+
+        self.assertEqual(str(context.exception), 'The number of collection windows must be greater than zero.')
+        collection_schedule_start_mock.assert_not_called()
+
+    @pyitt_native_patch('collection_schedule_stop')
+    def test_collection_schedule_stop(self, collection_schedule_stop_mock):
+        pyitt.collection_schedule_stop()
+        collection_schedule_stop_mock.assert_called_once_with()
+
+    @pyitt_native_patch('collection_schedule_is_active')
+    def test_collection_schedule_is_active(self, collection_schedule_is_active_mock):
+        collection_schedule_is_active_mock.return_value = True
+        self.assertTrue(pyitt.collection_schedule_is_active())
 
 
 if __name__ == '__main__':
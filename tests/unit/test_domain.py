@@ -2,6 +2,7 @@ from unittest import main as unittest_main, TestCase
 
 from .pyitt_native_mock import patch as pyitt_native_patch
 import pyitt  # pylint: disable=C0411
+from pyitt.domain import _get_allowlist  # pylint: disable=C0411
 
 
 class DomainTests(TestCase):
@@ -28,5 +29,20 @@ class DomainTests(TestCase):
         domain_class_mock.assert_called_once_with(name)
 
 
+class DomainEnablingTests(TestCase):
+    @pyitt_native_patch('domain_set_enabled')
+    def test_set_domain_enabled(self, set_enabled_mock):
+        pyitt.set_domain_enabled('my domain', False)
+        set_enabled_mock.assert_called_once_with('my domain', False)
+
+    def test_allowlist_from_environment_variable(self):
+        self.assertEqual(_get_allowlist('net, db,,io '), ('net', 'db', 'io'))
+
+    def test_allowlist_without_environment_variable(self):
+        self.assertIsNone(_get_allowlist(None))
+        self.assertIsNone(_get_allowlist(''))
+        self.assertIsNone(_get_allowlist(' , '))
+
+
 if __name__ == '__main__':
     unittest_main()  # pragma: no cover
@@ -0,0 +1,72 @@
+from multiprocessing import Process
+from os import environ
+from unittest import main as unittest_main, TestCase
+from unittest.mock import patch
+
+from .pyitt_native_mock import patch as pyitt_native_patch
+import pyitt  # pylint: disable=C0411
+
+# pylint: disable=W0212
+
+
+class ForkTests(TestCase):
+    def tearDown(self):
+        pyitt.fork.name_child_processes(False)
+
+    @pyitt_native_patch('thread_set_name')
+    def test_reinitialize_in_child(self, thread_set_name_mock):
+        pyitt.fork._reinitialize_in_child()
+
+        thread_set_name_mock.assert_not_called()
+
+    @pyitt_native_patch('thread_set_name')
+    def test_reinitialize_in_child_with_naming(self, thread_set_name_mock):
+        pyitt.fork.name_child_processes()
+
+        with patch('pyitt.fork._os.getpid', return_value=42):
+            pyitt.fork._reinitialize_in_child()
+
+        thread_set_name_mock.assert_called_once_with('MainThread (42)')
+
+    @pyitt_native_patch('thread_set_name')
+    def test_reinitialize_in_multiprocessing_child(self, thread_set_name_mock):
+        pyitt.fork.name_child_processes()
+
+        pyitt.fork._starting_process.active = True
+        with patch.dict(environ, {'PYITT_NAME_CHILD_PROCESSES': '1'}):
+            pyitt.fork._reinitialize_in_child()
+            self.assertNotIn('PYITT_NAME_CHILD_PROCESSES', environ)
+
+        self.assertFalse(pyitt.fork._starting_process.active)
+        thread_set_name_mock.assert_not_called()
+
+    @pyitt_native_patch('thread_set_name')
+    def test_name_multiprocessing_child_process(self, thread_set_name_mock):
+        pyitt.fork.name_child_processes()
+        pyitt.fork._name_started_process(None)
+
+        thread_set_name_mock.assert_called_once_with('MainProcess')
+
+    def test_name_child_processes_does_not_set_environment_variable(self):
+        pyitt.fork.name_child_processes()
+        self.assertNotIn('PYITT_NAME_CHILD_PROCESSES', environ)
+
+    def test_environment_variable_is_set_while_process_is_started(self):
+        values = []
+
+        def start(_):
+            values.append(environ.get('PYITT_NAME_CHILD_PROCESSES'))
+
+        with patch('pyitt.fork._original_process_start', start):
+            pyitt.fork.name_child_processes()
+            Process().start()
+
+            pyitt.fork.name_child_processes(False)
+            Process().start()
+
+        self.assertEqual(values, ['1', None])
+        self.assertNotIn('PYITT_NAME_CHILD_PROCESSES', environ)
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
@@ -1,3 +1,4 @@
+from array import array
 from unittest import main as unittest_main, TestCase
 from unittest.mock import call, Mock
 
@@ -339,5 +340,50 @@ class FrameExecutionTests(TestCase):
         frame_end_mock.assert_has_calls(expected_calls)
 
 
+class FrameSubmitTests(TestCase):
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('frame_submit')
+    def test_frame_submit(self, domain_class_mock, frame_submit_mock):
+        pyitt.frame_submit('my domain', 10, 20)
+
+        domain_class_mock.assert_called_once_with('my domain')
+        frame_submit_mock.assert_called_once_with(domain_class_mock.return_value, 10, 20, None)
+
+    @pyitt_native_patch('frame_submit')
+    def test_frame_submit_with_domain_object_and_id(self, frame_submit_mock):
+        domain = Mock()
+        frame_id = Mock()
+        pyitt.frame_submit(domain, 10, 20, frame_id)
+
+        frame_submit_mock.assert_called_once_with(domain, 10, 20, frame_id)
+
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('frame_submit_many')
+    def test_frame_submit_many_for_lists(self, domain_class_mock, frame_submit_many_mock):
+        frame_submit_many_mock.return_value = 2
+
+        self.assertEqual(pyitt.frame_submit_many(None, [1, 3], (2, 4)), 2)
+
+        domain_class_mock.assert_called_once_with(None)
+        domain, begins, ends = frame_submit_many_mock.call_args.args
+        self.assertIs(domain, domain_class_mock.return_value)
+        self.assertEqual(begins, array('Q', [1, 3]))
+        self.assertEqual(ends, array('Q', [2, 4]))
+
+    @pyitt_native_patch('frame_submit_many')
+    def test_frame_submit_many_for_buffers(self, frame_submit_many_mock):
+        domain = Mock()
+        begins = array('q', [1, 3])
+        ends = array('q', [2, 4])
+        pyitt.frame_submit_many(domain, begins, ends)
+
+        frame_submit_many_mock.assert_called_once_with(domain, begins, ends)
+
+    @pyitt_native_patch('get_timestamp')
+    def test_get_timestamp(self, get_timestamp_mock):
+        get_timestamp_mock.return_value = 42
+        self.assertEqual(pyitt.get_timestamp(), 42)
+
+
 if __name__ == '__main__':
     unittest_main()  # pragma: no cover
@@ -0,0 +1,176 @@
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from pickle import dumps, loads
+from threading import current_thread, Event as ThreadingEvent
+from unittest import main as unittest_main, TestCase
+from unittest.mock import call, Mock
+
+from .pyitt_native_mock import patch as pyitt_native_patch
+import pyitt  # pylint: disable=C0411
+
+
+def my_function(x):
+    return x * 2
+
+
+class InstrumentedThreadPoolExecutorTests(TestCase):
+    @pyitt_native_patch('Counter')
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('Id')
+    @pyitt_native_patch('StringHandle')
+    @pyitt_native_patch('relation_add')
+    @pyitt_native_patch('task_begin')
+    @pyitt_native_patch('task_end')
+    @pyitt_native_patch('task_begin_overlapped')
+    @pyitt_native_patch('task_end_overlapped')
+    @pyitt_native_patch('thread_set_name')
+    def test_thread_pool_executor_submit(self, counter_class_mock, domain_class_mock, id_class_mock,
+                                         string_handle_class_mock, relation_add_mock, task_begin_mock, task_end_mock,
+                                         task_begin_overlapped_mock, task_end_overlapped_mock,
+                                         thread_set_name_mock):
+        queue_depth_mock = Mock()
+        busy_workers_mock = Mock()
+        counter_class_mock.side_effect = [queue_depth_mock, busy_workers_mock]
+        domain_class_mock.return_value = 'domain_handle'
+        id_class_mock.side_effect = ['submit_id', 'queue_wait_id', 'execution_id']
+        string_handle_class_mock.side_effect = lambda x: x
+
+        with pyitt.futures.InstrumentedThreadPoolExecutor(1, 'my_pool', domain='my domain') as executor:
+            self.assertEqual(executor.submit(my_function, 21).result(), 42)
+
+        counter_class_mock.assert_has_calls([
+            call('my_pool queue depth', 'domain_handle', 0),
+            call('my_pool busy workers', 'domain_handle', 0),
+        ])
+        thread_set_name_mock.assert_called_once_with('my_pool_0')
+
+        task_begin_mock.assert_has_calls([
+            call('domain_handle', 'my_function submit', 'submit_id'),
+            call('domain_handle', 'my_function', 'execution_id', 'submit_id'),
+        ])
+        self.assertEqual(task_end_mock.call_count, 2)
+        task_begin_overlapped_mock.assert_called_once_with('domain_handle', 'my_function queue wait',
+                                                           'queue_wait_id', 'submit_id')
+        task_end_overlapped_mock.assert_called_once_with('domain_handle', 'queue_wait_id')
+        relation_add_mock.assert_called_once_with('domain_handle', 'execution_id', 4, 'queue_wait_id')
+
+        queue_depth_mock.assert_has_calls([call.inc(), call.dec()])
+        busy_workers_mock.assert_has_calls([call.inc(), call.dec()])
+
+    @pyitt_native_patch('Counter')
+    @pyitt_native_patch('task_end_overlapped')
+    def test_thread_pool_executor_cancelled_call(self, counter_class_mock, task_end_overlapped_mock):
+        queue_depth_mock = Mock()
+        counter_class_mock.side_effect = [queue_depth_mock, Mock()]
+        started = ThreadingEvent()
+        release = ThreadingEvent()
+
+        def block():
+            started.set()
+            release.wait()
+
+        with pyitt.futures.InstrumentedThreadPoolExecutor(1) as executor:
+            executor.submit(block)
+            started.wait()
+
+            future = executor.submit(my_function, 1)
+            self.assertTrue(future.cancel())
+            release.set()
+
+        self.assertEqual(task_end_overlapped_mock.call_count, 2)
+        queue_depth_mock.assert_has_calls([call.inc(), call.dec(), call.inc(), call.dec()])
+
+    @pyitt_native_patch('thread_set_name')
+    def test_thread_pool_executor_calls_initializer(self, thread_set_name_mock):
+        initializer = Mock()
+
+        with pyitt.futures.InstrumentedThreadPoolExecutor(1, initializer=initializer, initargs=(1, 2)) as executor:
+            executor.submit(my_function, 1).result()
+
+        initializer.assert_called_once_with(1, 2)
+        thread_set_name_mock.assert_called_once()
+
+
+class InstrumentExecutorTests(TestCase):
+    @pyitt_native_patch('task_begin')
+    @pyitt_native_patch('task_end')
+    def test_instrument_thread_pool_executor(self, task_begin_mock, task_end_mock):
+        with ThreadPoolExecutor(1) as executor:
+            self.assertIs(pyitt.futures.instrument_executor(executor, 'my pool'), executor)
+            self.assertEqual(executor.submit(my_function, 2).result(), 4)
+
+        self.assertEqual(task_begin_mock.call_count, 2)
+        self.assertEqual(task_end_mock.call_count, 2)
+
+    @pyitt_native_patch('Counter')
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('Id')
+    @pyitt_native_patch('task_begin_overlapped')
+    @pyitt_native_patch('task_end_overlapped')
+    def test_instrument_process_pool_executor(self, counter_class_mock, domain_class_mock, id_class_mock,
+                                              task_begin_overlapped_mock, task_end_overlapped_mock):
+        pending_calls_mock = Mock()
+        counter_class_mock.return_value = pending_calls_mock
+        domain_class_mock.return_value = Mock()
+        domain_class_mock.return_value.name = 'my domain'
+        id_class_mock.side_effect = ['submit_id', 'pending_id']
+
+        executor = ProcessPoolExecutor(1)
+        future = Future()
+        executor.submit = submit_mock = Mock(return_value=future)
+
+        pyitt.futures.instrument_executor(executor, 'my pool')
+        self.assertIs(executor.submit(my_function, 3), future)
+
+        counter_class_mock.assert_called_once_with('my pool pending calls', domain_class_mock.return_value, 0)
+        task_begin_overlapped_mock.assert_called_once()
+        pending_calls_mock.inc.assert_called_once_with()
+
+        process_call = submit_mock.call_args.args[0]
+        self.assertEqual(submit_mock.call_args.args[1:], (3,))
+        self.assertEqual(process_call.args, ('my domain', 'my_function', my_function))
+
+        future.set_result(6)
+        task_end_overlapped_mock.assert_called_once_with(domain_class_mock.return_value, 'pending_id')
+        pending_calls_mock.dec.assert_called_once_with()
+
+        executor.shutdown()
+
+    @pyitt_native_patch('thread_set_name')
+    def test_instrument_thread_pool_executor_with_worker_contexts(self, thread_set_name_mock):
+        with ThreadPoolExecutor(1) as executor:
+            # The layout of ThreadPoolExecutor in Python 3.14+, where the initializer is kept by the worker contexts.
+            # pylint: disable=W0212
+            vars(executor).pop('_initializer', None)
+            vars(executor).pop('_initargs', None)
+            context = Mock()
+            initialize_mock = context.initialize
+            executor._create_worker_context = Mock(return_value=context)
+
+            pyitt.futures.instrument_executor(executor, 'my pool')
+            executor._create_worker_context().initialize()
+
+        self.assertFalse(hasattr(executor, '_initializer'))
+        thread_set_name_mock.assert_called_once_with(current_thread().name)
+        initialize_mock.assert_called_once_with()
+
+    def test_instrument_invalid_executor(self):
+        with self.assertRaises(TypeError):
+            pyitt.futures.instrument_executor(object())
+
+
+class ProcessPoolCallTests(TestCase):
+    @pyitt_native_patch('task_begin')
+    @pyitt_native_patch('task_end')
+    def test_process_pool_call(self, task_begin_mock, task_end_mock):
+        process_call = partial(pyitt.futures._call_in_process,  # pylint: disable=W0212
+                               'my domain', 'my_function', my_function)
+        process_call = loads(dumps(process_call))
+
+        self.assertEqual(process_call(5), 10)
+        task_begin_mock.assert_called_once()
+        task_end_mock.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
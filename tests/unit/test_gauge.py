@@ -0,0 +1,101 @@
+from threading import Event
+from unittest import main as unittest_main, TestCase
+from unittest.mock import Mock
+
+from .pyitt_native_mock import patch as pyitt_native_patch
+from pyitt.gauge import read_source  # pylint: disable=C0411
+import pyitt  # pylint: disable=C0411
+
+
+class GaugeCreationTests(TestCase):
+    @pyitt_native_patch('Counter')
+    def test_gauge_with_non_positive_interval(self, counter_class_mock):
+        with self.assertRaises(ValueError):
+            pyitt.gauge('my gauge', lambda: 1, 0)
+
+        counter_class_mock.assert_not_called()
+
+    @pyitt_native_patch('Counter')
+    def test_gauge_with_invalid_source(self, counter_class_mock):
+        with self.assertRaises(TypeError):
+            pyitt.gauge('my gauge', 42)
+
+        counter_class_mock.assert_called_once_with('my gauge', None)
+
+
+class SourceGaugeTests(TestCase):
+    @pyitt_native_patch('Counter')
+    @pyitt_native_patch('gauge_source_start')
+    @pyitt_native_patch('gauge_source_stop')
+    def test_source_gauge(self, counter_class_mock, gauge_source_start_mock, gauge_source_stop_mock):
+        counter_class_mock.return_value = Mock()
+        counter_class_mock.return_value.name = 'my gauge'
+        gauge_source_start_mock.return_value = 7
+
+        with pyitt.gauge('my gauge', 'rss', 500, 'my domain') as gauge:
+            self.assertTrue(gauge.is_active)
+            self.assertEqual(gauge.name, 'my gauge')
+            self.assertEqual(gauge.interval_ms, 500)
+            self.assertEqual(repr(gauge), "_SourceGauge('my gauge', interval_ms=500)")
+
+        self.assertFalse(gauge.is_active)
+        counter_class_mock.assert_called_once_with('my gauge', 'my domain')
+        gauge_source_start_mock.assert_called_once_with('rss', counter_class_mock.return_value, 500)
+        gauge_source_stop_mock.assert_called_once_with(7)
+
+        gauge.stop()
+        gauge_source_stop_mock.assert_called_once_with(7)
+
+    @pyitt_native_patch('gauge_source_sample')
+    def test_read_source(self, gauge_source_sample_mock):
+        gauge_source_sample_mock.return_value = 4096
+
+        self.assertEqual(read_source('rss'), 4096)
+        gauge_source_sample_mock.assert_called_once_with('rss')
+
+
+class CallableGaugeTests(TestCase):
+    @pyitt_native_patch('Counter')
+    def test_callable_gauge(self, counter_class_mock):
+        counter = Mock()
+        counter_class_mock.return_value = counter
+        sampled = Event()
+        values = [None, 3]
+
+        def sample():
+            if not values:
+                sampled.set()
+            return values.pop(0) if values else None
+
+        with pyitt.gauge('my gauge', sample, 1) as gauge:
+            self.assertTrue(sampled.wait(10))
+
+        self.assertFalse(gauge.is_active)
+        self.assertIsNone(gauge.exception)
+        counter.set.assert_called_once_with(3)
+
+    @pyitt_native_patch('Counter')
+    def test_callable_gauge_is_stopped_by_exception(self, counter_class_mock):
+        counter = Mock()
+        counter_class_mock.return_value = counter
+        error = RuntimeError('my error')
+        raised = Event()
+
+        def sample():
+            raised.set()
+            raise error
+
+        gauge = pyitt.gauge('my gauge', sample, 1)
+        self.assertTrue(raised.wait(10))
+        for _ in range(1000):
+            if not gauge.is_active:
+                break
+            Event().wait(0.01)
+
+        self.assertFalse(gauge.is_active)
+        self.assertIs(gauge.exception, error)
+        counter.set.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
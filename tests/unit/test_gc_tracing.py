@@ -0,0 +1,76 @@
+import gc
+from unittest import main as unittest_main, TestCase
+from unittest.mock import call, Mock
+
+from .pyitt_native_mock import patch as pyitt_native_patch
+import pyitt  # pylint: disable=C0411
+
+
+class GcTracingTests(TestCase):
+    def setUp(self):
+        self.gc_was_enabled = gc.isenabled()
+        gc.disable()
+
+    def tearDown(self):
+        pyitt.trace_gc(False)
+        if self.gc_was_enabled:
+            gc.enable()
+
+    @pyitt_native_patch('Counter')
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('StringHandle')
+    @pyitt_native_patch('task_begin')
+    @pyitt_native_patch('task_end')
+    def test_trace_gc(self, counter_class_mock, domain_class_mock, string_handle_class_mock, task_begin_mock,
+                      task_end_mock):
+        domain = Mock()
+        domain.name = 'my gc domain'
+        domain_class_mock.return_value = domain
+        string_handle_class_mock.side_effect = lambda x: x
+        counters = {}
+        counter_class_mock.side_effect = lambda name, _: counters.setdefault(name, Mock())
+
+        callbacks_count = len(gc.callbacks)
+        pyitt.trace_gc(domain='my gc domain')
+
+        self.assertEqual(len(gc.callbacks), callbacks_count + 1)
+        domain_class_mock.assert_called_once_with('my gc domain')
+        self.assertEqual(string_handle_class_mock.call_args_list,
+                         [call('gc generation 0'), call('gc generation 1'), call('gc generation 2')])
+        self.assertEqual(set(counters), {'gc collected objects', 'gc uncollectable objects', 'gc pause time (us)'})
+
+        callback = gc.callbacks[-1]
+        callback('start', {'generation': 1, 'collected': 0, 'uncollectable': 0})
+        task_begin_mock.assert_called_once_with(domain, 'gc generation 1')
+        task_end_mock.assert_not_called()
+
+        callback('stop', {'generation': 1, 'collected': 5, 'uncollectable': 0})
+        task_end_mock.assert_called_once_with(domain)
+        counters['gc collected objects'].inc.assert_called_once_with(5)
+        counters['gc uncollectable objects'].inc.assert_not_called()
+        counters['gc pause time (us)'].set.assert_called_once()
+
+        pyitt.trace_gc(False)
+        self.assertEqual(len(gc.callbacks), callbacks_count)
+
+    @pyitt_native_patch('Counter')
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('StringHandle')
+    def test_trace_gc_enabled_twice(self, counter_class_mock, domain_class_mock, string_handle_class_mock):
+        domain_class_mock.return_value = Mock()
+        callbacks_count = len(gc.callbacks)
+
+        pyitt.trace_gc()
+        pyitt.trace_gc()
+
+        self.assertEqual(len(gc.callbacks), callbacks_count + 1)
+        self.assertEqual(counter_class_mock.call_count, 3)
+        self.assertEqual(string_handle_class_mock.call_count, 3)
+
+        pyitt.trace_gc(False)
+        pyitt.trace_gc(False)
+        self.assertEqual(len(gc.callbacks), callbacks_count)
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
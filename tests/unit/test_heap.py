@@ -0,0 +1,48 @@
+from unittest import main as unittest_main, TestCase
+from unittest.mock import call
+
+from .pyitt_native_mock import patch as pyitt_native_patch
+import pyitt  # pylint: disable=C0411
+from pyitt.heap import ALLOCATOR_DOMAINS  # pylint: disable=C0411
+
+
+class HeapTests(TestCase):
+    @pyitt_native_patch('heap_tracking_enable')
+    def test_enable(self, heap_tracking_enable_mock):
+        pyitt.heap.enable()
+        heap_tracking_enable_mock.assert_called_once_with(ALLOCATOR_DOMAINS['object'], 0, 1)
+
+    @pyitt_native_patch('heap_tracking_enable')
+    def test_enable_with_sampling(self, heap_tracking_enable_mock):
+        pyitt.heap.enable(('raw', 'mem'), min_size=1024, sample_every=10)
+        self.assertEqual(heap_tracking_enable_mock.call_args_list,
+                         [call(ALLOCATOR_DOMAINS['raw'], 1024, 10), call(ALLOCATOR_DOMAINS['mem'], 1024, 10)])
+
+    @pyitt_native_patch('heap_tracking_enable')
+    def test_enable_with_unknown_domain(self, heap_tracking_enable_mock):
+        with self.assertRaises(ValueError) as context:
+            pyitt.heap.enable('objects')
+
+        self.assertTrue(str(context.exception).startswith("Unknown allocator domain: 'objects'."))
+        heap_tracking_enable_mock.assert_not_called()
+
+    @pyitt_native_patch('heap_tracking_disable')
+    def test_disable(self, heap_tracking_disable_mock):
+        pyitt.heap.disable()
+        self.assertEqual(heap_tracking_disable_mock.call_args_list,
+                         [call(value) for value in ALLOCATOR_DOMAINS.values()])
+
+    @pyitt_native_patch('heap_tracking_disable')
+    def test_disable_for_domain(self, heap_tracking_disable_mock):
+        pyitt.heap.disable('mem')
+        heap_tracking_disable_mock.assert_called_once_with(ALLOCATOR_DOMAINS['mem'])
+
+    @pyitt_native_patch('heap_tracking_is_active')
+    def test_is_enabled(self, heap_tracking_is_active_mock):
+        heap_tracking_is_active_mock.return_value = True
+        self.assertTrue(pyitt.heap.is_enabled('raw'))
+        heap_tracking_is_active_mock.assert_called_once_with(ALLOCATOR_DOMAINS['raw'])
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
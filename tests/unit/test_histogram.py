@@ -0,0 +1,30 @@
+from unittest import main as unittest_main, TestCase
+
+from .pyitt_native_mock import patch as pyitt_native_patch
+import pyitt  # pylint: disable=C0411
+from pyitt.histogram import DATA_TYPES  # pylint: disable=C0411
+
+
+class HistogramCreationTests(TestCase):
+    @pyitt_native_patch('Histogram')
+    def test_histogram_creation_with_name(self, histogram_class_mock):
+        self.assertIs(pyitt.histogram('my histogram'), histogram_class_mock.return_value)
+        histogram_class_mock.assert_called_once_with('my histogram', None, DATA_TYPES['u64'], DATA_TYPES['u64'], 1024)
+
+    @pyitt_native_patch('Histogram')
+    def test_histogram_creation_with_all_arguments(self, histogram_class_mock):
+        pyitt.histogram('my histogram', 'my domain', 'double', 'u32', batch_size=16)
+        histogram_class_mock.assert_called_once_with('my histogram', 'my domain', DATA_TYPES['double'],
+                                                     DATA_TYPES['u32'], 16)
+
+    @pyitt_native_patch('Histogram')
+    def test_histogram_creation_with_unknown_data_type(self, histogram_class_mock):
+        with self.assertRaises(ValueError) as context:
+            pyitt.histogram('my histogram', x_type='int')
+
+        self.assertTrue(str(context.exception).startswith("Unknown histogram data type: 'int'."))
+        histogram_class_mock.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
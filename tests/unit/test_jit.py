@@ -0,0 +1,46 @@
+from unittest import main as unittest_main, TestCase
+
+from .pyitt_native_mock import patch as pyitt_native_patch
+import pyitt  # pylint: disable=C0411
+
+
+class JitTests(TestCase):
+    @pyitt_native_patch('jit_is_profiling_active')
+    def test_is_profiling_active(self, jit_is_profiling_active_mock):
+        jit_is_profiling_active_mock.return_value = True
+        self.assertTrue(pyitt.jit.is_profiling_active())
+        jit_is_profiling_active_mock.assert_called_once_with()
+
+    @pyitt_native_patch('jit_register_code')
+    def test_register_code_object(self, jit_register_code_mock):
+        def my_function():
+            pass  # pragma: no cover
+
+        jit_register_code_mock.return_value = True
+        self.assertTrue(pyitt.jit.register_code(my_function.__code__))
+        jit_register_code_mock.assert_called_once_with(my_function.__code__)
+
+    @pyitt_native_patch('jit_register_code')
+    def test_register_function(self, jit_register_code_mock):
+        def my_function():
+            pass  # pragma: no cover
+
+        jit_register_code_mock.return_value = False
+        self.assertFalse(pyitt.jit.register_code(my_function))
+        jit_register_code_mock.assert_called_once_with(my_function.__code__)
+
+    @pyitt_native_patch('jit_set_auto_registration')
+    def test_auto_register(self, jit_set_auto_registration_mock):
+        jit_set_auto_registration_mock.return_value = True
+        self.assertTrue(pyitt.jit.auto_register())
+        jit_set_auto_registration_mock.assert_called_once_with(True)
+
+    @pyitt_native_patch('jit_set_auto_registration')
+    def test_auto_register_disabling(self, jit_set_auto_registration_mock):
+        jit_set_auto_registration_mock.return_value = False
+        self.assertFalse(pyitt.jit.auto_register(False))
+        jit_set_auto_registration_mock.assert_called_once_with(False)
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
@@ -0,0 +1,91 @@
+from json import loads
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import main as unittest_main, TestCase
+from unittest.mock import call, patch
+
+from .pyitt_native_mock import patch as pyitt_native_patch
+import pyitt  # pylint: disable=C0411
+
+
+class PreloadTests(TestCase):
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('StringHandle')
+    def test_preload(self, domain_class_mock, string_handle_class_mock):
+        pyitt.preload(['my task', 'my event'], ['my domain'])
+
+        string_handle_class_mock.create_many.assert_called_once_with(['my task', 'my event'])
+        domain_class_mock.create_many.assert_called_once_with(['my domain'])
+
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('StringHandle')
+    def test_preload_with_manifest(self, domain_class_mock, string_handle_class_mock):
+        with TemporaryDirectory() as directory:
+            manifest_path = path.join(directory, 'manifest.json')
+            with open(manifest_path, 'w', encoding='utf-8') as manifest_file:
+                manifest_file.write('{"names": ["my manifest task"], "domains": ["my manifest domain"]}')
+
+            pyitt.preload(['my task'], manifest=manifest_path)
+
+        string_handle_class_mock.create_many.assert_called_once_with(['my task', 'my manifest task'])
+        domain_class_mock.create_many.assert_called_once_with(['my manifest domain'])
+
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('StringHandle')
+    def test_preload_with_missing_manifest(self, domain_class_mock, string_handle_class_mock):
+        with TemporaryDirectory() as directory:
+            pyitt.preload(['my task'], manifest=path.join(directory, 'manifest.json'))
+
+        string_handle_class_mock.create_many.assert_called_once_with(['my task'])
+        domain_class_mock.create_many.assert_called_once_with(())
+
+
+class ManifestRecordingTests(TestCase):
+    @pyitt_native_patch('manifest_recording_enable')
+    def test_record(self, manifest_recording_enable_mock):
+        with patch('pyitt.manifest._atexit_register') as atexit_register_mock:
+            pyitt.manifest.record()
+
+        manifest_recording_enable_mock.assert_called_once_with()
+        atexit_register_mock.assert_not_called()
+
+    @pyitt_native_patch('manifest_recording_enable')
+    def test_record_with_path(self, manifest_recording_enable_mock):
+        with patch('pyitt.manifest._atexit_register') as atexit_register_mock:
+            pyitt.manifest.record('manifest.json')
+
+        manifest_recording_enable_mock.assert_called_once_with()
+        atexit_register_mock.assert_called_once_with(pyitt.manifest.save, 'manifest.json')
+
+    @pyitt_native_patch('manifest_recording_disable')
+    def test_stop_recording(self, manifest_recording_disable_mock):
+        pyitt.manifest.stop_recording()
+        manifest_recording_disable_mock.assert_called_once_with()
+
+    @pyitt_native_patch('manifest_snapshot')
+    def test_save_and_load(self, manifest_snapshot_mock):
+        manifest_snapshot_mock.return_value = (['my task'], ['my domain'])
+
+        with TemporaryDirectory() as directory:
+            manifest_path = path.join(directory, 'manifest.json')
+            pyitt.manifest.save(manifest_path)
+
+            with open(manifest_path, 'r', encoding='utf-8') as manifest_file:
+                self.assertEqual(loads(manifest_file.read()), {'names': ['my task'], 'domains': ['my domain']})
+            self.assertEqual(pyitt.manifest.load(manifest_path), (['my task'], ['my domain']))
+
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('StringHandle')
+    @pyitt_native_patch('manifest_recording_enable')
+    def test_preload_and_record(self, domain_class_mock, string_handle_class_mock, manifest_recording_enable_mock):
+        with patch('pyitt.manifest._atexit_register') as atexit_register_mock:
+            pyitt.manifest._preload_and_record('missing_manifest.json')  # pylint: disable=W0212
+
+        self.assertEqual(string_handle_class_mock.create_many.call_args_list, [call(())])
+        self.assertEqual(domain_class_mock.create_many.call_args_list, [call(())])
+        manifest_recording_enable_mock.assert_called_once_with()
+        atexit_register_mock.assert_called_once_with(pyitt.manifest.save, 'missing_manifest.json')
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
@@ -0,0 +1,69 @@
+from unittest import main as unittest_main, TestCase
+from unittest.mock import Mock
+
+from .pyitt_native_mock import patch as pyitt_native_patch
+import pyitt  # pylint: disable=C0411
+from pyitt.marker import SCOPES, _CACHE_SIZE, _create_domain, _create_name  # pylint: disable=C0411
+
+
+class MarkerTests(TestCase):
+    def setUp(self):
+        _create_domain.cache_clear()
+        _create_name.cache_clear()
+
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('StringHandle')
+    @pyitt_native_patch('marker')
+    def test_marker(self, domain_class_mock, string_handle_class_mock, marker_mock):
+        pyitt.marker('my marker')
+
+        marker_mock.assert_called_once_with(domain_class_mock.return_value, string_handle_class_mock.return_value,
+                                            SCOPES['thread'], None)
+
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('StringHandle')
+    @pyitt_native_patch('marker')
+    def test_marker_caches_names_and_domains(self, domain_class_mock, string_handle_class_mock, marker_mock):
+        for _ in range(3):
+            pyitt.marker('my cached marker', 'process', 'my cached domain')
+
+        domain_class_mock.assert_called_once_with('my cached domain')
+        string_handle_class_mock.assert_called_once_with('my cached marker')
+        self.assertEqual(marker_mock.call_count, 3)
+        marker_mock.assert_called_with(domain_class_mock.return_value, string_handle_class_mock.return_value,
+                                       SCOPES['process'], None)
+
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('StringHandle')
+    @pyitt_native_patch('marker')
+    def test_marker_cache_is_bounded(self, domain_class_mock, string_handle_class_mock, marker_mock):
+        for i in range(_CACHE_SIZE + 1):
+            pyitt.marker(f'my dynamic marker {i}', domain='my cached domain')
+
+        self.assertEqual(string_handle_class_mock.call_count, _CACHE_SIZE + 1)
+        self.assertEqual(_create_name.cache_info().currsize, _CACHE_SIZE)
+        self.assertEqual(marker_mock.call_count, _CACHE_SIZE + 1)
+        domain_class_mock.assert_called_once_with('my cached domain')
+
+    @pyitt_native_patch('StringHandle')
+    @pyitt_native_patch('marker')
+    def test_marker_with_objects(self, string_handle_class_mock, marker_mock):
+        domain = Mock()
+        name = Mock()
+        marker_id = Mock()
+        pyitt.marker(name, 'global', domain, marker_id)
+
+        string_handle_class_mock.assert_not_called()
+        marker_mock.assert_called_once_with(domain, name, SCOPES['global'], marker_id)
+
+    @pyitt_native_patch('marker')
+    def test_marker_with_unknown_scope(self, marker_mock):
+        with self.assertRaises(ValueError) as context:
+            pyitt.marker('my marker', 'frame', Mock())
+
+        self.assertTrue(str(context.exception).startswith("Unknown marker scope: 'frame'."))
+        marker_mock.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
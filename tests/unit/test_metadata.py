@@ -0,0 +1,90 @@
+from array import array
+from unittest import main as unittest_main, TestCase
+
+from .pyitt_native_mock import patch as pyitt_native_patch
+import pyitt  # pylint: disable=C0411
+
+
+class MetadataTests(TestCase):
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('StringHandle')
+    @pyitt_native_patch('metadata_add')
+    def test_metadata_with_names(self, domain_class_mock, string_handle_class_mock, metadata_add_mock):
+        domain_class_mock.return_value = 'domain_handle'
+        string_handle_class_mock.return_value = 'string_handle'
+
+        pyitt.metadata('my domain', 'my metadata', 42)
+
+        domain_class_mock.assert_called_once_with('my domain')
+        string_handle_class_mock.assert_called_once_with('my metadata')
+        metadata_add_mock.assert_called_once_with(domain_class_mock.return_value,
+                                                  string_handle_class_mock.return_value, 42, None)
+
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('StringHandle')
+    @pyitt_native_patch('metadata_add')
+    def test_metadata_with_default_domain(self, domain_class_mock, string_handle_class_mock, metadata_add_mock):
+        domain_class_mock.return_value = 'domain_handle'
+
+        pyitt.metadata(None, 'my metadata', 'value')
+
+        domain_class_mock.assert_called_once_with(None)
+        metadata_add_mock.assert_called_once_with(domain_class_mock.return_value,
+                                                  string_handle_class_mock.return_value, 'value', None)
+
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('StringHandle')
+    @pyitt_native_patch('metadata_add')
+    def test_metadata_with_handles_and_id(self, domain_class_mock, string_handle_class_mock, metadata_add_mock):
+        pyitt.metadata('domain_handle', 'string_handle', 1.5, 'id_handle')
+
+        metadata_add_mock.assert_called_once_with(domain_class_mock.return_value,
+                                                  string_handle_class_mock.return_value, 1.5, 'id_handle')
+
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('StringHandle')
+    @pyitt_native_patch('metadata_add')
+    def test_metadata_with_buffer(self, domain_class_mock, string_handle_class_mock, metadata_add_mock):
+        values = array('i', [1, 2, 3])
+        pyitt.metadata('my domain', 'my metadata', values)
+
+        metadata_add_mock.assert_called_once_with(domain_class_mock.return_value,
+                                                  string_handle_class_mock.return_value, values, None)
+        self.assertIs(metadata_add_mock.call_args.args[2], values)
+
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('StringHandle')
+    @pyitt_native_patch('metadata_add')
+    def test_metadata_with_sequence_of_integers(self, domain_class_mock, string_handle_class_mock, metadata_add_mock):
+        pyitt.metadata('my domain', 'my metadata', (32, 3, 224, 224))
+
+        metadata_add_mock.assert_called_once_with(domain_class_mock.return_value,
+                                                  string_handle_class_mock.return_value,
+                                                  array('q', [32, 3, 224, 224]), None)
+
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('StringHandle')
+    @pyitt_native_patch('metadata_add')
+    def test_metadata_with_sequence_of_large_integers(self, domain_class_mock, string_handle_class_mock,
+                                                      metadata_add_mock):
+        pyitt.metadata('my domain', 'my metadata', [1, 2**64 - 1])
+
+        metadata_add_mock.assert_called_once_with(domain_class_mock.return_value,
+                                                  string_handle_class_mock.return_value,
+                                                  array('Q', [1, 2**64 - 1]), None)
+
+        with self.assertRaises(OverflowError):
+            pyitt.metadata('my domain', 'my metadata', [-1, 2**64 - 1])
+
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('StringHandle')
+    @pyitt_native_patch('metadata_add')
+    def test_metadata_with_sequence_of_floats(self, domain_class_mock, string_handle_class_mock, metadata_add_mock):
+        pyitt.metadata('my domain', 'my metadata', [1, 2.5])
+
+        metadata_add_mock.assert_called_once_with(domain_class_mock.return_value,
+                                                  string_handle_class_mock.return_value, array('d', [1, 2.5]), None)
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
@@ -0,0 +1,112 @@
+from io import StringIO
+from json import loads
+from os import getpid
+from struct import pack
+from unittest import main as unittest_main, TestCase
+from unittest.mock import patch
+
+from .pyitt_native_mock import patch as pyitt_native_patch
+import pyitt  # pylint: disable=C0411
+
+
+def make_record(timestamp, record_type, name=0, domain=0, value=0):
+    return pack('=QIIIIQ', timestamp, record_type, name, domain, 0, value)
+
+
+class RecorderControlTests(TestCase):
+    @pyitt_native_patch('recorder_enable')
+    def test_recorder_enable(self, recorder_enable_mock):
+        pyitt.recorder.enable()
+        recorder_enable_mock.assert_called_once_with(pyitt.recorder.DEFAULT_CAPACITY)
+
+    @pyitt_native_patch('recorder_enable')
+    def test_recorder_enable_with_output(self, recorder_enable_mock):
+        with patch('pyitt.recorder._atexit_register') as atexit_register_mock, \
+                patch.dict('pyitt.recorder._exit_export', {'output': None, 'registered': False}), \
+                patch('pyitt.recorder.export_chrome_trace') as export_chrome_trace_mock:
+            pyitt.recorder.enable(1024, 'trace.json')
+            pyitt.recorder.enable(1024, 'other_trace.json')
+
+            recorder_enable_mock.assert_called_with(1024)
+            atexit_register_mock.assert_called_once()
+
+            atexit_register_mock.call_args.args[0]()
+            export_chrome_trace_mock.assert_called_once_with('other_trace.json')
+
+    @pyitt_native_patch('recorder_disable')
+    def test_recorder_disable(self, recorder_disable_mock):
+        pyitt.recorder.disable()
+        recorder_disable_mock.assert_called_once_with()
+
+    @pyitt_native_patch('recorder_is_active')
+    def test_recorder_is_enabled(self, recorder_is_active_mock):
+        recorder_is_active_mock.return_value = True
+        self.assertTrue(pyitt.recorder.is_enabled())
+
+    @pyitt_native_patch('recorder_clear')
+    def test_recorder_clear(self, recorder_clear_mock):
+        pyitt.recorder.clear()
+        recorder_clear_mock.assert_called_once_with()
+
+
+class RecorderExportTests(TestCase):
+    @pyitt_native_patch('recorder_snapshot')
+    def test_chrome_trace_events_for_tasks(self, recorder_snapshot_mock):
+        records = (make_record(1000, 1, name=2, domain=1) + make_record(3000, 2, domain=1) +
+                   make_record(4000, 3, name=2, domain=1, value=7) + make_record(5000, 4, domain=1, value=7))
+        recorder_snapshot_mock.return_value = ([None, 'my domain', 'my task'], [(42, records)])
+
+        pid = getpid()
+        self.assertEqual(pyitt.recorder.chrome_trace_events(), [
+            {'ph': 'B', 'name': 'my task', 'cat': 'my domain', 'ts': 1.0, 'pid': pid, 'tid': 42},
+            {'ph': 'E', 'cat': 'my domain', 'ts': 3.0, 'pid': pid, 'tid': 42},
+            {'ph': 'b', 'name': 'my task', 'cat': 'my domain', 'id': '0x7', 'ts': 4.0, 'pid': pid, 'tid': 42},
+            {'ph': 'e', 'name': 'my task', 'cat': 'my domain', 'id': '0x7', 'ts': 5.0, 'pid': pid, 'tid': 42},
+        ])
+
+    @pyitt_native_patch('recorder_snapshot')
+    def test_chrome_trace_events_for_frames_events_counters_and_thread_names(self, recorder_snapshot_mock):
+        records = (make_record(1000, 10, name=3) + make_record(2000, 5, domain=1) + make_record(3000, 6, domain=1) +
+                   make_record(4000, 7, name=2) + make_record(5000, 8, name=2) +
+                   make_record(6000, 9, name=2, domain=1, value=5) + make_record(7000, 100))
+        recorder_snapshot_mock.return_value = ([None, 'my domain', 'my name', 'my thread'], [(1, records)])
+
+        pid = getpid()
+        self.assertEqual(pyitt.recorder.chrome_trace_events(), [
+            {'ph': 'M', 'name': 'thread_name', 'args': {'name': 'my thread'}, 'ts': 1.0, 'pid': pid, 'tid': 1},
+            {'ph': 'b', 'name': 'my domain', 'cat': 'frame', 'id': '0x0', 'ts': 2.0, 'pid': pid, 'tid': 1},
+            {'ph': 'e', 'name': 'my domain', 'cat': 'frame', 'id': '0x0', 'ts': 3.0, 'pid': pid, 'tid': 1},
+            {'ph': 'B', 'name': 'my name', 'cat': 'event', 'ts': 4.0, 'pid': pid, 'tid': 1},
+            {'ph': 'E', 'name': 'my name', 'cat': 'event', 'ts': 5.0, 'pid': pid, 'tid': 1},
+            {'ph': 'C', 'name': 'my name', 'cat': 'my domain', 'args': {'my name': 5}, 'ts': 6.0, 'pid': pid,
+             'tid': 1},
+        ])
+
+    @pyitt_native_patch('recorder_snapshot')
+    def test_chrome_trace_events_for_markers(self, recorder_snapshot_mock):
+        records = (make_record(1000, 11, name=2, domain=1, value=1) + make_record(2000, 11, name=2, domain=1, value=2) +
+                   make_record(3000, 11, name=2, domain=1, value=3))
+        recorder_snapshot_mock.return_value = ([None, 'my domain', 'my marker'], [(1, records)])
+
+        pid = getpid()
+        self.assertEqual(pyitt.recorder.chrome_trace_events(), [
+            {'ph': 'i', 'name': 'my marker', 'cat': 'my domain', 's': 'g', 'ts': 1.0, 'pid': pid, 'tid': 1},
+            {'ph': 'i', 'name': 'my marker', 'cat': 'my domain', 's': 'p', 'ts': 2.0, 'pid': pid, 'tid': 1},
+            {'ph': 'i', 'name': 'my marker', 'cat': 'my domain', 's': 't', 'ts': 3.0, 'pid': pid, 'tid': 1},
+        ])
+
+    @pyitt_native_patch('recorder_snapshot')
+    def test_export_chrome_trace_to_file_object(self, recorder_snapshot_mock):
+        recorder_snapshot_mock.return_value = ([None, 'my domain', 'my task'], [(1, make_record(1000, 1, 2, 1))])
+
+        file = StringIO()
+        pyitt.recorder.export_chrome_trace(file)
+
+        trace = loads(file.getvalue())
+        self.assertEqual(trace['displayTimeUnit'], 'ns')
+        self.assertEqual(len(trace['traceEvents']), 1)
+        self.assertEqual(trace['traceEvents'][0]['name'], 'my task')
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
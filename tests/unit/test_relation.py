@@ -0,0 +1,47 @@
+from unittest import main as unittest_main, TestCase
+
+from .pyitt_native_mock import patch as pyitt_native_patch
+import pyitt  # pylint: disable=C0411
+from pyitt.relation import RELATIONS  # pylint: disable=C0411
+
+
+class RelationTests(TestCase):
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('relation_add')
+    def test_relation_for_ids(self, domain_class_mock, relation_add_mock):
+        domain_class_mock.return_value = 'domain_handle'
+
+        pyitt.relation('my domain', 'head_id', 'parent_of', 'tail_id')
+
+        domain_class_mock.assert_called_once_with('my domain')
+        relation_add_mock.assert_called_once_with(domain_class_mock.return_value, 'head_id',
+                                                  RELATIONS['parent_of'], 'tail_id')
+
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('Id')
+    @pyitt_native_patch('StringHandle')
+    @pyitt_native_patch('relation_add_to_current')
+    def test_relation_to_current_for_task(self, domain_class_mock, id_class_mock, string_handle_class_mock,
+                                          relation_add_to_current_mock):
+        domain_class_mock.return_value = 'domain_handle'
+        id_class_mock.return_value = 'id_handle'
+        string_handle_class_mock.return_value = 'string_handle'
+
+        task = pyitt.overlapped_task('my task')
+        pyitt.relation_to_current(None, 'dependent_on', task)
+
+        relation_add_to_current_mock.assert_called_once_with(domain_class_mock.return_value,
+                                                             RELATIONS['dependent_on'],
+                                                             id_class_mock.return_value)
+
+    @pyitt_native_patch('relation_add')
+    def test_relation_with_unknown_kind(self, relation_add_mock):
+        with self.assertRaises(ValueError) as context:
+            pyitt.relation('domain_handle', 'head_id', 'depends', 'tail_id')
+
+        self.assertTrue(str(context.exception).startswith("Unknown relation kind: 'depends'."))
+        relation_add_mock.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
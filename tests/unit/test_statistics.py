@@ -0,0 +1,51 @@
+from unittest import main as unittest_main, TestCase
+
+from .pyitt_native_mock import patch as pyitt_native_patch
+import pyitt  # pylint: disable=C0411
+
+
+class StatisticsTests(TestCase):
+    @pyitt_native_patch('stats_enable')
+    def test_statistics_enable(self, stats_enable_mock):
+        pyitt.statistics.enable()
+        stats_enable_mock.assert_called_once_with()
+
+    @pyitt_native_patch('stats_disable')
+    def test_statistics_disable(self, stats_disable_mock):
+        pyitt.statistics.disable()
+        stats_disable_mock.assert_called_once_with()
+
+    @pyitt_native_patch('stats_is_active')
+    def test_statistics_is_enabled(self, stats_is_active_mock):
+        stats_is_active_mock.return_value = True
+        self.assertTrue(pyitt.statistics.is_enabled())
+
+    @pyitt_native_patch('stats_reset')
+    def test_statistics_reset(self, stats_reset_mock):
+        pyitt.statistics.reset()
+        stats_reset_mock.assert_called_once_with()
+
+    @pyitt_native_patch('stats_snapshot')
+    def test_stats(self, stats_snapshot_mock):
+        stats_snapshot_mock.return_value = {'my task': (2, 300, 100, 200, 200, 200)}
+
+        stats = pyitt.stats()
+        self.assertEqual(list(stats.keys()), ['my task'])
+
+        task_stats = stats['my task']
+        self.assertIsInstance(task_stats, pyitt.statistics.RegionStats)
+        self.assertEqual(task_stats.count, 2)
+        self.assertEqual(task_stats.total, 300)
+        self.assertEqual(task_stats.p50, 100)
+        self.assertEqual(task_stats.p90, 200)
+        self.assertEqual(task_stats.p99, 200)
+        self.assertEqual(task_stats.max, 200)
+
+    @pyitt_native_patch('stats_snapshot')
+    def test_stats_without_regions(self, stats_snapshot_mock):
+        stats_snapshot_mock.return_value = {}
+        self.assertEqual(pyitt.stats(), {})
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
@@ -0,0 +1,189 @@
+from asyncio import Lock as AsyncioLock, run as asyncio_run
+from inspect import currentframe
+from os.path import basename
+from sys import version_info
+from threading import Lock as ThreadingLock, RLock as ThreadingRLock, Semaphore as ThreadingSemaphore
+from unittest import main as unittest_main, skipIf, TestCase
+from unittest.mock import call, Mock
+
+from .pyitt_native_mock import patch as pyitt_native_patch
+import pyitt  # pylint: disable=C0411
+
+
+def setup_sync_object_mock(sync_object_class_mock):
+    sync_object_mock = Mock()
+    sync_object_mock.acquire.side_effect = lambda func, *args: func(*args)
+    sync_object_mock.release.side_effect = lambda func, *args: func(*args)
+    sync_object_class_mock.return_value = sync_object_mock
+    return sync_object_mock
+
+
+class LockTests(TestCase):
+    @pyitt_native_patch('SyncObject')
+    def test_lock_creation_with_name(self, sync_object_class_mock):
+        pyitt.sync.Lock('my lock')
+        sync_object_class_mock.assert_called_once_with('my lock', 'Lock')
+
+    @pyitt_native_patch('SyncObject')
+    def test_lock_creation_without_name(self, sync_object_class_mock):
+        lineno = currentframe().f_lineno + 1
+        pyitt.sync.Lock()
+        sync_object_class_mock.assert_called_once_with(f'Lock {basename(__file__)}:{lineno}', 'Lock')
+
+    @pyitt_native_patch('SyncObject')
+    def test_lock_acquire_and_release(self, sync_object_class_mock):
+        sync_object_mock = setup_sync_object_mock(sync_object_class_mock)
+        lock = pyitt.sync.Lock('my lock')
+
+        with lock:
+            self.assertTrue(lock.locked())
+        self.assertFalse(lock.locked())
+
+        sync_object_mock.acquire.assert_called_once()
+        self.assertEqual(sync_object_mock.acquire.call_args.args[1:], (True, -1))
+        sync_object_mock.release.assert_called_once()
+
+    @pyitt_native_patch('SyncObject')
+    def test_lock_non_blocking_acquire(self, sync_object_class_mock):
+        setup_sync_object_mock(sync_object_class_mock)
+        lock = pyitt.sync.Lock('my lock')
+
+        self.assertTrue(lock.acquire(False))
+        self.assertFalse(lock.acquire(False))
+        lock.release()
+
+
+class RLockTests(TestCase):
+    @pyitt_native_patch('SyncObject')
+    def test_rlock_reports_outermost_acquisition_only(self, sync_object_class_mock):
+        sync_object_mock = setup_sync_object_mock(sync_object_class_mock)
+        lock = pyitt.sync.RLock('my lock')
+
+        with lock:
+            with lock:
+                pass
+
+        sync_object_class_mock.assert_called_once_with('my lock', 'RLock')
+        sync_object_mock.acquire.assert_called_once()
+        sync_object_mock.release.assert_called_once()
+
+    @pyitt_native_patch('SyncObject')
+    def test_rlock_release_by_not_owner(self, sync_object_class_mock):
+        setup_sync_object_mock(sync_object_class_mock)
+        lock = pyitt.sync.RLock('my lock')
+
+        with self.assertRaises(RuntimeError):
+            lock.release()
+
+
+class ConditionTests(TestCase):
+    @pyitt_native_patch('SyncObject')
+    def test_condition_wait_and_notify(self, sync_object_class_mock):
+        sync_object_mock = setup_sync_object_mock(sync_object_class_mock)
+        condition = pyitt.sync.Condition(name='my condition')
+
+        with condition:
+            condition.notify()
+            self.assertFalse(condition.wait(0))
+
+        self.assertEqual(sync_object_class_mock.call_args_list,
+                         [call('my condition lock', 'RLock'), call('my condition', 'Condition')])
+        sync_object_mock.releasing.assert_called_once_with()
+        sync_object_mock.prepare.assert_called_once_with()
+        sync_object_mock.acquired.assert_called_once_with()
+        self.assertEqual(sync_object_mock.acquire.call_count, 2)
+        self.assertEqual(sync_object_mock.release.call_count, 2)
+
+
+class SemaphoreTests(TestCase):
+    @pyitt_native_patch('SyncObject')
+    def test_semaphore_acquire_and_release(self, sync_object_class_mock):
+        sync_object_mock = setup_sync_object_mock(sync_object_class_mock)
+        semaphore = pyitt.sync.Semaphore(2, 'my semaphore')
+
+        self.assertTrue(semaphore.acquire())
+        self.assertTrue(semaphore.acquire())
+        self.assertFalse(semaphore.acquire(timeout=0))
+        semaphore.release()
+
+        sync_object_class_mock.assert_called_once_with('my semaphore', 'Semaphore')
+        self.assertEqual(sync_object_mock.acquire.call_count, 3)
+        sync_object_mock.release.assert_called_once()
+
+    @skipIf(version_info < (3, 9), 'threading.Semaphore.release() accepts n since Python 3.9')
+    @pyitt_native_patch('SyncObject')
+    def test_semaphore_release_with_n(self, sync_object_class_mock):
+        sync_object_mock = setup_sync_object_mock(sync_object_class_mock)
+        semaphore = pyitt.sync.Semaphore(0, 'my semaphore')
+
+        semaphore.release(2)
+
+        self.assertTrue(semaphore.acquire(timeout=0))
+        self.assertTrue(semaphore.acquire(timeout=0))
+        self.assertFalse(semaphore.acquire(timeout=0))
+        sync_object_mock.release.assert_called_once()
+
+
+class AsyncLockTests(TestCase):
+    @pyitt_native_patch('SyncObject')
+    def test_async_lock_acquire_and_release(self, sync_object_class_mock):
+        sync_object_mock = setup_sync_object_mock(sync_object_class_mock)
+
+        async def workload():
+            lock = pyitt.sync.AsyncLock('my lock')
+            async with lock:
+                self.assertTrue(lock.locked())
+            self.assertFalse(lock.locked())
+
+        asyncio_run(workload())
+
+        sync_object_class_mock.assert_called_once_with('my lock', 'asyncio.Lock')
+        sync_object_mock.prepare.assert_called_once_with()
+        sync_object_mock.acquired.assert_called_once_with()
+        sync_object_mock.release.assert_called_once()
+
+    @pyitt_native_patch('SyncObject')
+    def test_async_lock_with_statement(self, sync_object_class_mock):
+        setup_sync_object_mock(sync_object_class_mock)
+
+        async def workload():
+            with self.assertRaises(TypeError):
+                with pyitt.sync.AsyncLock('my lock'):
+                    pass  # pragma: no cover
+
+        asyncio_run(workload())
+
+
+class InstrumentTests(TestCase):
+    @pyitt_native_patch('SyncObject')
+    def test_instrument(self, sync_object_class_mock):
+        self.assertIsInstance(pyitt.sync.instrument(ThreadingLock(), 'my lock'), pyitt.sync.Lock)
+        self.assertIsInstance(pyitt.sync.instrument(ThreadingRLock(), 'my lock'), pyitt.sync.RLock)
+        self.assertIsInstance(pyitt.sync.instrument(ThreadingSemaphore(), 'my lock'), pyitt.sync.Semaphore)
+
+        async def workload():
+            self.assertIsInstance(pyitt.sync.instrument(AsyncioLock(), 'my lock'), pyitt.sync.AsyncLock)
+
+        asyncio_run(workload())
+
+        self.assertEqual(sync_object_class_mock.call_count, 4)
+
+    @pyitt_native_patch('SyncObject')
+    def test_instrument_without_name(self, sync_object_class_mock):
+        lock = ThreadingLock()
+        lineno = currentframe().f_lineno + 1
+        instrumented_lock = pyitt.sync.instrument(lock)
+
+        self.assertIs(instrumented_lock._lock, lock)  # pylint: disable=W0212
+        sync_object_class_mock.assert_called_once_with(f'lock {basename(__file__)}:{lineno}', 'Lock')
+
+    @pyitt_native_patch('SyncObject')
+    def test_instrument_unsupported_object(self, sync_object_class_mock):
+        with self.assertRaises(TypeError):
+            pyitt.sync.instrument(object())
+
+        sync_object_class_mock.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest_main()  # pragma: no cover
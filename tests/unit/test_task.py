@@ -586,5 +586,166 @@ class OverlappedTaskExecution(TestCase):
         task_end_overlapped_mock.assert_has_calls(expected_calls)
 
 
+class TaskMetadataTests(TestCase):
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('Id')
+    @pyitt_native_patch('StringHandle')
+    @pyitt_native_patch('metadata_add')
+    def test_task_add_metadata(self, domain_class_mock, id_class_mock, string_handle_class_mock, metadata_add_mock):
+        domain_class_mock.return_value = 'domain_handle'
+        id_class_mock.return_value = 'id_handle'
+        string_handle_class_mock.side_effect = lambda x: x
+
+        task = pyitt.task('my task')
+        task.add_metadata('batch size', 32)
+
+        metadata_add_mock.assert_called_once_with(domain_class_mock.return_value, 'batch size', 32,
+                                                  id_class_mock.return_value)
+
+
+class TaskRelationTests(TestCase):
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('Id')
+    @pyitt_native_patch('StringHandle')
+    @pyitt_native_patch('relation_add')
+    def test_task_relate(self, domain_class_mock, id_class_mock, string_handle_class_mock, relation_add_mock):
+        domain_class_mock.return_value = 'domain_handle'
+        id_class_mock.side_effect = ['consumer_id', 'producer_id']
+        string_handle_class_mock.side_effect = lambda x: x
+
+        consumer = pyitt.overlapped_task('consumer')
+        producer = pyitt.overlapped_task('producer')
+        consumer.relate(producer)
+        consumer.relate(producer.id, kind='continuation_of')
+
+        relation_add_mock.assert_has_calls([
+            call(domain_class_mock.return_value, 'consumer_id', 1, 'producer_id'),
+            call(domain_class_mock.return_value, 'consumer_id', 4, 'producer_id'),
+        ])
+
+
+class TaskTimestampTests(TestCase):
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('Id')
+    @pyitt_native_patch('StringHandle')
+    @pyitt_native_patch('task_begin_ex')
+    @pyitt_native_patch('task_end_ex')
+    def test_nested_task_with_timestamps(self, domain_class_mock, id_class_mock, string_handle_class_mock,
+                                         task_begin_ex_mock, task_end_ex_mock):
+        domain_class_mock.return_value = 'domain_handle'
+        id_class_mock.return_value = 'id_handle'
+        string_handle_class_mock.side_effect = lambda x: x
+
+        task = pyitt.nested_task('my task')
+        task.begin(timestamp=100)
+        task.end(timestamp=200, clock_domain='clock_domain')
+
+        task_begin_ex_mock.assert_called_once_with(domain_class_mock.return_value, None, 100, 'my task',
+                                                   id_class_mock.return_value, None)
+        task_end_ex_mock.assert_called_once_with(domain_class_mock.return_value, 'clock_domain', 200)
+
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('Id')
+    @pyitt_native_patch('StringHandle')
+    @pyitt_native_patch('task_begin_overlapped_ex')
+    @pyitt_native_patch('task_end_overlapped_ex')
+    def test_overlapped_task_with_timestamps(self, domain_class_mock, id_class_mock, string_handle_class_mock,
+                                             task_begin_overlapped_ex_mock, task_end_overlapped_ex_mock):
+        domain_class_mock.return_value = 'domain_handle'
+        id_class_mock.return_value = 'id_handle'
+        string_handle_class_mock.side_effect = lambda x: x
+
+        task = pyitt.overlapped_task('my task')
+        task.begin(100, 'clock_domain')
+        task.end(200, 'clock_domain')
+
+        task_begin_overlapped_ex_mock.assert_called_once_with(domain_class_mock.return_value, 'clock_domain', 100,
+                                                              'my task', id_class_mock.return_value, None)
+        task_end_overlapped_ex_mock.assert_called_once_with(domain_class_mock.return_value, 'clock_domain', 200,
+                                                            id_class_mock.return_value)
+
+    @pyitt_native_patch('task_begin')
+    @pyitt_native_patch('task_begin_ex')
+    def test_task_with_clock_domain_without_timestamp(self, task_begin_mock, task_begin_ex_mock):
+        with self.assertRaises(ValueError) as context:
+            pyitt.nested_task('my task').begin(clock_domain='clock_domain')
+
+        self.assertEqual(str(context.exception), 'The timestamp must be passed together with the clock domain.')
+        task_begin_mock.assert_not_called()
+        task_begin_ex_mock.assert_not_called()
+
+
+class TaskParentTests(TestCase):
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('Id')
+    @pyitt_native_patch('StringHandle')
+    def test_task_with_parent_task(self, domain_class_mock, id_class_mock, string_handle_class_mock):
+        domain_class_mock.return_value = 'domain_handle'
+        id_class_mock.side_effect = ['parent_id', 'child_id']
+        string_handle_class_mock.side_effect = lambda x: x
+
+        parent = pyitt.overlapped_task('my parent task')
+        child = pyitt.overlapped_task('my child task', parent=parent)
+
+        self.assertEqual(child.parent_id, 'parent_id')
+
+
+class TaskStackTests(TestCase):
+    @pyitt_native_patch('current_task')
+    def test_current_task(self, current_task_mock):
+        current_task_mock.return_value = ('my task', 'my domain', 'id', 'parent id', True)
+
+        self.assertEqual(pyitt.current_task(), pyitt.TaskInfo('my task', 'my domain', 'id', 'parent id', True))
+        current_task_mock.assert_called_once_with()
+
+    @pyitt_native_patch('current_task')
+    def test_current_task_without_active_task(self, current_task_mock):
+        current_task_mock.return_value = None
+        self.assertIsNone(pyitt.current_task())
+
+    @pyitt_native_patch('task_stack')
+    def test_task_stack(self, task_stack_mock):
+        task_stack_mock.return_value = (('outer task', 'pyitt', None, None, False),
+                                        ('inner task', 'pyitt', 'id', None, True))
+
+        tasks = pyitt.task_stack()
+
+        self.assertEqual(tasks, (pyitt.TaskInfo('outer task', 'pyitt', None, None, False),
+                                 pyitt.TaskInfo('inner task', 'pyitt', 'id', None, True)))
+        self.assertEqual(tasks[-1].name, 'inner task')
+
+
+class TaskFactoryTests(TestCase):
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('TaskFactory')
+    def test_task_factory_with_default_domain(self, domain_class_mock, task_factory_class_mock):
+        domain_class_mock.return_value = 'domain_handle'
+        task_factory_class_mock.return_value = 'task_factory'
+
+        self.assertEqual(pyitt.task_factory(), 'task_factory')
+        domain_class_mock.assert_called_once_with(None)
+        task_factory_class_mock.assert_called_once_with('domain_handle', False)
+
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('TaskFactory')
+    def test_overlapped_task_factory_with_domain_name(self, domain_class_mock, task_factory_class_mock):
+        domain_class_mock.return_value = 'domain_handle'
+
+        pyitt.task_factory('my domain', overlapped=True)
+
+        domain_class_mock.assert_called_once_with('my domain')
+        task_factory_class_mock.assert_called_once_with('domain_handle', True)
+
+    @pyitt_native_patch('Domain')
+    @pyitt_native_patch('TaskFactory')
+    def test_task_factory_with_domain_object(self, domain_class_mock, task_factory_class_mock):
+        domain = Mock()
+
+        pyitt.task_factory(domain)
+
+        domain_class_mock.assert_not_called()
+        task_factory_class_mock.assert_called_once_with(domain, False)
+
+
 if __name__ == '__main__':
     unittest_main()  # pragma: no cover
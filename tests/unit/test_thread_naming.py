@@ -1,4 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread
 from unittest import main as unittest_main, TestCase
+from unittest.mock import call
 
 from .pyitt_native_mock import patch as pyitt_native_patch
 import pyitt  # pylint: disable=C0411
@@ -12,5 +15,79 @@ class ThreadNamingTests(TestCase):
         thread_set_name_mock.assert_called_once_with(name)
 
 
+class AutoThreadNamingTests(TestCase):
+    def tearDown(self):
+        pyitt.auto_name_threads(False)
+
+    @pyitt_native_patch('thread_set_name')
+    def test_auto_name_threads(self, thread_set_name_mock):
+        pyitt.auto_name_threads()
+
+        thread = Thread(target=lambda: None, name='my thread')
+        thread.start()
+        thread.join()
+
+        thread_set_name_mock.assert_called_once_with('my thread')
+
+    @pyitt_native_patch('thread_set_name')
+    def test_auto_name_threads_for_thread_with_overridden_run(self, thread_set_name_mock):
+        class MyThread(Thread):
+            def run(self):
+                pass
+
+        pyitt.auto_name_threads()
+
+        thread = MyThread(name='my thread')
+        thread.start()
+        thread.join()
+
+        thread_set_name_mock.assert_called_once_with('my thread')
+
+    @pyitt_native_patch('thread_set_name')
+    def test_auto_name_threads_for_thread_pool_workers(self, thread_set_name_mock):
+        pyitt.auto_name_threads()
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='my pool') as executor:
+            executor.submit(lambda: None).result()
+
+        thread_set_name_mock.assert_has_calls([call('my pool_0')])
+
+    @pyitt_native_patch('thread_set_name')
+    def test_auto_name_threads_disabled(self, thread_set_name_mock):
+        bootstrap_inner = Thread._bootstrap_inner  # pylint: disable=W0212
+
+        pyitt.auto_name_threads()
+        self.assertIsNot(Thread._bootstrap_inner, bootstrap_inner)  # pylint: disable=W0212
+        pyitt.auto_name_threads(False)
+        self.assertIs(Thread._bootstrap_inner, bootstrap_inner)  # pylint: disable=W0212
+
+        thread = Thread(target=lambda: None, name='my thread')
+        thread.start()
+        thread.join()
+
+        thread_set_name_mock.assert_not_called()
+
+    @pyitt_native_patch('thread_set_name')
+    def test_auto_name_threads_disabled_after_another_wrapper(self, thread_set_name_mock):
+        pyitt.auto_name_threads()
+        wrapped_bootstrap_inner = Thread._bootstrap_inner  # pylint: disable=W0212
+
+        def bootstrap_inner(thread):
+            wrapped_bootstrap_inner(thread)
+
+        Thread._bootstrap_inner = bootstrap_inner  # pylint: disable=W0212
+        try:
+            pyitt.auto_name_threads(False)
+            self.assertIs(Thread._bootstrap_inner, bootstrap_inner)  # pylint: disable=W0212
+
+            thread = Thread(target=lambda: None, name='my thread')
+            thread.start()
+            thread.join()
+        finally:
+            Thread._bootstrap_inner = wrapped_bootstrap_inner  # pylint: disable=W0212
+
+        thread_set_name_mock.assert_not_called()
+
+
 if __name__ == '__main__':
     unittest_main()  # pragma: no cover